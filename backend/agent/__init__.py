@@ -1,11 +1,16 @@
 """Agent 모듈"""
 
 from .agent import MeetingAgent
-from .llm_client import LLMClient
+from .llm_client import LLMClient, SystemPrompt
+from .llm_pool import LLMClientPool
+from .llm_router import LLMRouter
 from .conversation import ConversationManager
 
 __all__ = [
     "MeetingAgent",
     "LLMClient",
+    "SystemPrompt",
+    "LLMClientPool",
+    "LLMRouter",
     "ConversationManager",
 ]
@@ -3,10 +3,14 @@
 import json
 from typing import Optional
 
-from .llm_client import LLMClient, MockLLMClient
+from .llm_client import MockLLMClient, SystemPrompt
+from .llm_router import get_llm_router
+from .history import HistoryManager, LLMSummarizer
+from .tools.base import ToolResult
 from .tools.registry import ToolRegistry
-from .prompts.prompt_manager import PromptManager
+from .prompts.prompt_manager import get_prompt_manager
 from .conversation import ConversationContext
+from services.schedule_prefetch import get_schedule_prefetcher
 from models.chat import (
     ChatResponse,
     ResponseContent,
@@ -26,17 +30,27 @@ class MeetingAgent:
 
     def __init__(self, use_mock_llm: bool = False):
         # LLM 클라이언트
-        if use_mock_llm or not settings.get_api_key():
+        if use_mock_llm or not (settings.get_api_key() or settings.llm_replay_mode == "replay"):
             logger.warning("Using Mock LLM client")
             self.llm = MockLLMClient()
         else:
-            self.llm = LLMClient()
+            self.llm = get_llm_router("agent")
 
         # 도구 레지스트리
         self.tools = ToolRegistry()
 
         # 프롬프트 관리자
-        self.prompt_manager = PromptManager()
+        self.prompt_manager = get_prompt_manager()
+
+        # 대화 이력 관리자 (provider별 토큰 예산)
+        provider = getattr(self.llm, "provider", None)
+        provider = provider.value if provider else settings.llm_provider
+        self.history = HistoryManager(
+            token_budget=settings.get_history_token_budget(provider),
+            min_recent_messages=settings.history_min_recent_messages,
+        )
+        if settings.history_summarizer == "llm":
+            self.history.summarizer = LLMSummarizer(self.llm, max_tokens=self.history.summary_budget)
 
         # 최대 도구 호출 반복 횟수
         self.max_tool_iterations = 10
@@ -57,17 +71,13 @@ class MeetingAgent:
             AI 응답
         """
         try:
-            # 시스템 프롬프트 생성
-            system_prompt = self.prompt_manager.get_system_prompt()
-
-            # 컨텍스트 요약 추가
+            # 대화 컨텍스트
             ctx = ConversationContext(conversation)
-            context_summary = self.prompt_manager.get_context_summary(conversation.context)
-            if context_summary:
-                system_prompt += f"\n\n{context_summary}"
 
-            # 대화 이력 구성
-            messages = conversation.get_messages_for_llm()
+            # 대화 이력 구성 (토큰 예산 밖의 오래된 대화는 누적 요약으로)
+            history = await self.history.build(conversation)
+            messages = history.messages
+            system_prompt = self._build_system_prompt(conversation, history.summary)
 
             # 도구 스키마
             tools = self.tools.get_all_schemas()
@@ -97,44 +107,11 @@ class MeetingAgent:
                 logger.info(f"Tool calls: {[tc['name'] for tc in tool_calls]}")
 
                 # assistant 메시지 추가 (tool_use 포함)
-                assistant_content = []
-                if response.get("content"):
-                    assistant_content.append({
-                        "type": "text",
-                        "text": response["content"],
-                    })
-                for tc in tool_calls:
-                    assistant_content.append({
-                        "type": "tool_use",
-                        "id": tc["id"],
-                        "name": tc["name"],
-                        "input": tc["arguments"],
-                    })
-
-                messages.append({
-                    "role": "assistant",
-                    "content": assistant_content,
-                })
-
-                # 각 도구 실행 및 결과 수집
-                tool_results = []
-                for tc in tool_calls:
-                    result = await self.tools.execute(tc["name"], tc["arguments"])
-
-                    # 컨텍스트 업데이트
-                    self._update_context_from_result(ctx, tc["name"], result.data)
-
-                    tool_results.append({
-                        "type": "tool_result",
-                        "tool_use_id": tc["id"],
-                        "content": result.to_string(),
-                    })
+                messages.append(self._assistant_message(response))
 
                 # 도구 결과를 user 메시지로 추가
-                messages.append({
-                    "role": "user",
-                    "content": tool_results,
-                })
+                results = await self._run_tools(ctx, tool_calls)
+                messages.append(self._tool_results_message(tool_calls, results))
 
             # 최대 반복 도달
             logger.warning("Max tool iterations reached")
@@ -207,34 +184,131 @@ class MeetingAgent:
             dict: 스트리밍 청크 (type: content/tool_call)
         """
         try:
-            # 시스템 프롬프트 생성
-            system_prompt = self.prompt_manager.get_system_prompt()
-
-            # 컨텍스트 요약 추가
+            # 대화 컨텍스트
             ctx = ConversationContext(conversation)
-            context_summary = self.prompt_manager.get_context_summary(conversation.context)
-            if context_summary:
-                system_prompt += f"\n\n{context_summary}"
 
-            # 대화 이력 구성
-            messages = conversation.get_messages_for_llm()
+            # 대화 이력 구성 (토큰 예산 밖의 오래된 대화는 누적 요약으로)
+            history = await self.history.build(conversation)
+            messages = history.messages
+            system_prompt = self._build_system_prompt(conversation, history.summary)
 
             # 도구 스키마
             tools = self.tools.get_all_schemas()
 
-            # 첫 응답: 진짜 스트리밍 시도
-            # 도구 호출 없는 단순 대화는 바로 스트리밍
-            async for chunk in self.llm.chat_stream(
-                messages=messages,
-                tools=tools,
-                system_prompt=system_prompt,
-            ):
-                yield {"type": "content", "text": chunk}
+            # LLM 스트리밍 및 도구 실행 루프
+            # 텍스트는 받는 즉시 전달하고, 도구 호출이 있으면 실행 후 다음 응답을 이어서 스트리밍
+            for _ in range(self.max_tool_iterations):
+                response = None
+                async for event in self.llm.chat_stream_events(
+                    messages=messages,
+                    tools=tools,
+                    system_prompt=system_prompt,
+                ):
+                    if event["type"] == "text":
+                        yield {"type": "content", "text": event["text"]}
+                    elif event["type"] == "message":
+                        response = event
+
+                if not response or not response.get("tool_calls"):
+                    return
+
+                tool_calls = response["tool_calls"]
+                logger.info(f"Tool calls (stream): {[tc['name'] for tc in tool_calls]}")
+                messages.append(self._assistant_message(response))
+
+                for tc in tool_calls:
+                    yield {"type": "tool_call", "name": tc["name"], "status": "start"}
+
+                results = await self._run_tools(ctx, tool_calls)
+
+                for tc, result in zip(tool_calls, results):
+                    yield {
+                        "type": "tool_call",
+                        "name": tc["name"],
+                        "status": "success" if result.success else "error",
+                    }
+
+                messages.append(self._tool_results_message(tool_calls, results))
+
+            logger.warning("Max tool iterations reached (stream)")
+            yield {"type": "content", "text": "처리 중 문제가 발생했습니다. 다시 시도해 주세요."}
 
         except Exception as e:
             logger.error(f"Agent streaming error: {str(e)}", exc_info=True)
             yield {"type": "content", "text": "죄송합니다, 요청을 처리하는 중 오류가 발생했습니다."}
 
+    def _build_system_prompt(self, conversation: Conversation, history_summary: str = "") -> SystemPrompt:
+        """시스템 프롬프트 (고정 부분은 캐시 대상, 날짜/이전 대화 요약/컨텍스트 요약은 동적 부분)"""
+        dynamic = self.prompt_manager.get_datetime_prompt()
+        if history_summary:
+            dynamic += f"\n\n## 이전 대화 요약\n{history_summary}"
+        context_summary = self.prompt_manager.get_context_summary(conversation.context)
+        if context_summary:
+            dynamic += f"\n\n{context_summary}"
+        return SystemPrompt(self.prompt_manager.get_static_prompt(), dynamic)
+
+    @staticmethod
+    def _assistant_message(response: dict) -> dict:
+        """LLM 응답 → assistant 메시지 (tool_use 포함)"""
+        assistant_content = []
+        if response.get("content"):
+            assistant_content.append({
+                "type": "text",
+                "text": response["content"],
+            })
+        for tc in response["tool_calls"]:
+            assistant_content.append({
+                "type": "tool_use",
+                "id": tc["id"],
+                "name": tc["name"],
+                "input": tc["arguments"],
+            })
+        return {"role": "assistant", "content": assistant_content}
+
+    async def _run_tools(
+        self,
+        ctx: ConversationContext,
+        tool_calls: list[dict],
+    ) -> list[ToolResult]:
+        """도구 동시 실행 후 호출 순서대로 컨텍스트 업데이트"""
+        results = await self.tools.execute_many(
+            tool_calls,
+            concurrency=settings.agent_tool_concurrency,
+        )
+        # 완료 순서와 무관하게 호출 순서대로 적용
+        for tc, result in zip(tool_calls, results):
+            self._update_context_from_result(ctx, tc["name"], result.data)
+        return results
+
+    @staticmethod
+    def _tool_results_message(tool_calls: list[dict], results: list[ToolResult]) -> dict:
+        """도구 결과 → user 메시지 (tool_use_id 순서 유지)"""
+        return {
+            "role": "user",
+            "content": [
+                {
+                    "type": "tool_result",
+                    "tool_use_id": tc["id"],
+                    "content": result.to_string(),
+                }
+                for tc, result in zip(tool_calls, results)
+            ],
+        }
+
+    @staticmethod
+    def _prefetch_schedules(ctx: ConversationContext) -> None:
+        """
+        확정된 참석자의 오늘 ~ 다음 주 금요일 일정을 백그라운드로 선조회
+
+        다음 LLM 왕복 동안 일정 캐시를 데워 find_common_free_slots 조회가 바로 끝나게 합니다.
+        """
+        prefetcher = get_schedule_prefetcher()
+        if prefetcher is None:
+            return
+        employee_ids = [e["id"] for e in ctx.selected_employees if e.get("id")]
+        if employee_ids:
+            prefetcher.prefetch(employee_ids, owner=ctx.conversation.id)
+
     def _update_context_from_result(
         self,
         ctx: ConversationContext,
@@ -253,6 +327,7 @@ class MeetingAgent:
                 if employees[0] not in current:
                     current.append(employees[0])
                     ctx.selected_employees = current
+                    self._prefetch_schedules(ctx)
             elif len(employees) > 1:
                 # 다중 매칭 - 확인 대기
                 ctx.pending_employees = employees
@@ -260,6 +335,7 @@ class MeetingAgent:
         elif tool_name == "get_team_members":
             members = result_data.get("members", [])
             ctx.selected_employees = members
+            self._prefetch_schedules(ctx)
 
         elif tool_name == "find_common_free_slots":
             slots = result_data.get("free_slots", [])
@@ -276,6 +352,9 @@ class MeetingAgent:
 
         elif tool_name == "create_meeting":
             # 회의 생성 완료 - 컨텍스트 정리
+            prefetcher = get_schedule_prefetcher()
+            if prefetcher is not None:
+                prefetcher.cancel(ctx.conversation.id)
             ctx.awaiting_confirmation = False
             ctx.available_slots = []
             ctx.available_rooms = []
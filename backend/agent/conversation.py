@@ -1,68 +1,527 @@
-"""대화 관리"""
+"""대화 관리
 
-import json
+대화는 Redis에 저장해 여러 워커/서버가 같은 대화를 이어서 처리할 수 있게 합니다.
+Redis에 연결할 수 없거나 요청 중 오류가 나면 프로세스 내 저장소로 대신 처리하며,
+프로세스 내 저장소는 최대 대화 수와 TTL로 제한한 LRU입니다.
+
+Redis에는 대화를 세 키로 나눠 저장하고, 저장할 때는 지난 저장 이후 바뀐 부분만 씁니다.
+
+- conv:{id}:meta      해시 (사용자, 상태, 요약 등 메시지/컨텍스트 외 필드)
+- conv:{id}:messages  리스트 (메시지, 새 메시지만 RPUSH)
+- conv:{id}:context   해시 (컨텍스트 키별 값, 바뀐 키만 HSET/HDEL)
+
+메시지와 컨텍스트 값은 ConversationCodec으로 직렬화하고(conversation_codec 참고),
+메시지는 읽을 때 바로 Message로 만들지 않고 처음 접근할 때 디코딩합니다.
+
+이전 버전의 conv:{id} (대화 전체 JSON) 키는 조회 시 또는 migrate_legacy()로 옮깁니다.
+
+같은 대화의 턴은 lock()으로 직렬화합니다. 프로세스 안에서는 asyncio.Lock, 워커/서버 간에는
+Redis 임대(conv:{id}:lock, 턴이 끝날 때까지 주기적으로 연장)를 잡으며,
+정해진 시간 안에 잡지 못하거나 이미 기다리는 요청이 많으면 바로 ConversationBusy를 냅니다.
+"""
+
+import asyncio
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import nullcontext
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Optional, Union
 import redis.asyncio as redis
 
 from config import get_settings
 from models.chat import Conversation, Message, ChatStatus
+from .conversation_codec import ConversationCodec, LazyMessageList, get_conversation_codec
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 settings = get_settings()
 
 
+def _text(value: Union[bytes, str]) -> str:
+    """Redis 응답(bytes)을 문자열로"""
+    return value.decode() if isinstance(value, bytes) else value
+
+
+class ConversationBusy(Exception):
+    """다른 요청이 같은 대화를 처리 중 (대기 시간 또는 대기 요청 수 초과)"""
+
+
+# 내 임대일 때만 삭제/연장 (다른 워커가 잡은 임대를 건드리지 않도록)
+_RELEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+_RENEW_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("pexpire", KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+
+class _LocalLock:
+    """대화별 프로세스 내 잠금 (기다리는 요청이 없으면 제거)"""
+
+    __slots__ = ("lock", "users")
+
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        self.users = 0  # 잡고 있거나 기다리는 요청 수
+
+
+class ConversationLock:
+    """대화 한 턴 동안의 잠금 (async with로 사용)"""
+
+    def __init__(self, manager: "ConversationManager", conversation_id: str):
+        self.manager = manager
+        self.conversation_id = conversation_id
+        self.token = uuid.uuid4().hex
+        self._local: Optional[_LocalLock] = None
+        self._lease_key: Optional[str] = None
+        self._renew_task: Optional[asyncio.Task] = None
+
+    async def acquire(self) -> None:
+        """
+        잠금 획득
+
+        Raises:
+            ConversationBusy: 대기 시간 안에 잡지 못했거나 대기 요청 수 초과
+        """
+        manager = self.manager
+        started = time.monotonic()
+        deadline = started + manager.lock_wait
+        local = manager._local_locks.get(self.conversation_id)
+        if local is None:
+            local = manager._local_locks[self.conversation_id] = _LocalLock()
+        if local.users > manager.lock_max_waiters:
+            manager._lock_rejected()
+            raise ConversationBusy(self.conversation_id)
+
+        local.users += 1
+        self._local = local
+        contended = local.users > 1
+        try:
+            try:
+                await asyncio.wait_for(local.lock.acquire(), max(deadline - time.monotonic(), 0.001))
+            except asyncio.TimeoutError:
+                manager._lock_rejected()
+                raise ConversationBusy(self.conversation_id) from None
+
+            try:
+                contended = await self._acquire_lease(deadline) or contended
+            except BaseException:
+                local.lock.release()
+                raise
+        except BaseException:
+            self._release_local()
+            raise
+
+        manager._lock_acquired(time.monotonic() - started, contended)
+
+    async def _acquire_lease(self, deadline: float) -> bool:
+        """Redis 임대 획득 (Redis를 쓰지 않거나 오류면 프로세스 내 잠금만), 반환: 기다렸는지"""
+        manager = self.manager
+        if not (manager._use_redis and manager._redis_client):
+            return False
+
+        key = manager._key(self.conversation_id, "lock")
+        lease_ms = int(manager.lock_lease * 1000)
+        delay = 0.01
+        contended = False
+        try:
+            while not await manager._redis_client.set(key, self.token, nx=True, px=lease_ms):
+                contended = True
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    manager._lock_rejected()
+                    raise ConversationBusy(self.conversation_id)
+                await asyncio.sleep(min(delay, remaining))
+                delay = min(delay * 2, 0.2)
+        except redis.RedisError as e:
+            manager._redis_failed("lock", e)
+            return contended
+
+        self._lease_key = key
+        self._renew_task = asyncio.create_task(self._renew(key, lease_ms))
+        return contended
+
+    async def _renew(self, key: str, lease_ms: int) -> None:
+        """턴이 끝날 때까지 임대 연장"""
+        while True:
+            await asyncio.sleep(lease_ms / 3000)
+            try:
+                renewed = await self.manager._redis_client.eval(_RENEW_SCRIPT, 1, key, self.token, lease_ms)
+            except redis.RedisError as e:
+                self.manager._redis_failed("lock renewal", e)
+                continue
+            if not renewed:
+                self.manager.lock_lost_total += 1
+                logger.warning(f"Conversation lease lost: {self.conversation_id}")
+                return
+
+    def _release_local(self) -> None:
+        local, self._local = self._local, None
+        if local is None:
+            return
+        local.users -= 1
+        if local.users == 0 and self.manager._local_locks.get(self.conversation_id) is local:
+            del self.manager._local_locks[self.conversation_id]
+
+    async def release(self) -> None:
+        """
+        잠금 해제 (여러 번 불러도 안전)
+
+        해제 도중 취소되어도 프로세스 내 잠금은 풀고, Redis 임대 삭제는 끝까지 진행합니다.
+        """
+        if self._renew_task:
+            self._renew_task.cancel()
+            self._renew_task = None
+        lease_key, self._lease_key = self._lease_key, None
+        try:
+            if lease_key and self.manager._redis_client:
+                task = asyncio.create_task(self._unlock(lease_key))
+                self.manager._unlock_tasks.add(task)
+                task.add_done_callback(self.manager._unlock_tasks.discard)
+                await asyncio.shield(task)
+        finally:
+            if self._local:
+                self._local.lock.release()
+                self._release_local()
+
+    async def _unlock(self, lease_key: str) -> None:
+        try:
+            await self.manager._redis_client.eval(_RELEASE_SCRIPT, 1, lease_key, self.token)
+        except redis.RedisError as e:
+            self.manager._redis_failed("unlock", e)  # 임대 만료로 풀림
+
+    async def __aenter__(self) -> "ConversationLock":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.release()
+
+
 class ConversationManager:
     """대화 세션 관리자"""
 
-    def __init__(self):
-        self._local_store: dict[str, Conversation] = {}
+    KEY_PREFIX = "conv"
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        ttl_seconds: int = 86400,
+        local_max_entries: int = 1000,
+        local_ttl_seconds: Optional[int] = None,
+        max_connections: int = 50,
+        socket_timeout: float = 1.0,
+        lock_wait: float = 5.0,
+        lock_max_waiters: int = 1,
+        lock_lease: float = 30.0,
+        codec: Optional[ConversationCodec] = None,
+    ):
+        """
+        Args:
+            redis_url: Redis 주소 (None이면 프로세스 내 저장소만 사용)
+            ttl_seconds: 마지막 조회/저장 후 대화 유지 시간 (초)
+            local_max_entries: 프로세스 내 저장소 최대 대화 수 (넘으면 오래 안 쓴 대화부터 제거)
+            local_ttl_seconds: 프로세스 내 저장소 대화 유지 시간 (초, 기본: ttl_seconds)
+            max_connections: Redis 커넥션 풀 최대 연결 수
+            socket_timeout: Redis 연결/명령 타임아웃 (초, 넘으면 프로세스 내 저장소로 처리)
+            lock_wait: 턴 잠금 최대 대기 시간 (초, 넘으면 ConversationBusy)
+            lock_max_waiters: 대화별 최대 대기 요청 수 (넘으면 바로 ConversationBusy)
+            lock_lease: Redis 임대 유지 시간 (초, 턴 동안 주기적으로 연장)
+            codec: 메시지/컨텍스트 직렬화 코덱 (기본: 설정값)
+        """
+        self.redis_url = redis_url
+        self.ttl_seconds = ttl_seconds
+        self.local_max_entries = local_max_entries
+        self.local_ttl_seconds = local_ttl_seconds or ttl_seconds
+        self.max_connections = max_connections
+        self.socket_timeout = socket_timeout
+        self.lock_wait = lock_wait
+        self.lock_max_waiters = lock_max_waiters
+        self.lock_lease = lock_lease
+        self.codec = codec or get_conversation_codec()
+        self._local_locks: dict[str, _LocalLock] = {}
+        self._unlock_tasks: set[asyncio.Task] = set()  # 취소된 해제 요청의 Redis 임대 삭제
+        self._local_store: OrderedDict[str, tuple[float, Conversation]] = OrderedDict()
         self._redis_client: Optional[redis.Redis] = None
         self._use_redis = False
 
-    async def connect_redis(self):
-        """Redis 연결"""
+        self.hits = 0
+        self.misses = 0
+        self.redis_errors = 0
+        self.evicted_total = 0
+        self.written_messages = 0  # Redis에 쓴 메시지 수
+        self.written_context_fields = 0  # Redis에 쓰거나 지운 컨텍스트 키 수
+        self.migrated_total = 0
+        self.lock_acquired_total = 0
+        self.lock_contended_total = 0  # 다른 요청이 끝나길 기다린 뒤 획득
+        self.lock_rejected_total = 0
+        self.lock_lost_total = 0  # 턴 도중 Redis 임대가 만료됨
+        self.lock_wait_seconds_total = 0.0
+        self.lock_wait_seconds_max = 0.0
+
+    @property
+    def backend(self) -> str:
+        """현재 사용 중인 저장소 (redis, local)"""
+        return "redis" if self._use_redis else "local"
+
+    def _key(self, conversation_id: str, part: Optional[str] = None) -> str:
+        key = f"{self.KEY_PREFIX}:{conversation_id}"
+        return f"{key}:{part}" if part else key
+
+    def _keys(self, conversation_id: str) -> tuple[str, str, str]:
+        """(meta, messages, context) 키"""
+        return (
+            self._key(conversation_id, "meta"),
+            self._key(conversation_id, "messages"),
+            self._key(conversation_id, "context"),
+        )
+
+    async def connect_redis(self) -> bool:
+        """
+        Redis 연결 (커넥션 풀)
+
+        Returns:
+            연결 성공 여부 (실패하면 프로세스 내 저장소 사용)
+        """
+        if not self.redis_url:
+            return False
+
         try:
-            self._redis_client = redis.from_url(
-                settings.redis_url,
-                encoding="utf-8",
-                decode_responses=True,
+            pool = redis.ConnectionPool.from_url(
+                self.redis_url,
+                max_connections=self.max_connections,
+                socket_timeout=self.socket_timeout,
+                socket_connect_timeout=self.socket_timeout,
             )
+            self._redis_client = redis.Redis(connection_pool=pool)
             await self._redis_client.ping()
             self._use_redis = True
             logger.info("Redis connected for conversation storage")
         except Exception as e:
             logger.warning(f"Redis connection failed, using local store: {e}")
-            self._use_redis = False
+            await self.close()
+        return self._use_redis
+
+    async def close(self) -> None:
+        """Redis 커넥션 풀 종료"""
+        client, self._redis_client = self._redis_client, None
+        self._use_redis = False
+        if client is not None:
+            await client.aclose()
+
+    def _redis_failed(self, operation: str, error: Exception) -> None:
+        self.redis_errors += 1
+        logger.warning(f"Conversation {operation} failed on Redis, using local store: {error}")
+
+    def lock(self, conversation_id: str) -> ConversationLock:
+        """
+        대화 턴 잠금 (async with manager.lock(id): ...)
+
+        같은 대화의 요청만 서로 기다리고, 다른 대화는 영향을 받지 않습니다.
+        """
+        return ConversationLock(self, conversation_id)
+
+    def _lock_acquired(self, waited: float, contended: bool) -> None:
+        self.lock_acquired_total += 1
+        if contended:
+            self.lock_contended_total += 1
+        self.lock_wait_seconds_total += waited
+        self.lock_wait_seconds_max = max(self.lock_wait_seconds_max, waited)
+
+    def _lock_rejected(self) -> None:
+        self.lock_rejected_total += 1
+
+    def _local_get(self, conversation_id: str) -> Optional[Conversation]:
+        entry = self._local_store.get(conversation_id)
+        if entry is None:
+            return None
+        expires_at, conversation = entry
+        if expires_at <= time.monotonic():
+            del self._local_store[conversation_id]
+            return None
+        self._local_store.move_to_end(conversation_id)
+        return conversation
+
+    def _local_set(self, conversation: Conversation) -> None:
+        self._local_store[conversation.id] = (time.monotonic() + self.local_ttl_seconds, conversation)
+        self._local_store.move_to_end(conversation.id)
+        while len(self._local_store) > self.local_max_entries:
+            self._local_store.popitem(last=False)
+            self.evicted_total += 1
+
+    async def _read_redis(self, conversation_id: str) -> Optional[Conversation]:
+        """나눠 저장한 대화를 한 번의 왕복으로 읽어 조립 (만료 시간 연장 포함)"""
+        keys = self._keys(conversation_id)
+        async with self._redis_client.pipeline(transaction=False) as pipe:
+            pipe.hgetall(keys[0])
+            pipe.lrange(keys[1], 0, -1)
+            pipe.hgetall(keys[2])
+            for key in keys:
+                pipe.expire(key, self.ttl_seconds)
+            meta, messages, context = (await pipe.execute())[:3]
+
+        if not meta:
+            conversation = await self._migrate_one(conversation_id)
+            if conversation is None and await self._redis_client.exists(keys[0]):
+                return await self._read_redis(conversation_id)  # 다른 워커가 먼저 옮김
+            return conversation
+
+        context = {_text(field): value for field, value in context.items()}
+        conversation = Conversation.model_validate({
+            **{_text(field): _text(value) for field, value in meta.items()},
+            "context": {field: self.codec.decode(value) for field, value in context.items()},
+        })
+        conversation.messages = LazyMessageList(messages, self.codec.decode_message)
+        conversation._stored_messages = len(messages)
+        conversation._stored_context = context
+        return conversation
+
+    async def _write_redis(self, conversation: Conversation, pipe: Optional[Any] = None) -> None:
+        """
+        지난 저장 이후 바뀐 부분만 저장 (MULTI)
+
+        처음 저장하거나 메시지가 줄었으면(이력 재작성) 전체를 다시 씁니다.
+
+        Args:
+            conversation: 저장할 대화
+            pipe: WATCH 후 MULTI를 시작한 파이프라인 (없으면 새로 만듦)
+
+        Raises:
+            redis.WatchError: pipe가 WATCH한 키를 다른 클라이언트가 바꿈
+        """
+        meta_key, messages_key, context_key = self._keys(conversation.id)
+        context = {field: self.codec.encode(value) for field, value in conversation.context.items()}
+        stored_context = conversation._stored_context
+        rewrite = stored_context is None or len(conversation.messages) < conversation._stored_messages
+        if rewrite:
+            stored_context = {}
+            new_messages = conversation.messages
+        else:
+            new_messages = conversation.messages[conversation._stored_messages:]
+        changed = {field: value for field, value in context.items() if stored_context.get(field) != value}
+        removed = [field for field in stored_context if field not in context]
+        meta = conversation.model_dump(mode="json", exclude={"messages", "context"})
+
+        async with nullcontext(pipe) if pipe is not None else self._redis_client.pipeline(transaction=True) as pipe:
+            if rewrite:
+                pipe.delete(messages_key, context_key, self._key(conversation.id))
+            if new_messages:
+                pipe.rpush(messages_key, *[self.codec.encode_message(message) for message in new_messages])
+            if changed:
+                pipe.hset(context_key, mapping=changed)
+            if removed:
+                pipe.hdel(context_key, *removed)
+            pipe.hset(meta_key, mapping=meta)
+            for key in (meta_key, messages_key, context_key):
+                pipe.expire(key, self.ttl_seconds)
+            await pipe.execute()
+
+        conversation._stored_messages = len(conversation.messages)
+        conversation._stored_context = context
+        self.written_messages += len(new_messages)
+        self.written_context_fields += len(changed) + len(removed)
+
+    async def _migrate_one(self, conversation_id: str) -> Optional[Conversation]:
+        """
+        이전 형식(대화 전체 JSON) 키가 있으면 나눠 저장하는 형식으로 옮김
+
+        이전 형식 키와 meta 키를 WATCH하므로, 읽은 뒤 다른 워커가 먼저 옮기고
+        턴을 이어 저장했다면 오래된 JSON으로 덮어쓰지 않고 None을 반환합니다.
+        """
+        legacy_key, meta_key = self._key(conversation_id), self._keys(conversation_id)[0]
+        async with self._redis_client.pipeline(transaction=True) as pipe:
+            await pipe.watch(legacy_key, meta_key)
+            data = await pipe.get(legacy_key)
+            if not data or await pipe.exists(meta_key):
+                return None
+            conversation = Conversation.model_validate_json(data)
+            pipe.multi()
+            try:
+                await self._write_redis(conversation, pipe)
+            except redis.WatchError:
+                return None
+        self.migrated_total += 1
+        return conversation
+
+    async def migrate_legacy(self, batch_size: int = 100) -> int:
+        """
+        이전 형식(conv:{id} 문자열) 키를 모두 옮김 (여러 워커가 동시에 실행해도 안전)
+
+        Args:
+            batch_size: SCAN 한 번에 훑을 키 수
+
+        Returns:
+            옮긴 대화 수
+        """
+        if not (self._use_redis and self._redis_client):
+            return 0
+
+        migrated = 0
+        async for key in self._redis_client.scan_iter(match=f"{self.KEY_PREFIX}:*", count=batch_size):
+            conversation_id = _text(key)[len(self.KEY_PREFIX) + 1:]
+            if ":" in conversation_id:
+                continue
+            try:
+                if await self._migrate_one(conversation_id):
+                    migrated += 1
+            except (redis.RedisError, ValueError) as e:
+                logger.warning(f"Conversation migration failed ({conversation_id}): {e}")
+        if migrated:
+            logger.info(f"Conversations migrated to delta layout: {migrated}")
+        return migrated
 
     async def get(self, conversation_id: str) -> Optional[Conversation]:
         """대화 조회"""
+        conversation = None
         if self._use_redis and self._redis_client:
-            data = await self._redis_client.get(f"conv:{conversation_id}")
-            if data:
-                return Conversation.model_validate_json(data)
-        return self._local_store.get(conversation_id)
+            try:
+                conversation = await self._read_redis(conversation_id)
+            except redis.RedisError as e:
+                self._redis_failed("read", e)
+                conversation = self._local_get(conversation_id)
+        else:
+            conversation = self._local_get(conversation_id)
+
+        if conversation is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return conversation
 
     async def save(self, conversation: Conversation):
-        """대화 저장"""
+        """대화 저장 (Redis는 바뀐 부분만)"""
         conversation.updated_at = datetime.now()
 
         if self._use_redis and self._redis_client:
-            await self._redis_client.set(
-                f"conv:{conversation.id}",
-                conversation.model_dump_json(),
-                ex=86400,  # 24시간 만료
-            )
-        else:
-            self._local_store[conversation.id] = conversation
-
-    async def delete(self, conversation_id: str):
-        """대화 삭제"""
+            try:
+                await self._write_redis(conversation)
+                return
+            except redis.RedisError as e:
+                self._redis_failed("write", e)
+        self._local_set(conversation)
+
+    async def delete(self, conversation_id: str) -> bool:
+        """
+        대화 삭제
+
+        Returns:
+            삭제한 대화가 있었는지 여부
+        """
+        deleted = self._local_store.pop(conversation_id, None) is not None
         if self._use_redis and self._redis_client:
-            await self._redis_client.delete(f"conv:{conversation_id}")
-        elif conversation_id in self._local_store:
-            del self._local_store[conversation_id]
+            try:
+                removed = await self._redis_client.delete(*self._keys(conversation_id), self._key(conversation_id))
+                deleted = bool(removed) or deleted
+            except redis.RedisError as e:
+                self._redis_failed("delete", e)
+        return deleted
 
     async def update_context(self, conversation_id: str, key: str, value: Any):
         """대화 컨텍스트 업데이트"""
@@ -78,6 +537,58 @@ class ConversationManager:
             return conversation.context.get(key)
         return None
 
+    def stats(self) -> dict:
+        """저장소 지표"""
+        return {
+            "backend": self.backend,
+            "codec": self.codec.name,
+            "hits": self.hits,
+            "misses": self.misses,
+            "redis_errors": self.redis_errors,
+            "redis_max_connections": self.max_connections,
+            "local_entries": len(self._local_store),
+            "local_max_entries": self.local_max_entries,
+            "evicted_total": self.evicted_total,
+            "written_messages": self.written_messages,
+            "written_context_fields": self.written_context_fields,
+            "migrated_total": self.migrated_total,
+            "locks": {
+                "held": sum(local.lock.locked() for local in self._local_locks.values()),
+                "waiting": sum(
+                    local.users - local.lock.locked() for local in self._local_locks.values()
+                ),
+                "acquired_total": self.lock_acquired_total,
+                "contended_total": self.lock_contended_total,
+                "rejected_total": self.lock_rejected_total,
+                "lost_total": self.lock_lost_total,
+                "wait_seconds_avg": round(
+                    self.lock_wait_seconds_total / self.lock_acquired_total, 4
+                ) if self.lock_acquired_total else 0.0,
+                "wait_seconds_max": round(self.lock_wait_seconds_max, 4),
+            },
+        }
+
+
+_conversation_manager: Optional[ConversationManager] = None
+
+
+def get_conversation_manager() -> ConversationManager:
+    """설정에 따른 프로세스 공용 대화 관리자 반환 (Redis 연결은 connect_redis로)"""
+    global _conversation_manager
+    if _conversation_manager is None:
+        _conversation_manager = ConversationManager(
+            redis_url=settings.redis_url if settings.conversation_backend == "redis" else None,
+            ttl_seconds=settings.conversation_ttl,
+            local_max_entries=settings.conversation_local_max_entries,
+            local_ttl_seconds=settings.conversation_local_ttl,
+            max_connections=settings.redis_max_connections,
+            socket_timeout=settings.redis_socket_timeout,
+            lock_wait=settings.conversation_lock_wait,
+            lock_max_waiters=settings.conversation_lock_max_waiters,
+            lock_lease=settings.conversation_lock_lease,
+        )
+    return _conversation_manager
+
 
 class ConversationContext:
     """대화 컨텍스트 헬퍼"""
@@ -0,0 +1,252 @@
+"""대화 저장 코덱
+
+ConversationManager가 Redis에 쓰는 메시지/컨텍스트 값의 직렬화 방식입니다.
+
+모든 값은 3바이트 헤더(스키마 버전, 형식, 플래그) 뒤에 본문을 붙여 저장하므로,
+코덱 설정을 바꿔도 이전에 저장한 값을 그대로 읽을 수 있습니다.
+헤더가 없는 값(JSON 텍스트)은 스키마 0(model_dump_json 시절 형식)으로 읽습니다.
+
+스키마 1은 다음처럼 줄여 저장합니다.
+
+- 메시지: [역할, 내용, 시각(1970-01-01 기준 마이크로초), 메타데이터] 배열
+- 키 구성이 같은 dict 목록인 컨텍스트 값(available_slots, available_rooms 등): 키 목록 + 값 행 목록
+
+본문 형식은 json(표준 라이브러리 또는 orjson으로 처리)과 msgpack 중에서 고르고,
+zstd(zstandard 패키지 필요)로 일정 크기 이상의 값을 압축할 수 있습니다.
+"""
+
+import json
+from datetime import datetime, timedelta
+from typing import Any, Callable, Optional, Union
+
+from config import get_settings
+from models.chat import Message
+from utils.logger import get_logger
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+SCHEMA_VERSION = 1
+
+FORMAT_JSON = 1
+FORMAT_MSGPACK = 2
+
+FLAG_ZSTD = 0x01
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_COLUMNS = "\x00c"  # 키 목록
+_ROWS = "\x00r"  # 값 행 목록
+
+Payload = Union[bytes, str]
+
+
+def _json_dumps(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str).encode()
+
+
+def _orjson_dumps(value: Any) -> bytes:
+    return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _msgpack_dumps(value: Any) -> bytes:
+    return msgpack.packb(value, default=str, use_bin_type=True)
+
+
+def _msgpack_loads(data: bytes) -> Any:
+    return msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+
+def _compact(value: Any) -> Any:
+    """키 구성이 같은 dict 목록을 키 목록 + 값 행으로"""
+    if isinstance(value, (list, tuple)) and len(value) >= 2 and isinstance(value[0], dict):
+        columns = tuple(value[0])
+        if all(isinstance(item, dict) and tuple(item) == columns for item in value):
+            return {_COLUMNS: columns, _ROWS: [tuple(item.values()) for item in value]}
+    return value
+
+
+def _expand(value: Any) -> Any:
+    """_compact의 역변환"""
+    if isinstance(value, dict) and _COLUMNS in value and _ROWS in value and len(value) == 2:
+        columns = value[_COLUMNS]
+        return [dict(zip(columns, row)) for row in value[_ROWS]]
+    return value
+
+
+def _pack_time(value: datetime) -> Union[int, str]:
+    if value.tzinfo is not None:
+        return value.isoformat()
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _unpack_time(value: Union[int, str]) -> datetime:
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return _EPOCH + _MICROSECOND * value
+
+
+class ConversationCodec:
+    """메시지/컨텍스트 값 직렬화 (버전 헤더 + 형식 + 선택적 zstd 압축)"""
+
+    def __init__(
+        self,
+        format: str = "orjson",
+        compression: Optional[str] = None,
+        compress_min_bytes: int = 1024,
+        compression_level: int = 3,
+    ):
+        """
+        Args:
+            format: 본문 형식 (json, orjson, msgpack), 패키지가 없으면 json (읽기는 형식과 무관하게 가능)
+            compression: 압축 방식 (None, zstd), 패키지가 없으면 압축하지 않음
+            compress_min_bytes: 이 크기 이상의 본문만 압축
+            compression_level: zstd 압축 수준
+        """
+        if format == "msgpack" and msgpack is None:
+            logger.warning("msgpack package not installed, falling back to JSON conversation codec")
+            format = "orjson"
+        if format == "orjson" and orjson is None:
+            format = "json"
+        if compression == "zstd" and zstandard is None:
+            logger.warning("zstandard package not installed, conversation payloads are not compressed")
+            compression = None
+
+        self.format = format
+        self.compression = compression if compression != "none" else None
+        self.compress_min_bytes = compress_min_bytes
+        self._format_id = FORMAT_MSGPACK if format == "msgpack" else FORMAT_JSON
+        self._dumps: Callable[[Any], bytes] = {
+            "msgpack": _msgpack_dumps,
+            "orjson": _orjson_dumps,
+        }.get(format, _json_dumps)
+        self._json_loads: Callable[[bytes], Any] = orjson.loads if orjson is not None else json.loads
+        self._compressor = zstandard.ZstdCompressor(level=compression_level) if self.compression else None
+        self._decompressor = zstandard.ZstdDecompressor() if zstandard is not None else None
+
+    @property
+    def name(self) -> str:
+        return f"{self.format}+{self.compression}" if self.compression else self.format
+
+    def _encode(self, value: Any) -> bytes:
+        body = self._dumps(value)
+        flags = 0
+        if self._compressor is not None and len(body) >= self.compress_min_bytes:
+            body = self._compressor.compress(body)
+            flags |= FLAG_ZSTD
+        return bytes((SCHEMA_VERSION, self._format_id, flags)) + body
+
+    def _decode(self, payload: Payload) -> tuple[int, Any]:
+        """(스키마 버전, 값)"""
+        if isinstance(payload, str):
+            payload = payload.encode()
+        if not payload or payload[0] != SCHEMA_VERSION:
+            return 0, self._json_loads(payload)
+
+        format_id, flags, body = payload[1], payload[2], payload[3:]
+        if flags & FLAG_ZSTD:
+            if self._decompressor is None:
+                raise ValueError("zstd-compressed conversation payload but zstandard is not installed")
+            body = self._decompressor.decompress(body)
+        if format_id == FORMAT_MSGPACK:
+            if msgpack is None:
+                raise ValueError("msgpack conversation payload but msgpack is not installed")
+            return SCHEMA_VERSION, _msgpack_loads(body)
+        return SCHEMA_VERSION, self._json_loads(body)
+
+    def encode(self, value: Any) -> bytes:
+        """컨텍스트 값 등 임의 값 인코딩"""
+        return self._encode(_compact(value))
+
+    def decode(self, payload: Payload) -> Any:
+        """encode의 역변환 (스키마 0 JSON 텍스트도 읽음)"""
+        version, value = self._decode(payload)
+        return _expand(value) if version else value
+
+    def encode_message(self, message: Message) -> bytes:
+        """메시지 인코딩"""
+        return self._encode([
+            message.role,
+            message.content,
+            _pack_time(message.timestamp),
+            message.metadata,
+        ])
+
+    def decode_message(self, payload: Payload) -> Message:
+        """메시지 디코딩 (스키마 0은 Message JSON)"""
+        version, value = self._decode(payload)
+        if not version:
+            return Message.model_validate(value)
+        role, content, timestamp, metadata = value
+        return Message(role=role, content=content, timestamp=_unpack_time(timestamp), metadata=metadata)
+
+
+class LazyMessageList(list):
+    """
+    저장소에서 읽은 메시지 목록 (원소에 처음 접근할 때 디코딩)
+
+    길이 확인과 append는 디코딩하지 않으므로, 컨텍스트만 쓰는 턴이나
+    요약으로 접힌 앞쪽 메시지는 Message로 만들지 않습니다.
+    """
+
+    def __init__(self, payloads: list[Payload], decode: Callable[[Payload], Message]):
+        super().__init__(payloads)
+        self._decode_message = decode
+
+    def _load(self, index: int) -> Message:
+        item = list.__getitem__(self, index)
+        if isinstance(item, Message):
+            return item
+        message = self._decode_message(item)
+        list.__setitem__(self, index, message)
+        return message
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._load(i) for i in range(*index.indices(len(self)))]
+        return self._load(index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self._load(index)
+
+    def __reversed__(self):
+        for index in reversed(range(len(self))):
+            yield self._load(index)
+
+    @property
+    def decoded_count(self) -> int:
+        """지금까지 디코딩한 메시지 수"""
+        return sum(isinstance(item, Message) for item in list.__iter__(self))
+
+
+_codec: Optional[ConversationCodec] = None
+
+
+def get_conversation_codec() -> ConversationCodec:
+    """설정에 따른 프로세스 공용 대화 코덱 반환"""
+    global _codec
+    if _codec is None:
+        _codec = ConversationCodec(
+            format=settings.conversation_codec,
+            compression=settings.conversation_compression,
+            compress_min_bytes=settings.conversation_compression_min_bytes,
+            compression_level=settings.conversation_compression_level,
+        )
+        logger.info(f"Conversation codec: {_codec.name}")
+    return _codec
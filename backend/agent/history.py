@@ -0,0 +1,203 @@
+"""대화 이력 윈도우 관리 (토큰 예산 + 누적 요약)"""
+
+from typing import NamedTuple, Optional, Protocol
+
+from models.chat import Conversation
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 메시지당 역할/구분자 등 고정 비용 (대략치)
+MESSAGE_OVERHEAD_TOKENS = 4
+
+# 토큰 예산 중 누적 요약에 배정하는 비율 (나머지는 최근 메시지 원문)
+SUMMARY_BUDGET_RATIO = 0.25
+
+SUMMARY_SYSTEM_PROMPT = """당신은 회의 일정 조율 대화를 요약하는 도우미입니다.
+이전 요약과 새로 접힌 대화를 합쳐 하나의 요약으로 갱신하세요.
+- 참석자, 날짜/시간, 회의실, 사용자의 선택/거절 등 결정 사항 위주로 적습니다
+- 인사말이나 반복 내용은 생략합니다
+- 한국어 글머리표(-)로 간결하게 작성합니다"""
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    대략적인 토큰 수 추정
+
+    provider별 토크나이저 없이 예산 계산에 쓰는 근사치입니다.
+    영문/숫자는 약 4자당 1토큰, 한글 등 비ASCII 문자는 1자당 약 1토큰으로 셉니다.
+    """
+    if not text:
+        return 0
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
+
+
+def _message_tokens(message: dict) -> int:
+    return estimate_tokens(message["content"]) + MESSAGE_OVERHEAD_TOKENS
+
+
+class HistoryWindow(NamedTuple):
+    """LLM에 보낼 대화 이력"""
+
+    messages: list[dict]  # 원문 그대로 보내는 최근 메시지
+    summary: str  # 윈도우 밖(오래된) 대화의 누적 요약
+    full_tokens: int  # 전체 이력을 그대로 보냈을 때의 추정 토큰 수
+    window_tokens: int  # 실제로 보내는 추정 토큰 수 (요약 포함)
+
+    @property
+    def saved_tokens(self) -> int:
+        return max(0, self.full_tokens - self.window_tokens)
+
+
+class Summarizer(Protocol):
+    """누적 요약기: 이전 요약 + 새로 접힌 메시지 → 새 요약"""
+
+    async def summarize(self, previous: str, messages: list[dict]) -> str:
+        ...
+
+
+class ExtractiveSummarizer:
+    """
+    LLM 호출 없는 요약기
+
+    접힌 메시지를 화자별 한 줄로 줄여 이전 요약 뒤에 덧붙이고,
+    max_tokens를 넘으면 가장 오래된 줄부터 버립니다.
+    """
+
+    def __init__(self, max_tokens: int = 500, max_line_chars: int = 120):
+        self.max_tokens = max_tokens
+        self.max_line_chars = max_line_chars
+
+    async def summarize(self, previous: str, messages: list[dict]) -> str:
+        lines = previous.splitlines() if previous else []
+        for message in messages:
+            speaker = "사용자" if message["role"] == "user" else "회의봇"
+            text = " ".join(message["content"].split())
+            if len(text) > self.max_line_chars:
+                text = text[: self.max_line_chars - 1] + "…"
+            lines.append(f"- {speaker}: {text}")
+
+        while len(lines) > 1 and estimate_tokens("\n".join(lines)) > self.max_tokens:
+            lines.pop(0)
+        return "\n".join(lines)
+
+
+class LLMSummarizer:
+    """LLM으로 이전 요약과 새로 접힌 대화를 합쳐 요약 (실패 시 추출 요약)"""
+
+    def __init__(self, llm, max_tokens: int = 500):
+        self.llm = llm
+        self.max_tokens = max_tokens
+        self.fallback = ExtractiveSummarizer(max_tokens=max_tokens)
+
+    async def summarize(self, previous: str, messages: list[dict]) -> str:
+        transcript = "\n".join(
+            f"{'사용자' if m['role'] == 'user' else '회의봇'}: {m['content']}"
+            for m in messages
+        )
+        prompt = f"이전 요약:\n{previous or '(없음)'}\n\n새 대화:\n{transcript}"
+
+        try:
+            response = await self.llm.chat(
+                messages=[{"role": "user", "content": prompt}],
+                system_prompt=SUMMARY_SYSTEM_PROMPT,
+                max_tokens=self.max_tokens,
+            )
+            summary = (response.get("content") or "").strip()
+            if summary:
+                return summary
+        except Exception as e:
+            logger.warning(f"History summarization failed, using extractive summary: {e}")
+
+        return await self.fallback.summarize(previous, messages)
+
+
+class HistoryManager:
+    """
+    토큰 예산 기반 대화 이력 관리
+
+    최근 메시지는 원문 그대로 두고, 예산을 넘는 오래된 메시지는 누적 요약으로 접습니다.
+    요약 상태(요약문, 접힌 메시지 수)는 Conversation에 저장되므로 매 턴 새로 넘친
+    메시지만 요약하며, conversation.context(구조화된 상태)는 건드리지 않습니다.
+    """
+
+    def __init__(
+        self,
+        token_budget: int,
+        min_recent_messages: int = 6,
+        summarizer: Optional[Summarizer] = None,
+    ):
+        """
+        Args:
+            token_budget: 대화 이력(요약 포함)에 쓸 최대 추정 토큰 수
+            min_recent_messages: 예산과 관계없이 원문으로 남길 최근 메시지 수
+            summarizer: 누적 요약기 (기본: ExtractiveSummarizer)
+        """
+        self.token_budget = token_budget
+        self.summary_budget = max(1, int(token_budget * SUMMARY_BUDGET_RATIO))
+        self.min_recent_messages = min_recent_messages
+        self.summarizer = summarizer or ExtractiveSummarizer(max_tokens=self.summary_budget)
+
+    async def build(self, conversation: Conversation) -> HistoryWindow:
+        """
+        이번 턴에 보낼 대화 이력 구성 (필요 시 오래된 메시지를 요약으로 접음)
+
+        Args:
+            conversation: 대화 세션
+
+        Returns:
+            대화 이력 윈도우와 토큰 절감 정보
+        """
+        start = conversation.summarized_count
+        pending = [
+            (i, {"role": msg.role, "content": msg.content})
+            for i, msg in enumerate(conversation.messages[start:], start)
+            if msg.role in ("user", "assistant", "system")
+        ]
+        tokens = [_message_tokens(m) for _, m in pending]
+        full_tokens = conversation.summarized_tokens + sum(tokens)
+
+        # 뒤에서부터 원문 예산(요약 몫 제외) 안에 드는 만큼 원문 유지
+        message_budget = self.token_budget - self.summary_budget
+        cut = len(pending)
+        used = 0
+        while cut > 0:
+            kept = len(pending) - cut
+            if kept >= self.min_recent_messages and used + tokens[cut - 1] > message_budget:
+                break
+            cut -= 1
+            used += tokens[cut]
+
+        # 접을 때는 윈도우가 user 메시지로 시작하도록 경계 조정 (provider 제약)
+        while 0 < cut < len(pending) - 1 and pending[cut][1]["role"] != "user":
+            cut += 1
+
+        if cut > 0:
+            overflow = [m for _, m in pending[:cut]]
+            conversation.history_summary = await self.summarizer.summarize(
+                conversation.history_summary, overflow
+            )
+            conversation.summarized_count = pending[cut - 1][0] + 1
+            conversation.summarized_tokens += sum(tokens[:cut])
+
+        messages = [m for _, m in pending[cut:]]
+        window = HistoryWindow(
+            messages=messages,
+            summary=conversation.history_summary,
+            full_tokens=full_tokens,
+            window_tokens=sum(tokens[cut:]) + estimate_tokens(conversation.history_summary),
+        )
+
+        logger.info(
+            f"History window: {len(messages)} messages, "
+            f"{window.window_tokens}/{window.full_tokens} tokens (saved {window.saved_tokens})",
+            extra={
+                "conversation_id": conversation.id,
+                "folded_messages": cut,
+                "full_tokens": window.full_tokens,
+                "window_tokens": window.window_tokens,
+                "saved_tokens": window.saved_tokens,
+            },
+        )
+        return window
@@ -0,0 +1,387 @@
+"""규칙 기반 Intent 파서
+
+/api/chat/parse-intent의 빠른 경로입니다. 날짜/시각/회의실/참석자 표현을 규칙으로
+추출해 FUNCTION_DEFINITIONS와 같은 형식의 함수 호출을 만들고, 메시지에서 해석하지
+못한 단어의 비율로 신뢰도를 계산합니다. 신뢰도가 낮으면 LLM으로 넘깁니다.
+"""
+
+import re
+import unicodedata
+from datetime import date, time
+from typing import NamedTuple, Optional
+
+from config import get_settings
+from utils.datetime_utils import (
+    KOREAN_DURATION_PATTERN,
+    KOREAN_TIME_PATTERN,
+    KOREAN_TIME_RANGE_CONNECTOR,
+    get_today,
+    is_ambiguous_korean_hour,
+    parse_duration_minutes,
+    parse_korean_time_range,
+    parse_relative_date,
+)
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+DATE_PATTERN = re.compile(
+    r"(?<![가-힣])(?:"
+    r"(?:다다음|다음\s*다음)\s*주(?:\s*[월화수목금토일]요일)?"
+    r"|오늘|내일|모레"
+    r"|(?:이번|다음)\s*주\s*[월화수목금토일]요일"
+    r"|다음\s*주"
+    r"|[월화수목금토일]요일"
+    r"|\d{4}-\d{2}-\d{2}"
+    r"|\d{1,2}/\d{1,2}"
+    r"|\d{1,2}월\s*\d{1,2}일"
+    r")"
+)
+# 날짜를 지운 뒤에도 남은 날짜 표현 (두 번째 날짜, "지난 주"처럼 해석하지 않는 수식어)
+DATE_RESIDUE_PATTERN = re.compile(
+    r"(?:지난|저번|지지난|다다음|다음|이번)\s*주|[월화수목금토일]요일|오늘|내일|모레|글피|\d{1,2}월|\d{1,2}일"
+)
+# 시각 뒤의 수식어: "4시까지", "3시 전에", "2시쯤", "2시나 3시" (범위 끝의 "까지"는 예외)
+TIME_MODIFIER_PATTERN = re.compile(
+    r"\s*(까지|이전|이후|전|후|쯤|경|즈음|이나|나|또는|아니면)(?:으로|로|에|은|는|도|만)?(?![가-힣])"
+)
+
+ROOM_PATTERN = re.compile(
+    r"(?:대|소)회의실"
+    r"|회의실\s*[A-Za-z0-9]+(?![A-Za-z0-9가-힣])"
+    r"|(?:세미나실|강의실)(?:\s*[A-Za-z0-9]+(?![A-Za-z0-9가-힣]))?"
+    r"|[가-힣A-Za-z]+룸"
+)
+
+TITLE_PATTERN = re.compile(r"[\"'“‘]([^\"'”’]+)[\"'”’]")
+
+_TITLES = "님|씨|과장님|대리님|부장님|차장님|사원님|팀장님|본부장님|매니저님|과장|대리|부장|차장|사원|팀장|본부장|매니저"
+TITLE_WORDS = frozenset(_TITLES.split("|"))
+# 직함/호칭이 붙은 이름, 또는 연결 조사 앞의 흔한 성씨로 시작하는 3글자 이름
+NAME_WITH_TITLE_PATTERN = re.compile(rf"([가-힣]{{2,4}}?)\s?(?:{_TITLES})")
+NAME_IN_LIST_PATTERN = re.compile(
+    r"(?<![가-힣])([김이박최정강조윤장임한오서신권황안송류전홍고문양손배백허유남심노하곽성차주우구민진나지엄채원천방공현함변염여추도석선설마길연위표명기반왕금옥육인맹제모탁국어은편용예봉경사부][가-힣]{2})"
+    r"(?=\s*(?:,|、|이랑|랑|하고|와|과|님|씨|\s(?:그리고|및)\s))"
+)
+
+RESERVE_KEYWORDS = ("예약", "잡아", "만들어", "생성", "부킹", "booking")
+CANCEL_KEYWORDS = ("취소", "삭제")
+MY_RESERVATION_KEYWORDS = ("내 예약", "예약 목록", "예약 현황", "예약 내역", "나의 예약")
+AVAILABLE_ROOM_KEYWORDS = ("빈 회의실", "비어있는", "비어 있는", "가능한 회의실", "남는 회의실", "사용 가능한")
+OPTIMAL_TIME_KEYWORDS = ("최적", "언제", "가능한 시간", "추천", "빈 시간")
+PARTICIPANT_KEYWORDS = ("추가", "참석", "초대", "넣어")
+CHANGE_KEYWORDS = ("변경", "바꿔", "바꾸", "옮겨", "수정")
+
+# 예약/취소를 그대로 실행하면 안 되는 표현 (부정, 의문, 완료 확인) — LLM으로 넘김
+NEGATION_PATTERN = re.compile(r"지\s*마|말아|말고|않|(?<![가-힣])(?:안|못)\s*(?:해|하|돼|되|할|잡)")
+QUESTION_PATTERN = re.compile(r"\?|했어|했나|했니|됐어|됐나|가능|할까|될까|되나|해도|어때")
+
+# 해석된 표현을 지운 뒤 남아도 의미를 바꾸지 않는 단어 (조사는 별도로 제거)
+KNOWN_WORDS = {
+    "회의", "미팅", "회의실", "좀", "같이", "함께", "나", "저", "제", "내", "나의",
+    "참석자", "필수", "선택", "날짜", "시간", "시각", "목록", "현황", "내역",
+    "빈", "비어있는", "비어", "있는", "가능한", "남는", "사용", "최적", "최적의", "언제",
+    "가능", "정도", "그리고", "및", "지금", "다시", "주", "이번", "다음", "오전", "오후",
+    "요", "줘", "주세요", "해줘", "해주세요", "할래", "할게", "싶어", "하고", "please",
+}
+VERB_STEMS = (
+    "예약", "잡아", "만들어", "생성", "부킹", "booking", "추가", "초대", "참석", "넣어",
+    "설정", "변경", "바꿔", "선택해", "골라", "조회", "보여", "알려", "찾아", "확인",
+    "취소", "삭제", "추천", "부탁", "있어", "있나",
+)
+# 동사 어간 뒤에 올 수 있는 요청/명령형 어미 (했어, 하지마, 해도 등은 해석하지 않음)
+REQUEST_ENDINGS = frozenset((
+    "", "해", "해줘", "해주세요", "해줄래", "해봐", "해요", "하자", "하기",
+    "줘", "주세요", "줄래", "봐", "드려요", "드립니다",
+))
+PARTICLES = (
+    "으로", "에서", "부터", "까지", "이랑", "하고", "에게", "한테", "이요",
+    "은", "는", "이", "가", "을", "를", "에", "의", "로", "와", "과", "도", "만", "랑", "요",
+)
+
+_WORD = re.compile(r"[가-힣A-Za-z]+")
+_MEANINGFUL = re.compile(r"[가-힣A-Za-z0-9]")
+
+
+class IntentParseResult(NamedTuple):
+    """규칙 기반 파싱 결과"""
+
+    function_calls: list[dict]
+    confidence: float  # 0~1, 해석한 글자 비율 (의도를 정하지 못하면 0)
+
+
+def _is_request_verb(word: str) -> bool:
+    """동사 어간 + 요청/명령형 어미인지"""
+    return any(
+        word.startswith(stem) and word[len(stem):] in REQUEST_ENDINGS
+        for stem in VERB_STEMS
+    )
+
+
+def _is_known_word(word: str) -> bool:
+    """조사를 뗀 형태까지 포함해 알려진 단어/동사/조사/호칭인지 (이름·날짜를 지우고 남은 조각 포함)"""
+    candidates = [word]
+    for particle in PARTICLES:
+        if word.endswith(particle) and len(word) > len(particle):
+            candidates.append(word[: -len(particle)])
+    return any(
+        c in KNOWN_WORDS or c in PARTICLES or c in TITLE_WORDS or _is_request_verb(c)
+        for c in candidates
+    )
+
+
+def _format_time(value: time) -> str:
+    return value.strftime("%H:%M")
+
+
+class IntentParser:
+    """
+    규칙 기반 Intent 파서 (LLM 호출 전 빠른 경로)
+
+    프론트엔드 functionCalling.js의 규칙과 같은 함수 집합을 대상으로 하되,
+    메시지의 모든 단어를 해석한 경우에만 높은 신뢰도를 줍니다.
+    """
+
+    def __init__(self, threshold: float = 0.9):
+        self.threshold = threshold
+        self.handled = 0
+        self.fallbacks = 0
+
+    def parse(
+        self,
+        message: str,
+        context: Optional[dict] = None,
+        today: Optional[date] = None,
+    ) -> IntentParseResult:
+        """
+        메시지에서 함수 호출 추출
+
+        Args:
+            message: 사용자 메시지
+            context: 현재 UI 상태 (participants, selectedTimeRange, selectedRoom, selectedDate)
+            today: 상대 날짜 기준일 (기본: 오늘)
+
+        Returns:
+            함수 호출 목록과 신뢰도
+        """
+        context = context or {}
+        text = " ".join(unicodedata.normalize("NFKC", message).split())
+        lower = text.lower()
+        today = today or get_today()
+
+        # 표현 추출 (해석한 구간은 신뢰도 계산을 위해 지움)
+        remaining = text
+        date_match = DATE_PATTERN.search(text)
+        target_date = self._resolve_date(date_match.group(0), today) if date_match else None
+        if date_match and target_date:
+            remaining = remaining.replace(date_match.group(0), " ", 1)
+
+        times = parse_korean_time_range(text)
+        duration = parse_duration_minutes(text)
+        remaining = KOREAN_TIME_PATTERN.sub(" ", remaining)
+        remaining = KOREAN_DURATION_PATTERN.sub(" ", remaining)
+
+        room_match = ROOM_PATTERN.search(remaining)
+        room = room_match.group(0) if room_match else None
+        if room:
+            remaining = remaining.replace(room, " ", 1)
+
+        title_match = TITLE_PATTERN.search(remaining)
+        title = title_match.group(1).strip() if title_match else None
+        if title_match:
+            remaining = remaining.replace(title_match.group(0), " ", 1)
+
+        names = self._extract_names(remaining)
+        for name in names:
+            remaining = remaining.replace(name, " ")
+
+        function_calls = self._build_calls(
+            lower, context, today, target_date, times, duration, room, title, names,
+        )
+        if not function_calls:
+            return IntentParseResult([], 0.0)
+
+        # 날짜/시각을 바꿀 수 있는 표현이 남았으면 글자 비율과 무관하게 LLM으로
+        if DATE_RESIDUE_PATTERN.search(remaining) or self._has_unresolved_time(text):
+            return IntentParseResult(function_calls, 0.0)
+
+        return IntentParseResult(function_calls, self._coverage(text, remaining))
+
+    def parse_confident(
+        self,
+        message: str,
+        context: Optional[dict] = None,
+    ) -> Optional[list[dict]]:
+        """신뢰도가 threshold 이상이면 함수 호출 목록, 아니면 None (처리/위임 횟수 집계)"""
+        result = self.parse(message, context)
+        if result.function_calls and result.confidence >= self.threshold:
+            self.handled += 1
+            return result.function_calls
+
+        self.fallbacks += 1
+        return None
+
+    def stats(self) -> dict:
+        """빠른 경로 처리 비율 지표"""
+        total = self.handled + self.fallbacks
+        return {
+            "handled": self.handled,
+            "fallbacks": self.fallbacks,
+            "handled_rate": round(self.handled / total, 4) if total else 0.0,
+        }
+
+    @staticmethod
+    def _resolve_date(expression: str, today: date) -> Optional[date]:
+        """날짜 표현 → date (parse_relative_date 사용)"""
+        expression = re.sub(r"다음\s*주", "다음 주", expression)
+        expression = re.sub(r"다음\s+다음", "다음 다음", expression)
+        month_day = re.fullmatch(r"(\d{1,2})월\s*(\d{1,2})일", expression)
+        if month_day:
+            expression = f"{month_day.group(1)}/{month_day.group(2)}"
+        return parse_relative_date(expression, today)
+
+    @staticmethod
+    def _extract_names(text: str) -> list[str]:
+        """직함/호칭이 붙었거나 나열된 참석자 이름 (등장 순서, 중복 제거)"""
+        found = []
+        for pattern in (NAME_WITH_TITLE_PATTERN, NAME_IN_LIST_PATTERN):
+            for match in pattern.finditer(text):
+                found.append((match.start(1), match.group(1)))
+
+        names = []
+        for _, name in sorted(found):
+            if name not in names and name not in TITLE_WORDS and not _is_known_word(name):
+                names.append(name)
+        return names
+
+    @staticmethod
+    def _has_unresolved_time(text: str) -> bool:
+        """
+        규칙으로 정확히 해석할 수 없는 시각 표현이 있는지
+
+        범위가 아닌 두 시각("2시 3시"), 수식어가 붙은 시각("4시까지", "2시나"),
+        오전/오후를 정할 수 없는 시각("7시")이 해당합니다.
+        """
+        matches = list(KOREAN_TIME_PATTERN.finditer(text))
+        if len(matches) > 2:
+            return True
+        connected = len(matches) == 2 and bool(
+            KOREAN_TIME_RANGE_CONNECTOR.fullmatch(text[matches[0].end():matches[1].start()])
+        )
+        if len(matches) == 2 and not connected:
+            return True
+
+        for index, match in enumerate(matches):
+            modifier = TIME_MODIFIER_PATTERN.match(text, match.end())
+            if modifier and not (connected and index == 1 and modifier.group(1) == "까지"):
+                return True
+        return bool(matches) and is_ambiguous_korean_hour(matches[0])
+
+    @staticmethod
+    def _coverage(text: str, remaining: str) -> float:
+        """메시지에서 해석한 글자 비율 (남은 단어 중 모르는 단어의 글자를 미해석으로 봄)"""
+        total = len(_MEANINGFUL.findall(text))
+        if total == 0:
+            return 0.0
+        unknown = sum(len(w) for w in _WORD.findall(remaining) if not _is_known_word(w.lower()))
+        # 해석하지 못한 숫자 (예: 시각/날짜로 읽히지 않은 "3")
+        unknown += len(re.findall(r"\d", remaining))
+        return max(0.0, 1 - unknown / total)
+
+    def _build_calls(
+        self,
+        lower: str,
+        context: dict,
+        today: date,
+        target_date: Optional[date],
+        times: Optional[tuple[time, time]],
+        duration: Optional[int],
+        room: Optional[str],
+        title: Optional[str],
+        names: list[str],
+    ) -> list[dict]:
+        """추출한 표현과 키워드로 함수 호출 구성"""
+        time_range = (
+            {"startTime": _format_time(times[0]), "endTime": _format_time(times[1])}
+            if times else None
+        )
+
+        if NEGATION_PATTERN.search(lower):
+            return []
+        # 예약/취소 여부를 묻거나 기존 예약을 바꾸는 요청은 실행하지 않음
+        mutation_allowed = not (
+            QUESTION_PATTERN.search(lower) or any(k in lower for k in CHANGE_KEYWORDS)
+        )
+
+        # 예약 취소
+        if any(k in lower for k in CANCEL_KEYWORDS):
+            if room and time_range and mutation_allowed:
+                return [{
+                    "name": "cancelReservationByTime",
+                    "arguments": {"roomName": room, "startTime": time_range["startTime"]},
+                }]
+            return []
+
+        # 내 예약 조회
+        if any(k in lower for k in MY_RESERVATION_KEYWORDS):
+            arguments = {"date": target_date.isoformat()} if target_date else {}
+            return [{"name": "getMyReservationList", "arguments": arguments}]
+
+        # 예약 생성 (시간은 메시지 또는 UI에서 선택한 시간)
+        if any(k in lower for k in RESERVE_KEYWORDS):
+            if not mutation_allowed:
+                return []
+            selected = context.get("selectedTimeRange") or {}
+            if not time_range and selected.get("startTime") and selected.get("endTime"):
+                time_range = {"startTime": selected["startTime"], "endTime": selected["endTime"]}
+            if not time_range:
+                return []
+
+            arguments = {
+                "title": title or "회의",
+                "date": (target_date or today).isoformat(),
+                **time_range,
+            }
+            if room:
+                arguments["roomName"] = room
+            if names:
+                arguments["requiredNames"] = names
+            return [{"name": "createQuickReservation", "arguments": arguments}]
+
+        # 빈 회의실 조회
+        if any(k in lower for k in AVAILABLE_ROOM_KEYWORDS) and time_range:
+            return [{"name": "getAvailableRooms", "arguments": time_range}]
+
+        # 최적 시간 찾기
+        if any(k in lower for k in OPTIMAL_TIME_KEYWORDS):
+            return [{"name": "findOptimalTimes", "arguments": {"durationMinutes": duration or 60}}]
+
+        # 개별 설정 (여러 개 가능)
+        calls = []
+        if names and any(k in lower for k in PARTICIPANT_KEYWORDS):
+            calls.append({
+                "name": "setParticipantsByNames",
+                "arguments": {"names": names, "type": "OPTIONAL" if "선택" in lower else "REQUIRED"},
+            })
+        if target_date:
+            calls.append({"name": "setDateByString", "arguments": {"dateStr": target_date.isoformat()}})
+        if time_range:
+            calls.append({"name": "setTimeByRange", "arguments": time_range})
+        if room:
+            calls.append({"name": "setRoomByName", "arguments": {"roomName": room}})
+        return calls
+
+
+_intent_parser: Optional[IntentParser] = None
+
+
+def get_intent_parser() -> Optional[IntentParser]:
+    """설정에 따른 프로세스 공용 Intent 파서 반환 (비활성화 시 None)"""
+    global _intent_parser
+    if not settings.intent_fast_path_enabled:
+        return None
+
+    if _intent_parser is None:
+        _intent_parser = IntentParser(threshold=settings.intent_fast_path_threshold)
+    return _intent_parser
@@ -1,11 +1,19 @@
 """LLM API 클라이언트 - Anthropic, OpenAI, Gemini 지원"""
 
+import asyncio
 import json
-from typing import Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, NamedTuple, Optional, Union
 from enum import Enum
 
+import httpx
+
 from config import get_settings
 from utils.logger import get_logger
+from .history import estimate_tokens
+from .rate_limiter import get_rate_limiter
+from .tools.base import ToolSchemas
 
 logger = get_logger(__name__)
 settings = get_settings()
@@ -20,12 +28,159 @@ class LLMProvider(str, Enum):
     CUSTOM = "custom"
 
 
+class LLMCallMode(str, Enum):
+    """SDK 호출 방식"""
+    NATIVE = "native"  # 비동기 SDK 클라이언트 (AsyncAnthropic, AsyncOpenAI, genai aio)
+    THREAD = "thread"  # 동기 SDK 클라이언트를 스레드 풀에서 실행
+
+
+_offload_executor: Optional[ThreadPoolExecutor] = None
+_STREAM_DONE = object()
+
+
+def _get_offload_executor() -> ThreadPoolExecutor:
+    """동기 SDK 호출용 프로세스 공용 스레드 풀"""
+    global _offload_executor
+    if _offload_executor is None:
+        _offload_executor = ThreadPoolExecutor(
+            max_workers=settings.llm_offload_workers,
+            thread_name_prefix="llm-offload",
+        )
+    return _offload_executor
+
+
+class SystemPrompt(NamedTuple):
+    """
+    캐싱용으로 나눈 시스템 프롬프트
+
+    cached는 요청 간 바이트 단위로 동일한 부분(역할/규칙 등)으로 provider 프롬프트 캐시의
+    접두부가 되고, dynamic은 날짜/진행 상황처럼 자주 바뀌는 부분으로 캐시 경계 뒤에 붙습니다.
+    """
+    cached: str
+    dynamic: str = ""
+
+    def __str__(self) -> str:
+        return "\n\n".join(part for part in (self.cached, self.dynamic) if part)
+
+
+def _split_system_prompt(system_prompt: Union[str, SystemPrompt, None]) -> tuple[str, str]:
+    """시스템 프롬프트 → (캐시 대상, 동적 부분)"""
+    if isinstance(system_prompt, SystemPrompt):
+        if not settings.llm_prompt_cache:
+            return str(system_prompt), ""
+        return system_prompt.cached, system_prompt.dynamic
+    return system_prompt or "", ""
+
+
+def _usage(
+    input_tokens: Optional[int],
+    output_tokens: Optional[int],
+    cache_hit_tokens: Optional[int] = 0,
+    cache_write_tokens: Optional[int] = 0,
+) -> dict:
+    """
+    provider별 사용량 → 공통 형식
+
+    input_tokens는 캐시 적중분을 포함한 전체 입력 토큰 수입니다.
+    """
+    input_tokens = input_tokens or 0
+    cache_hit_tokens = cache_hit_tokens or 0
+    return {
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens or 0,
+        "cache_hit_tokens": cache_hit_tokens,
+        "cache_miss_tokens": max(0, input_tokens - cache_hit_tokens),
+        "cache_write_tokens": cache_write_tokens or 0,
+    }
+
+
+def _log_usage(provider: str, usage: Optional[dict]) -> None:
+    """호출별 프롬프트 캐시 적중/미스 토큰 로깅"""
+    if not usage:
+        return
+    logger.info(
+        f"LLM usage ({provider}): input={usage['input_tokens']} "
+        f"cache_hit={usage['cache_hit_tokens']} cache_miss={usage['cache_miss_tokens']} "
+        f"cache_write={usage['cache_write_tokens']} output={usage['output_tokens']}",
+        extra={"usage": usage},
+    )
+
+
+class _ToolCallAccumulator:
+    """스트리밍 도구 호출 델타 조립 (인덱스별 id, 이름, 인자 JSON 조각)"""
+
+    def __init__(self):
+        self._calls: dict[int, dict] = {}
+
+    def add(
+        self,
+        index: int,
+        call_id: Optional[str] = None,
+        name: Optional[str] = None,
+        arguments: Optional[str] = None,
+    ) -> None:
+        call = self._calls.setdefault(index, {"id": "", "name": "", "arguments": ""})
+        if call_id:
+            call["id"] = call_id
+        if name:
+            call["name"] = name
+        if arguments:
+            call["arguments"] += arguments
+
+    def build(self) -> list[dict]:
+        """chat() 응답과 같은 형식의 도구 호출 목록"""
+        tool_calls = []
+        for index in sorted(self._calls):
+            call = self._calls[index]
+            try:
+                arguments = json.loads(call["arguments"]) if call["arguments"] else {}
+            except json.JSONDecodeError:
+                logger.warning(f"Invalid tool call arguments in stream: {call['name']}")
+                arguments = {}
+            tool_calls.append({
+                "id": call["id"] or f"call_{index}",
+                "name": call["name"],
+                "arguments": arguments,
+            })
+        return tool_calls
+
+
+def _message_event(
+    content: str,
+    tool_calls: list[dict],
+    stop_reason: str,
+    usage: Optional[dict] = None,
+) -> dict:
+    """스트림 종료 시 전달하는 전체 응답 이벤트"""
+    return {
+        "type": "message",
+        "content": content,
+        "tool_calls": tool_calls,
+        "stop_reason": "tool_use" if tool_calls else stop_reason,
+        "usage": usage,
+    }
+
+
 class LLMClient:
     """통합 LLM API 클라이언트"""
 
-    def __init__(self, provider: Optional[str] = None):
+    def __init__(
+        self,
+        provider: Optional[str] = None,
+        call_mode: Optional[str] = None,
+        limits: Optional[httpx.Limits] = None,
+    ):
+        """
+        Args:
+            provider: LLM 제공자 (기본: 설정값)
+            call_mode: SDK 호출 방식 (기본: 설정값)
+            limits: HTTP 커넥션 풀 제한 (기본: SDK 기본값)
+        """
         self.provider = LLMProvider(provider or settings.llm_provider)
-        self.max_retries = 3
+        self.call_mode = LLMCallMode(call_mode or settings.llm_call_mode)
+        self.max_retries = max(1, settings.llm_retry_max_attempts)
+        self.limits = limits
+        self.http_client: Union[httpx.AsyncClient, httpx.Client, None] = None  # 이 클라이언트가 소유한 HTTP 클라이언트
 
         # 제공자별 클라이언트 초기화
         if self.provider == LLMProvider.ANTHROPIC:
@@ -39,31 +194,60 @@ class LLMClient:
         elif self.provider == LLMProvider.CUSTOM:
             self._init_custom()
 
+        # (provider, 모델)별 공용 속도 제한/재시도 스케줄러
+        self.rate_limiter = get_rate_limiter(self.provider.value, self.model)
+
     def _init_anthropic(self):
         """Anthropic 클라이언트 초기화"""
-        from anthropic import Anthropic
+        from anthropic import Anthropic, AsyncAnthropic, DefaultAsyncHttpxClient, DefaultHttpxClient
         base_url = settings.anthropic_api_url or None
-        self.client = Anthropic(
+        if self.call_mode == LLMCallMode.NATIVE:
+            client_class, http_client_class = AsyncAnthropic, DefaultAsyncHttpxClient
+        else:
+            client_class, http_client_class = Anthropic, DefaultHttpxClient
+        self.http_client = http_client_class(**self._http_client_args())
+        self.client = client_class(
             api_key=settings.get_api_key("anthropic"),
             base_url=base_url,
+            http_client=self.http_client,
+            max_retries=0,  # 재시도는 rate_limiter가 담당
         )
         self.model = settings.get_model("anthropic")
 
     def _init_openai(self):
         """OpenAI 클라이언트 초기화"""
-        from openai import OpenAI
+        from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
         base_url = settings.openai_api_url or None
-        self.client = OpenAI(
+        if self.call_mode == LLMCallMode.NATIVE:
+            client_class, http_client_class = AsyncOpenAI, DefaultAsyncHttpxClient
+        else:
+            client_class, http_client_class = OpenAI, DefaultHttpxClient
+        self.http_client = http_client_class(**self._http_client_args())
+        self.client = client_class(
             api_key=settings.get_api_key("openai"),
             base_url=base_url,
+            http_client=self.http_client,
+            max_retries=0,  # 재시도는 rate_limiter가 담당
         )
         self.model = settings.get_model("openai")
 
     def _init_gemini(self):
         """Gemini 클라이언트 초기화 (google-genai 패키지)"""
         from google import genai
-        self.client = genai.Client(api_key=settings.get_api_key("gemini"))
+        from google.genai import types
+        # genai.Client는 동기/비동기(aio) 인터페이스를 함께 제공
+        if self.call_mode == LLMCallMode.NATIVE:
+            self.http_client = httpx.AsyncClient(follow_redirects=True, **self._http_client_args())
+            http_options = types.HttpOptions(httpx_async_client=self.http_client)
+        else:
+            self.http_client = httpx.Client(follow_redirects=True, **self._http_client_args())
+            http_options = types.HttpOptions(httpx_client=self.http_client)
+        self.client = genai.Client(api_key=settings.get_api_key("gemini"), http_options=http_options)
         self.model = settings.get_model("gemini")
+        if self.call_mode == LLMCallMode.NATIVE:
+            self._gemini_models = self.client.aio.models
+        else:
+            self._gemini_models = self.client.models
 
     def _init_litellm(self):
         """LiteLLM 클라이언트 초기화"""
@@ -81,7 +265,6 @@ class LLMClient:
 
     def _init_custom(self):
         """Custom LLM 클라이언트 초기화 (OpenAI 호환 API, httpx 사용)"""
-        import httpx
         self.base_url = settings.custom_api_url.rstrip("/")
         self.api_key = settings.custom_api_key
         self.model = settings.custom_model
@@ -92,14 +275,80 @@ class LLMClient:
                 "Content-Type": "application/json",
                 **({"Authorization": f"Bearer {self.api_key}"} if self.api_key else {}),
             },
+            **self._http_client_args(),
         )
+        self.http_client = self.client
+
+    def _http_client_args(self) -> dict:
+        """HTTP 클라이언트 생성 인자 (커넥션 풀 제한)"""
+        return {"limits": self.limits} if self.limits else {}
+
+    async def warmup(self) -> bool:
+        """
+        provider API 연결을 미리 열어 keep-alive 풀에 남김
+
+        첫 사용자 요청이 TCP/TLS 핸드셰이크 비용을 내지 않도록 합니다.
+        응답 코드는 보지 않습니다 (연결만 필요).
+
+        Returns:
+            연결 성공 여부 (HTTP 클라이언트가 없는 LiteLLM은 False)
+        """
+        url = settings.get_api_url(self.provider.value)
+        if self.http_client is None or not url:
+            return False
+        try:
+            if isinstance(self.http_client, httpx.AsyncClient):
+                # custom provider는 thread 모드에서도 비동기 클라이언트를 씀
+                await self.http_client.head(url)
+            else:
+                await self._call(self.http_client.head, url)
+        except httpx.HTTPError as e:
+            logger.warning(f"LLM connection warmup failed ({self.provider.value}): {e}")
+            return False
+        return True
+
+    async def close(self) -> None:
+        """소유한 HTTP 클라이언트 종료 (LiteLLM은 라이브러리가 관리)"""
+        http_client, self.http_client = self.http_client, None
+        if isinstance(http_client, httpx.AsyncClient):
+            await http_client.aclose()
+        elif http_client is not None:
+            http_client.close()
+
+    async def _call(self, func, *args, **kwargs):
+        """
+        SDK 호출 (이벤트 루프를 막지 않음)
+
+        native 모드(비동기 SDK)는 그대로 await하고,
+        thread 모드(동기 SDK)는 스레드 풀에서 실행합니다.
+        """
+        if self.call_mode == LLMCallMode.NATIVE:
+            return await func(*args, **kwargs)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_offload_executor(), partial(func, *args, **kwargs))
+
+    async def _aiter(self, stream):
+        """SDK 스트림 순회 (동기 스트림은 청크마다 스레드 풀에서 읽음)"""
+        if hasattr(stream, "__aiter__"):
+            async for chunk in stream:
+                yield chunk
+            return
+
+        iterator = iter(stream)
+        loop = asyncio.get_running_loop()
+        executor = _get_offload_executor()
+        while True:
+            chunk = await loop.run_in_executor(executor, next, iterator, _STREAM_DONE)
+            if chunk is _STREAM_DONE:
+                break
+            yield chunk
 
     async def chat(
         self,
         messages: list[dict],
         tools: Optional[list[dict]] = None,
         tool_choice: Optional[dict] = None,
-        system_prompt: Optional[str] = None,
+        system_prompt: Union[str, SystemPrompt, None] = None,
         max_tokens: int = 4096,
     ) -> dict:
         """
@@ -109,29 +358,52 @@ class LLMClient:
             messages: 대화 메시지 목록
             tools: 사용 가능한 도구 목록
             tool_choice: 도구 선택 옵션
-            system_prompt: 시스템 프롬프트
+            system_prompt: 시스템 프롬프트 (SystemPrompt면 cached 부분을 프롬프트 캐시 대상으로 표시)
             max_tokens: 최대 응답 토큰 수
 
         Returns:
-            LLM 응답
+            LLM 응답 (usage: 입력/출력 및 캐시 적중/미스 토큰 수)
         """
         if self.provider == LLMProvider.ANTHROPIC:
-            return await self._chat_anthropic(messages, tools, tool_choice, system_prompt, max_tokens)
+            request = self._chat_anthropic
         elif self.provider == LLMProvider.OPENAI:
-            return await self._chat_openai(messages, tools, tool_choice, system_prompt, max_tokens)
+            request = self._chat_openai
         elif self.provider == LLMProvider.GEMINI:
-            return await self._chat_gemini(messages, tools, tool_choice, system_prompt, max_tokens)
+            request = self._chat_gemini
         elif self.provider == LLMProvider.LITELLM:
-            return await self._chat_litellm(messages, tools, tool_choice, system_prompt, max_tokens)
-        elif self.provider == LLMProvider.CUSTOM:
-            return await self._chat_custom(messages, tools, tool_choice, system_prompt, max_tokens)
+            request = self._chat_litellm
+        else:
+            request = self._chat_custom
+
+        response = await self.rate_limiter.run(
+            partial(request, messages, tools, tool_choice, system_prompt, max_tokens),
+            estimated_tokens=self._estimate_tokens(messages, system_prompt, max_tokens),
+            max_attempts=self.max_retries,
+        )
+        _log_usage(self.provider.value, response.get("usage"))
+        return response
+
+    @staticmethod
+    def _estimate_tokens(
+        messages: list[dict],
+        system_prompt: Union[str, SystemPrompt, None],
+        max_tokens: int,
+    ) -> int:
+        """속도 제한용 요청 토큰 추정 (입력 + 최대 출력)"""
+        total = estimate_tokens(str(system_prompt or "")) + max_tokens
+        for message in messages:
+            content = message.get("content")
+            if not isinstance(content, str):
+                content = json.dumps(content, ensure_ascii=False, default=str)
+            total += estimate_tokens(content)
+        return total
 
     async def chat_stream(
         self,
         messages: list[dict],
         tools: Optional[list[dict]] = None,
         tool_choice: Optional[dict] = None,
-        system_prompt: Optional[str] = None,
+        system_prompt: Union[str, SystemPrompt, None] = None,
         max_tokens: int = 4096,
     ):
         """
@@ -140,21 +412,51 @@ class LLMClient:
         Yields:
             str: 응답 텍스트 청크
         """
+        async for event in self.chat_stream_events(messages, tools, tool_choice, system_prompt, max_tokens):
+            if event["type"] == "text":
+                yield event["text"]
+
+    async def chat_stream_events(
+        self,
+        messages: list[dict],
+        tools: Optional[list[dict]] = None,
+        tool_choice: Optional[dict] = None,
+        system_prompt: Union[str, SystemPrompt, None] = None,
+        max_tokens: int = 4096,
+    ):
+        """
+        LLM 스트리밍 대화 (도구 호출 포함)
+
+        텍스트는 받는 즉시 전달하고, 도구 호출 델타는 모아서
+        마지막 message 이벤트에 chat()과 같은 형식으로 담습니다.
+
+        Yields:
+            dict: {"type": "text", "text": 청크} 또는
+                  {"type": "message", "content", "tool_calls", "stop_reason"} (마지막 1회)
+        """
         if self.provider == LLMProvider.ANTHROPIC:
-            async for chunk in self._chat_stream_anthropic(messages, tools, tool_choice, system_prompt, max_tokens):
-                yield chunk
+            stream = self._chat_stream_anthropic(messages, tools, tool_choice, system_prompt, max_tokens)
         elif self.provider == LLMProvider.OPENAI:
-            async for chunk in self._chat_stream_openai(messages, tools, tool_choice, system_prompt, max_tokens):
-                yield chunk
+            stream = self._chat_stream_openai(messages, tools, tool_choice, system_prompt, max_tokens)
         elif self.provider == LLMProvider.GEMINI:
-            async for chunk in self._chat_stream_gemini(messages, tools, tool_choice, system_prompt, max_tokens):
-                yield chunk
+            stream = self._chat_stream_gemini(messages, tools, tool_choice, system_prompt, max_tokens)
         elif self.provider == LLMProvider.LITELLM:
-            async for chunk in self._chat_stream_litellm(messages, tools, tool_choice, system_prompt, max_tokens):
-                yield chunk
-        elif self.provider == LLMProvider.CUSTOM:
-            async for chunk in self._chat_stream_custom(messages, tools, tool_choice, system_prompt, max_tokens):
-                yield chunk
+            stream = self._chat_stream_litellm(messages, tools, tool_choice, system_prompt, max_tokens)
+        else:
+            stream = self._chat_stream_custom(messages, tools, tool_choice, system_prompt, max_tokens)
+
+        # 스트림은 중간에 재시도할 수 없으므로 속도 제한만 적용
+        estimated_tokens = self._estimate_tokens(messages, system_prompt, max_tokens)
+        await self.rate_limiter.acquire(estimated_tokens)
+        try:
+            async for event in stream:
+                if event["type"] == "message":
+                    self.rate_limiter.record_success(estimated_tokens, event.get("usage"))
+                    _log_usage(self.provider.value, event.get("usage"))
+                yield event
+        except Exception as e:
+            self.rate_limiter.record_error(e)  # 429면 공용 리미터 감속
+            raise
 
     async def _chat_stream_anthropic(self, messages, tools, tool_choice, system_prompt, max_tokens):
         """Anthropic 스트리밍 API 호출"""
@@ -163,14 +465,36 @@ class LLMClient:
             "max_tokens": max_tokens,
             "messages": self._convert_messages_anthropic(messages),
         }
-        if system_prompt:
-            kwargs["system"] = system_prompt
-        if tools:
-            kwargs["tools"] = self._convert_tools_anthropic(tools)
-
-        with self.client.messages.stream(**kwargs) as stream:
-            for text in stream.text_stream:
-                yield text
+        self._apply_system_and_tools_anthropic(kwargs, system_prompt, tools)
+        if tool_choice:
+            kwargs["tool_choice"] = tool_choice
+
+        stream = await self._call(self.client.messages.create, stream=True, **kwargs)
+        text_parts = []
+        tool_calls = _ToolCallAccumulator()
+        stop_reason = "end_turn"
+        start_usage = None
+        output_tokens = 0
+
+        async for event in self._aiter(stream):
+            if event.type == "message_start":
+                start_usage = event.message.usage
+            elif event.type == "content_block_start" and event.content_block.type == "tool_use":
+                tool_calls.add(event.index, call_id=event.content_block.id, name=event.content_block.name)
+            elif event.type == "content_block_delta":
+                if event.delta.type == "text_delta":
+                    text_parts.append(event.delta.text)
+                    yield {"type": "text", "text": event.delta.text}
+                elif event.delta.type == "input_json_delta":
+                    tool_calls.add(event.index, arguments=event.delta.partial_json)
+            elif event.type == "message_delta":
+                if event.delta.stop_reason:
+                    stop_reason = event.delta.stop_reason
+                if event.usage:
+                    output_tokens = event.usage.output_tokens
+
+        usage = self._usage_anthropic(start_usage, output_tokens) if start_usage else None
+        yield _message_event("".join(text_parts), tool_calls.build(), stop_reason, usage)
 
     async def _chat_stream_openai(self, messages, tools, tool_choice, system_prompt, max_tokens):
         """OpenAI 스트리밍 API 호출"""
@@ -180,165 +504,172 @@ class LLMClient:
             "max_completion_tokens": max_tokens,  # 새 모델은 max_completion_tokens 사용
             "messages": openai_messages,
             "stream": True,
+            "stream_options": {"include_usage": True},
         }
         if tools:
-            kwargs["tools"] = self._convert_tools_openai(tools)
+            kwargs["tools"] = self._provider_tools(tools, self._convert_tools_openai)
+        if tool_choice:
+            kwargs["tool_choice"] = "auto"
+
+        stream = await self._call(self.client.chat.completions.create, **kwargs)
+        async for event in self._openai_stream_events(self._aiter(stream)):
+            yield event
+
+    async def _openai_stream_events(self, chunks):
+        """OpenAI 형식 스트림 청크(SDK 객체) → 스트리밍 이벤트 (OpenAI, LiteLLM 공용)"""
+        text_parts = []
+        tool_calls = _ToolCallAccumulator()
+        stop_reason = "end_turn"
+        usage = None
+
+        async for chunk in chunks:
+            # include_usage 사용 시 마지막 청크에 사용량만 담겨 옴
+            if getattr(chunk, "usage", None):
+                usage = self._usage_openai(chunk.usage)
+            if not getattr(chunk, "choices", None):
+                continue
+            choice = chunk.choices[0]
+            delta = choice.delta
+
+            content = getattr(delta, "content", None)
+            if content:
+                text_parts.append(content)
+                yield {"type": "text", "text": content}
+
+            for tc in getattr(delta, "tool_calls", None) or []:
+                function = tc.function
+                tool_calls.add(
+                    tc.index,
+                    call_id=tc.id,
+                    name=function.name if function else None,
+                    arguments=function.arguments if function else None,
+                )
+
+            if choice.finish_reason:
+                stop_reason = choice.finish_reason
 
-        stream = self.client.chat.completions.create(**kwargs)
-        for chunk in stream:
-            if chunk.choices[0].delta.content:
-                yield chunk.choices[0].delta.content
+        yield _message_event("".join(text_parts), tool_calls.build(), stop_reason, usage)
 
     async def _chat_stream_gemini(self, messages, tools, tool_choice, system_prompt, max_tokens):
         """Gemini 스트리밍 API 호출 (google-genai 패키지)"""
         from google.genai import types
 
         gemini_contents = self._convert_messages_gemini(messages, system_prompt)
+        cached, _ = _split_system_prompt(system_prompt)
 
         config = types.GenerateContentConfig(
             max_output_tokens=max_tokens,
-            system_instruction=system_prompt if system_prompt else None,
+            system_instruction=cached or None,
         )
 
         if tools:
-            config.tools = self._convert_tools_gemini(tools)
+            config.tools = self._provider_tools(tools, self._convert_tools_gemini)
 
         # 스트리밍 응답
-        for chunk in self.client.models.generate_content_stream(
+        stream = await self._call(
+            self._gemini_models.generate_content_stream,
             model=self.model,
             contents=gemini_contents,
             config=config,
-        ):
-            if hasattr(chunk, "text") and chunk.text:
-                yield chunk.text
+        )
+        text_parts = []
+        tool_calls = []
+        usage = None
+        async for chunk in self._aiter(stream):
+            # 청크마다 완성된 텍스트/함수 호출이 들어 있음
+            parsed = self._parse_response_gemini(chunk)
+            if parsed["content"]:
+                text_parts.append(parsed["content"])
+                yield {"type": "text", "text": parsed["content"]}
+            tool_calls.extend(parsed["tool_calls"])
+            usage = parsed.get("usage") or usage
+
+        yield _message_event("".join(text_parts), tool_calls, "end_turn", usage)
 
     async def _chat_anthropic(
         self,
         messages: list[dict],
         tools: Optional[list[dict]],
         tool_choice: Optional[dict],
-        system_prompt: Optional[str],
+        system_prompt: Union[str, SystemPrompt, None],
         max_tokens: int,
     ) -> dict:
         """Anthropic API 호출"""
-        from anthropic import APIError, RateLimitError
-
-        for attempt in range(self.max_retries):
-            try:
-                kwargs = {
-                    "model": self.model,
-                    "max_tokens": max_tokens,
-                    "messages": self._convert_messages_anthropic(messages),
-                }
-
-                if system_prompt:
-                    kwargs["system"] = system_prompt
-
-                if tools:
-                    kwargs["tools"] = self._convert_tools_anthropic(tools)
-
-                if tool_choice:
-                    kwargs["tool_choice"] = tool_choice
+        kwargs = {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "messages": self._convert_messages_anthropic(messages),
+        }
 
-                response = self.client.messages.create(**kwargs)
-                return self._parse_response_anthropic(response)
+        self._apply_system_and_tools_anthropic(kwargs, system_prompt, tools)
 
-            except RateLimitError:
-                logger.warning(f"Rate limit hit, attempt {attempt + 1}/{self.max_retries}")
-                if attempt == self.max_retries - 1:
-                    raise
-                import asyncio
-                await asyncio.sleep(2 ** attempt)
+        if tool_choice:
+            kwargs["tool_choice"] = tool_choice
 
-            except APIError as e:
-                logger.error(f"Anthropic API error: {str(e)}")
-                raise
+        response = await self._call(self.client.messages.create, **kwargs)
+        return self._parse_response_anthropic(response)
 
     async def _chat_openai(
         self,
         messages: list[dict],
         tools: Optional[list[dict]],
         tool_choice: Optional[dict],
-        system_prompt: Optional[str],
+        system_prompt: Union[str, SystemPrompt, None],
         max_tokens: int,
     ) -> dict:
         """OpenAI API 호출"""
-        from openai import APIError, RateLimitError
-
-        for attempt in range(self.max_retries):
-            try:
-                # 메시지 변환
-                openai_messages = self._convert_messages_openai(messages, system_prompt)
-
-                kwargs = {
-                    "model": self.model,
-                    "max_completion_tokens": max_tokens,  # 새 모델은 max_completion_tokens 사용
-                    "messages": openai_messages,
-                }
-
-                if tools:
-                    kwargs["tools"] = self._convert_tools_openai(tools)
+        # 메시지 변환
+        openai_messages = self._convert_messages_openai(messages, system_prompt)
 
-                if tool_choice:
-                    kwargs["tool_choice"] = "auto"
+        kwargs = {
+            "model": self.model,
+            "max_completion_tokens": max_tokens,  # 새 모델은 max_completion_tokens 사용
+            "messages": openai_messages,
+        }
 
-                response = self.client.chat.completions.create(**kwargs)
-                return self._parse_response_openai(response)
+        if tools:
+            kwargs["tools"] = self._provider_tools(tools, self._convert_tools_openai)
 
-            except RateLimitError:
-                logger.warning(f"Rate limit hit, attempt {attempt + 1}/{self.max_retries}")
-                if attempt == self.max_retries - 1:
-                    raise
-                import asyncio
-                await asyncio.sleep(2 ** attempt)
+        if tool_choice:
+            kwargs["tool_choice"] = "auto"
 
-            except APIError as e:
-                logger.error(f"OpenAI API error: {str(e)}")
-                raise
+        response = await self._call(self.client.chat.completions.create, **kwargs)
+        return self._parse_response_openai(response)
 
     async def _chat_gemini(
         self,
         messages: list[dict],
         tools: Optional[list[dict]],
         tool_choice: Optional[dict],
-        system_prompt: Optional[str],
+        system_prompt: Union[str, SystemPrompt, None],
         max_tokens: int,
     ) -> dict:
         """Gemini API 호출 (google-genai 패키지)"""
         from google.genai import types
 
-        for attempt in range(self.max_retries):
-            try:
-                # Gemini용 메시지 변환
-                gemini_contents = self._convert_messages_gemini(messages, system_prompt)
-
-                # 생성 설정
-                config = types.GenerateContentConfig(
-                    max_output_tokens=max_tokens,
-                    system_instruction=system_prompt if system_prompt else None,
-                )
+        # Gemini용 메시지 변환
+        gemini_contents = self._convert_messages_gemini(messages, system_prompt)
+        cached, _ = _split_system_prompt(system_prompt)
 
-                # 도구 설정
-                if tools:
-                    config.tools = self._convert_tools_gemini(tools)
+        # 생성 설정 (system_instruction + tools가 암묵적 캐시 접두부)
+        config = types.GenerateContentConfig(
+            max_output_tokens=max_tokens,
+            system_instruction=cached or None,
+        )
 
-                # 응답 생성
-                response = self.client.models.generate_content(
-                    model=self.model,
-                    contents=gemini_contents,
-                    config=config,
-                )
+        # 도구 설정
+        if tools:
+            config.tools = self._provider_tools(tools, self._convert_tools_gemini)
 
-                return self._parse_response_gemini(response)
+        # 응답 생성
+        response = await self._call(
+            self._gemini_models.generate_content,
+            model=self.model,
+            contents=gemini_contents,
+            config=config,
+        )
 
-            except Exception as e:
-                logger.error(f"Gemini API error, attempt {attempt + 1}/{self.max_retries}: {type(e).__name__}: {e}")
-                import traceback
-                logger.error(f"Traceback: {traceback.format_exc()}")
-                if attempt == self.max_retries - 1:
-                    raise
-                import asyncio
-                await asyncio.sleep(2 ** attempt)
+        return self._parse_response_gemini(response)
 
     # Anthropic 변환 메서드
     def _convert_messages_anthropic(self, messages: list[dict]) -> list[dict]:
@@ -367,7 +698,20 @@ class LLMClient:
 
         return converted
 
-    def _convert_tools_anthropic(self, tools: list[dict]) -> list[dict]:
+    @staticmethod
+    def _provider_tools(tools: list[dict], convert) -> Any:
+        """
+        provider용 도구 정의
+
+        레지스트리의 ToolSchemas면 변환 결과를 캐시해 재사용하고,
+        일반 list면 매번 변환합니다. 반환값은 공유되므로 수정하지 않습니다.
+        """
+        if isinstance(tools, ToolSchemas):
+            return tools.compiled(convert.__name__, convert)
+        return convert(tools)
+
+    @staticmethod
+    def _convert_tools_anthropic(tools: list[dict]) -> list[dict]:
         """Anthropic용 도구 변환"""
         return [
             {
@@ -378,9 +722,57 @@ class LLMClient:
             for tool in tools
         ]
 
+    def _apply_system_and_tools_anthropic(
+        self,
+        kwargs: dict,
+        system_prompt: Union[str, SystemPrompt, None],
+        tools: Optional[list[dict]],
+    ) -> None:
+        """
+        시스템 프롬프트/도구 설정 (프롬프트 캐시 경계 표시)
+
+        Anthropic 프롬프트 캐시 접두부는 tools → system 순서이므로, 고정 시스템 블록에
+        cache_control을 달면 도구 정의까지 함께 캐싱됩니다.
+        """
+        cached, dynamic = _split_system_prompt(system_prompt)
+        if tools:
+            kwargs["tools"] = self._provider_tools(tools, self._convert_tools_anthropic)
+
+        if not isinstance(system_prompt, SystemPrompt) or not settings.llm_prompt_cache:
+            # 일반 문자열이거나 캐시를 끈 경우 (_split_system_prompt가 전체를 cached로 반환)
+            if cached:
+                kwargs["system"] = cached
+            return
+
+        blocks = []
+        if cached:
+            blocks.append({"type": "text", "text": cached, "cache_control": {"type": "ephemeral"}})
+        elif tools:
+            # 변환 결과는 캐시되어 공유되므로 복사본에 표시
+            *rest, last = kwargs["tools"]
+            kwargs["tools"] = [*rest, {**last, "cache_control": {"type": "ephemeral"}}]
+        if dynamic:
+            blocks.append({"type": "text", "text": dynamic})
+        if blocks:
+            kwargs["system"] = blocks
+
+    @staticmethod
+    def _usage_anthropic(usage, output_tokens: Optional[int] = None) -> dict:
+        """Anthropic 사용량 (input_tokens는 캐시 읽기/쓰기분 제외 값)"""
+        cache_read = getattr(usage, "cache_read_input_tokens", 0) or 0
+        cache_write = getattr(usage, "cache_creation_input_tokens", 0) or 0
+        return _usage(
+            (usage.input_tokens or 0) + cache_read + cache_write,
+            output_tokens if output_tokens is not None else usage.output_tokens,
+            cache_hit_tokens=cache_read,
+            cache_write_tokens=cache_write,
+        )
+
     def _parse_response_anthropic(self, response) -> dict:
         """Anthropic 응답 파싱"""
         result = {"content": "", "tool_calls": [], "stop_reason": response.stop_reason}
+        if getattr(response, "usage", None):
+            result["usage"] = self._usage_anthropic(response.usage)
 
         for block in response.content:
             if block.type == "text":
@@ -395,12 +787,23 @@ class LLMClient:
         return result
 
     # OpenAI 변환 메서드
-    def _convert_messages_openai(self, messages: list[dict], system_prompt: Optional[str]) -> list[dict]:
-        """OpenAI용 메시지 변환"""
+    def _convert_messages_openai(
+        self,
+        messages: list[dict],
+        system_prompt: Union[str, SystemPrompt, None],
+    ) -> list[dict]:
+        """
+        OpenAI용 메시지 변환
+
+        OpenAI 호환 API의 프롬프트 캐시는 자동(접두부 일치)이므로, 고정 부분과 동적 부분을
+        별도 system 메시지로 나눠 고정 접두부가 바뀌지 않게 합니다.
+        """
         converted = []
 
-        if system_prompt:
-            converted.append({"role": "system", "content": system_prompt})
+        cached, dynamic = _split_system_prompt(system_prompt)
+        for part in (cached, dynamic):
+            if part:
+                converted.append({"role": "system", "content": part})
 
         for msg in messages:
             role = msg.get("role", "user")
@@ -417,7 +820,8 @@ class LLMClient:
 
         return converted
 
-    def _convert_tools_openai(self, tools: list[dict]) -> list[dict]:
+    @staticmethod
+    def _convert_tools_openai(tools: list[dict]) -> list[dict]:
         """OpenAI용 도구 변환"""
         return [
             {
@@ -438,6 +842,7 @@ class LLMClient:
             "content": message.content or "",
             "tool_calls": [],
             "stop_reason": response.choices[0].finish_reason,
+            "usage": self._usage_openai(getattr(response, "usage", None)),
         }
 
         if message.tool_calls:
@@ -450,13 +855,38 @@ class LLMClient:
 
         return result
 
+    @staticmethod
+    def _usage_openai(usage) -> Optional[dict]:
+        """OpenAI 형식 사용량 (SDK 객체, prompt_tokens는 캐시 적중분 포함)"""
+        if not usage:
+            return None
+        details = getattr(usage, "prompt_tokens_details", None)
+        return _usage(
+            usage.prompt_tokens,
+            usage.completion_tokens,
+            cache_hit_tokens=getattr(details, "cached_tokens", 0) if details else 0,
+        )
+
     # Gemini 변환 메서드
-    def _convert_messages_gemini(self, messages: list[dict], system_prompt: Optional[str]) -> list:
-        """Gemini용 메시지 변환 (google-genai 패키지)"""
+    def _convert_messages_gemini(
+        self,
+        messages: list[dict],
+        system_prompt: Union[str, SystemPrompt, None],
+    ) -> list:
+        """
+        Gemini용 메시지 변환 (google-genai 패키지)
+
+        시스템 프롬프트의 고정 부분은 system_instruction으로 보내고,
+        동적 부분은 대화 맨 앞의 user 메시지로 넣어 캐시 접두부를 유지합니다.
+        """
         from google.genai import types
 
         converted = []
 
+        _, dynamic = _split_system_prompt(system_prompt)
+        if dynamic:
+            converted.append(types.Content(role="user", parts=[types.Part(text=dynamic)]))
+
         for msg in messages:
             role = msg.get("role", "user")
             content = msg.get("content", "")
@@ -488,7 +918,8 @@ class LLMClient:
 
         return converted
 
-    def _convert_tools_gemini(self, tools: list[dict]) -> list:
+    @staticmethod
+    def _convert_tools_gemini(tools: list[dict]) -> list:
         """Gemini용 도구 변환 (google-genai 패키지)"""
         from google.genai import types
 
@@ -530,6 +961,14 @@ class LLMClient:
         """Gemini 응답 파싱 (google-genai 패키지)"""
         result = {"content": "", "tool_calls": [], "stop_reason": "end_turn"}
 
+        usage_metadata = getattr(response, "usage_metadata", None)
+        if usage_metadata and usage_metadata.prompt_token_count is not None:
+            result["usage"] = _usage(
+                usage_metadata.prompt_token_count,
+                usage_metadata.candidates_token_count,
+                cache_hit_tokens=usage_metadata.cached_content_token_count,
+            )
+
         try:
             # 텍스트 응답 추출
             if hasattr(response, "text") and response.text:
@@ -568,42 +1007,33 @@ class LLMClient:
         messages: list[dict],
         tools: Optional[list[dict]],
         tool_choice: Optional[dict],
-        system_prompt: Optional[str],
+        system_prompt: Union[str, SystemPrompt, None],
         max_tokens: int,
     ) -> dict:
         """LiteLLM API 호출"""
-        for attempt in range(self.max_retries):
-            try:
-                # OpenAI 형식으로 메시지 변환
-                litellm_messages = self._convert_messages_openai(messages, system_prompt)
-
-                kwargs = {
-                    "model": self.model,
-                    "messages": litellm_messages,
-                    "max_tokens": max_tokens,
-                }
+        # OpenAI 형식으로 메시지 변환
+        litellm_messages = self._convert_messages_openai(messages, system_prompt)
 
-                if self.api_key:
-                    kwargs["api_key"] = self.api_key
-                if self.api_base:
-                    kwargs["api_base"] = self.api_base
+        kwargs = {
+            "model": self.model,
+            "messages": litellm_messages,
+            "max_tokens": max_tokens,
+        }
 
-                if tools:
-                    kwargs["tools"] = self._convert_tools_openai(tools)
+        if self.api_key:
+            kwargs["api_key"] = self.api_key
+        if self.api_base:
+            kwargs["api_base"] = self.api_base
 
-                if tool_choice:
-                    kwargs["tool_choice"] = "auto"
+        if tools:
+            kwargs["tools"] = self._provider_tools(tools, self._convert_tools_openai)
 
-                # LiteLLM async completion
-                response = await self.client.acompletion(**kwargs)
-                return self._parse_response_litellm(response)
+        if tool_choice:
+            kwargs["tool_choice"] = "auto"
 
-            except Exception as e:
-                logger.error(f"LiteLLM API error, attempt {attempt + 1}/{self.max_retries}: {type(e).__name__}: {e}")
-                if attempt == self.max_retries - 1:
-                    raise
-                import asyncio
-                await asyncio.sleep(2 ** attempt)
+        # LiteLLM async completion
+        response = await self.client.acompletion(**kwargs)
+        return self._parse_response_litellm(response)
 
     async def _chat_stream_litellm(self, messages, tools, tool_choice, system_prompt, max_tokens):
         """LiteLLM 스트리밍 API 호출"""
@@ -614,6 +1044,7 @@ class LLMClient:
             "messages": litellm_messages,
             "max_tokens": max_tokens,
             "stream": True,
+            "stream_options": {"include_usage": True},
         }
 
         if self.api_key:
@@ -622,14 +1053,13 @@ class LLMClient:
             kwargs["api_base"] = self.api_base
 
         if tools:
-            kwargs["tools"] = self._convert_tools_openai(tools)
+            kwargs["tools"] = self._provider_tools(tools, self._convert_tools_openai)
+        if tool_choice:
+            kwargs["tool_choice"] = "auto"
 
         response = await self.client.acompletion(**kwargs)
-        async for chunk in response:
-            if hasattr(chunk, "choices") and chunk.choices:
-                delta = chunk.choices[0].delta
-                if hasattr(delta, "content") and delta.content:
-                    yield delta.content
+        async for event in self._openai_stream_events(response):
+            yield event
 
     def _parse_response_litellm(self, response) -> dict:
         """LiteLLM 응답 파싱"""
@@ -645,6 +1075,7 @@ class LLMClient:
 
             result["content"] = message.content or ""
             result["stop_reason"] = choice.finish_reason or "end_turn"
+            result["usage"] = self._usage_openai(getattr(response, "usage", None))
 
             if hasattr(message, "tool_calls") and message.tool_calls:
                 for tc in message.tool_calls:
@@ -672,39 +1103,30 @@ class LLMClient:
         messages: list[dict],
         tools: Optional[list[dict]],
         tool_choice: Optional[dict],
-        system_prompt: Optional[str],
+        system_prompt: Union[str, SystemPrompt, None],
         max_tokens: int,
     ) -> dict:
         """Custom LLM API 호출 (OpenAI 호환)"""
-        for attempt in range(self.max_retries):
-            try:
-                # OpenAI 형식으로 메시지 변환
-                openai_messages = self._convert_messages_openai(messages, system_prompt)
-
-                payload = {
-                    "model": self.model,
-                    "messages": openai_messages,
-                    "max_tokens": max_tokens,
-                }
+        # OpenAI 형식으로 메시지 변환
+        openai_messages = self._convert_messages_openai(messages, system_prompt)
 
-                if tools:
-                    payload["tools"] = self._convert_tools_openai(tools)
+        payload = {
+            "model": self.model,
+            "messages": openai_messages,
+            "max_tokens": max_tokens,
+        }
 
-                if tool_choice:
-                    payload["tool_choice"] = "auto"
+        if tools:
+            payload["tools"] = self._provider_tools(tools, self._convert_tools_openai)
 
-                response = await self.client.post("/chat/completions", json=payload)
-                response.raise_for_status()
-                data = response.json()
+        if tool_choice:
+            payload["tool_choice"] = "auto"
 
-                return self._parse_response_custom(data)
+        response = await self.client.post("/chat/completions", json=payload)
+        response.raise_for_status()
+        data = response.json()
 
-            except Exception as e:
-                logger.error(f"Custom LLM API error, attempt {attempt + 1}/{self.max_retries}: {type(e).__name__}: {e}")
-                if attempt == self.max_retries - 1:
-                    raise
-                import asyncio
-                await asyncio.sleep(2 ** attempt)
+        return self._parse_response_custom(data)
 
     async def _chat_stream_custom(self, messages, tools, tool_choice, system_prompt, max_tokens):
         """Custom LLM 스트리밍 API 호출 (OpenAI 호환)"""
@@ -718,7 +1140,14 @@ class LLMClient:
         }
 
         if tools:
-            payload["tools"] = self._convert_tools_openai(tools)
+            payload["tools"] = self._provider_tools(tools, self._convert_tools_openai)
+        if tool_choice:
+            payload["tool_choice"] = "auto"
+
+        text_parts = []
+        tool_calls = _ToolCallAccumulator()
+        stop_reason = "end_turn"
+        usage = None
 
         async with self.client.stream("POST", "/chat/completions", json=payload) as response:
             response.raise_for_status()
@@ -729,10 +1158,32 @@ class LLMClient:
                         break
                     try:
                         chunk = json.loads(data)
-                        if chunk.get("choices") and chunk["choices"][0].get("delta", {}).get("content"):
-                            yield chunk["choices"][0]["delta"]["content"]
                     except json.JSONDecodeError:
                         continue
+                    if chunk.get("usage"):
+                        usage = self._usage_custom(chunk["usage"])
+                    if not chunk.get("choices"):
+                        continue
+
+                    choice = chunk["choices"][0]
+                    delta = choice.get("delta", {})
+                    if delta.get("content"):
+                        text_parts.append(delta["content"])
+                        yield {"type": "text", "text": delta["content"]}
+
+                    for tc in delta.get("tool_calls") or []:
+                        function = tc.get("function") or {}
+                        tool_calls.add(
+                            tc.get("index", 0),
+                            call_id=tc.get("id"),
+                            name=function.get("name"),
+                            arguments=function.get("arguments"),
+                        )
+
+                    if choice.get("finish_reason"):
+                        stop_reason = choice["finish_reason"]
+
+        yield _message_event("".join(text_parts), tool_calls.build(), stop_reason, usage)
 
     def _parse_response_custom(self, data: dict) -> dict:
         """Custom LLM 응답 파싱 (OpenAI 형식)"""
@@ -767,15 +1218,28 @@ class LLMClient:
                 if result["tool_calls"]:
                     result["stop_reason"] = "tool_use"
 
+        if data.get("usage"):
+            result["usage"] = self._usage_custom(data["usage"])
+
         return result
 
+    @staticmethod
+    def _usage_custom(usage: dict) -> dict:
+        """Custom LLM 사용량 (OpenAI 형식 JSON)"""
+        return _usage(
+            usage.get("prompt_tokens"),
+            usage.get("completion_tokens"),
+            cache_hit_tokens=(usage.get("prompt_tokens_details") or {}).get("cached_tokens"),
+        )
+
 
 class MockLLMClient:
     """테스트용 Mock LLM 클라이언트"""
 
-    def __init__(self):
+    def __init__(self, stream_delay: float = 0.02):
         self.responses = []
         self.call_count = 0
+        self.stream_delay = stream_delay
 
     def add_response(self, response: dict):
         """Mock 응답 추가"""
@@ -786,7 +1250,7 @@ class MockLLMClient:
         messages: list[dict],
         tools: Optional[list[dict]] = None,
         tool_choice: Optional[dict] = None,
-        system_prompt: Optional[str] = None,
+        system_prompt: Union[str, SystemPrompt, None] = None,
         max_tokens: int = 4096,
     ) -> dict:
         """Mock 대화"""
@@ -816,19 +1280,37 @@ class MockLLMClient:
             "stop_reason": "end_turn",
         }
 
+    async def chat_stream_events(
+        self,
+        messages: list[dict],
+        tools: Optional[list[dict]] = None,
+        tool_choice: Optional[dict] = None,
+        system_prompt: Union[str, SystemPrompt, None] = None,
+        max_tokens: int = 4096,
+    ):
+        """Mock 스트리밍 대화 (도구 호출 포함, chat() 응답을 글자 단위로 전달)"""
+        response = await self.chat(messages, tools, tool_choice, system_prompt, max_tokens)
+        for char in response.get("content", ""):
+            yield {"type": "text", "text": char}
+            await asyncio.sleep(self.stream_delay)  # 타이핑 효과
+        yield _message_event(
+            response.get("content", ""),
+            response.get("tool_calls", []),
+            response.get("stop_reason", "end_turn"),
+        )
+
     async def chat_stream(
         self,
         messages: list[dict],
         tools: Optional[list[dict]] = None,
         tool_choice: Optional[dict] = None,
-        system_prompt: Optional[str] = None,
+        system_prompt: Union[str, SystemPrompt, None] = None,
         max_tokens: int = 4096,
     ):
         """Mock 스트리밍 대화"""
-        import asyncio
         response_text = "안녕하세요! 회의 일정 조율을 도와드릴게요. 어떤 회의를 잡으시겠어요?"
 
         # 텍스트를 청크로 나눠서 yield
         for char in response_text:
             yield char
-            await asyncio.sleep(0.02)  # 타이핑 효과
+            await asyncio.sleep(self.stream_delay)  # 타이핑 효과
@@ -0,0 +1,139 @@
+"""LLM 클라이언트 풀
+
+요청마다 LLMClient를 새로 만들면 SDK 클라이언트와 HTTP 커넥션 풀도 새로 생기고
+매번 TCP/TLS 연결 비용을 냅니다. (provider, 호출 방식)별로 프로세스 공용
+LLMClient 하나를 만들어 keep-alive 연결을 재사용하고,
+FastAPI lifespan 종료 시 한꺼번에 닫습니다.
+"""
+
+from typing import Optional
+
+import httpx
+
+from config import get_settings
+from utils.logger import get_logger
+from .llm_client import LLMCallMode, LLMClient, LLMProvider
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+class LLMClientPool:
+    """(provider, 호출 방식)별 공용 LLM 클라이언트 풀"""
+
+    def __init__(
+        self,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 120.0,
+        max_connections_by_provider: Optional[dict[str, int]] = None,
+    ):
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.max_connections_by_provider = max_connections_by_provider or {}
+        self._clients: dict[tuple[LLMProvider, LLMCallMode], LLMClient] = {}
+        self.requests_total = 0
+        self.created_total = 0
+
+    def limits(self, provider: str) -> httpx.Limits:
+        """provider별 커넥션 풀 제한"""
+        max_connections = self.max_connections_by_provider.get(provider, self.max_connections)
+        return httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=min(self.max_keepalive_connections, max_connections),
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def get(self, provider: Optional[str] = None, call_mode: Optional[str] = None) -> LLMClient:
+        """
+        공용 LLM 클라이언트 반환 (없으면 생성)
+
+        Args:
+            provider: LLM 제공자 (기본: 설정값)
+            call_mode: SDK 호출 방식 (기본: 설정값)
+
+        Returns:
+            LLM 클라이언트
+        """
+        key = (
+            LLMProvider(provider or settings.llm_provider),
+            LLMCallMode(call_mode or settings.llm_call_mode),
+        )
+        self.requests_total += 1
+        client = self._clients.get(key)
+        if client is None:
+            client = LLMClient(key[0].value, key[1].value, limits=self.limits(key[0].value))
+            self._clients[key] = client
+            self.created_total += 1
+            logger.info(f"LLM client created: {key[0].value} ({key[1].value})")
+        return client
+
+    async def warmup(self, provider: Optional[str] = None) -> bool:
+        """
+        provider 연결을 미리 열어 둠
+
+        Args:
+            provider: LLM 제공자 (기본: 설정값)
+
+        Returns:
+            연결 성공 여부
+        """
+        return await self.get(provider).warmup()
+
+    def stats(self) -> dict:
+        """클라이언트 재사용/커넥션 풀 설정 지표"""
+        return {
+            "requests_total": self.requests_total,
+            "created_total": self.created_total,
+            "clients": [
+                {
+                    "provider": provider.value,
+                    "call_mode": call_mode.value,
+                    "model": client.model,
+                    "max_connections": client.limits.max_connections,
+                    "max_keepalive_connections": client.limits.max_keepalive_connections,
+                    "keepalive_expiry": client.limits.keepalive_expiry,
+                }
+                for (provider, call_mode), client in self._clients.items()
+            ],
+        }
+
+    async def close_all(self) -> None:
+        """모든 클라이언트 종료"""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            try:
+                await client.close()
+            except Exception as e:
+                logger.warning(f"LLM client close failed ({client.provider.value}): {e}")
+        if clients:
+            logger.info(f"LLM clients closed: {len(clients)}")
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+
+_pool: Optional[LLMClientPool] = None
+
+
+def get_llm_pool() -> LLMClientPool:
+    """설정에 따른 프로세스 공용 LLM 클라이언트 풀 반환"""
+    global _pool
+    if _pool is None:
+        _pool = LLMClientPool(
+            max_connections=settings.llm_pool_max_connections,
+            max_keepalive_connections=settings.llm_pool_max_keepalive,
+            keepalive_expiry=settings.llm_keepalive_expiry,
+            max_connections_by_provider={
+                provider.value: settings.get_llm_pool_max_connections(provider.value)
+                for provider in LLMProvider
+            },
+        )
+    return _pool
+
+
+def get_llm_client(provider: Optional[str] = None) -> LLMClient:
+    """공용 풀에서 LLM 클라이언트 반환"""
+    return get_llm_pool().get(provider)
@@ -0,0 +1,409 @@
+"""LLM provider 라우팅 (헤징/장애 조치)
+
+용도(도구 호출 / Intent 파싱)별로 설정한 provider 우선순위에 따라 요청을 보냅니다.
+기본 provider의 응답이 최근 지연 시간 백분위를 넘도록 오지 않으면 예비 provider에
+두 번째 요청을 보내 먼저 온 쓸 만한 응답을 쓰고 나머지는 취소합니다.
+오류가 나면 다음 provider로 넘어가고, 연속으로 실패한 provider는 잠시 뒤로 미룹니다.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Optional, Union
+
+from config import get_settings
+from utils.logger import get_logger
+from .llm_client import LLMProvider, SystemPrompt
+from .llm_pool import LLMClientPool, get_llm_pool
+from .rate_limiter import RateLimitExceeded
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# 지연 시간 백분위 계산에 필요한 최소 표본 수
+MIN_LATENCY_SAMPLES = 10
+
+
+class ProviderHealth:
+    """provider별 최근 성공률/지연 시간과 일시 제외 상태"""
+
+    def __init__(self, window: int = 100, failure_threshold: int = 3, cooldown_seconds: float = 30.0):
+        self.latencies: deque[float] = deque(maxlen=window)
+        self.outcomes: deque[bool] = deque(maxlen=window)
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.consecutive_failures = 0
+        self.unavailable_until = 0.0
+        self.requests_total = 0
+        self.errors_total = 0
+
+    def record_success(self, latency: float) -> None:
+        self.requests_total += 1
+        self.latencies.append(latency)
+        self.outcomes.append(True)
+        self.consecutive_failures = 0
+
+    def record_failure(self) -> None:
+        self.requests_total += 1
+        self.errors_total += 1
+        self.outcomes.append(False)
+        self.consecutive_failures += 1
+        if self.consecutive_failures >= self.failure_threshold:
+            self.unavailable_until = time.monotonic() + self.cooldown_seconds
+
+    @property
+    def available(self) -> bool:
+        """일시 제외 중이 아닌지"""
+        return time.monotonic() >= self.unavailable_until
+
+    @property
+    def score(self) -> float:
+        """건강 점수 (최근 성공률, 제외 중이면 0)"""
+        if not self.available:
+            return 0.0
+        if not self.outcomes:
+            return 1.0
+        return sum(self.outcomes) / len(self.outcomes)
+
+    def latency_percentile(self, percentile: float) -> Optional[float]:
+        """최근 성공 응답 지연 시간 백분위 (표본이 부족하면 None)"""
+        if len(self.latencies) < MIN_LATENCY_SAMPLES:
+            return None
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, int(percentile * len(ordered)))
+        return ordered[index]
+
+    def stats(self) -> dict:
+        p50 = self.latency_percentile(0.5)
+        p95 = self.latency_percentile(0.95)
+        return {
+            "score": round(self.score, 3),
+            "available": self.available,
+            "requests_total": self.requests_total,
+            "errors_total": self.errors_total,
+            "consecutive_failures": self.consecutive_failures,
+            "latency_p50": round(p50, 3) if p50 is not None else None,
+            "latency_p95": round(p95, 3) if p95 is not None else None,
+        }
+
+
+_health: dict[str, ProviderHealth] = {}
+
+
+def get_provider_health(provider: str) -> ProviderHealth:
+    """provider별 프로세스 공용 건강 상태 반환 (용도와 관계없이 공유)"""
+    health = _health.get(provider)
+    if health is None:
+        health = ProviderHealth(
+            failure_threshold=settings.llm_failure_threshold,
+            cooldown_seconds=settings.llm_failure_cooldown,
+        )
+        _health[provider] = health
+    return health
+
+
+def _is_usable(response: dict) -> bool:
+    """응답에 텍스트나 도구 호출이 있는지"""
+    return bool(response.get("content") or response.get("tool_calls"))
+
+
+class LLMRouter:
+    """
+    여러 provider에 걸친 LLM 요청 라우터
+
+    LLMClient와 같은 chat()/chat_stream()/chat_stream_events() 인터페이스를 제공합니다.
+    스트리밍은 첫 이벤트 전 오류만 다음 provider로 넘기고 헤징하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        providers: list[str],
+        purpose: str = "agent",
+        pool: Optional[LLMClientPool] = None,
+        hedge_enabled: bool = True,
+        hedge_percentile: float = 0.95,
+        hedge_min_delay: float = 1.0,
+        hedge_default_delay: float = 5.0,
+    ):
+        """
+        Args:
+            providers: provider 우선순위
+            purpose: 용도 (agent, intent)
+            pool: LLM 클라이언트 풀 (기본: 프로세스 공용 풀)
+            hedge_enabled: 헤징 사용 여부
+            hedge_percentile: 이 지연 시간 백분위를 넘으면 헤징
+            hedge_min_delay: 헤징 전 최소 대기 시간 (초)
+            hedge_default_delay: 지연 시간 표본이 부족할 때의 헤징 대기 시간 (초)
+        """
+        self.providers = providers
+        self.purpose = purpose
+        self.pool = pool or get_llm_pool()
+        self.hedge_enabled = hedge_enabled
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_delay = hedge_min_delay
+        self.hedge_default_delay = hedge_default_delay
+
+        self.requests_total = 0
+        self.hedged_total = 0
+        self.hedge_wins = 0  # 헤징 요청이 먼저 응답한 횟수
+        self.failovers_total = 0
+        self.wins: dict[str, int] = {provider: 0 for provider in providers}
+
+    @property
+    def provider(self) -> LLMProvider:
+        """기본 provider (대화 이력 예산 등 provider별 설정 조회용)"""
+        return LLMProvider(self.providers[0])
+
+    def ranked_providers(self) -> list[str]:
+        """요청 순서 (일시 제외/성공률 50% 미만 provider는 뒤로, 나머지는 설정 순서)"""
+        def rank(item: tuple[int, str]) -> tuple:
+            index, provider = item
+            health = get_provider_health(provider)
+            return (not health.available, health.score < 0.5, index)
+
+        return [provider for _, provider in sorted(enumerate(self.providers), key=rank)]
+
+    def hedge_delay(self, provider: str) -> float:
+        """provider 응답을 기다렸다가 헤징할 때까지의 시간"""
+        latency = get_provider_health(provider).latency_percentile(self.hedge_percentile)
+        if latency is None:
+            latency = self.hedge_default_delay
+        return max(self.hedge_min_delay, latency)
+
+    async def _chat_on(self, provider: str, **kwargs) -> dict:
+        """
+        provider 하나로 요청하고 건강 상태 기록
+
+        취소된 요청과 우리 쪽 속도 제한 대기열이 거절한 요청은 provider 상태와 무관하므로 기록하지 않습니다.
+        """
+        health = get_provider_health(provider)
+        started = time.monotonic()
+        try:
+            response = await self.pool.get(provider).chat(**kwargs)
+        except (asyncio.CancelledError, RateLimitExceeded):
+            raise
+        except Exception:
+            health.record_failure()
+            raise
+
+        if _is_usable(response):
+            health.record_success(time.monotonic() - started)
+        else:
+            health.record_failure()
+        return response
+
+    async def chat(
+        self,
+        messages: list[dict],
+        tools: Optional[list[dict]] = None,
+        tool_choice: Optional[dict] = None,
+        system_prompt: Union[str, SystemPrompt, None] = None,
+        max_tokens: int = 4096,
+    ) -> dict:
+        """
+        LLM과 대화 (헤징 + 장애 조치)
+
+        Args:
+            messages: 대화 메시지 목록
+            tools: 사용 가능한 도구 목록
+            tool_choice: 도구 선택 옵션
+            system_prompt: 시스템 프롬프트
+            max_tokens: 최대 응답 토큰 수
+
+        Returns:
+            먼저 도착한 쓸 만한 응답
+        """
+        kwargs = {
+            "messages": messages,
+            "tools": tools,
+            "tool_choice": tool_choice,
+            "system_prompt": system_prompt,
+            "max_tokens": max_tokens,
+        }
+        self.requests_total += 1
+        candidates = self.ranked_providers()
+        primary = candidates[0]
+        pending: dict[asyncio.Task, str] = {}
+        hedged = False
+        last_error: Optional[Exception] = None
+        fallback: Optional[dict] = None  # 비어 있는 응답 (다른 응답이 없을 때만 사용)
+
+        def launch() -> None:
+            provider = candidates.pop(0)
+            pending[asyncio.create_task(self._chat_on(provider, **kwargs))] = provider
+
+        launch()
+        try:
+            while pending:
+                timeout = None
+                if self.hedge_enabled and not hedged and candidates and len(pending) == 1:
+                    timeout = self.hedge_delay(next(iter(pending.values())))
+
+                done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    hedged = True
+                    self.hedged_total += 1
+                    logger.info(f"LLM hedge ({self.purpose}): {pending[next(iter(pending))]} -> {candidates[0]}")
+                    launch()
+                    continue
+
+                for task in done:
+                    provider = pending.pop(task)
+                    try:
+                        response = task.result()
+                    except Exception as e:
+                        logger.warning(f"LLM provider failed ({self.purpose}, {provider}): {type(e).__name__}: {e}")
+                        last_error = e
+                        continue
+                    if not _is_usable(response):
+                        fallback = fallback or response
+                        continue
+
+                    if hedged and provider != primary:
+                        self.hedge_wins += 1
+                    self.wins[provider] = self.wins.get(provider, 0) + 1
+                    return response
+
+                if not pending and candidates:
+                    self.failovers_total += 1
+                    logger.info(f"LLM failover ({self.purpose}): -> {candidates[0]}")
+                    launch()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        if fallback is not None:
+            return fallback
+        raise last_error
+
+    async def chat_stream(
+        self,
+        messages: list[dict],
+        tools: Optional[list[dict]] = None,
+        tool_choice: Optional[dict] = None,
+        system_prompt: Union[str, SystemPrompt, None] = None,
+        max_tokens: int = 4096,
+    ):
+        """
+        LLM 스트리밍 대화
+
+        Yields:
+            str: 응답 텍스트 청크
+        """
+        async for event in self.chat_stream_events(messages, tools, tool_choice, system_prompt, max_tokens):
+            if event["type"] == "text":
+                yield event["text"]
+
+    async def chat_stream_events(
+        self,
+        messages: list[dict],
+        tools: Optional[list[dict]] = None,
+        tool_choice: Optional[dict] = None,
+        system_prompt: Union[str, SystemPrompt, None] = None,
+        max_tokens: int = 4096,
+    ):
+        """
+        LLM 스트리밍 대화 (도구 호출 포함, 첫 이벤트 전 오류는 다음 provider로)
+
+        Yields:
+            dict: LLMClient.chat_stream_events()와 같은 이벤트
+        """
+        self.requests_total += 1
+        last_error: Optional[Exception] = None
+
+        for index, provider in enumerate(self.ranked_providers()):
+            if index:
+                self.failovers_total += 1
+                logger.info(f"LLM failover ({self.purpose}): -> {provider}")
+
+            health = get_provider_health(provider)
+            started = time.monotonic()
+            streamed = False
+            try:
+                async for event in self.pool.get(provider).chat_stream_events(
+                    messages, tools, tool_choice, system_prompt, max_tokens,
+                ):
+                    streamed = True
+                    yield event
+            except Exception as e:
+                if not isinstance(e, RateLimitExceeded):  # 우리 쪽 대기열 거절은 provider 실패가 아님
+                    health.record_failure()
+                if streamed:
+                    raise
+                logger.warning(f"LLM provider failed ({self.purpose}, {provider}): {type(e).__name__}: {e}")
+                last_error = e
+                continue
+
+            health.record_success(time.monotonic() - started)
+            self.wins[provider] = self.wins.get(provider, 0) + 1
+            return
+
+        raise last_error
+
+    def stats(self) -> dict:
+        """라우팅 지표"""
+        return {
+            "purpose": self.purpose,
+            "providers": self.providers,
+            "requests_total": self.requests_total,
+            "hedged_total": self.hedged_total,
+            "hedge_wins": self.hedge_wins,
+            "failovers_total": self.failovers_total,
+            "wins": self.wins,
+            "health": {provider: get_provider_health(provider).stats() for provider in self.providers},
+        }
+
+
+_routers: dict[str, LLMRouter] = {}
+
+
+_replay_client = None
+
+
+def get_llm_router(purpose: str = "agent"):
+    """
+    설정에 따른 용도별 프로세스 공용 LLM 라우터 반환
+
+    LLM_REPLAY_MODE=replay면 기록 재생 클라이언트(용도 공용),
+    record면 기록 클라이언트로 감싼 라우터를 반환합니다.
+
+    Args:
+        purpose: agent (도구 호출), intent (Intent 파싱)
+
+    Returns:
+        LLM 라우터 (또는 같은 인터페이스의 재생/기록 클라이언트)
+    """
+    global _replay_client
+    if settings.llm_replay_mode == "replay":
+        if _replay_client is None:
+            from .replay_client import ReplayLLMClient
+            _replay_client = ReplayLLMClient(
+                settings.llm_replay_path,
+                latency=settings.llm_replay_latency,
+                fixed_latency=settings.llm_replay_fixed_latency,
+            )
+            logger.info(f"LLM replay: {settings.llm_replay_path} ({settings.llm_replay_latency})")
+        return _replay_client
+
+    router = _routers.get(purpose)
+    if router is None:
+        router = LLMRouter(
+            settings.get_llm_providers(purpose),
+            purpose=purpose,
+            hedge_enabled=settings.llm_hedge_enabled,
+            hedge_percentile=settings.llm_hedge_percentile,
+            hedge_min_delay=settings.llm_hedge_min_delay,
+            hedge_default_delay=settings.llm_hedge_default_delay,
+        )
+        logger.info(f"LLM router ({purpose}): {', '.join(router.providers)}")
+        if settings.llm_replay_mode == "record":
+            from .replay_client import RecordingLLMClient
+            router = RecordingLLMClient(router, settings.llm_replay_path)
+            logger.info(f"LLM recording ({purpose}): {settings.llm_replay_path}")
+        _routers[purpose] = router
+    return router
+
+
+def get_llm_router_stats() -> list[dict]:
+    """생성된 모든 라우터의 지표"""
+    return [getattr(router, "inner", router).stats() for router in _routers.values()]
@@ -2,13 +2,19 @@
 
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Optional
 from jinja2 import Environment, FileSystemLoader
 
-from utils.datetime_utils import get_today, get_current_datetime, KST
+from utils.datetime_utils import get_current_datetime
 
 
 class PromptManager:
-    """프롬프트 템플릿 관리"""
+    """
+    프롬프트 템플릿 관리
+
+    템플릿은 생성 시 한 번 컴파일하고, 고정 부분은 한 번만 렌더링합니다.
+    날짜/시간 섹션은 분 단위로만 바뀌므로 같은 분 안에서는 렌더링 결과를 재사용합니다.
+    """
 
     def __init__(self):
         template_dir = Path(__file__).parent
@@ -16,13 +22,41 @@ class PromptManager:
             loader=FileSystemLoader(template_dir),
             autoescape=False,
         )
+        self._system_template = self.env.get_template("system.jinja2")
+        self._datetime_template = self.env.get_template("datetime.jinja2")
+        self._static_prompt: Optional[str] = None
+        # (렌더링한 분, 결과)
+        self._datetime_prompt: Optional[tuple[datetime, str]] = None
 
     def get_system_prompt(self) -> str:
-        """시스템 프롬프트 생성"""
-        template = self.env.get_template("system.jinja2")
-
-        today = get_today()
-        now = get_current_datetime()
+        """시스템 프롬프트 생성 (고정 부분 + 현재 날짜/시간)"""
+        return f"{self.get_static_prompt()}\n\n{self.get_datetime_prompt()}"
+
+    def get_static_prompt(self) -> str:
+        """
+        시스템 프롬프트 고정 부분
+
+        시각에 따라 바뀌는 값을 넣지 않아 요청 간 바이트 단위로 동일하므로,
+        provider 프롬프트 캐시의 접두부로 사용합니다.
+        """
+        if self._static_prompt is None:
+            self._static_prompt = self._system_template.render()
+        return self._static_prompt
+
+    def get_datetime_prompt(self) -> str:
+        """현재 날짜/시간 섹션 (프롬프트 캐시 경계 뒤에 붙는 동적 부분)"""
+        minute = get_current_datetime().replace(second=0, microsecond=0)
+        cached = self._datetime_prompt
+        if cached is not None and cached[0] == minute:
+            return cached[1]
+
+        rendered = self._render_datetime_prompt(minute)
+        self._datetime_prompt = (minute, rendered)
+        return rendered
+
+    def _render_datetime_prompt(self, now: datetime) -> str:
+        """now 기준 날짜/시간 섹션 렌더링"""
+        today = now.date()
         tomorrow = today + timedelta(days=1)
 
         # 다음 주 월요일 계산
@@ -40,7 +74,7 @@ class PromptManager:
             "next_week_end": next_week_end.strftime("%Y년 %m월 %d일 (%a)"),
         }
 
-        return template.render(**context)
+        return self._datetime_template.render(**context)
 
     def get_context_summary(self, context: dict) -> str:
         """대화 컨텍스트 요약 생성"""
@@ -72,3 +106,14 @@ class PromptManager:
             return "\n현재 진행 상황:\n- " + "\n- ".join(summary_parts)
 
         return ""
+
+
+_prompt_manager: Optional[PromptManager] = None
+
+
+def get_prompt_manager() -> PromptManager:
+    """프로세스 공용 프롬프트 관리자 반환 (렌더링 캐시 공유)"""
+    global _prompt_manager
+    if _prompt_manager is None:
+        _prompt_manager = PromptManager()
+    return _prompt_manager
@@ -0,0 +1,435 @@
+"""LLM provider 요청 속도 제한 및 재시도 스케줄러
+
+(provider, 모델)별 프로세스 공용 리미터가 분당 요청 수/토큰 수를 토큰 버킷으로
+계산해 요청을 대기열에서 고르게 내보냅니다. 429 응답을 받으면
+Retry-After/rate-limit 헤더가 알려 준 시각까지 같은 리미터를 쓰는 모든 요청을 멈추고
+허용 속도를 절반으로 줄였다가 성공할 때마다 조금씩 되돌립니다.
+재시도 간격에는 지터를 넣어 여러 요청/워커가 같은 시각에 몰리지 않게 합니다.
+"""
+
+import asyncio
+import random
+import re
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Optional
+
+import httpx
+
+from config import get_settings
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# 429 이후 허용 속도 하한 (설정값 대비 비율)과 성공 시 회복 폭
+MIN_RATE_RATIO = 0.1
+RECOVERY_RATIO = 0.05
+
+# 재시도할 HTTP 상태 코드 (429 제외: 속도 제한으로 따로 처리)
+RETRYABLE_STATUS_CODES = {408, 409, 500, 502, 503, 504, 529}
+RETRYABLE_ERROR_NAMES = {"APIConnectionError", "APITimeoutError", "Timeout", "ServiceUnavailableError"}
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+
+
+class RateLimitExceeded(Exception):
+    """대기열이 가득 찼거나 최대 대기 시간을 넘어 요청을 보내지 않음"""
+
+    def __init__(self, limiter: str, wait_seconds: float):
+        super().__init__(f"LLM rate limit exceeded ({limiter}): wait {wait_seconds:.1f}s")
+        self.wait_seconds = wait_seconds
+
+
+class TokenBucket:
+    """
+    토큰 버킷 (예약 방식)
+
+    잔량이 부족해도 요청을 거절하지 않고 잔량을 음수로 만들어 예약한 뒤
+    채워질 때까지의 대기 시간을 돌려줍니다. 먼저 예약한 요청이 먼저 나갑니다.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        self.rate_per_minute = rate_per_minute
+        self.capacity = capacity or rate_per_minute
+        self.tokens = self.capacity
+        self._updated_at = time.monotonic()
+
+    @property
+    def rate(self) -> float:
+        """초당 충전량"""
+        return self.rate_per_minute / 60
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def reserve(self, amount: float, now: Optional[float] = None) -> float:
+        """
+        amount만큼 예약
+
+        Args:
+            amount: 사용할 양 (용량을 넘으면 용량만큼)
+            now: 현재 시각 (time.monotonic)
+
+        Returns:
+            예약한 양을 쓸 수 있을 때까지 기다릴 시간 (초)
+        """
+        self._refill(time.monotonic() if now is None else now)
+        self.tokens -= min(amount, self.capacity)
+        return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+    def refund(self, amount: float) -> None:
+        """예약량 보정 (양수면 반환, 음수면 추가 차감)"""
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+
+def _parse_reset(value: str) -> Optional[float]:
+    """rate-limit reset 헤더를 남은 초로 변환 ("1m30s", "250ms", "20", RFC 3339 시각)"""
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    parts = _DURATION_PART.findall(value)
+    if parts and "".join(n + u for n, u in parts) == value:
+        return sum(float(n) * _DURATION_UNITS[u] for n, u in parts)
+
+    try:
+        reset_at = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if reset_at.tzinfo is None:
+        reset_at = reset_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (reset_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def retry_after_seconds(headers: Any) -> Optional[float]:
+    """
+    응답 헤더에서 다시 요청해도 되는 시점까지의 시간 추출
+
+    retry-after-ms, retry-after(초 또는 HTTP 날짜), provider별 rate-limit reset 헤더 순으로 봅니다.
+
+    Args:
+        headers: 응답 헤더 (대소문자 구분 없는 Mapping)
+
+    Returns:
+        대기 시간 (초), 헤더가 없으면 None
+    """
+    if not headers:
+        return None
+
+    value = headers.get("retry-after-ms")
+    if value:
+        try:
+            return max(0.0, float(value) / 1000)
+        except ValueError:
+            pass
+
+    value = headers.get("retry-after")
+    if value:
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            try:
+                from email.utils import parsedate_to_datetime
+                return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+            except (TypeError, ValueError):
+                pass
+
+    resets = []
+    for name in (
+        "x-ratelimit-reset-requests",
+        "x-ratelimit-reset-tokens",
+        "anthropic-ratelimit-requests-reset",
+        "anthropic-ratelimit-tokens-reset",
+    ):
+        value = headers.get(name)
+        seconds = _parse_reset(value) if value else None
+        if seconds is not None:
+            resets.append(seconds)
+    return max(resets) if resets else None
+
+
+def _error_status(error: BaseException) -> Optional[int]:
+    """SDK/HTTP 예외의 상태 코드"""
+    for attr in ("status_code", "code"):
+        status = getattr(error, attr, None)
+        if isinstance(status, int):
+            return status
+    response = getattr(error, "response", None)
+    status = getattr(response, "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def _error_headers(error: BaseException) -> Any:
+    response = getattr(error, "response", None)
+    return getattr(response, "headers", None)
+
+
+def is_retryable(error: BaseException) -> bool:
+    """일시적인 오류인지 (속도 제한, 과부하, 서버 오류, 연결/타임아웃)"""
+    status = _error_status(error)
+    if status is not None:
+        return status == 429 or status in RETRYABLE_STATUS_CODES
+    if isinstance(error, (httpx.TransportError, asyncio.TimeoutError, ConnectionError)):
+        return True
+    return type(error).__name__ in RETRYABLE_ERROR_NAMES
+
+
+class RateLimiter:
+    """(provider, 모델)별 적응형 속도 제한 + 재시도 지연 계산"""
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_minute: int = 0,
+        tokens_per_minute: int = 0,
+        queue_enabled: bool = True,
+        max_queue_size: int = 100,
+        max_wait_seconds: float = 30.0,
+        retry_base_delay: float = 1.0,
+        retry_max_delay: float = 30.0,
+    ):
+        """
+        Args:
+            name: 리미터 이름 (provider:model)
+            requests_per_minute: 분당 최대 요청 수 (0이면 제한 없음)
+            tokens_per_minute: 분당 최대 토큰 수 (0이면 제한 없음)
+            queue_enabled: 한도 초과 요청을 대기열에서 기다리게 할지 (False면 바로 거절)
+            max_queue_size: 최대 대기 요청 수
+            max_wait_seconds: 요청당 최대 대기 시간 (초)
+            retry_base_delay: 재시도 지연 기준값 (초, 시도마다 2배)
+            retry_max_delay: 재시도 지연 상한 (초)
+        """
+        self.name = name
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.queue_enabled = queue_enabled
+        self.max_queue_size = max_queue_size
+        self.max_wait_seconds = max_wait_seconds
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.blocked_until = 0.0  # 429 응답 헤더가 알려 준 재개 시각 (time.monotonic)
+
+        self.queue_depth = 0
+        self.peak_queue_depth = 0
+        self.requests_total = 0
+        self.queued_total = 0
+        self.rejected_total = 0
+        self.throttled_total = 0  # provider가 돌려준 429 횟수
+        self.retries_total = 0
+        self.wait_seconds_total = 0.0
+        self.max_wait_observed = 0.0
+
+    async def acquire(self, estimated_tokens: int = 0) -> float:
+        """
+        요청 1건과 예상 토큰만큼 예약하고 보낼 수 있을 때까지 대기
+
+        Args:
+            estimated_tokens: 요청의 예상 토큰 수 (입력 + 최대 출력)
+
+        Returns:
+            대기한 시간 (초)
+
+        Raises:
+            RateLimitExceeded: 대기열 비활성화/가득 참 또는 최대 대기 시간 초과
+        """
+        now = time.monotonic()
+        wait = max(0.0, self.blocked_until - now)
+        if self.requests:
+            wait = max(wait, self.requests.reserve(1, now))
+        if self.tokens and estimated_tokens:
+            wait = max(wait, self.tokens.reserve(estimated_tokens, now))
+
+        self.requests_total += 1
+        if wait <= 0:
+            return 0.0
+
+        if (
+            not self.queue_enabled
+            or self.queue_depth >= self.max_queue_size
+            or wait > self.max_wait_seconds
+        ):
+            self._release(estimated_tokens)
+            self.rejected_total += 1
+            raise RateLimitExceeded(self.name, wait)
+
+        self.queued_total += 1
+        self.queue_depth += 1
+        self.peak_queue_depth = max(self.peak_queue_depth, self.queue_depth)
+        try:
+            await asyncio.sleep(wait)
+            # 대기 중 받은 429가 재개 시각을 늦췄으면 그 시각까지 더 대기 (최대 대기 시간 안에서)
+            while (blocked := self.blocked_until - time.monotonic()) > 0:
+                if wait + blocked > self.max_wait_seconds:
+                    self.rejected_total += 1
+                    raise RateLimitExceeded(self.name, blocked)
+                await asyncio.sleep(blocked)
+                wait += blocked
+        except (asyncio.CancelledError, RateLimitExceeded):
+            self._release(estimated_tokens)
+            raise
+        finally:
+            self.queue_depth -= 1
+
+        self.wait_seconds_total += wait
+        self.max_wait_observed = max(self.max_wait_observed, wait)
+        return wait
+
+    def _release(self, estimated_tokens: int) -> None:
+        """보내지 않은 요청의 예약 반환"""
+        if self.requests:
+            self.requests.refund(1)
+        if self.tokens and estimated_tokens:
+            self.tokens.refund(estimated_tokens)
+
+    def record_success(self, estimated_tokens: int = 0, usage: Optional[dict] = None) -> None:
+        """
+        성공한 요청 반영 (실제 토큰 사용량으로 예약 보정, 줄였던 속도 회복)
+
+        Args:
+            estimated_tokens: acquire()에 넘긴 예상 토큰 수
+            usage: LLM 응답의 usage (input_tokens, output_tokens)
+        """
+        if self.tokens and estimated_tokens and usage:
+            actual = (usage.get("input_tokens") or 0) + (usage.get("output_tokens") or 0)
+            if actual:
+                self.tokens.refund(estimated_tokens - actual)
+
+        for bucket, configured in ((self.requests, self.requests_per_minute), (self.tokens, self.tokens_per_minute)):
+            if bucket and bucket.rate_per_minute < configured:
+                bucket.rate_per_minute = min(configured, bucket.rate_per_minute + configured * RECOVERY_RATIO)
+
+    def record_error(self, error: BaseException) -> Optional[float]:
+        """
+        실패한 요청 반영
+
+        429면 허용 속도를 절반으로 줄이고, 헤더가 알려 준 시각까지
+        이 리미터를 쓰는 모든 요청을 멈춥니다.
+
+        Args:
+            error: 발생한 예외
+
+        Returns:
+            헤더가 알려 준 재시도 대기 시간 (초), 없으면 None
+        """
+        retry_after = retry_after_seconds(_error_headers(error))
+        if _error_status(error) == 429:
+            self.throttled_total += 1
+            for bucket, configured in ((self.requests, self.requests_per_minute), (self.tokens, self.tokens_per_minute)):
+                if bucket:
+                    bucket.rate_per_minute = max(configured * MIN_RATE_RATIO, bucket.rate_per_minute / 2)
+            if retry_after is not None:
+                self.blocked_until = max(self.blocked_until, time.monotonic() + retry_after)
+        return retry_after
+
+    def retry_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        재시도 지연 계산
+
+        헤더 값이 있으면 그 시간에 약간의 지터를 더하고,
+        없으면 지수 백오프에 full jitter를 적용합니다.
+
+        Args:
+            attempt: 실패한 시도 번호 (0부터)
+            retry_after: 헤더가 알려 준 대기 시간 (초)
+
+        Returns:
+            재시도까지 기다릴 시간 (초)
+        """
+        if retry_after is not None:
+            # 헤더 시각에 모든 요청이 한꺼번에 몰리지 않도록 약간 분산
+            return min(self.retry_max_delay, retry_after) + random.uniform(0, self.retry_base_delay / 2)
+        return random.uniform(0, min(self.retry_max_delay, self.retry_base_delay * 2 ** attempt))
+
+    async def run(
+        self,
+        request: Callable[[], Awaitable[dict]],
+        estimated_tokens: int = 0,
+        max_attempts: int = 3,
+    ) -> dict:
+        """
+        속도 제한을 지키며 요청하고 일시적 오류는 재시도
+
+        Args:
+            request: LLM 요청 코루틴 함수 (usage가 담긴 응답 dict 반환)
+            estimated_tokens: 요청의 예상 토큰 수
+            max_attempts: 최대 시도 횟수
+
+        Returns:
+            LLM 응답
+
+        Raises:
+            RateLimitExceeded: 대기열에서 거절됨
+            Exception: 재시도할 수 없는 오류 또는 마지막 시도의 오류
+        """
+        for attempt in range(max_attempts):
+            await self.acquire(estimated_tokens)
+            try:
+                response = await request()
+            except Exception as e:
+                retry_after = self.record_error(e)
+                if not is_retryable(e) or attempt == max_attempts - 1:
+                    logger.error(f"LLM API error ({self.name}): {type(e).__name__}: {e}")
+                    raise
+                delay = self.retry_delay(attempt, retry_after)
+                self.retries_total += 1
+                logger.warning(
+                    f"LLM API error ({self.name}), attempt {attempt + 1}/{max_attempts}, "
+                    f"retrying in {delay:.2f}s: {type(e).__name__}: {e}"
+                )
+                await asyncio.sleep(delay)
+                continue
+
+            self.record_success(estimated_tokens, response.get("usage"))
+            return response
+
+    def stats(self) -> dict:
+        """대기열/속도 제한 지표"""
+        return {
+            "name": self.name,
+            "requests_per_minute": round(self.requests.rate_per_minute, 1) if self.requests else None,
+            "tokens_per_minute": round(self.tokens.rate_per_minute, 1) if self.tokens else None,
+            "queue_depth": self.queue_depth,
+            "peak_queue_depth": self.peak_queue_depth,
+            "requests_total": self.requests_total,
+            "queued_total": self.queued_total,
+            "rejected_total": self.rejected_total,
+            "throttled_total": self.throttled_total,
+            "retries_total": self.retries_total,
+            "avg_wait_seconds": round(self.wait_seconds_total / self.queued_total, 3) if self.queued_total else 0.0,
+            "max_wait_seconds": round(self.max_wait_observed, 3),
+            "blocked_for_seconds": round(max(0.0, self.blocked_until - time.monotonic()), 3),
+        }
+
+
+_limiters: dict[tuple[str, str], RateLimiter] = {}
+
+
+def get_rate_limiter(provider: str, model: str = "") -> RateLimiter:
+    """설정에 따른 (provider, 모델)별 프로세스 공용 리미터 반환"""
+    key = (provider, model)
+    limiter = _limiters.get(key)
+    if limiter is None:
+        limiter = RateLimiter(
+            f"{provider}:{model}" if model else provider,
+            requests_per_minute=settings.get_llm_rate_limit_rpm(provider),
+            tokens_per_minute=settings.get_llm_rate_limit_tpm(provider),
+            queue_enabled=settings.llm_queue_enabled,
+            max_queue_size=settings.llm_queue_max_size,
+            max_wait_seconds=settings.llm_queue_max_wait,
+            retry_base_delay=settings.llm_retry_base_delay,
+            retry_max_delay=settings.llm_retry_max_delay,
+        )
+        _limiters[key] = limiter
+    return limiter
+
+
+def get_rate_limiter_stats() -> list[dict]:
+    """모든 리미터의 지표"""
+    return [limiter.stats() for limiter in _limiters.values()]
@@ -0,0 +1,288 @@
+"""LLM 요청/응답 기록 및 재생
+
+RecordingLLMClient는 실제 provider 클라이언트(LLMClient/LLMRouter)를 감싸
+요청과 응답(도구 호출, 스트리밍 이벤트와 그 시각 포함)을 JSONL 파일에 기록합니다.
+ReplayLLMClient는 기록한 파일을 읽어 같은 요청에 같은 응답을 결정적으로 돌려주며,
+지연 시간을 zero(없음) / fixed(고정) / recorded(기록된 시간 그대로) 중에서 고를 수 있어
+부하 테스트에서 provider 지연과 백엔드 자체 오버헤드를 분리해 잴 수 있습니다.
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import time
+from enum import Enum
+from pathlib import Path
+from typing import Optional, Union
+
+from config import get_settings
+from utils.logger import get_logger
+from .llm_client import LLMProvider, SystemPrompt, _message_event
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+class ReplayLatency(str, Enum):
+    """재생 시 지연 시간"""
+    ZERO = "zero"  # 지연 없음 (백엔드 오버헤드만 측정)
+    FIXED = "fixed"  # 응답(스트림은 첫 이벤트) 전 고정 지연
+    RECORDED = "recorded"  # 기록된 응답 시간/이벤트 간격 그대로
+
+
+def make_trace_key(
+    messages: list[dict],
+    tools: Optional[list[dict]],
+    system_prompt: Union[str, SystemPrompt, None],
+) -> str:
+    """
+    요청 매칭 키
+
+    시스템 프롬프트는 고정 부분만 씁니다 (날짜 등 동적 부분은 실행 시각마다 달라짐).
+    도구는 이름만 씁니다.
+    """
+    cached = system_prompt.cached if isinstance(system_prompt, SystemPrompt) else system_prompt or ""
+    payload = json.dumps(
+        [cached, sorted(tool["name"] for tool in tools or []), messages],
+        ensure_ascii=False,
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class RecordingLLMClient:
+    """실제 LLM 클라이언트를 감싸 요청/응답을 JSONL로 기록"""
+
+    def __init__(self, inner, path: Union[str, Path]):
+        """
+        Args:
+            inner: 실제 LLM 클라이언트 (LLMClient, LLMRouter)
+            path: 기록 파일 경로 (이어 쓰기)
+        """
+        self.inner = inner
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.recorded = 0
+
+    @property
+    def provider(self) -> LLMProvider:
+        return self.inner.provider
+
+    def _write(self, record: dict) -> None:
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+        self.recorded += 1
+
+    def _record(self, messages, tools, system_prompt, max_tokens, **fields) -> None:
+        self._write({
+            "key": make_trace_key(messages, tools, system_prompt),
+            "provider": self.provider.value,
+            "max_tokens": max_tokens,
+            "messages": messages,
+            "tools": [tool["name"] for tool in tools or []],
+            **fields,
+        })
+
+    async def chat(
+        self,
+        messages: list[dict],
+        tools: Optional[list[dict]] = None,
+        tool_choice: Optional[dict] = None,
+        system_prompt: Union[str, SystemPrompt, None] = None,
+        max_tokens: int = 4096,
+    ) -> dict:
+        """실제 LLM과 대화하고 기록"""
+        started = time.monotonic()
+        response = await self.inner.chat(messages, tools, tool_choice, system_prompt, max_tokens)
+        self._record(
+            messages, tools, system_prompt, max_tokens,
+            latency=round(time.monotonic() - started, 4),
+            response=response,
+        )
+        return response
+
+    async def chat_stream(
+        self,
+        messages: list[dict],
+        tools: Optional[list[dict]] = None,
+        tool_choice: Optional[dict] = None,
+        system_prompt: Union[str, SystemPrompt, None] = None,
+        max_tokens: int = 4096,
+    ):
+        """실제 LLM 스트리밍 대화 (텍스트 청크)"""
+        async for event in self.chat_stream_events(messages, tools, tool_choice, system_prompt, max_tokens):
+            if event["type"] == "text":
+                yield event["text"]
+
+    async def chat_stream_events(
+        self,
+        messages: list[dict],
+        tools: Optional[list[dict]] = None,
+        tool_choice: Optional[dict] = None,
+        system_prompt: Union[str, SystemPrompt, None] = None,
+        max_tokens: int = 4096,
+    ):
+        """실제 LLM 스트리밍 대화 (이벤트와 시작 후 경과 시간을 기록)"""
+        started = time.monotonic()
+        events = []
+        async for event in self.inner.chat_stream_events(messages, tools, tool_choice, system_prompt, max_tokens):
+            events.append({"at": round(time.monotonic() - started, 4), "event": event})
+            yield event
+
+        response = next((e["event"] for e in reversed(events) if e["event"]["type"] == "message"), None)
+        self._record(
+            messages, tools, system_prompt, max_tokens,
+            latency=round(time.monotonic() - started, 4),
+            response={k: v for k, v in response.items() if k != "type"} if response else None,
+            events=events,
+        )
+
+
+class ReplayLLMClient:
+    """
+    기록한 요청/응답을 재생하는 LLM 클라이언트
+
+    같은 키(make_trace_key)의 기록을 기록 순서대로 돌려주고, 키가 맞는 기록이 없으면
+    파일 순서대로 순환하며 돌려줍니다 (strict면 KeyError).
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        latency: str = ReplayLatency.ZERO,
+        fixed_latency: float = 0.0,
+        strict: bool = False,
+    ):
+        """
+        Args:
+            path: RecordingLLMClient가 기록한 JSONL 파일
+            latency: 지연 시간 방식 (zero, fixed, recorded)
+            fixed_latency: fixed 방식의 지연 시간 (초)
+            strict: 키가 맞는 기록이 없으면 KeyError
+        """
+        self.path = Path(path)
+        self.latency = ReplayLatency(latency)
+        self.fixed_latency = fixed_latency
+        self.strict = strict
+        self.records = [
+            json.loads(line)
+            for line in self.path.read_text(encoding="utf-8").splitlines()
+            if line.strip()
+        ]
+        if not self.records:
+            raise ValueError(f"LLM trace is empty: {self.path}")
+
+        self._by_key: dict[str, list[int]] = {}
+        for index, record in enumerate(self.records):
+            self._by_key.setdefault(record["key"], []).append(index)
+        self._served_by_key: dict[str, int] = {}
+        self._next_fallback = 0
+        self.call_count = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def provider(self) -> LLMProvider:
+        return LLMProvider(self.records[0].get("provider") or settings.llm_provider)
+
+    def _lookup(self, messages, tools, system_prompt) -> dict:
+        """요청에 맞는 기록 선택 (같은 키가 여러 번 기록됐으면 순환)"""
+        self.call_count += 1
+        key = make_trace_key(messages, tools, system_prompt)
+        indexes = self._by_key.get(key)
+        if indexes:
+            served = self._served_by_key.get(key, 0)
+            self._served_by_key[key] = served + 1
+            self.hits += 1
+            return self.records[indexes[served % len(indexes)]]
+
+        if self.strict:
+            raise KeyError(f"No recorded LLM response for request {key[:12]}")
+        self.misses += 1
+        record = self.records[self._next_fallback % len(self.records)]
+        self._next_fallback += 1
+        return record
+
+    async def _delay(self, seconds: float) -> None:
+        if seconds > 0:
+            await asyncio.sleep(seconds)
+
+    def _response_delay(self, record: dict) -> float:
+        if self.latency == ReplayLatency.FIXED:
+            return self.fixed_latency
+        if self.latency == ReplayLatency.RECORDED:
+            return record.get("latency") or 0.0
+        return 0.0
+
+    async def chat(
+        self,
+        messages: list[dict],
+        tools: Optional[list[dict]] = None,
+        tool_choice: Optional[dict] = None,
+        system_prompt: Union[str, SystemPrompt, None] = None,
+        max_tokens: int = 4096,
+    ) -> dict:
+        """기록된 응답 재생"""
+        record = self._lookup(messages, tools, system_prompt)
+        await self._delay(self._response_delay(record))
+        return copy.deepcopy(record["response"])
+
+    async def chat_stream(
+        self,
+        messages: list[dict],
+        tools: Optional[list[dict]] = None,
+        tool_choice: Optional[dict] = None,
+        system_prompt: Union[str, SystemPrompt, None] = None,
+        max_tokens: int = 4096,
+    ):
+        """기록된 스트리밍 응답 재생 (텍스트 청크)"""
+        async for event in self.chat_stream_events(messages, tools, tool_choice, system_prompt, max_tokens):
+            if event["type"] == "text":
+                yield event["text"]
+
+    async def chat_stream_events(
+        self,
+        messages: list[dict],
+        tools: Optional[list[dict]] = None,
+        tool_choice: Optional[dict] = None,
+        system_prompt: Union[str, SystemPrompt, None] = None,
+        max_tokens: int = 4096,
+    ):
+        """
+        기록된 스트리밍 이벤트 재생
+
+        chat()으로 기록한 응답은 텍스트 1청크 + message 이벤트로 재생합니다.
+        """
+        record = self._lookup(messages, tools, system_prompt)
+        events = record.get("events")
+        if not events:
+            response = record["response"]
+            events = [{"at": record.get("latency") or 0.0, "event": _message_event(
+                response.get("content", ""),
+                response.get("tool_calls", []),
+                response.get("stop_reason", "end_turn"),
+                response.get("usage"),
+            )}]
+            if response.get("content"):
+                events.insert(0, {"at": events[0]["at"], "event": {"type": "text", "text": response["content"]}})
+
+        elapsed = 0.0
+        for index, item in enumerate(events):
+            if self.latency == ReplayLatency.RECORDED:
+                await self._delay(item["at"] - elapsed)
+                elapsed = item["at"]
+            elif self.latency == ReplayLatency.FIXED and index == 0:
+                await self._delay(self.fixed_latency)
+            yield copy.deepcopy(item["event"])
+
+    def stats(self) -> dict:
+        """재생 지표 (키 적중/미스)"""
+        return {
+            "records": len(self.records),
+            "calls": self.call_count,
+            "hits": self.hits,
+            "misses": self.misses,
+            "latency": self.latency.value,
+        }
@@ -1,6 +1,6 @@
 """도구 모듈"""
 
-from .base import BaseTool, ToolResult
+from .base import BaseTool, ToolResult, ToolSchemas
 from .employee import SearchEmployeeTool
 from .calendar import GetCalendarTool, FindFreeSlotsTool
 from .room import SearchRoomsTool
@@ -10,6 +10,7 @@ from .registry import ToolRegistry
 __all__ = [
     "BaseTool",
     "ToolResult",
+    "ToolSchemas",
     "SearchEmployeeTool",
     "GetCalendarTool",
     "FindFreeSlotsTool",
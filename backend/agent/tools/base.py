@@ -1,7 +1,7 @@
 """도구 베이스 클래스"""
 
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 from pydantic import BaseModel
 
 
@@ -30,12 +30,33 @@ class ToolResult(BaseModel):
         return "작업이 완료되었습니다."
 
 
+class ToolSchemas(list):
+    """
+    도구 스키마 목록 + provider별 변환 결과 캐시
+
+    일반 list처럼 LLM 클라이언트에 전달되며, provider용 도구 정의는 변환 함수별로
+    한 번만 만들어 재사용합니다. 도구 구성이 바뀌면 레지스트리가 새 목록을 만듭니다.
+    """
+
+    def __init__(self, schemas: list[dict]):
+        super().__init__(schemas)
+        self._compiled: dict[str, Any] = {}
+
+    def compiled(self, key: str, convert: Callable[[list[dict]], Any]) -> Any:
+        """key(변환 종류)별 변환 결과 (최초 호출 시 변환)"""
+        if key not in self._compiled:
+            self._compiled[key] = convert(self)
+        return self._compiled[key]
+
+
 class BaseTool(ABC):
     """도구 베이스 클래스"""
 
     name: str
     description: str
     parameters: dict
+    # 같은 턴의 다른 도구 호출과 동시에 실행해도 되는지 (외부 상태를 바꾸는 도구는 False)
+    parallel_safe: bool = True
 
     @abstractmethod
     async def execute(self, **kwargs) -> ToolResult:
@@ -5,13 +5,23 @@ from typing import Optional
 
 from .base import BaseTool, ToolResult
 from services.calendar import CalendarService
+from services.fanout import FanOutResult
 from services.slot_finder import SlotFinder
+from models.calendar import QuorumSlot
 from utils.datetime_utils import parse_relative_date, get_today, format_datetime_korean
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+def _failure_note(failures: dict[str, str]) -> str:
+    """일부 직원 일정 조회 실패 안내 문구"""
+    if not failures:
+        return ""
+    failed = ", ".join(f"{emp_id}({reason})" for emp_id, reason in failures.items())
+    return f"\n※ 다음 직원의 일정은 확인하지 못해 제외되었습니다: {failed}"
+
+
 class GetCalendarTool(BaseTool):
     """일정 조회 도구"""
 
@@ -56,10 +66,13 @@ class GetCalendarTool(BaseTool):
             start = parse_relative_date(start_date) or get_today()
             end = parse_relative_date(end_date, start) or start
 
-            # 여러 직원 일정 조회
-            schedules = await self.calendar_service.get_schedules(
+            # 여러 직원 일정 동시 조회
+            fetched = await self.calendar_service.fetch_schedules(
                 employee_ids, start, end
             )
+            if not fetched.results:
+                fetched.raise_first_error()
+            schedules = fetched.values
 
             result_data = []
             for schedule in schedules:
@@ -88,6 +101,7 @@ class GetCalendarTool(BaseTool):
                 message += " 일정을 확인했습니다."
             else:
                 message = f"{', '.join(names)}의 일정을 확인했습니다."
+            message += _failure_note(fetched.failures)
 
             return ToolResult(
                 success=True,
@@ -95,6 +109,7 @@ class GetCalendarTool(BaseTool):
                     "schedules": result_data,
                     "start_date": start.isoformat(),
                     "end_date": end.isoformat(),
+                    "failed_employee_ids": list(fetched.failures),
                 },
                 message=message,
             )
@@ -113,7 +128,9 @@ class FindFreeSlotsTool(BaseTool):
     name = "find_common_free_slots"
     description = """여러 참석자의 공통 빈 시간대를 찾습니다.
 업무 시간(09:00-18:00) 내에서 모든 참석자가 가능한 시간을 찾습니다.
-점심시간(12:00-13:00)은 기본적으로 제외됩니다."""
+점심시간(12:00-13:00)은 기본적으로 제외됩니다.
+모두 가능한 시간이 없으면 같은 호출에서 최대한 많은 인원이 참석 가능한 시간(best-effort)을
+불참자 정보와 함께 반환하므로, 기간을 바꿔 다시 호출하기 전에 이 결과를 먼저 안내하세요."""
 
     parameters = {
         "type": "object",
@@ -140,6 +157,15 @@ class FindFreeSlotsTool(BaseTool):
                 "enum": ["morning", "afternoon", "any"],
                 "description": "선호 시간대 (morning: 오전, afternoon: 오후, any: 상관없음)",
             },
+            "optional_employee_ids": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "선택 참석자 ID 목록 (공통 시간 계산에는 포함하지 않음)",
+            },
+            "min_attendees": {
+                "type": "integer",
+                "description": "best-effort 검색 시 최소 참석 인원 (기본: 전체 인원 - 1)",
+            },
         },
         "required": ["employee_ids", "start_date", "end_date", "duration_minutes"],
     }
@@ -155,6 +181,8 @@ class FindFreeSlotsTool(BaseTool):
         end_date: str,
         duration_minutes: int,
         preferred_time: Optional[str] = "any",
+        optional_employee_ids: Optional[list[str]] = None,
+        min_attendees: Optional[int] = None,
         **kwargs,
     ) -> ToolResult:
         """공통 빈 시간대 찾기 실행"""
@@ -163,10 +191,20 @@ class FindFreeSlotsTool(BaseTool):
             start = parse_relative_date(start_date) or get_today()
             end = parse_relative_date(end_date, start) or start
 
-            # 일정 조회
-            schedules = await self.calendar_service.get_schedules(
-                employee_ids, start, end
+            # 필수/선택 참석자 일정 동시 조회
+            optional_ids = [
+                emp_id for emp_id in optional_employee_ids or []
+                if emp_id not in employee_ids
+            ]
+            fetched = await self.calendar_service.fetch_schedules(
+                employee_ids + optional_ids, start, end
             )
+            if not fetched.results:
+                fetched.raise_first_error()
+            schedules = [
+                fetched.results[emp_id] for emp_id in employee_ids
+                if emp_id in fetched.results
+            ]
 
             # 공통 빈 시간대 찾기
             free_slots = self.slot_finder.find_common_free_slots(
@@ -174,12 +212,28 @@ class FindFreeSlotsTool(BaseTool):
             )
 
             if not free_slots:
+                # 일부 인원 불참을 허용하는 best-effort 검색
+                quorum_slots = self.slot_finder.find_quorum_slots(
+                    fetched.values,
+                    start,
+                    end,
+                    duration_minutes,
+                    min_attendees=min_attendees,
+                    required_ids=employee_ids,
+                    preferred_time=preferred_time,
+                )
+                if quorum_slots:
+                    return self._quorum_result(
+                        quorum_slots, fetched, duration_minutes, start, end
+                    )
+
                 return ToolResult(
                     success=True,
                     data={"free_slots": [], "count": 0},
                     message=f"해당 기간({start.month}월 {start.day}일 ~ {end.month}월 {end.day}일)에 "
                             f"모든 참석자가 {duration_minutes}분 이상 가능한 시간이 없습니다. "
-                            f"다른 기간을 확인해 볼까요?",
+                            f"다른 기간을 확인해 볼까요?"
+                            f"{_failure_note(fetched.failures)}",
                 )
 
             # 상위 10개만 반환
@@ -203,6 +257,7 @@ class FindFreeSlotsTool(BaseTool):
 
             for i, slot in enumerate(top_slots[:5], 1):
                 message += f"{i}. {format_datetime_korean(slot.start)}\n"
+            message += _failure_note(fetched.failures)
 
             return ToolResult(
                 success=True,
@@ -210,6 +265,7 @@ class FindFreeSlotsTool(BaseTool):
                     "free_slots": slots_data,
                     "count": len(free_slots),
                     "duration_minutes": duration_minutes,
+                    "failed_employee_ids": list(fetched.failures),
                 },
                 message=message,
             )
@@ -220,3 +276,56 @@ class FindFreeSlotsTool(BaseTool):
                 success=False,
                 error=f"빈 시간대 검색 중 오류가 발생했습니다: {str(e)}",
             )
+
+    def _quorum_result(
+        self,
+        quorum_slots: list[QuorumSlot],
+        fetched: FanOutResult,
+        duration_minutes: int,
+        start: date,
+        end: date,
+    ) -> ToolResult:
+        """best-effort 검색 결과 생성"""
+        names = {
+            schedule.employee_id: schedule.employee_name
+            for schedule in fetched.values
+        }
+        total = len(fetched.results)
+
+        slots_data = [
+            {
+                "start": slot.start.isoformat(),
+                "end": slot.end.isoformat(),
+                "duration_minutes": slot.duration_minutes,
+                "display": format_datetime_korean(slot.start),
+                "available_count": slot.attendance_count,
+                "unavailable_ids": slot.unavailable_ids,
+                "unavailable_names": [names.get(i, i) for i in slot.unavailable_ids],
+            }
+            for slot in quorum_slots
+        ]
+
+        message = (
+            f"해당 기간({start.month}월 {start.day}일 ~ {end.month}월 {end.day}일)에 "
+            f"모든 참석자가 {duration_minutes}분 이상 가능한 시간은 없지만, "
+            f"최대한 많은 인원이 참석 가능한 시간입니다:\n"
+        )
+        for i, slot in enumerate(slots_data[:5], 1):
+            missing = ", ".join(slot["unavailable_names"]) or "없음"
+            message += (
+                f"{i}. {slot['display']} "
+                f"(참석 {slot['available_count']}/{total}명, 불참: {missing})\n"
+            )
+        message += _failure_note(fetched.failures)
+
+        return ToolResult(
+            success=True,
+            data={
+                "free_slots": slots_data,
+                "count": len(slots_data),
+                "duration_minutes": duration_minutes,
+                "best_effort": True,
+                "failed_employee_ids": list(fetched.failures),
+            },
+            message=message,
+        )
@@ -56,6 +56,9 @@ class CreateMeetingTool(BaseTool):
         "required": ["title", "attendee_ids", "room_id", "start_time", "end_time"],
     }
 
+    # 회의실 예약/일정 생성은 다른 도구 호출과 겹치지 않게 단독 실행
+    parallel_safe = False
+
     def __init__(self):
         self.calendar_service = CalendarService()
         self.room_service = RoomService()
@@ -112,10 +115,11 @@ class CreateMeetingTool(BaseTool):
                     error="회의실 예약에 실패했습니다. 다른 회의실을 선택해주세요.",
                 )
 
-            # 참석자 이름 조회
+            # 참석자 이름 동시 조회
+            fetched = await self.org_service.get_employees_by_ids(attendee_ids)
             attendee_names = []
             for emp_id in attendee_ids:
-                emp = await self.org_service.get_employee_by_id(emp_id)
+                emp = fetched.results.get(emp_id)
                 if emp:
                     attendee_names.append(emp.name)
 
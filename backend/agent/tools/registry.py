@@ -1,8 +1,9 @@
 """도구 레지스트리"""
 
+import asyncio
 from typing import Optional
 
-from .base import BaseTool, ToolResult
+from .base import BaseTool, ToolResult, ToolSchemas
 from .employee import SearchEmployeeTool, GetTeamMembersTool
 from .calendar import GetCalendarTool, FindFreeSlotsTool
 from .room import SearchRoomsTool, ListRoomsTool
@@ -17,6 +18,7 @@ class ToolRegistry:
 
     def __init__(self):
         self._tools: dict[str, BaseTool] = {}
+        self._schemas: Optional[ToolSchemas] = None
         self._register_default_tools()
 
     def _register_default_tools(self):
@@ -36,17 +38,25 @@ class ToolRegistry:
             self.register(tool)
 
     def register(self, tool: BaseTool):
-        """도구 등록"""
+        """도구 등록 (도구 구성이 바뀌므로 스키마/provider 변환 캐시 무효화)"""
         self._tools[tool.name] = tool
+        self._schemas = None
         logger.debug(f"Tool registered: {tool.name}")
 
     def get(self, name: str) -> Optional[BaseTool]:
         """이름으로 도구 조회"""
         return self._tools.get(name)
 
-    def get_all_schemas(self) -> list[dict]:
-        """모든 도구 스키마 반환 (LLM용)"""
-        return [tool.get_schema() for tool in self._tools.values()]
+    def get_all_schemas(self) -> ToolSchemas:
+        """
+        모든 도구 스키마 반환 (LLM용)
+
+        도구 구성이 같은 동안 같은 ToolSchemas를 돌려주므로,
+        provider별 도구 정의 변환도 한 번만 수행됩니다.
+        """
+        if self._schemas is None:
+            self._schemas = ToolSchemas([tool.get_schema() for tool in self._tools.values()])
+        return self._schemas
 
     async def execute(self, name: str, arguments: dict) -> ToolResult:
         """
@@ -88,6 +98,47 @@ class ToolRegistry:
                 error=f"도구 실행 중 오류가 발생했습니다: {str(e)}",
             )
 
+    async def execute_many(
+        self,
+        tool_calls: list[dict],
+        concurrency: int = 4,
+    ) -> list[ToolResult]:
+        """
+        한 턴의 여러 도구 호출 실행
+
+        parallel_safe 도구 호출은 최대 concurrency개까지 동시에 실행하고,
+        그렇지 않은 도구는 앞선 호출이 모두 끝난 뒤 단독으로 실행합니다.
+
+        Args:
+            tool_calls: 도구 호출 목록 ({"name", "arguments"})
+            concurrency: 최대 동시 실행 수
+
+        Returns:
+            호출 순서대로의 실행 결과
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def run(tc: dict) -> ToolResult:
+            async with semaphore:
+                return await self.execute(tc["name"], tc["arguments"])
+
+        results: list[ToolResult] = []
+        batch: list[dict] = []
+        for tc in tool_calls:
+            tool = self.get(tc["name"])
+            if tool is None or tool.parallel_safe:
+                batch.append(tc)
+                continue
+
+            if batch:
+                results.extend(await asyncio.gather(*[run(b) for b in batch]))
+                batch = []
+            results.append(await self.execute(tc["name"], tc["arguments"]))
+
+        if batch:
+            results.extend(await asyncio.gather(*[run(b) for b in batch]))
+        return results
+
     @property
     def tool_names(self) -> list[str]:
         """등록된 모든 도구 이름"""
@@ -16,8 +16,11 @@ from models.chat import (
     Conversation,
 )
 from agent.agent import MeetingAgent
-from agent.llm_client import LLMClient
+from agent.conversation import ConversationBusy, ConversationLock, get_conversation_manager
+from agent.intent_parser import get_intent_parser
+from agent.llm_router import get_llm_router
 from config import get_settings
+from services.intent_cache import get_intent_cache, make_intent_cache_key
 from utils.logger import get_logger
 
 router = APIRouter()
@@ -149,9 +152,6 @@ class ParseIntentResponse(BaseModel):
     function_calls: list
     message: Optional[str] = None  # LLM이 생성한 추가 메시지
 
-# 대화 저장소 (실제로는 Redis 사용)
-conversations: dict[str, Conversation] = {}
-
 # Agent 인스턴스
 agent: Optional[MeetingAgent] = None
 
@@ -164,22 +164,59 @@ def get_agent() -> MeetingAgent:
     return agent
 
 
-def get_or_create_conversation(
+async def get_or_create_conversation(
     conversation_id: Optional[str],
     user_id: str = "user_001",
 ) -> Conversation:
-    """대화 조회 또는 생성"""
-    if conversation_id and conversation_id in conversations:
-        return conversations[conversation_id]
+    """대화 조회 또는 생성 (새 대화는 턴이 끝날 때 저장)"""
+    if conversation_id:
+        conversation = await get_conversation_manager().get(conversation_id)
+        if conversation:
+            return conversation
 
     # 새 대화 생성
     new_id = f"conv_{uuid.uuid4().hex[:12]}"
-    conversation = Conversation(
+    return Conversation(
         id=new_id,
         user_id=user_id,
     )
-    conversations[new_id] = conversation
-    return conversation
+
+
+async def lock_conversation(conversation_id: Optional[str]) -> Optional[ConversationLock]:
+    """
+    기존 대화의 턴 잠금 (새 대화는 잠글 필요 없음)
+
+    Raises:
+        HTTPException: 같은 대화의 이전 요청이 아직 처리 중 (409)
+    """
+    if not conversation_id:
+        return None
+    lock = get_conversation_manager().lock(conversation_id)
+    try:
+        await lock.acquire()
+    except ConversationBusy:
+        raise HTTPException(status_code=409, detail="이전 메시지를 처리하는 중입니다. 잠시 후 다시 시도해주세요.")
+    return lock
+
+
+class LockedStreamingResponse(StreamingResponse):
+    """
+    전송이 끝나면(중단, 본문 미시작 포함) 대화 잠금을 푸는 스트리밍 응답
+
+    본문 생성기가 한 번도 시작되지 않으면 생성기의 finally가 돌지 않으므로,
+    응답 자체의 전송 종료 시점에서도 잠금을 해제합니다 (release는 여러 번 불러도 안전).
+    """
+
+    def __init__(self, *args, lock: Optional[ConversationLock] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lock = lock
+
+    async def __call__(self, scope, receive, send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            if self.lock:
+                await self.lock.release()
 
 
 @router.post("", response_model=ChatResponse)
@@ -192,9 +229,10 @@ async def chat(
 
     사용자 메시지를 받아 AI 응답 반환
     """
+    lock = await lock_conversation(request.conversation_id)
     try:
         # 대화 조회 또는 생성
-        conversation = get_or_create_conversation(request.conversation_id)
+        conversation = await get_or_create_conversation(request.conversation_id)
 
         # 사용자 메시지 추가
         conversation.add_message("user", request.message)
@@ -204,6 +242,7 @@ async def chat(
 
         # 응답 메시지 추가
         conversation.add_message("assistant", response.response.content)
+        await get_conversation_manager().save(conversation)
 
         return response
 
@@ -221,24 +260,52 @@ async def chat(
             status=ChatStatus.ERROR,
         )
 
+    finally:
+        if lock:
+            await lock.release()
+
 
 @router.post("/parse-intent", response_model=ParseIntentResponse)
 async def parse_intent(request: ParseIntentRequest) -> ParseIntentResponse:
     """
     LLM을 사용하여 사용자 메시지에서 의도와 함수 호출 추출
 
-    규칙 기반 파싱이 실패했을 때 폴백으로 사용
+    규칙 기반 파싱이 실패했을 때 폴백으로 사용.
+    서버 규칙 기반 파서가 충분히 확신하면 LLM 없이 바로 반환하고,
+    같은 메시지/UI 컨텍스트/날짜의 결과는 Intent 캐시에서 바로 반환합니다.
     """
     try:
-        # API 키 체크
-        if not settings.get_api_key():
+        # 규칙 기반 빠른 경로
+        parser = get_intent_parser()
+        if parser is not None:
+            function_calls = parser.parse_confident(request.message, request.context)
+            if function_calls is not None:
+                return ParseIntentResponse(function_calls=function_calls)
+
+        # API 키 체크 (Intent 라우터의 provider 중 하나라도 설정되어 있으면 됨)
+        providers = settings.get_llm_providers("intent")
+        configured = any(settings.is_llm_provider_configured(provider) for provider in providers)
+        if not (configured or settings.llm_replay_mode == "replay"):
             logger.warning("No API key configured, returning empty function calls")
             return ParseIntentResponse(
                 function_calls=[],
                 message="API 키가 설정되지 않았습니다."
             )
 
-        llm = LLMClient()
+        # 캐시 조회 (적중 시 LLM 호출 없음)
+        cache = get_intent_cache()
+        cache_key = None
+        if cache is not None:
+            cache_key = make_intent_cache_key(
+                request.message,
+                request.context,
+                model=",".join(f"{provider}:{settings.get_model(provider)}" for provider in providers),
+            )
+            cached = await cache.get(cache_key)
+            if cached is not None:
+                return ParseIntentResponse(**cached)
+
+        llm = get_llm_router("intent")
 
         # 컨텍스트 정보 구성
         context_info = ""
@@ -289,10 +356,13 @@ async def parse_intent(request: ParseIntentRequest) -> ParseIntentResponse:
                 "arguments": tc["arguments"],
             })
 
-        return ParseIntentResponse(
+        result = ParseIntentResponse(
             function_calls=function_calls,
             message=response.get("content"),
         )
+        if cache is not None:
+            await cache.set(cache_key, result.model_dump())
+        return result
 
     except Exception as e:
         logger.error(f"Parse intent error: {str(e)}", exc_info=True)
@@ -310,10 +380,12 @@ async def chat_stream(
     """
     스트리밍 채팅 메시지 처리 (SSE)
     """
+    lock = await lock_conversation(request.conversation_id)
+
     async def generate() -> AsyncGenerator[str, None]:
         try:
             # 대화 조회 또는 생성
-            conversation = get_or_create_conversation(request.conversation_id)
+            conversation = await get_or_create_conversation(request.conversation_id)
 
             # 사용자 메시지 추가
             conversation.add_message("user", request.message)
@@ -333,6 +405,7 @@ async def chat_stream(
             # 응답 메시지 추가
             if full_content:
                 conversation.add_message("assistant", full_content)
+            await get_conversation_manager().save(conversation)
 
             # 완료 이벤트
             yield f"data: {json.dumps({'type': 'done', 'conversation_id': conversation.id})}\n\n"
@@ -341,8 +414,13 @@ async def chat_stream(
             logger.error(f"Chat stream error: {str(e)}", exc_info=True)
             yield f"data: {json.dumps({'type': 'error', 'message': '죄송합니다, 요청을 처리하는 중 오류가 발생했습니다.'})}\n\n"
 
-    return StreamingResponse(
+        finally:
+            if lock:
+                await lock.release()
+
+    return LockedStreamingResponse(
         generate(),
+        lock=lock,
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -357,10 +435,10 @@ async def get_conversation(conversation_id: str) -> dict:
     """
     대화 내역 조회
     """
-    if conversation_id not in conversations:
+    conversation = await get_conversation_manager().get(conversation_id)
+    if conversation is None:
         raise HTTPException(status_code=404, detail="대화를 찾을 수 없습니다")
 
-    conversation = conversations[conversation_id]
     return {
         "conversation_id": conversation.id,
         "messages": [
@@ -380,8 +458,7 @@ async def delete_conversation(conversation_id: str) -> dict:
     """
     대화 삭제 (새 대화 시작)
     """
-    if conversation_id in conversations:
-        del conversations[conversation_id]
+    if await get_conversation_manager().delete(conversation_id):
         return {"message": "대화가 삭제되었습니다"}
 
     raise HTTPException(status_code=404, detail="대화를 찾을 수 없습니다")
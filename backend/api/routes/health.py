@@ -3,7 +3,15 @@
 from fastapi import APIRouter
 from pydantic import BaseModel
 
+from agent.conversation import get_conversation_manager
+from agent.intent_parser import get_intent_parser
+from agent.llm_pool import get_llm_pool
+from agent.llm_router import get_llm_router_stats
+from agent.rate_limiter import get_rate_limiter_stats
 from config import get_settings
+from services.client_registry import get_api_client_registry
+from services.intent_cache import get_intent_cache
+from services.schedule_prefetch import get_schedule_prefetcher
 
 router = APIRouter()
 settings = get_settings()
@@ -49,7 +57,7 @@ async def health_check() -> HealthResponse:
             org_api="unknown",
             calendar_api="unknown",
             room_api="unknown",
-            redis="unknown",
+            redis="connected" if get_conversation_manager().backend == "redis" else "disconnected",
         )
 
     return HealthResponse(
@@ -82,3 +90,84 @@ async def readiness_check() -> dict:
         return {"status": "not_ready", "reason": "LLM API key not configured"}
 
     return {"status": "ready"}
+
+
+@router.get("/health/pools")
+async def pool_stats() -> dict:
+    """
+    사내 API / LLM 커넥션 풀 지표
+
+    API 클라이언트별 동시 요청 수, 최대치, 풀 포화(연결 대기) 횟수와
+    LLM 클라이언트 재사용 횟수, provider별 연결 제한
+    """
+    return {"clients": get_api_client_registry().stats(), "llm": get_llm_pool().stats()}
+
+
+@router.get("/health/intent-cache")
+async def intent_cache_stats() -> dict:
+    """
+    Intent 파싱 응답 캐시 지표
+
+    적중/미스 횟수와 적중률 (redis 백엔드는 워커별 집계)
+    """
+    cache = get_intent_cache()
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.stats()}
+
+
+@router.get("/health/intent-parser")
+async def intent_parser_stats() -> dict:
+    """
+    Intent 규칙 기반 빠른 경로 지표
+
+    LLM 없이 처리한 요청 수, LLM으로 넘긴 요청 수와 처리 비율
+    """
+    parser = get_intent_parser()
+    if parser is None:
+        return {"enabled": False}
+    return {"enabled": True, **parser.stats()}
+
+
+@router.get("/health/llm-rate-limits")
+async def llm_rate_limit_stats() -> dict:
+    """
+    LLM 속도 제한/재시도 지표
+
+    (provider, 모델)별 현재 허용 속도, 대기열 길이, 대기 시간, 거절/429/재시도 횟수
+    """
+    return {"limiters": get_rate_limiter_stats()}
+
+
+@router.get("/health/llm-router")
+async def llm_router_stats() -> dict:
+    """
+    LLM 라우팅 지표
+
+    용도별 provider 우선순위, 헤징/장애 조치 횟수, provider별 건강 점수와 지연 시간 백분위
+    """
+    return {"routers": get_llm_router_stats()}
+
+
+@router.get("/health/schedule-prefetch")
+async def schedule_prefetch_stats() -> dict:
+    """
+    참석자 일정 선조회 지표
+
+    진행 중인 작업 수, 완료/실패/취소/생략 횟수, 조회 요청이 선조회를 기다린 횟수
+    """
+    prefetcher = get_schedule_prefetcher()
+    if prefetcher is None:
+        return {"enabled": False}
+    return {"enabled": True, **prefetcher.stats()}
+
+
+@router.get("/health/conversations")
+async def conversation_store_stats() -> dict:
+    """
+    대화 저장소 지표
+
+    사용 중인 저장소(redis, local), 조회 적중/미스, Redis 오류 횟수,
+    프로세스 내 저장소 크기와 LRU 제거 횟수, 턴 잠금 경합/거절 횟수와 대기 시간
+    """
+    return get_conversation_manager().stats()
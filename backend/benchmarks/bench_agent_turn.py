@@ -0,0 +1,87 @@
+"""Agent 턴 준비 비용 벤치마크
+
+한 턴(LLM 호출 여러 번) 동안 반복되는 시스템 프롬프트 렌더링과
+provider 도구 정의 변환의 CPU 시간을 캐시 적용 전/후로 비교합니다.
+
+- before: 호출마다 템플릿 조회/렌더링, 도구 스키마 생성/변환
+- after: 분 단위 프롬프트 캐시, 레지스트리의 provider별 변환 캐시
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.bench_agent_turn
+    python -m benchmarks.bench_agent_turn --turns 500 --iterations 4
+"""
+
+import argparse
+import time
+
+from agent.llm_client import LLMClient
+from agent.prompts.prompt_manager import PromptManager
+from agent.tools.registry import ToolRegistry
+from utils.datetime_utils import get_current_datetime
+
+CONTEXT = {
+    "selected_employees": [{"name": "이영희"}, {"name": "홍길동"}],
+    "duration_minutes": 60,
+}
+
+CONVERTERS = {
+    "anthropic": LLMClient._convert_tools_anthropic,
+    "openai": LLMClient._convert_tools_openai,
+    "gemini": LLMClient._convert_tools_gemini,
+}
+
+
+def turn_before(manager: PromptManager, registry: ToolRegistry, convert, iterations: int) -> None:
+    """캐시 적용 전 방식의 한 턴"""
+    for _ in range(iterations):
+        static = manager.env.get_template("system.jinja2").render()
+        dynamic = manager._render_datetime_prompt(get_current_datetime())
+        dynamic += manager.get_context_summary(CONTEXT)
+        convert([tool.get_schema() for tool in registry._tools.values()])
+        assert static and dynamic
+
+
+def turn_after(manager: PromptManager, registry: ToolRegistry, convert, iterations: int) -> None:
+    """캐시 적용 후 방식의 한 턴"""
+    for _ in range(iterations):
+        static = manager.get_static_prompt()
+        dynamic = manager.get_datetime_prompt() + manager.get_context_summary(CONTEXT)
+        LLMClient._provider_tools(registry.get_all_schemas(), convert)
+        assert static and dynamic
+
+
+def run(provider: str, turns: int, iterations: int) -> None:
+    """provider별 턴당 CPU 시간 측정"""
+    convert = CONVERTERS[provider]
+    registry = ToolRegistry()
+    manager = PromptManager()
+
+    results = {}
+    for label, turn in (("before", turn_before), ("after", turn_after)):
+        turn(manager, registry, convert, iterations)  # 워밍업
+        started = time.process_time()
+        for _ in range(turns):
+            turn(manager, registry, convert, iterations)
+        results[label] = (time.process_time() - started) / turns
+
+    before, after = results["before"], results["after"]
+    print(
+        f"  {provider:<9} before {before * 1e6:8.1f} us/turn  "
+        f"after {after * 1e6:8.1f} us/turn  x{before / after:6.1f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Agent turn preparation benchmark")
+    parser.add_argument("--turns", type=int, default=300)
+    parser.add_argument("--iterations", type=int, default=3, help="턴당 LLM 호출 수")
+    parser.add_argument("--providers", nargs="+", default=list(CONVERTERS), choices=list(CONVERTERS))
+    args = parser.parse_args()
+
+    print(f"turns={args.turns} iterations={args.iterations}")
+    for provider in args.providers:
+        run(provider, args.turns, args.iterations)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""대화 직렬화 벤치마크
+
+대화 하나(메시지 + 컨텍스트)를 저장/복원할 때의 크기와 CPU 시간을
+기존 방식(model_dump_json / model_validate_json)과 코덱별로 비교합니다.
+
+- bytes: 저장 크기 (코덱은 메시지/컨텍스트 값 크기 합)
+- encode: 전체 직렬화
+- decode: 전체 복원 (모든 메시지를 Message로)
+- context: 컨텍스트만 쓰는 턴의 복원 (메시지는 지연 디코딩)
+- turn: 한 턴의 저장 (코덱은 새 메시지 2개 + 바뀐 컨텍스트 값 1개, 기존 방식은 전체)
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.bench_conversation_codec
+    python -m benchmarks.bench_conversation_codec --turns 50 --repeat 500
+"""
+
+import argparse
+import importlib.util
+import time
+
+from agent.conversation_codec import ConversationCodec, LazyMessageList
+from models.chat import Conversation
+
+
+def make_conversation(turns: int) -> Conversation:
+    """회의 조율 대화 (가능 시간대/회의실 목록이 채워진 상태)"""
+    conversation = Conversation(id="conv_bench", user_id="user_001")
+    for i in range(turns):
+        conversation.add_message("user", f"다음 주에 이영희, 홍길동이랑 1시간 회의 잡아줘 ({i})")
+        conversation.add_message("assistant", "가능한 시간대를 찾았어요. 원하시는 시간을 골라주세요. " * 3)
+    conversation.context.update({
+        "selected_employees": [
+            {"id": f"EMP{i:03d}", "name": name, "department": "개발팀", "email": f"emp{i}@company.com"}
+            for i, name in enumerate(["이영희", "홍길동", "윤서연"])
+        ],
+        "available_slots": [
+            {
+                "date": f"2026-10-{day:02d}",
+                "start_time": f"{hour:02d}:00",
+                "end_time": f"{hour + 1:02d}:00",
+                "available_count": 3,
+                "total_count": 3,
+            }
+            for day in range(19, 24)
+            for hour in range(9, 18)
+        ],
+        "available_rooms": [
+            {
+                "id": f"ROOM{i:03d}",
+                "name": f"본관 {i}층 회의실",
+                "building": "본관",
+                "floor": i,
+                "capacity": 8,
+                "facilities": ["TV", "화상회의", "화이트보드"],
+            }
+            for i in range(12)
+        ],
+        "duration_minutes": 60,
+        "meeting_title": "주간 회의",
+    })
+    return conversation
+
+
+def timed(fn, repeat: int) -> float:
+    """1회 평균 CPU 시간 (초)"""
+    fn()  # 워밍업
+    started = time.process_time()
+    for _ in range(repeat):
+        fn()
+    return (time.process_time() - started) / repeat
+
+
+def report(label: str, size: int, encode: float, decode: float, context: float, turn: float, baseline: tuple) -> None:
+    base_size, base_encode, base_decode = baseline
+    print(
+        f"  {label:<15} {size:7d} B ({size / base_size:4.0%})  "
+        f"encode {encode * 1e6:7.1f} us (x{base_encode / encode:4.1f})  "
+        f"decode {decode * 1e6:7.1f} us (x{base_decode / decode:4.1f})  "
+        f"context {context * 1e6:7.1f} us (x{base_decode / context:4.1f})  "
+        f"turn {turn * 1e6:7.1f} us (x{base_encode / turn:5.1f})"
+    )
+
+
+def run_codec(codec: ConversationCodec, conversation: Conversation, repeat: int, baseline: tuple) -> None:
+    def encode():
+        messages = [codec.encode_message(message) for message in conversation.messages]
+        context = {field: codec.encode(value) for field, value in conversation.context.items()}
+        return messages, context
+
+    messages, context = encode()
+    size = sum(map(len, messages)) + sum(map(len, context.values()))
+
+    def decode_context():
+        values = {field: codec.decode(value) for field, value in context.items()}
+        return LazyMessageList(messages, codec.decode_message), values
+
+    def decode_all():
+        lazy, values = decode_context()
+        return list(lazy), values
+
+    def encode_turn():
+        messages = [codec.encode_message(message) for message in conversation.messages[-2:]]
+        return messages, codec.encode(conversation.context["available_slots"])
+
+    report(
+        codec.name, size,
+        timed(encode, repeat), timed(decode_all, repeat), timed(decode_context, repeat), timed(encode_turn, repeat),
+        baseline,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Conversation serialization benchmark")
+    parser.add_argument("--turns", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=300)
+    args = parser.parse_args()
+
+    conversation = make_conversation(args.turns)
+    blob = conversation.model_dump_json()
+    encode = timed(conversation.model_dump_json, args.repeat)
+    decode = timed(lambda: Conversation.model_validate_json(blob), args.repeat)
+    baseline = (len(blob.encode()), encode, decode)
+
+    print(f"turns={args.turns} messages={len(conversation.messages)} repeat={args.repeat}")
+    report("model_dump_json", baseline[0], encode, decode, decode, encode, baseline)
+
+    formats = ["json", "orjson"] + (["msgpack"] if importlib.util.find_spec("msgpack") else [])
+    compressions = [None] + (["zstd"] if importlib.util.find_spec("zstandard") else [])
+    for format in formats:
+        for compression in compressions:
+            run_codec(ConversationCodec(format=format, compression=compression), conversation, args.repeat, baseline)
+
+
+if __name__ == "__main__":
+    main()
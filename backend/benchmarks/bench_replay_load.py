@@ -0,0 +1,120 @@
+"""Agent 턴 부하 벤치마크 (LLM 기록 재생)
+
+ReplayLLMClient로 LLM 응답을 재생해 동시 턴 처리량과 턴 지연 시간을 잽니다.
+LLM 지연을 zero로 두면 백엔드 자체 오버헤드(이력 구성, 프롬프트, 도구 실행)만,
+fixed/recorded로 두면 provider 지연이 섞인 상황을 재현합니다.
+
+--trace를 주지 않으면 도구 호출 1회 + 최종 응답으로 이루어진 기록을 만들어 씁니다.
+실제 provider 기록은 LLM_REPLAY_MODE=record로 서버를 돌려 만든 파일을 넘기면 됩니다.
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.bench_replay_load
+    python -m benchmarks.bench_replay_load --turns 500 --concurrency 50 --latency fixed --fixed-latency 0.3
+    python -m benchmarks.bench_replay_load --trace traces/llm_trace.jsonl --latency recorded
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from agent.agent import MeetingAgent
+from agent.llm_client import LLMProvider
+from agent.replay_client import RecordingLLMClient, ReplayLLMClient
+from config import get_settings
+from models.chat import Conversation
+
+MESSAGE = "이영희랑 회의 잡아줘"
+
+SCRIPT = [
+    {
+        "content": "",
+        "tool_calls": [{"id": "call_0", "name": "search_employee", "arguments": {"query": "이영희"}}],
+        "stop_reason": "tool_use",
+    },
+    {"content": "이영희 님을 참석자로 추가했습니다. 언제로 잡을까요?", "tool_calls": [], "stop_reason": "end_turn"},
+]
+
+
+class ScriptedLLM:
+    """정해진 응답을 순서대로 돌려주는 LLM (기록 생성용)"""
+
+    def __init__(self, responses: list[dict]):
+        self.provider = LLMProvider(get_settings().llm_provider)
+        self.responses = responses
+        self.calls = 0
+
+    async def chat(self, messages, tools=None, tool_choice=None, system_prompt=None, max_tokens=4096):
+        response = self.responses[self.calls % len(self.responses)]
+        self.calls += 1
+        return response
+
+
+def new_conversation(index: int) -> Conversation:
+    conversation = Conversation(id=f"conv_bench_{index}", user_id="user_001")
+    conversation.add_message("user", MESSAGE)
+    return conversation
+
+
+async def make_trace(path: Path) -> None:
+    """스크립트 응답으로 한 턴을 기록"""
+    agent = MeetingAgent(use_mock_llm=True)
+    agent.llm = RecordingLLMClient(ScriptedLLM(SCRIPT), path)
+    await agent.process(MESSAGE, new_conversation(0))
+
+
+async def run(trace: Path, turns: int, concurrency: int, latency: str, fixed_latency: float) -> None:
+    """동시 턴 처리량/지연 시간 측정"""
+    replay = ReplayLLMClient(trace, latency=latency, fixed_latency=fixed_latency)
+    agent = MeetingAgent(use_mock_llm=True)
+    agent.llm = replay
+    semaphore = asyncio.Semaphore(concurrency)
+    durations = []
+
+    async def turn(index: int) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            await agent.process(MESSAGE, new_conversation(index))
+            durations.append(time.perf_counter() - started)
+
+    await turn(0)  # 워밍업
+    durations.clear()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(turn(i) for i in range(turns)))
+    elapsed = time.perf_counter() - started
+
+    durations.sort()
+    stats = replay.stats()
+    calls_per_turn = stats["calls"] / (turns + 1)
+    print(
+        f"  latency={latency:<8} {turns / elapsed:8.1f} turns/s  "
+        f"p50 {statistics.median(durations) * 1e3:7.2f} ms  "
+        f"p95 {durations[int(len(durations) * 0.95) - 1] * 1e3:7.2f} ms  "
+        f"llm calls/turn {calls_per_turn:.1f}  misses {stats['misses']}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Agent turn load benchmark with LLM replay")
+    parser.add_argument("--trace", type=Path, help="RecordingLLMClient 기록 파일 (기본: 생성)")
+    parser.add_argument("--turns", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--latency", default="zero", choices=["zero", "fixed", "recorded"])
+    parser.add_argument("--fixed-latency", type=float, default=0.2, help="fixed 지연 시간 (초)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        trace = args.trace
+        if trace is None:
+            trace = Path(tmp) / "trace.jsonl"
+            asyncio.run(make_trace(trace))
+
+        print(f"turns={args.turns} concurrency={args.concurrency} trace={trace}")
+        asyncio.run(run(trace, args.turns, args.concurrency, args.latency, args.fixed_latency))
+
+
+if __name__ == "__main__":
+    main()
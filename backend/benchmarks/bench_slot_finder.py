@@ -0,0 +1,113 @@
+"""SlotFinder 엔진 벤치마크
+
+기존 병합(merge) 방식과 스윕(sweep), NumPy 비트맵(bitmap) 엔진의
+공통 빈 시간대 계산 시간을 비교합니다 (엔진별 워밍업 1회 후 최솟값).
+
+참고 결과 (28일, 30분 회의, 날마다 모두 비워 둔 시간대 포함):
+sweep이 merge보다 1.7~2배 빠르고, bitmap은 15~300명 모두에서 sweep보다 느립니다
+(300명 기준 sweep 21ms, bitmap 38ms). bitmap은 참석자-날짜 행렬을 만드는 비용이
+커서, 이 규모에서는 대규모 검색용 엔진으로 쓸 이점이 없습니다.
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.bench_slot_finder
+    python -m benchmarks.bench_slot_finder --attendees 300 --days 28 --repeat 3
+"""
+
+import argparse
+import random
+import time
+from datetime import date, datetime, timedelta
+
+from models.calendar import TimeSlot, DaySchedule, ScheduleResponse
+from services.slot_finder import SlotFinder
+from utils.datetime_utils import KST
+
+
+def generate_schedules(attendees: int, days: int, seed: int = 42) -> list[ScheduleResponse]:
+    """
+    15분 단위로 정렬된 무작위 일정 생성
+
+    날마다 모두가 비워 둔 시간대(10:00~11:00, 15:00~16:30)를 남겨 두므로,
+    참석자가 수백 명이어도 공통 빈 시간대가 있습니다.
+    """
+    rng = random.Random(seed)
+    start = date.today()
+    protected = [(10 * 60, 11 * 60), (15 * 60, 16 * 60 + 30)]
+    schedules = []
+
+    for a in range(attendees):
+        day_schedules = []
+        for d in range(days):
+            target = start + timedelta(days=d)
+            day_start = datetime.combine(target, datetime.min.time(), tzinfo=KST)
+            busy = []
+            for _ in range(rng.randint(0, 3)):
+                length = rng.choice([30, 60, 90])
+                begin = rng.randrange(9 * 60, 18 * 60 - length + 1, 15)
+                if any(begin < p_end and begin + length > p_start for p_start, p_end in protected):
+                    continue
+                busy.append(TimeSlot(
+                    start=day_start + timedelta(minutes=begin),
+                    end=day_start + timedelta(minutes=begin + length),
+                    is_busy=True,
+                ))
+            day_schedules.append(DaySchedule(
+                schedule_date=target,
+                employee_id=f"emp_{a:04d}",
+                busy_slots=busy,
+            ))
+        schedules.append(ScheduleResponse(
+            employee_id=f"emp_{a:04d}",
+            employee_name=f"직원{a}",
+            start_date=start,
+            end_date=start + timedelta(days=days - 1),
+            schedules=day_schedules,
+        ))
+
+    return schedules
+
+
+def run(attendees: int, days: int, duration: int, repeat: int) -> None:
+    """엔진별 실행 시간 측정 및 결과 일치 확인"""
+    schedules = generate_schedules(attendees, days)
+    start = schedules[0].start_date
+    end = schedules[0].end_date
+    finder = SlotFinder()
+
+    print(f"attendees={attendees} days={days} duration={duration}min repeat={repeat}")
+    baseline = None
+    baseline_time = None
+
+    for engine in ("merge", "sweep", "bitmap"):
+        finder.find_common_free_slots(schedules, start, end, duration, engine=engine)  # 워밍업 (import, 캐시)
+        best = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            slots = finder.find_common_free_slots(
+                schedules, start, end, duration, engine=engine
+            )
+            best = min(best, time.perf_counter() - started)
+
+        if baseline is None:
+            baseline, baseline_time = slots, best
+        same = "same" if slots == baseline else "DIFFERENT"
+        print(
+            f"  {engine:<7} {best * 1000:9.2f} ms  "
+            f"x{baseline_time / best:6.1f}  slots={len(slots)} ({same})"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="SlotFinder engine benchmark")
+    parser.add_argument("--attendees", type=int, nargs="+", default=[15, 50, 150, 300])
+    parser.add_argument("--days", type=int, default=28)
+    parser.add_argument("--duration", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for attendees in args.attendees:
+        run(attendees, args.days, args.duration, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 """환경설정 모듈"""
 
 from functools import lru_cache
+from typing import Optional
 from pydantic_settings import BaseSettings
 
 
@@ -35,6 +36,55 @@ class Settings(BaseSettings):
     custom_api_url: str = ""  # 예: http://localhost:11434/v1, https://your-server.com/v1
     custom_model: str = ""  # 예: llama3, mistral, etc.
 
+    # LLM SDK 호출 방식
+    llm_call_mode: str = "native"  # native (비동기 SDK), thread (동기 SDK를 스레드 풀에서 실행)
+    llm_offload_workers: int = 16  # thread 모드 스레드 풀 크기
+    llm_prompt_cache: bool = True  # 시스템 프롬프트 고정 부분/도구 정의에 provider 프롬프트 캐시 적용
+
+    # LLM 클라이언트 풀 설정 (provider별 프로세스 공용 클라이언트)
+    llm_pool_max_connections: int = 20  # provider별 최대 연결 수
+    llm_pool_max_connections_by_provider: str = ""  # provider별 재정의, 예: openai=50,custom=4
+    llm_pool_max_keepalive: int = 10  # provider별 유지할 유휴 연결 수
+    llm_keepalive_expiry: float = 120.0  # 유휴 연결 유지 시간 (초)
+    llm_pool_warmup: bool = False  # 시작 시 현재 provider 연결을 미리 열어 둠
+
+    # LLM 속도 제한/재시도 설정 ((provider, 모델)별 프로세스 공용 리미터)
+    llm_rate_limit_rpm: int = 0  # 분당 최대 요청 수 (0이면 제한 없음)
+    llm_rate_limit_rpm_by_provider: str = ""  # provider별 재정의, 예: openai=500,gemini=1000
+    llm_rate_limit_tpm: int = 0  # 분당 최대 토큰 수 (0이면 제한 없음)
+    llm_rate_limit_tpm_by_provider: str = ""  # provider별 재정의, 예: openai=200000
+    llm_queue_enabled: bool = True  # 한도 초과 요청을 대기열에서 기다리게 함 (False면 바로 거절)
+    llm_queue_max_size: int = 100  # 리미터별 최대 대기 요청 수
+    llm_queue_max_wait: float = 30.0  # 요청당 최대 대기 시간 (초)
+    llm_retry_max_attempts: int = 3  # 일시적 오류 시 최대 시도 횟수
+    llm_retry_base_delay: float = 1.0  # 재시도 지연 기준값 (초, 시도마다 2배 + 지터)
+    llm_retry_max_delay: float = 30.0  # 재시도 지연 상한 (초)
+
+    # LLM 라우팅 설정 (여러 provider 간 헤징/장애 조치)
+    llm_agent_providers: str = ""  # 도구 호출(Agent)에 쓸 provider 우선순위, 예: anthropic,openai (비우면 llm_provider)
+    llm_intent_providers: str = ""  # Intent 파싱에 쓸 provider 우선순위, 예: gemini,openai (비우면 llm_provider)
+    llm_hedge_enabled: bool = True  # 기본 provider가 느리면 예비 provider에 두 번째 요청
+    llm_hedge_percentile: float = 0.95  # 이 지연 시간 백분위를 넘으면 헤징
+    llm_hedge_min_delay: float = 1.0  # 헤징 전 최소 대기 시간 (초)
+    llm_hedge_default_delay: float = 5.0  # 지연 시간 표본이 부족할 때의 헤징 대기 시간 (초)
+    llm_failure_threshold: int = 3  # 연속 실패 시 provider를 잠시 제외할 횟수
+    llm_failure_cooldown: float = 30.0  # 제외 시간 (초)
+
+    # LLM 요청/응답 기록·재생 (부하/회귀 테스트용)
+    llm_replay_mode: str = ""  # "" (사용 안 함), record (실제 호출을 파일에 기록), replay (기록 재생, API 키 불필요)
+    llm_replay_path: str = "traces/llm_trace.jsonl"
+    llm_replay_latency: str = "zero"  # zero, fixed, recorded
+    llm_replay_fixed_latency: float = 0.0  # fixed 방식의 지연 시간 (초)
+
+    # Agent 설정
+    agent_tool_concurrency: int = 4  # 한 턴의 도구 호출 최대 동시 실행 수
+
+    # 대화 이력 설정 (토큰 예산 초과분은 누적 요약으로 접음)
+    history_token_budget: int = 8000  # 대화 이력(요약 포함) 최대 추정 토큰 수
+    history_token_budgets: str = ""  # provider별 예산, 예: gemini=32000,custom=4000
+    history_min_recent_messages: int = 6  # 예산과 관계없이 원문으로 남길 최근 메시지 수
+    history_summarizer: str = "extractive"  # extractive (LLM 호출 없음), llm
+
     def get_api_key(self, provider: str = None) -> str:
         """현재 provider에 맞는 API 키 반환"""
         p = provider or self.llm_provider
@@ -65,6 +115,61 @@ class Settings(BaseSettings):
             return self.custom_model
         return ""
 
+    def _get_provider_override(self, overrides: str, provider: str = None) -> Optional[int]:
+        """"provider=값,..." 형식 설정에서 provider 값 반환 (없으면 None)"""
+        p = provider or self.llm_provider
+        for item in overrides.split(","):
+            name, _, value = item.partition("=")
+            if name.strip() == p and value.strip():
+                return int(value)
+        return None
+
+    def get_history_token_budget(self, provider: str = None) -> int:
+        """provider별 대화 이력 토큰 예산 반환"""
+        budget = self._get_provider_override(self.history_token_budgets, provider)
+        return self.history_token_budget if budget is None else budget
+
+    def get_llm_pool_max_connections(self, provider: str = None) -> int:
+        """provider별 LLM 최대 연결 수 반환"""
+        limit = self._get_provider_override(self.llm_pool_max_connections_by_provider, provider)
+        return self.llm_pool_max_connections if limit is None else limit
+
+    def is_llm_provider_configured(self, provider: str) -> bool:
+        """provider 호출에 필요한 설정(API 키/모델/URL)이 있는지"""
+        if provider == "litellm":
+            return bool(self.litellm_model)
+        if provider == "custom":
+            return bool(self.custom_api_url)
+        return bool(self.get_api_key(provider))
+
+    def get_llm_providers(self, purpose: str = "agent") -> list[str]:
+        """
+        용도별 LLM provider 우선순위 반환
+
+        Args:
+            purpose: agent (도구 호출), intent (Intent 파싱)
+
+        Returns:
+            설정이 갖춰진 provider 목록 (없으면 llm_provider 하나)
+        """
+        value = self.llm_intent_providers if purpose == "intent" else self.llm_agent_providers
+        providers = []
+        for name in value.split(","):
+            name = name.strip()
+            if name and name not in providers and self.is_llm_provider_configured(name):
+                providers.append(name)
+        return providers or [self.llm_provider]
+
+    def get_llm_rate_limit_rpm(self, provider: str = None) -> int:
+        """provider별 분당 최대 LLM 요청 수 반환 (0이면 제한 없음)"""
+        limit = self._get_provider_override(self.llm_rate_limit_rpm_by_provider, provider)
+        return self.llm_rate_limit_rpm if limit is None else limit
+
+    def get_llm_rate_limit_tpm(self, provider: str = None) -> int:
+        """provider별 분당 최대 LLM 토큰 수 반환 (0이면 제한 없음)"""
+        limit = self._get_provider_override(self.llm_rate_limit_tpm_by_provider, provider)
+        return self.llm_rate_limit_tpm if limit is None else limit
+
     def get_api_url(self, provider: str = None) -> str:
         """현재 provider에 맞는 API URL 반환"""
         p = provider or self.llm_provider
@@ -86,10 +191,61 @@ class Settings(BaseSettings):
     room_api_url: str = "https://intranet.company.com/api/rooms"
     api_auth_token: str = ""
 
+    # 사내 API 동시 호출 설정 (여러 직원/회의실 일괄 조회)
+    api_fanout_concurrency: int = 8  # 최대 동시 요청 수
+    api_fanout_timeout: float = 10.0  # 요청당 타임아웃 (초, 0이면 무제한)
+    room_index_ttl: int = 60  # 회의실 예약 현황 인덱스 갱신 주기 (초, 사내 API 사용 시)
+
+    # 사내 API 커넥션 풀 설정 (프로세스 공용 클라이언트)
+    api_pool_max_connections: int = 100  # API별 최대 연결 수
+    api_pool_max_keepalive: int = 20  # API별 유지할 유휴 연결 수
+    api_keepalive_expiry: float = 30.0  # 유휴 연결 유지 시간 (초)
+    api_http2: bool = True  # HTTP/2 사용 (h2 패키지 필요)
+    api_timeout: float = 30.0  # 요청 타임아웃 (초)
+
     # 서버 설정
     redis_url: str = "redis://localhost:6379"
+    redis_max_connections: int = 50  # 대화 저장소 커넥션 풀 최대 연결 수
+    redis_socket_timeout: float = 1.0  # 연결/명령 타임아웃 (초, 넘으면 프로세스 내 저장소로 처리)
     log_level: str = "INFO"
 
+    # 대화 저장소 설정 (redis는 연결 실패/오류 시 프로세스 내 저장소로 대신 처리)
+    conversation_backend: str = "redis"  # redis, local
+    conversation_ttl: int = 86400  # 마지막 조회/저장 후 유지 시간 (초)
+    conversation_local_max_entries: int = 1000  # 프로세스 내 저장소 최대 대화 수 (LRU)
+    conversation_local_ttl: int = 3600  # 프로세스 내 저장소 유지 시간 (초)
+    conversation_migrate_on_startup: bool = True  # 시작 시 이전 형식(대화 전체 JSON) 키를 증분 저장 형식으로 옮김
+    conversation_codec: str = "orjson"  # json, orjson, msgpack (메시지/컨텍스트 값 직렬화, 패키지가 없으면 json)
+    conversation_compression: str = "none"  # none, zstd (zstandard 패키지 필요)
+    conversation_compression_min_bytes: int = 1024  # 이 크기 이상의 값만 압축
+    conversation_compression_level: int = 3  # zstd 압축 수준
+
+    # 대화 턴 잠금 설정 (같은 대화의 동시 요청 직렬화, redis 백엔드는 워커/서버 간 임대)
+    conversation_lock_wait: float = 5.0  # 최대 대기 시간 (초, 넘으면 409)
+    conversation_lock_max_waiters: int = 1  # 대화별 최대 대기 요청 수 (넘으면 바로 409)
+    conversation_lock_lease: float = 30.0  # Redis 임대 유지 시간 (초, 턴 동안 주기적으로 연장)
+
+    # 일정 캐시 설정 ((직원 ID, 날짜) 단위)
+    schedule_cache_enabled: bool = True
+    schedule_cache_backend: str = "local"  # local, redis
+    schedule_cache_ttl: int = 300  # 초
+    schedule_cache_max_entries: int = 10000  # local 백엔드 최대 항목 수
+
+    # 참석자 일정 선조회 설정 (참석자 확정 시 오늘 ~ 다음 주 금요일 일정을 일정 캐시에 미리 적재)
+    schedule_prefetch_enabled: bool = True
+    schedule_prefetch_concurrency: int = 4  # 최대 동시 조회 수
+    schedule_prefetch_max_pending: int = 32  # 최대 대기/진행 중 작업 수 (넘으면 생략)
+
+    # Intent 파싱 응답 캐시 설정 (정규화한 메시지 + UI 컨텍스트 + 날짜 단위)
+    intent_cache_enabled: bool = True
+    intent_cache_backend: str = "local"  # local, redis
+    intent_cache_ttl: int = 600  # 초
+    intent_cache_max_entries: int = 2000  # local 백엔드 최대 항목 수
+
+    # Intent 규칙 기반 빠른 경로 (신뢰도가 낮으면 LLM으로)
+    intent_fast_path_enabled: bool = True
+    intent_fast_path_threshold: float = 0.9  # 메시지에서 해석한 글자 비율
+
     # Mock API 사용 여부
     use_mock_api: bool = True
 
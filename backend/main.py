@@ -6,6 +6,9 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from config import get_settings
 from api.routes import api_router
+from services.client_registry import get_api_client_registry
+from agent.conversation import get_conversation_manager
+from agent.llm_pool import get_llm_pool
 from api.middleware.auth import AuthMiddleware
 from utils.logger import setup_logger, get_logger
 
@@ -20,11 +23,21 @@ async def lifespan(app: FastAPI):
     setup_logger(settings.log_level)
     logger.info("Meeting Scheduler AI starting...")
     logger.info(f"Mock mode: {settings.use_mock_api}")
+    api_clients = get_api_client_registry()
+    llm_pool = get_llm_pool()
+    conversations = get_conversation_manager()
+    if await conversations.connect_redis() and settings.conversation_migrate_on_startup:
+        await conversations.migrate_legacy()
+    if settings.llm_pool_warmup and settings.get_api_key():
+        await llm_pool.warmup()
 
     yield
 
     # 종료 시
     logger.info("Meeting Scheduler AI shutting down...")
+    await api_clients.close_all()
+    await llm_pool.close_all()
+    await conversations.close()
 
 
 app = FastAPI(
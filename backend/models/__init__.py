@@ -1,7 +1,7 @@
 """데이터 모델 모듈"""
 
 from .employee import Employee, EmployeeSearchResult
-from .calendar import TimeSlot, DaySchedule, ScheduleResponse
+from .calendar import TimeSlot, FreeSlot, QuorumSlot, DaySchedule, ScheduleResponse
 from .room import Room, RoomAvailability, RoomSearchResult
 from .meeting import MeetingRequest, Meeting, MeetingOption
 from .chat import ChatRequest, ChatResponse, ResponseType, ChatStatus
@@ -10,6 +10,8 @@ __all__ = [
     "Employee",
     "EmployeeSearchResult",
     "TimeSlot",
+    "FreeSlot",
+    "QuorumSlot",
     "DaySchedule",
     "ScheduleResponse",
     "Room",
@@ -34,6 +34,22 @@ class FreeSlot(BaseModel):
         return cls(start=start, end=end, duration_minutes=duration)
 
 
+class QuorumSlot(BaseModel):
+    """일부 참석자만 가능한 시간대 모델 (K명 이상 참석)"""
+
+    start: datetime = Field(..., description="시작 시간")
+    end: datetime = Field(..., description="종료 시간")
+    duration_minutes: int = Field(..., description="구간 길이 (분)")
+    available_ids: list[str] = Field(default_factory=list, description="참석 가능한 직원 ID 목록")
+    unavailable_ids: list[str] = Field(default_factory=list, description="참석 불가능한 직원 ID 목록")
+    score: float = Field(0.0, description="가중 참석 점수 (높을수록 좋음)")
+
+    @property
+    def attendance_count(self) -> int:
+        """참석 가능 인원"""
+        return len(self.available_ids)
+
+
 class DaySchedule(BaseModel):
     """일별 일정 모델"""
 
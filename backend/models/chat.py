@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, field_serializer
 from typing import Optional, Any
 
 
@@ -74,9 +74,21 @@ class Conversation(BaseModel):
     messages: list[Message] = Field(default_factory=list, description="메시지 목록")
     status: ChatStatus = Field(ChatStatus.PROCESSING, description="대화 상태")
     context: dict[str, Any] = Field(default_factory=dict, description="대화 컨텍스트")
+    history_summary: str = Field("", description="토큰 예산 밖으로 접힌 오래된 대화의 누적 요약")
+    summarized_count: int = Field(0, description="요약으로 접힌 메시지 수 (messages 앞쪽부터)")
+    summarized_tokens: int = Field(0, description="요약으로 접힌 메시지의 추정 토큰 수")
     created_at: datetime = Field(default_factory=datetime.now, description="생성 시간")
     updated_at: datetime = Field(default_factory=datetime.now, description="수정 시간")
 
+    # 저장소에 이미 반영된 상태 (증분 저장용, 직렬화하지 않음)
+    _stored_messages: int = PrivateAttr(0)
+    _stored_context: Optional[dict[str, bytes]] = PrivateAttr(None)  # 키별 인코딩 값, None이면 전체 저장
+
+    @field_serializer("messages", mode="wrap")
+    def _serialize_messages(self, messages: list[Message], handler):
+        # 저장소에서 지연 디코딩하는 목록도 Message로 풀어서 직렬화
+        return handler(list(messages))
+
     def add_message(self, role: str, content: str, metadata: Optional[dict] = None) -> None:
         """메시지 추가"""
         self.messages.append(
@@ -1,6 +1,8 @@
 """서비스 모듈"""
 
 from .base import BaseAPIClient
+from .client_registry import APIClientRegistry, get_api_client, get_api_client_registry
+from .fanout import fan_out, FanOutResult
 from .organization import OrganizationService
 from .calendar import CalendarService
 from .room import RoomService
@@ -8,6 +10,11 @@ from .slot_finder import SlotFinder
 
 __all__ = [
     "BaseAPIClient",
+    "APIClientRegistry",
+    "get_api_client",
+    "get_api_client_registry",
+    "fan_out",
+    "FanOutResult",
     "OrganizationService",
     "CalendarService",
     "RoomService",
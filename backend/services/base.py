@@ -1,5 +1,6 @@
 """API 클라이언트 베이스 클래스"""
 
+import importlib.util
 from abc import ABC
 from typing import Any, Optional
 import httpx
@@ -17,19 +18,49 @@ class BaseAPIClient(ABC):
         base_url: str,
         auth_token: Optional[str] = None,
         timeout: float = 30.0,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
     ):
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self.limits = limits or httpx.Limits()
         headers = {"Content-Type": "application/json"}
         if auth_token:
             headers["Authorization"] = f"Bearer {auth_token}"
 
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("h2 package not installed, falling back to HTTP/1.1")
+            http2 = False
+        self.http2 = http2
+
         self.client = httpx.AsyncClient(
             base_url=self.base_url,
             headers=headers,
             timeout=timeout,
+            limits=self.limits,
+            http2=http2,
         )
 
+        # 커넥션 풀 포화도 지표
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.requests_total = 0
+        self.saturated_total = 0  # 풀이 가득 찬 상태에서 시작된 요청 수 (연결 대기)
+
+    def stats(self) -> dict:
+        """커넥션 풀 사용 지표"""
+        max_connections = self.limits.max_connections
+        return {
+            "base_url": self.base_url,
+            "http2": self.http2,
+            "max_connections": max_connections,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "requests_total": self.requests_total,
+            "saturated_total": self.saturated_total,
+            "utilization": self.in_flight / max_connections if max_connections else 0.0,
+        }
+
     async def close(self) -> None:
         """클라이언트 종료"""
         await self.client.aclose()
@@ -43,6 +74,13 @@ class BaseAPIClient(ABC):
         **kwargs: Any,
     ) -> dict:
         """HTTP 요청 실행"""
+        max_connections = self.limits.max_connections
+        if max_connections and self.in_flight >= max_connections:
+            self.saturated_total += 1
+        self.requests_total += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
         try:
             response = await self.client.request(
                 method,
@@ -65,6 +103,8 @@ class BaseAPIClient(ABC):
                 extra={"path": path, "method": method},
             )
             raise
+        finally:
+            self.in_flight -= 1
 
     async def get(self, path: str, params: Optional[dict] = None) -> dict:
         """GET 요청"""
@@ -9,7 +9,10 @@ from models.calendar import TimeSlot, DaySchedule, ScheduleResponse, FreeSlot
 from models.meeting import Meeting, MeetingRequest
 from utils.logger import get_logger
 from utils.datetime_utils import get_work_hours, is_lunch_time, KST
-from .base import BaseAPIClient
+from .client_registry import get_api_client
+from .fanout import fan_out, FanOutResult
+from .schedule_cache import ScheduleCache, get_schedule_cache
+from .schedule_prefetch import get_schedule_prefetcher
 from .mock_data import generate_mock_schedule, MOCK_EMPLOYEES
 
 logger = get_logger(__name__)
@@ -19,13 +22,14 @@ settings = get_settings()
 class CalendarService:
     """캘린더 API 서비스"""
 
-    def __init__(self, use_mock: bool = True):
+    def __init__(self, use_mock: bool = True, cache: Optional[ScheduleCache] = None):
         self.use_mock = use_mock or settings.use_mock_api
         if not self.use_mock:
-            self.client = BaseAPIClient(
+            self.client = get_api_client(
                 settings.calendar_api_url,
                 settings.api_auth_token,
             )
+        self.cache = cache if cache is not None else get_schedule_cache()
         self._created_meetings: dict[str, Meeting] = {}
 
     async def get_schedule(
@@ -37,6 +41,10 @@ class CalendarService:
         """
         직원 일정 조회
 
+        캐시가 켜져 있으면 캐시된 날짜는 그대로 쓰고,
+        캐시에 없는 날짜 구간만 API로 조회합니다.
+        같은 직원의 선조회가 진행 중이면 끝날 때까지 기다린 뒤 캐시를 봅니다.
+
         Args:
             employee_id: 직원 ID
             start_date: 시작일
@@ -45,6 +53,48 @@ class CalendarService:
         Returns:
             일정 응답
         """
+        if self.cache is None:
+            return await self._fetch_schedule(employee_id, start_date, end_date)
+
+        prefetcher = get_schedule_prefetcher()
+        if prefetcher is not None:
+            await prefetcher.wait(employee_id, start_date, end_date)
+
+        dates = [
+            start_date + timedelta(days=i)
+            for i in range((end_date - start_date).days + 1)
+        ]
+        employee_name, days = await self.cache.get_days(employee_id, dates)
+        missing = [d for d in dates if d not in days]
+
+        if missing:
+            fetched = await self._fetch_schedule(employee_id, missing[0], missing[-1])
+            employee_name = fetched.employee_name
+            fetched_days = {day.schedule_date: day for day in fetched.schedules}
+
+            # 응답에 없는 날짜는 일정이 없는 날로 캐싱
+            for d in dates[dates.index(missing[0]):dates.index(missing[-1]) + 1]:
+                if d not in fetched_days:
+                    fetched_days[d] = DaySchedule(schedule_date=d, employee_id=employee_id)
+
+            await self.cache.set_days(employee_id, employee_name, list(fetched_days.values()))
+            days.update(fetched_days)
+
+        return ScheduleResponse(
+            employee_id=employee_id,
+            employee_name=employee_name or "",
+            start_date=start_date,
+            end_date=end_date,
+            schedules=[days[d] for d in dates],
+        )
+
+    async def _fetch_schedule(
+        self,
+        employee_id: str,
+        start_date: date,
+        end_date: date,
+    ) -> ScheduleResponse:
+        """API(또는 Mock)에서 직원 일정 조회"""
         if self.use_mock:
             return self._get_mock_schedule(employee_id, start_date, end_date)
 
@@ -97,12 +147,41 @@ class CalendarService:
 
         Returns:
             일정 응답 목록
+
+        Raises:
+            일부 직원의 조회가 실패하면 첫 번째 오류를 다시 발생
         """
-        results = []
-        for emp_id in employee_ids:
-            schedule = await self.get_schedule(emp_id, start_date, end_date)
-            results.append(schedule)
-        return results
+        fetched = await self.fetch_schedules(employee_ids, start_date, end_date)
+        fetched.raise_first_error()
+        return [fetched.results[emp_id] for emp_id in employee_ids]
+
+    async def fetch_schedules(
+        self,
+        employee_ids: list[str],
+        start_date: date,
+        end_date: date,
+        concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> FanOutResult:
+        """
+        여러 직원 일정 동시 조회 (부분 실패 허용)
+
+        Args:
+            employee_ids: 직원 ID 목록
+            start_date: 시작일
+            end_date: 종료일
+            concurrency: 최대 동시 요청 수
+            timeout: 요청당 타임아웃 (초)
+
+        Returns:
+            직원 ID별 일정 응답과 실패 정보
+        """
+        return await fan_out(
+            employee_ids,
+            lambda emp_id: self.get_schedule(emp_id, start_date, end_date),
+            concurrency=concurrency,
+            timeout=timeout,
+        )
 
     async def create_event(self, meeting: MeetingRequest) -> Meeting:
         """
@@ -115,8 +194,15 @@ class CalendarService:
             생성된 회의 정보
         """
         if self.use_mock:
-            return self._create_mock_event(meeting)
+            created = self._create_mock_event(meeting)
+        else:
+            created = await self._create_api_event(meeting)
 
+        await self._invalidate_attendee_cache(meeting)
+        return created
+
+    async def _create_api_event(self, meeting: MeetingRequest) -> Meeting:
+        """API로 회의 일정 생성"""
         data = await self.client.post(
             "/events",
             json_data={
@@ -140,6 +226,21 @@ class CalendarService:
             description=meeting.description,
         )
 
+    async def _invalidate_attendee_cache(self, meeting: MeetingRequest) -> None:
+        """회의 참석자(주최자 포함)의 회의 날짜 캐시 무효화"""
+        if self.cache is None:
+            return
+
+        first = meeting.start_time.astimezone(KST).date()
+        last = meeting.end_time.astimezone(KST).date()
+        dates = [first + timedelta(days=i) for i in range((last - first).days + 1)]
+
+        employee_ids = list(meeting.attendee_ids)
+        if meeting.organizer_id and meeting.organizer_id not in employee_ids:
+            employee_ids.append(meeting.organizer_id)
+        for employee_id in employee_ids:
+            await self.cache.invalidate(employee_id, dates)
+
     def _get_mock_schedule(
         self,
         employee_id: str,
@@ -0,0 +1,104 @@
+"""사내 API 클라이언트 레지스트리
+
+도구마다 서비스 객체를 새로 만들더라도 같은 (API URL, 인증 토큰)에는
+프로세스 공용 BaseAPIClient 하나만 쓰도록 해서 커넥션 풀과 TLS 세션을 재사용합니다.
+생성된 클라이언트는 FastAPI lifespan 종료 시 한꺼번에 닫습니다.
+"""
+
+from typing import Optional
+
+import httpx
+
+from config import get_settings
+from utils.logger import get_logger
+from .base import BaseAPIClient
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+class APIClientRegistry:
+    """(API URL, 인증 토큰)별 공용 API 클라이언트 레지스트리"""
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = True,
+        timeout: float = 30.0,
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2
+        self.timeout = timeout
+        self._clients: dict[tuple[str, str], BaseAPIClient] = {}
+
+    def get(self, base_url: str, auth_token: Optional[str] = None) -> BaseAPIClient:
+        """
+        공용 API 클라이언트 반환 (없으면 생성)
+
+        Args:
+            base_url: API 기본 URL
+            auth_token: 인증 토큰
+
+        Returns:
+            API 클라이언트
+        """
+        key = (base_url.rstrip("/"), auth_token or "")
+        client = self._clients.get(key)
+        if client is None:
+            client = BaseAPIClient(
+                base_url,
+                auth_token,
+                timeout=self.timeout,
+                limits=self.limits,
+                http2=self.http2,
+            )
+            self._clients[key] = client
+            logger.info(f"API client created: {key[0]} (http2={client.http2})")
+        return client
+
+    def stats(self) -> list[dict]:
+        """클라이언트별 커넥션 풀 사용 지표"""
+        return [client.stats() for client in self._clients.values()]
+
+    async def close_all(self) -> None:
+        """모든 클라이언트 종료"""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            try:
+                await client.close()
+            except Exception as e:
+                logger.warning(f"API client close failed ({client.base_url}): {e}")
+        if clients:
+            logger.info(f"API clients closed: {len(clients)}")
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+
+_registry: Optional[APIClientRegistry] = None
+
+
+def get_api_client_registry() -> APIClientRegistry:
+    """설정에 따른 프로세스 공용 API 클라이언트 레지스트리 반환"""
+    global _registry
+    if _registry is None:
+        _registry = APIClientRegistry(
+            max_connections=settings.api_pool_max_connections,
+            max_keepalive_connections=settings.api_pool_max_keepalive,
+            keepalive_expiry=settings.api_keepalive_expiry,
+            http2=settings.api_http2,
+            timeout=settings.api_timeout,
+        )
+    return _registry
+
+
+def get_api_client(base_url: str, auth_token: Optional[str] = None) -> BaseAPIClient:
+    """공용 레지스트리에서 API 클라이언트 반환"""
+    return get_api_client_registry().get(base_url, auth_token)
@@ -0,0 +1,98 @@
+"""사내 API 동시 호출(fan-out) 유틸리티"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable, Iterable, Optional
+
+from config import get_settings
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+class FanOutResult:
+    """fan-out 실행 결과 (부분 실패 포함)"""
+
+    def __init__(self):
+        self.results: dict[Hashable, Any] = {}
+        self.errors: dict[Hashable, BaseException] = {}
+
+    @property
+    def values(self) -> list[Any]:
+        """성공한 결과 목록 (요청 순서 유지)"""
+        return list(self.results.values())
+
+    @property
+    def failures(self) -> dict[Hashable, str]:
+        """실패한 키별 오류 메시지"""
+        return {key: _describe_error(error) for key, error in self.errors.items()}
+
+    @property
+    def has_failures(self) -> bool:
+        """실패 여부"""
+        return bool(self.errors)
+
+    def raise_first_error(self) -> None:
+        """실패가 있으면 첫 번째 오류를 다시 발생"""
+        for error in self.errors.values():
+            raise error
+
+
+def _describe_error(error: BaseException) -> str:
+    """오류를 사용자 메시지용 문자열로 변환"""
+    if isinstance(error, asyncio.TimeoutError):
+        return "응답 시간 초과"
+    return str(error) or type(error).__name__
+
+
+async def fan_out(
+    keys: Iterable[Hashable],
+    func: Callable[[Any], Awaitable[Any]],
+    concurrency: Optional[int] = None,
+    timeout: Optional[float] = None,
+) -> FanOutResult:
+    """
+    키 목록에 대해 비동기 함수를 제한된 동시성으로 실행
+
+    Args:
+        keys: 요청 키 목록 (직원 ID, 회의실 ID 등, 중복은 한 번만 실행)
+        func: 키 하나를 받아 결과를 반환하는 코루틴 함수
+        concurrency: 최대 동시 실행 수 (기본: settings.api_fanout_concurrency)
+        timeout: 요청당 타임아웃 초 (기본: settings.api_fanout_timeout, 0이면 무제한)
+
+    Returns:
+        키별 성공 결과와 실패 오류를 담은 FanOutResult
+    """
+    unique_keys = list(dict.fromkeys(keys))
+    limit = max(1, concurrency or settings.api_fanout_concurrency)
+    if timeout is None:
+        timeout = settings.api_fanout_timeout
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(key: Hashable) -> Any:
+        async with semaphore:
+            if timeout:
+                return await asyncio.wait_for(func(key), timeout)
+            return await func(key)
+
+    outcomes = await asyncio.gather(
+        *(run(key) for key in unique_keys),
+        return_exceptions=True,
+    )
+
+    result = FanOutResult()
+    for key, outcome in zip(unique_keys, outcomes):
+        if isinstance(outcome, asyncio.CancelledError):
+            raise outcome
+        if isinstance(outcome, BaseException):
+            result.errors[key] = outcome
+        else:
+            result.results[key] = outcome
+
+    if result.has_failures:
+        logger.warning(
+            f"Fan-out partial failure: {len(result.errors)}/{len(unique_keys)} failed",
+            extra={"failures": result.failures},
+        )
+
+    return result
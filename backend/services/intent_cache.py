@@ -0,0 +1,231 @@
+"""Intent 파싱 응답 캐시
+
+/api/chat/parse-intent의 함수 호출 결과는 정규화한 메시지, UI 컨텍스트,
+오늘 날짜(상대 날짜 해석 기준)에만 의존하므로 이 세 가지로 키를 만들어
+LLM 호출 없이 같은 결과를 돌려줍니다.
+"""
+
+import hashlib
+import json
+import re
+import time
+import unicodedata
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import date
+from typing import Optional
+
+import redis.asyncio as redis
+
+from config import get_settings
+from utils.datetime_utils import get_today
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# 캐시 값 형식/프롬프트가 바뀌면 올려 이전 항목을 무효화
+KEY_VERSION = 1
+
+# 프롬프트에 들어가는 UI 컨텍스트 항목 (나머지 UI 상태는 결과에 영향 없음)
+CONTEXT_KEYS = ("participants", "selectedTimeRange", "selectedRoom", "selectedDate")
+
+_WHITESPACE = re.compile(r"\s+")
+_TRAILING_PUNCTUATION = re.compile(r"[\s.!?~,。！？]+$")
+
+
+def normalize_message(message: str) -> str:
+    """유니코드 정규화(NFKC), 소문자화, 공백 압축, 끝 문장부호 제거"""
+    text = unicodedata.normalize("NFKC", message).lower()
+    text = _WHITESPACE.sub(" ", text).strip()
+    return _TRAILING_PUNCTUATION.sub("", text)
+
+
+def canonicalize_context(context: Optional[dict]) -> str:
+    """결과에 영향을 주는 컨텍스트 항목만 키 순서를 고정해 직렬화"""
+    if not context:
+        return ""
+    relevant = {k: context[k] for k in CONTEXT_KEYS if context.get(k)}
+    return json.dumps(relevant, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+
+def make_intent_cache_key(
+    message: str,
+    context: Optional[dict],
+    today: Optional[date] = None,
+    model: str = "",
+) -> str:
+    """
+    Intent 캐시 키 생성
+
+    Args:
+        message: 사용자 메시지
+        context: 현재 UI 상태
+        today: 날짜 버킷 (기본: 오늘, KST)
+        model: 응답을 만든 provider/모델 (모델이 바뀌면 다른 키)
+
+    Returns:
+        캐시 키
+    """
+    payload = json.dumps(
+        [
+            KEY_VERSION,
+            model,
+            (today or get_today()).isoformat(),
+            normalize_message(message),
+            canonicalize_context(context),
+        ],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class IntentCache(ABC):
+    """Intent 파싱 응답 캐시 인터페이스"""
+
+    backend = ""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key: str) -> Optional[dict]:
+        """
+        캐시된 응답 조회 (적중/미스 집계)
+
+        Args:
+            key: make_intent_cache_key()로 만든 키
+
+        Returns:
+            ParseIntentResponse 데이터, 없으면 None
+        """
+        value = await self._get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    @abstractmethod
+    async def _get(self, key: str) -> Optional[dict]:
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: dict) -> None:
+        """응답 저장"""
+        pass
+
+    def stats(self) -> dict:
+        """적중률 지표"""
+        lookups = self.hits + self.misses
+        return {
+            "backend": self.backend,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+class LocalIntentCache(IntentCache):
+    """프로세스 내 LRU + TTL Intent 캐시"""
+
+    backend = "local"
+
+    def __init__(self, ttl_seconds: float = 600, max_entries: int = 2000):
+        super().__init__()
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+
+    async def _get(self, key: str) -> Optional[dict]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: dict) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        return {**super().stats(), "entries": len(self._entries)}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisIntentCache(IntentCache):
+    """
+    Redis 기반 Intent 캐시 (여러 워커 간 공유)
+
+    항목별 TTL로 만료되며, LRU 제거는 Redis의 maxmemory-policy 설정을 따릅니다.
+    Redis 오류 시에는 캐시 미스로 처리합니다. 적중률 지표는 워커별로 집계됩니다.
+    """
+
+    backend = "redis"
+    KEY_PREFIX = "intent"
+
+    def __init__(self, redis_url: str, ttl_seconds: int = 600):
+        super().__init__()
+        self.ttl_seconds = ttl_seconds
+        self._client = redis.from_url(
+            redis_url,
+            encoding="utf-8",
+            decode_responses=True,
+        )
+
+    def _key(self, key: str) -> str:
+        return f"{self.KEY_PREFIX}:{key}"
+
+    async def _get(self, key: str) -> Optional[dict]:
+        try:
+            value = await self._client.get(self._key(key))
+        except redis.RedisError as e:
+            logger.warning(f"Intent cache read failed: {e}")
+            return None
+        return json.loads(value) if value is not None else None
+
+    async def set(self, key: str, value: dict) -> None:
+        try:
+            await self._client.set(
+                self._key(key),
+                json.dumps(value, ensure_ascii=False),
+                ex=self.ttl_seconds,
+            )
+        except redis.RedisError as e:
+            logger.warning(f"Intent cache write failed: {e}")
+
+
+_intent_cache: Optional[IntentCache] = None
+
+
+def get_intent_cache() -> Optional[IntentCache]:
+    """설정에 따른 프로세스 공용 Intent 캐시 반환 (비활성화 시 None)"""
+    global _intent_cache
+    if not settings.intent_cache_enabled:
+        return None
+
+    if _intent_cache is None:
+        if settings.intent_cache_backend == "redis":
+            _intent_cache = RedisIntentCache(
+                settings.redis_url,
+                ttl_seconds=settings.intent_cache_ttl,
+            )
+        else:
+            _intent_cache = LocalIntentCache(
+                ttl_seconds=settings.intent_cache_ttl,
+                max_entries=settings.intent_cache_max_entries,
+            )
+        logger.info(f"Intent cache enabled: {settings.intent_cache_backend}")
+
+    return _intent_cache
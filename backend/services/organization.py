@@ -5,7 +5,8 @@ from typing import Optional
 from config import get_settings
 from models.employee import Employee, EmployeeSearchResult
 from utils.logger import get_logger
-from .base import BaseAPIClient
+from .client_registry import get_api_client
+from .fanout import fan_out, FanOutResult
 from .mock_data import MOCK_EMPLOYEES
 
 logger = get_logger(__name__)
@@ -18,7 +19,7 @@ class OrganizationService:
     def __init__(self, use_mock: bool = True):
         self.use_mock = use_mock or settings.use_mock_api
         if not self.use_mock:
-            self.client = BaseAPIClient(
+            self.client = get_api_client(
                 settings.org_api_url,
                 settings.api_auth_token,
             )
@@ -81,6 +82,30 @@ class OrganizationService:
             return Employee.from_api(data)
         return None
 
+    async def get_employees_by_ids(
+        self,
+        employee_ids: list[str],
+        concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> FanOutResult:
+        """
+        여러 직원 동시 조회 (부분 실패 허용)
+
+        Args:
+            employee_ids: 직원 ID 목록
+            concurrency: 최대 동시 요청 수
+            timeout: 요청당 타임아웃 (초)
+
+        Returns:
+            직원 ID별 직원 정보(없으면 None)와 실패 정보
+        """
+        return await fan_out(
+            employee_ids,
+            self.get_employee_by_id,
+            concurrency=concurrency,
+            timeout=timeout,
+        )
+
     async def get_team_members(self, department: str) -> list[Employee]:
         """
         부서/팀 구성원 조회
@@ -1,14 +1,16 @@
 """회의실 API 서비스"""
 
-from datetime import datetime, date
+from datetime import datetime, date, time
 from typing import Optional
 from zoneinfo import ZoneInfo
 
 from config import get_settings
 from models.room import Room, RoomAvailability, RoomSearchResult
 from utils.logger import get_logger
-from .base import BaseAPIClient
+from .client_registry import get_api_client
+from .fanout import fan_out, FanOutResult
 from .mock_data import MOCK_ROOMS, generate_mock_room_bookings
+from .room_index import RoomTimelineIndex
 
 logger = get_logger(__name__)
 settings = get_settings()
@@ -21,11 +23,15 @@ class RoomService:
     def __init__(self, use_mock: bool = True):
         self.use_mock = use_mock or settings.use_mock_api
         if not self.use_mock:
-            self.client = BaseAPIClient(
+            self.client = get_api_client(
                 settings.room_api_url,
                 settings.api_auth_token,
             )
-        self._room_bookings: dict[str, list[dict]] = {}
+        # Mock 예약은 이 인스턴스에만 있으므로 만료시키지 않음
+        self.index = RoomTimelineIndex(
+            self._load_bookings,
+            ttl_seconds=None if self.use_mock else settings.room_index_ttl,
+        )
 
     async def list_rooms(
         self,
@@ -76,7 +82,7 @@ class RoomService:
             예약 가능 여부
         """
         if self.use_mock:
-            return self._check_mock_availability(room_id, start_time, end_time)
+            return await self._check_mock_availability(room_id, start_time, end_time)
 
         data = await self.client.get(
             f"/rooms/{room_id}/availability",
@@ -97,6 +103,34 @@ class RoomService:
             conflict_reason=data.get("conflict_reason"),
         )
 
+    async def get_rooms_availability(
+        self,
+        room_ids: list[str],
+        start_time: datetime,
+        end_time: datetime,
+        concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> FanOutResult:
+        """
+        여러 회의실 예약 가능 여부 동시 확인 (부분 실패 허용)
+
+        Args:
+            room_ids: 회의실 ID 목록
+            start_time: 시작 시간
+            end_time: 종료 시간
+            concurrency: 최대 동시 요청 수
+            timeout: 요청당 타임아웃 (초)
+
+        Returns:
+            회의실 ID별 예약 가능 여부와 실패 정보
+        """
+        return await fan_out(
+            room_ids,
+            lambda room_id: self.get_room_availability(room_id, start_time, end_time),
+            concurrency=concurrency,
+            timeout=timeout,
+        )
+
     async def search_available_rooms(
         self,
         start_time: datetime,
@@ -116,23 +150,87 @@ class RoomService:
         Returns:
             검색 결과
         """
+        [result] = await self.search_available_rooms_bulk(
+            [(start_time, end_time)], min_capacity, facilities
+        )
+        return result
+
+    async def search_available_rooms_bulk(
+        self,
+        slots: list[tuple[datetime, datetime]],
+        min_capacity: Optional[int] = None,
+        facilities: Optional[list[str]] = None,
+    ) -> list[RoomSearchResult]:
+        """
+        여러 후보 시간대의 예약 가능한 회의실 일괄 검색
+
+        회의실 목록은 한 번만 조회하고, 예약 현황은 날짜별로 한 번씩만 불러옵니다.
+
+        Args:
+            slots: (시작 시간, 종료 시간) 후보 목록
+            min_capacity: 최소 수용 인원
+            facilities: 필요 시설 목록
+
+        Returns:
+            후보 시간대 순서대로 검색 결과
+        """
         if self.use_mock:
-            return self._search_mock_available(
-                start_time, end_time, min_capacity, facilities
-            )
+            rooms = self._filter_mock_rooms(None, min_capacity, facilities)
+        else:
+            rooms = await self.list_rooms(None, min_capacity, facilities)
+
+        free_per_slot = await self.index.free_rooms_bulk([room.id for room in rooms], slots)
+        return [
+            self._to_search_result(rooms, set(free_ids), start_time, end_time)
+            for (start_time, end_time), free_ids in zip(slots, free_per_slot)
+        ]
 
-        params = {
-            "start_time": start_time.isoformat(),
-            "end_time": end_time.isoformat(),
-        }
-        if min_capacity:
-            params["min_capacity"] = min_capacity
-        if facilities:
-            params["facilities"] = ",".join(facilities)
+    async def get_room_free_windows(
+        self,
+        window_start: datetime,
+        window_end: datetime,
+        min_capacity: Optional[int] = None,
+        facilities: Optional[list[str]] = None,
+    ) -> list[RoomAvailability]:
+        """
+        기간 내 회의실별 빈 구간 조회 (시간대 × 회의실 매칭 입력용)
+
+        Args:
+            window_start: 기간 시작
+            window_end: 기간 종료
+            min_capacity: 최소 수용 인원
+            facilities: 필요 시설 목록
+
+        Returns:
+            빈 구간마다 하나씩의 RoomAvailability 목록
+        """
+        if self.use_mock:
+            rooms = self._filter_mock_rooms(None, min_capacity, facilities)
+        else:
+            rooms = await self.list_rooms(None, min_capacity, facilities)
 
-        data = await self.client.get("/rooms/available", params=params)
+        windows = await self.index.free_windows(
+            [room.id for room in rooms], window_start, window_end
+        )
+        return [
+            RoomAvailability(
+                room=room,
+                is_available=True,
+                start_time=start,
+                end_time=end,
+            )
+            for room in rooms
+            for start, end in windows[room.id]
+        ]
 
-        rooms = [Room.from_api(item) for item in data.get("rooms", [])]
+    @staticmethod
+    def _to_search_result(
+        rooms: list[Room],
+        free_ids: set[str],
+        start_time: datetime,
+        end_time: datetime,
+    ) -> RoomSearchResult:
+        """빈 회의실 ID로 검색 결과 구성 (회의실 목록 순서 유지)"""
         available = [
             RoomAvailability(
                 room=room,
@@ -141,12 +239,13 @@ class RoomService:
                 end_time=end_time,
             )
             for room in rooms
+            if room.id in free_ids
         ]
 
         return RoomSearchResult(
-            rooms=rooms,
+            rooms=[a.room for a in available],
             available_rooms=available,
-            total_count=len(rooms),
+            total_count=len(available),
         )
 
     async def book_room(
@@ -171,7 +270,7 @@ class RoomService:
             예약 성공 여부
         """
         if self.use_mock:
-            return self._book_mock_room(room_id, start_time, end_time, meeting_id, title)
+            return await self._book_mock_room(room_id, start_time, end_time, meeting_id, title)
 
         data = await self.client.post(
             f"/rooms/{room_id}/book",
@@ -182,7 +281,47 @@ class RoomService:
                 "title": title,
             },
         )
-        return data.get("success", False)
+        success = data.get("success", False)
+        if success:
+            self.index.add_booking(room_id, start_time, end_time, title)
+        return success
+
+    async def _load_bookings(
+        self,
+        room_ids: list[str],
+        target_date: date,
+    ) -> dict[str, list[dict]]:
+        """인덱스에 채울 회의실별 하루 예약 현황 조회"""
+        if self.use_mock:
+            return {
+                room_id: generate_mock_room_bookings(room_id, target_date)
+                for room_id in room_ids
+            }
+
+        data = await self.client.post(
+            "/rooms/reservations/bulk",
+            json_data={
+                "room_ids": room_ids,
+                "date": target_date.isoformat(),
+            },
+        )
+
+        bookings = {}
+        for room_id, result in data.get("results", {}).items():
+            bookings[room_id] = [
+                {
+                    "start": self._combine_kst(target_date, item["start_time"]),
+                    "end": self._combine_kst(target_date, item["end_time"]),
+                    "meeting_title": item.get("title"),
+                }
+                for item in result.get("reservations", [])
+            ]
+        return bookings
+
+    @staticmethod
+    def _combine_kst(target_date: date, hhmm: str) -> str:
+        """날짜 + "HH:MM" → KST ISO 문자열"""
+        return datetime.combine(target_date, time.fromisoformat(hhmm), tzinfo=KST).isoformat()
 
     def _filter_mock_rooms(
         self,
@@ -208,7 +347,7 @@ class RoomService:
 
         return results
 
-    def _check_mock_availability(
+    async def _check_mock_availability(
         self,
         room_id: str,
         start_time: datetime,
@@ -231,26 +370,15 @@ class RoomService:
                 conflict_reason="회의실을 찾을 수 없습니다",
             )
 
-        # 기존 예약 확인
-        bookings = generate_mock_room_bookings(room_id, start_time.date())
-
-        # 내부 예약 확인
-        if room_id in self._room_bookings:
-            bookings.extend(self._room_bookings[room_id])
-
-        for booking in bookings:
-            booking_start = datetime.fromisoformat(booking["start"])
-            booking_end = datetime.fromisoformat(booking["end"])
-
-            # 시간 충돌 확인
-            if start_time < booking_end and end_time > booking_start:
-                return RoomAvailability(
-                    room=room,
-                    is_available=False,
-                    start_time=start_time,
-                    end_time=end_time,
-                    conflict_reason=f"이미 예약된 시간입니다 ({booking.get('meeting_title', '기존 예약')})",
-                )
+        conflict = await self.index.get_conflict(room_id, start_time, end_time)
+        if conflict:
+            return RoomAvailability(
+                room=room,
+                is_available=False,
+                start_time=start_time,
+                end_time=end_time,
+                conflict_reason=f"이미 예약된 시간입니다 ({conflict})",
+            )
 
         return RoomAvailability(
             room=room,
@@ -259,30 +387,7 @@ class RoomService:
             end_time=end_time,
         )
 
-    def _search_mock_available(
-        self,
-        start_time: datetime,
-        end_time: datetime,
-        min_capacity: Optional[int],
-        facilities: Optional[list[str]],
-    ) -> RoomSearchResult:
-        """Mock 예약 가능 회의실 검색"""
-        # 조건에 맞는 회의실 필터링
-        filtered_rooms = self._filter_mock_rooms(None, min_capacity, facilities)
-
-        available = []
-        for room in filtered_rooms:
-            availability = self._check_mock_availability(room.id, start_time, end_time)
-            if availability.is_available:
-                available.append(availability)
-
-        return RoomSearchResult(
-            rooms=[a.room for a in available],
-            available_rooms=available,
-            total_count=len(available),
-        )
-
-    def _book_mock_room(
+    async def _book_mock_room(
         self,
         room_id: str,
         start_time: datetime,
@@ -292,20 +397,12 @@ class RoomService:
     ) -> bool:
         """Mock 회의실 예약"""
         # 예약 가능 여부 확인
-        availability = self._check_mock_availability(room_id, start_time, end_time)
+        availability = await self._check_mock_availability(room_id, start_time, end_time)
         if not availability.is_available:
             return False
 
         # 예약 추가
-        if room_id not in self._room_bookings:
-            self._room_bookings[room_id] = []
-
-        self._room_bookings[room_id].append({
-            "start": start_time.isoformat(),
-            "end": end_time.isoformat(),
-            "meeting_id": meeting_id,
-            "meeting_title": title,
-        })
+        self.index.add_booking(room_id, start_time, end_time, title)
 
         logger.info(f"Mock room booking: {room_id} for {meeting_id}")
         return True
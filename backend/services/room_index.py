@@ -0,0 +1,246 @@
+"""회의실 예약 타임라인 인덱스
+
+회의실별·날짜별로 예약 구간을 시작 시간 순으로 정렬해 두고,
+"[start, end) 동안 비어 있는 회의실" 질의를 회의실마다 bisect 한 번으로 처리합니다.
+예약 현황은 (회의실, 날짜) 단위로 처음 필요할 때 한 번 불러오며,
+book_room으로 생긴 예약은 즉시 인덱스에 반영됩니다.
+"""
+
+import time
+from bisect import bisect_left
+from datetime import date, datetime, timedelta
+from typing import Awaitable, Callable, Optional
+
+from utils.datetime_utils import KST
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# (회의실 ID 목록, 날짜) -> 회의실별 예약 목록 ({"start", "end", "meeting_title"})
+BookingLoader = Callable[[list[str], date], Awaitable[dict[str, list[dict]]]]
+
+
+class _DayTimeline:
+    """한 회의실의 하루 예약 구간 (시작 시간 순 정렬)"""
+
+    __slots__ = ("starts", "ends", "titles", "max_ends")
+
+    def __init__(self):
+        self.starts: list[float] = []
+        self.ends: list[float] = []
+        self.titles: list[Optional[str]] = []
+        # max_ends[i] = max(ends[:i+1]) - 겹치는 예약이 있어도 bisect 한 번으로 판정
+        self.max_ends: list[float] = []
+
+    def add(self, start: float, end: float, title: Optional[str]) -> None:
+        i = bisect_left(self.starts, start)
+        self.starts.insert(i, start)
+        self.ends.insert(i, end)
+        self.titles.insert(i, title)
+        self.max_ends.insert(i, 0.0)
+        running = self.max_ends[i - 1] if i else float("-inf")
+        for j in range(i, len(self.starts)):
+            running = max(running, self.ends[j])
+            self.max_ends[j] = running
+
+    def conflict(self, start: float, end: float) -> Optional[int]:
+        """[start, end)와 겹치는 예약 인덱스 (없으면 None)"""
+        i = bisect_left(self.starts, end)
+        if i == 0 or self.max_ends[i - 1] <= start:
+            return None
+        for j in range(i - 1, -1, -1):
+            if self.ends[j] > start:
+                return j
+        return None
+
+
+class RoomTimelineIndex:
+    """회의실별·날짜별 예약 타임라인 인덱스"""
+
+    def __init__(self, loader: BookingLoader, ttl_seconds: Optional[float] = None):
+        """
+        Args:
+            loader: (회의실, 날짜) 예약 현황을 불러오는 함수
+            ttl_seconds: 불러온 예약 현황 유효 시간 (None이면 만료 없음)
+        """
+        self.loader = loader
+        self.ttl_seconds = ttl_seconds
+        self._timelines: dict[tuple[str, date], _DayTimeline] = {}
+        self._loaded_at: dict[tuple[str, date], float] = {}
+
+    async def ensure_loaded(self, room_ids: list[str], dates: list[date]) -> None:
+        """질의에 필요한 (회의실, 날짜) 예약 현황을 아직 없으면 불러오기"""
+        now = time.monotonic()
+        for target_date in dates:
+            missing = [
+                room_id for room_id in room_ids
+                if not self._is_fresh((room_id, target_date), now)
+            ]
+            if not missing:
+                continue
+
+            bookings = await self.loader(missing, target_date)
+            for room_id in missing:
+                key = (room_id, target_date)
+                self._timelines[key] = _DayTimeline()
+                self._loaded_at[key] = now
+                for booking in bookings.get(room_id, []):
+                    self._add_to_day(
+                        room_id,
+                        target_date,
+                        datetime.fromisoformat(booking["start"]),
+                        datetime.fromisoformat(booking["end"]),
+                        booking.get("meeting_title"),
+                    )
+
+    def _is_fresh(self, key: tuple[str, date], now: float) -> bool:
+        loaded_at = self._loaded_at.get(key)
+        if loaded_at is None:
+            return False
+        return self.ttl_seconds is None or now - loaded_at < self.ttl_seconds
+
+    def add_booking(
+        self,
+        room_id: str,
+        start_time: datetime,
+        end_time: datetime,
+        title: Optional[str] = None,
+    ) -> None:
+        """예약 추가 (예약이 걸친 모든 날짜에 반영)"""
+        for target_date in _dates_between(start_time, end_time):
+            self._add_to_day(room_id, target_date, start_time, end_time, title)
+
+    def _add_to_day(
+        self,
+        room_id: str,
+        target_date: date,
+        start_time: datetime,
+        end_time: datetime,
+        title: Optional[str],
+    ) -> None:
+        timeline = self._timelines.get((room_id, target_date))
+        if timeline is None:
+            # 아직 불러오지 않은 날짜는 불러올 때 함께 반영되므로 건너뜀
+            return
+        timeline.add(start_time.timestamp(), end_time.timestamp(), title)
+
+    def find_conflict(
+        self,
+        room_id: str,
+        start_time: datetime,
+        end_time: datetime,
+    ) -> Optional[str]:
+        """
+        충돌 예약 확인 (ensure_loaded 이후 호출)
+
+        Returns:
+            충돌한 예약 제목 (없으면 None, 제목이 없으면 "기존 예약")
+        """
+        start = start_time.timestamp()
+        end = end_time.timestamp()
+        for target_date in _dates_between(start_time, end_time):
+            timeline = self._timelines.get((room_id, target_date))
+            if timeline is None:
+                continue
+            j = timeline.conflict(start, end)
+            if j is not None:
+                return timeline.titles[j] or "기존 예약"
+        return None
+
+    async def get_conflict(
+        self,
+        room_id: str,
+        start_time: datetime,
+        end_time: datetime,
+    ) -> Optional[str]:
+        """필요한 예약 현황을 불러온 뒤 충돌 예약 확인"""
+        await self.ensure_loaded([room_id], _dates_between(start_time, end_time))
+        return self.find_conflict(room_id, start_time, end_time)
+
+    def free_rooms(
+        self,
+        room_ids: list[str],
+        start_time: datetime,
+        end_time: datetime,
+    ) -> list[str]:
+        """[start, end) 동안 비어 있는 회의실 ID 목록 (ensure_loaded 이후 호출)"""
+        return [
+            room_id for room_id in room_ids
+            if self.find_conflict(room_id, start_time, end_time) is None
+        ]
+
+    async def free_windows(
+        self,
+        room_ids: list[str],
+        window_start: datetime,
+        window_end: datetime,
+    ) -> dict[str, list[tuple[datetime, datetime]]]:
+        """
+        기간 내 회의실별 빈 구간 조회
+
+        Args:
+            room_ids: 회의실 ID 목록
+            window_start: 기간 시작
+            window_end: 기간 종료
+
+        Returns:
+            회의실 ID별 (시작, 종료) 빈 구간 목록 (시간 순)
+        """
+        dates = _dates_between(window_start, window_end)
+        await self.ensure_loaded(room_ids, dates)
+
+        lo, hi = window_start.timestamp(), window_end.timestamp()
+        tz = window_start.tzinfo
+        windows = {}
+        for room_id in room_ids:
+            # 여러 날짜에 걸친 예약은 날짜마다 들어 있으므로 중복 제거
+            busy = sorted({
+                (start, end)
+                for target_date in dates
+                for start, end in zip(
+                    self._timelines[(room_id, target_date)].starts,
+                    self._timelines[(room_id, target_date)].ends,
+                )
+                if start < hi and end > lo
+            })
+
+            free = []
+            cursor = lo
+            for start, end in busy:
+                if start > cursor:
+                    free.append((cursor, start))
+                cursor = max(cursor, end)
+            if cursor < hi:
+                free.append((cursor, hi))
+
+            windows[room_id] = [
+                (datetime.fromtimestamp(start, tz), datetime.fromtimestamp(end, tz))
+                for start, end in free
+            ]
+        return windows
+
+    async def free_rooms_bulk(
+        self,
+        room_ids: list[str],
+        slots: list[tuple[datetime, datetime]],
+    ) -> list[list[str]]:
+        """
+        여러 후보 시간대의 빈 회의실 일괄 조회
+
+        Args:
+            room_ids: 회의실 ID 목록
+            slots: (시작, 종료) 후보 시간대 목록
+
+        Returns:
+            후보 시간대 순서대로 비어 있는 회의실 ID 목록
+        """
+        dates = sorted({d for start, end in slots for d in _dates_between(start, end)})
+        await self.ensure_loaded(room_ids, dates)
+        return [self.free_rooms(room_ids, start, end) for start, end in slots]
+
+
+def _dates_between(start_time: datetime, end_time: datetime) -> list[date]:
+    """구간이 걸친 KST 날짜 목록 (종료 시각은 미포함)"""
+    first = start_time.astimezone(KST).date()
+    last = (end_time - timedelta(microseconds=1)).astimezone(KST).date()
+    return [first + timedelta(days=i) for i in range(max(0, (last - first).days) + 1)]
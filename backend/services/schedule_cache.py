@@ -0,0 +1,227 @@
+"""직원 일정 캐시
+
+(직원 ID, 날짜) 단위로 DaySchedule을 캐싱합니다.
+기간 조회는 캐시된 날짜를 그대로 쓰고 없는 날짜만 API로 조회하며,
+회의 생성 시 참석자의 해당 날짜 캐시를 무효화합니다.
+"""
+
+import json
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import date
+from typing import Optional
+
+import redis.asyncio as redis
+
+from config import get_settings
+from models.calendar import DaySchedule
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+class ScheduleCache(ABC):
+    """일정 캐시 인터페이스"""
+
+    @abstractmethod
+    async def get_days(
+        self,
+        employee_id: str,
+        dates: list[date],
+    ) -> tuple[Optional[str], dict[date, DaySchedule]]:
+        """
+        캐시된 일별 일정 조회
+
+        Args:
+            employee_id: 직원 ID
+            dates: 조회할 날짜 목록
+
+        Returns:
+            (직원 이름, 날짜별 일정) 튜플. 캐시에 없는 날짜는 빠집니다.
+        """
+        pass
+
+    @abstractmethod
+    async def set_days(
+        self,
+        employee_id: str,
+        employee_name: str,
+        days: list[DaySchedule],
+    ) -> None:
+        """일별 일정 저장"""
+        pass
+
+    @abstractmethod
+    async def invalidate(self, employee_id: str, dates: list[date]) -> None:
+        """직원의 특정 날짜 캐시 삭제"""
+        pass
+
+
+class LocalScheduleCache(ScheduleCache):
+    """프로세스 내 LRU + TTL 일정 캐시"""
+
+    def __init__(self, ttl_seconds: float = 300, max_entries: int = 10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, date], tuple[float, str, DaySchedule]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    async def get_days(
+        self,
+        employee_id: str,
+        dates: list[date],
+    ) -> tuple[Optional[str], dict[date, DaySchedule]]:
+        now = time.monotonic()
+        employee_name = None
+        found = {}
+
+        for target_date in dates:
+            key = (employee_id, target_date)
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                continue
+
+            expires_at, name, day = entry
+            if expires_at <= now:
+                del self._entries[key]
+                self.misses += 1
+                continue
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            employee_name = name
+            found[target_date] = day
+
+        return employee_name, found
+
+    async def set_days(
+        self,
+        employee_id: str,
+        employee_name: str,
+        days: list[DaySchedule],
+    ) -> None:
+        expires_at = time.monotonic() + self.ttl_seconds
+        for day in days:
+            key = (employee_id, day.schedule_date)
+            self._entries[key] = (expires_at, employee_name, day)
+            self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def invalidate(self, employee_id: str, dates: list[date]) -> None:
+        for target_date in dates:
+            self._entries.pop((employee_id, target_date), None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisScheduleCache(ScheduleCache):
+    """
+    Redis 기반 일정 캐시 (여러 워커 간 공유)
+
+    항목별 TTL로 만료되며, 메모리 상한/LRU 제거는 Redis의
+    maxmemory-policy(allkeys-lru 등) 설정을 따릅니다.
+    Redis 오류 시에는 캐시 미스로 처리합니다.
+    """
+
+    KEY_PREFIX = "sched"
+
+    def __init__(self, redis_url: str, ttl_seconds: int = 300):
+        self.ttl_seconds = ttl_seconds
+        self._client = redis.from_url(
+            redis_url,
+            encoding="utf-8",
+            decode_responses=True,
+        )
+
+    def _key(self, employee_id: str, target_date: date) -> str:
+        return f"{self.KEY_PREFIX}:{employee_id}:{target_date.isoformat()}"
+
+    async def get_days(
+        self,
+        employee_id: str,
+        dates: list[date],
+    ) -> tuple[Optional[str], dict[date, DaySchedule]]:
+        if not dates:
+            return None, {}
+
+        try:
+            values = await self._client.mget([self._key(employee_id, d) for d in dates])
+        except redis.RedisError as e:
+            logger.warning(f"Schedule cache read failed: {e}")
+            return None, {}
+
+        employee_name = None
+        found = {}
+        for target_date, value in zip(dates, values):
+            if value is None:
+                continue
+            entry = json.loads(value)
+            employee_name = entry["employee_name"]
+            found[target_date] = DaySchedule.model_validate(entry["day"])
+
+        return employee_name, found
+
+    async def set_days(
+        self,
+        employee_id: str,
+        employee_name: str,
+        days: list[DaySchedule],
+    ) -> None:
+        if not days:
+            return
+
+        try:
+            async with self._client.pipeline(transaction=False) as pipe:
+                for day in days:
+                    pipe.set(
+                        self._key(employee_id, day.schedule_date),
+                        json.dumps({
+                            "employee_name": employee_name,
+                            "day": day.model_dump(mode="json"),
+                        }, ensure_ascii=False),
+                        ex=self.ttl_seconds,
+                    )
+                await pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Schedule cache write failed: {e}")
+
+    async def invalidate(self, employee_id: str, dates: list[date]) -> None:
+        if not dates:
+            return
+
+        try:
+            await self._client.delete(*[self._key(employee_id, d) for d in dates])
+        except redis.RedisError as e:
+            logger.warning(f"Schedule cache invalidation failed: {e}")
+
+
+_schedule_cache: Optional[ScheduleCache] = None
+
+
+def get_schedule_cache() -> Optional[ScheduleCache]:
+    """설정에 따른 프로세스 공용 일정 캐시 반환 (비활성화 시 None)"""
+    global _schedule_cache
+    if not settings.schedule_cache_enabled:
+        return None
+
+    if _schedule_cache is None:
+        if settings.schedule_cache_backend == "redis":
+            _schedule_cache = RedisScheduleCache(
+                settings.redis_url,
+                ttl_seconds=settings.schedule_cache_ttl,
+            )
+        else:
+            _schedule_cache = LocalScheduleCache(
+                ttl_seconds=settings.schedule_cache_ttl,
+                max_entries=settings.schedule_cache_max_entries,
+            )
+        logger.info(f"Schedule cache enabled: {settings.schedule_cache_backend}")
+
+    return _schedule_cache
@@ -0,0 +1,252 @@
+"""참석자 일정 예측 선조회
+
+참석자가 확정되면(search_employee, get_team_members) 다음 LLM 왕복을 기다리는 동안
+가능성이 높은 기간(오늘 ~ 다음 주 금요일)의 일정을 백그라운드로 조회해 일정 캐시를 데워 둡니다.
+이후 find_common_free_slots 등의 조회는 캐시에서 바로 읽고, 이미 조회 중인
+선조회가 있으면 같은 요청을 다시 보내지 않고 그 결과를 기다립니다.
+
+캘린더 API에 부담을 주지 않도록 동시 조회 수/대기 작업 수/요청당 시간을 제한하고,
+대화의 참석자가 바뀌거나 회의가 생성되면 해당 대화의 남은 선조회를 취소합니다
+(다른 대화도 기다리는 작업은 유지).
+"""
+
+import asyncio
+from contextvars import ContextVar
+from datetime import date, timedelta
+from typing import Awaitable, Callable, Optional
+
+from config import get_settings
+from utils.datetime_utils import get_today
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+ScheduleFetch = Callable[[str, date, date], Awaitable[object]]
+
+# 선조회 작업 안에서의 조회인지 (자기 자신을 기다리지 않도록)
+_prefetching: ContextVar[bool] = ContextVar("schedule_prefetching", default=False)
+
+
+def prefetch_window(today: Optional[date] = None) -> tuple[date, date]:
+    """선조회 기간 (오늘 ~ 다음 주 금요일)"""
+    today = today or get_today()
+    next_friday = today + timedelta(days=4 - today.weekday() + 7)
+    return today, next_friday
+
+
+class _Prefetch:
+    """직원 한 명의 기간 선조회 작업 (여러 대화가 함께 쓸 수 있음)"""
+
+    __slots__ = ("employee_id", "start_date", "end_date", "owners", "task", "fetching")
+
+    def __init__(self, employee_id: str, start_date: date, end_date: date, owner: str):
+        self.employee_id = employee_id
+        self.start_date = start_date
+        self.end_date = end_date
+        self.owners = {owner}  # 이 작업을 필요로 하는 대화 ID (모두 빠지면 취소)
+        self.task: Optional[asyncio.Task] = None
+        self.fetching = False  # 동시 조회 제한을 통과해 조회를 시작했는지
+
+    def covers(self, start_date: date, end_date: date) -> bool:
+        return self.start_date <= start_date and self.end_date >= end_date
+
+    def overlaps(self, start_date: date, end_date: date) -> bool:
+        return self.start_date <= end_date and self.end_date >= start_date
+
+
+class SchedulePrefetcher:
+    """대화(owner)별 직원 일정 선조회 작업 관리"""
+
+    def __init__(
+        self,
+        fetch: ScheduleFetch,
+        concurrency: int = 4,
+        max_pending: int = 32,
+        timeout: Optional[float] = 10.0,
+    ):
+        """
+        Args:
+            fetch: 일정 조회 함수 (직원 ID, 시작일, 종료일), 결과를 일정 캐시에 저장해야 함
+            concurrency: 최대 동시 조회 수
+            max_pending: 최대 대기/진행 중 작업 수 (넘으면 선조회 생략)
+            timeout: 조회당 타임아웃 (초, None이면 무제한)
+        """
+        self.fetch = fetch
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._tasks: dict[str, list[_Prefetch]] = {}  # 직원 ID -> 기간별 작업
+        self._pending = 0
+
+        self.started_total = 0
+        self.completed_total = 0
+        self.failed_total = 0
+        self.cancelled_total = 0
+        self.skipped_total = 0  # 작업 수 한도로 생략
+        self.joined_total = 0  # 조회 요청이 진행 중인 선조회를 기다린 횟수
+        self.bypassed_total = 0  # 아직 시작 전인 선조회를 기다리지 않고 직접 조회한 횟수
+
+    def prefetch(
+        self,
+        employee_ids: list[str],
+        owner: str = "",
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> int:
+        """
+        직원 일정 선조회 시작
+
+        같은 기간을 덮는 작업이 이미 있으면 새로 시작하지 않고 owner만 추가하며,
+        owner의 이전 선조회 중 이번 목록에 없는 직원은 owner에서 뺍니다
+        (다른 대화가 쓰는 작업은 계속).
+
+        Args:
+            employee_ids: 직원 ID 목록
+            owner: 선조회를 요청한 대화 ID
+            start_date: 시작일 (기본: 오늘)
+            end_date: 종료일 (기본: 다음 주 금요일)
+
+        Returns:
+            새로 시작한 작업 수
+        """
+        default_start, default_end = prefetch_window()
+        start_date = start_date or default_start
+        end_date = end_date or default_end
+        self.cancel(owner, keep=set(employee_ids))
+
+        started = 0
+        for employee_id in employee_ids:
+            entries = self._tasks.get(employee_id, [])
+            covering = next((entry for entry in entries if entry.covers(start_date, end_date)), None)
+            if covering is not None:
+                covering.owners.add(owner)
+                continue
+            if self._pending >= self.max_pending:
+                self.skipped_total += 1
+                continue
+
+            entry = _Prefetch(employee_id, start_date, end_date, owner)
+            entry.task = asyncio.create_task(self._run(entry))
+            entry.task.add_done_callback(lambda _, e=entry: self._discard(e))
+            self._tasks.setdefault(employee_id, []).append(entry)
+            self._pending += 1
+            self.started_total += 1
+            started += 1
+        return started
+
+    async def _run(self, entry: _Prefetch) -> None:
+        _prefetching.set(True)
+        async with self._semaphore:
+            entry.fetching = True
+            try:
+                await asyncio.wait_for(
+                    self.fetch(entry.employee_id, entry.start_date, entry.end_date), self.timeout,
+                )
+            except Exception as e:
+                self.failed_total += 1
+                logger.debug(f"Schedule prefetch failed ({entry.employee_id}): {type(e).__name__}: {e}")
+            else:
+                self.completed_total += 1
+
+    def _discard(self, entry: _Prefetch) -> None:
+        entries = self._tasks.get(entry.employee_id)
+        if entries and entry in entries:
+            entries.remove(entry)
+            self._pending -= 1
+            if not entries:
+                del self._tasks[entry.employee_id]
+
+    async def wait(self, employee_id: str, start_date: date, end_date: date) -> None:
+        """
+        요청 기간과 겹치는, 이미 조회를 시작한 선조회가 있으면 끝날 때까지 대기
+
+        동시 조회 제한에 막혀 아직 시작하지 않은 선조회는 기다리지 않습니다
+        (사용자 요청이 선조회 대기열 뒤에 서지 않도록, 호출자가 직접 조회).
+        선조회가 실패/취소되어도 예외를 내지 않습니다.
+
+        Args:
+            employee_id: 직원 ID
+            start_date: 시작일
+            end_date: 종료일
+        """
+        if _prefetching.get():
+            return
+        entries = [e for e in self._tasks.get(employee_id, []) if e.overlaps(start_date, end_date)]
+        if not entries:
+            return
+        fetching = [entry.task for entry in entries if entry.fetching]
+        if not fetching:
+            self.bypassed_total += 1
+            return
+
+        self.joined_total += 1
+        await asyncio.wait(fetching)  # 기다리는 쪽이 취소되어도 선조회는 계속
+
+    def cancel(self, owner: str, keep: Optional[set[str]] = None) -> int:
+        """
+        owner의 진행 중인 선조회 취소 (다른 대화도 쓰는 작업은 owner만 뺌)
+
+        Args:
+            owner: 대화 ID
+            keep: 취소하지 않을 직원 ID
+
+        Returns:
+            취소한 작업 수
+        """
+        cancelled = 0
+        for employee_id, entries in list(self._tasks.items()):
+            if keep and employee_id in keep:
+                continue
+            for entry in list(entries):
+                if owner not in entry.owners:
+                    continue
+                entry.owners.discard(owner)
+                if not entry.owners:
+                    entry.task.cancel()
+                    self._discard(entry)
+                    cancelled += 1
+        self.cancelled_total += cancelled
+        return cancelled
+
+    def stats(self) -> dict:
+        """선조회 지표"""
+        return {
+            "pending": self._pending,
+            "started_total": self.started_total,
+            "completed_total": self.completed_total,
+            "failed_total": self.failed_total,
+            "cancelled_total": self.cancelled_total,
+            "skipped_total": self.skipped_total,
+            "joined_total": self.joined_total,
+            "bypassed_total": self.bypassed_total,
+        }
+
+    def __len__(self) -> int:
+        return self._pending
+
+
+_prefetcher: Optional[SchedulePrefetcher] = None
+
+
+def get_schedule_prefetcher() -> Optional[SchedulePrefetcher]:
+    """
+    설정에 따른 프로세스 공용 선조회 관리자 반환
+
+    비활성화했거나 결과를 둘 일정 캐시가 꺼져 있으면 None
+    """
+    global _prefetcher
+    if not settings.schedule_prefetch_enabled or not settings.schedule_cache_enabled:
+        return None
+
+    if _prefetcher is None:
+        from .calendar import CalendarService
+
+        calendar_service = CalendarService()
+        _prefetcher = SchedulePrefetcher(
+            calendar_service.get_schedule,
+            concurrency=settings.schedule_prefetch_concurrency,
+            max_pending=settings.schedule_prefetch_max_pending,
+            timeout=settings.api_fanout_timeout or None,
+        )
+    return _prefetcher
@@ -0,0 +1,110 @@
+"""NumPy 비트맵 기반 공통 빈 시간대 계산
+
+참석자-날짜마다 업무 시간을 일정 간격(버킷)으로 나눈 불리언 행을 만들고,
+np.logical_or.reduce 한 번으로 공통 바쁜 시간을 구한 뒤
+run-length 스캔으로 충분히 긴 빈 구간을 찾습니다.
+
+결과는 버킷 경계로 정렬됩니다. benchmarks/bench_slot_finder.py 기준으로는
+15~300명, 28일 범위에서 행렬 구성 비용 때문에 sweep 엔진보다 느리므로 기본값이 아닙니다.
+"""
+
+from datetime import date, datetime, time
+
+import numpy as np
+
+from models.calendar import ScheduleResponse
+from utils.datetime_utils import KST
+
+
+def build_busy_matrix(
+    schedules: list[ScheduleResponse],
+    dates: list[date],
+    work_start_minute: int,
+    work_end_minute: int,
+    granularity: int,
+) -> np.ndarray:
+    """
+    참석자 × 날짜 × 버킷 바쁨 행렬 생성
+
+    Args:
+        schedules: 참석자 일정 목록
+        dates: 대상 날짜 목록
+        work_start_minute: 업무 시작 (자정 기준 분)
+        work_end_minute: 업무 종료 (자정 기준 분)
+        granularity: 버킷 크기 (분)
+
+    Returns:
+        shape (참석자 수, 날짜 수, 버킷 수) 불리언 행렬.
+        버킷에 조금이라도 걸친 일정은 바쁨으로 표시됩니다.
+    """
+    n_buckets = (work_end_minute - work_start_minute) // granularity
+    date_index = {d: i for i, d in enumerate(dates)}
+
+    # 파이썬 루프에서는 원시 타임스탬프만 모으고 버킷 계산은 벡터화
+    attendee_idx: list[int] = []
+    day_idx: list[int] = []
+    base_ts: list[float] = []
+    start_ts: list[float] = []
+    end_ts: list[float] = []
+
+    for a, schedule in enumerate(schedules):
+        for day_schedule in schedule.schedules:
+            d = date_index.get(day_schedule.schedule_date)
+            if d is None or not day_schedule.busy_slots:
+                continue
+            work_start = datetime.combine(
+                day_schedule.schedule_date, time.min, tzinfo=KST
+            ).timestamp() + work_start_minute * 60
+            for slot in day_schedule.busy_slots:
+                attendee_idx.append(a)
+                day_idx.append(d)
+                base_ts.append(work_start)
+                start_ts.append(slot.start.timestamp())
+                end_ts.append(slot.end.timestamp())
+
+    bucket_seconds = granularity * 60
+    base = np.asarray(base_ts)
+    starts = np.floor((np.asarray(start_ts) - base) / bucket_seconds).astype(np.int64)
+    ends = np.ceil((np.asarray(end_ts) - base) / bucket_seconds).astype(np.int64)
+    np.clip(starts, 0, n_buckets, out=starts)
+    np.clip(ends, 0, n_buckets, out=ends)
+    valid = ends > starts
+    attendees = np.asarray(attendee_idx, dtype=np.int64)[valid]
+    days = np.asarray(day_idx, dtype=np.int64)[valid]
+
+    # 차분 배열에 구간 시작/끝을 누적한 뒤 cumsum으로 채우기
+    diff = np.zeros((len(schedules), len(dates), n_buckets + 1), dtype=np.int16)
+    np.add.at(diff, (attendees, days, starts[valid]), 1)
+    np.add.at(diff, (attendees, days, ends[valid]), -1)
+    return np.cumsum(diff[:, :, :n_buckets], axis=2) > 0
+
+
+def find_free_runs(
+    busy: np.ndarray,
+    min_buckets: int,
+) -> list[tuple[int, int, int]]:
+    """
+    날짜별 바쁨 행에서 min_buckets 이상 연속된 빈 구간 찾기
+
+    Args:
+        busy: shape (날짜 수, 버킷 수) 불리언 행렬
+        min_buckets: 필요한 최소 연속 버킷 수
+
+    Returns:
+        (날짜 인덱스, 시작 버킷, 종료 버킷) 목록 (날짜, 시간 순)
+    """
+    n_days = busy.shape[0]
+    padded = np.ones((n_days, busy.shape[1] + 2), dtype=np.int8)
+    padded[:, 1:-1] = busy
+    edges = np.diff(padded, axis=1)
+
+    # 바쁨→빈(-1)이 구간 시작, 빈→바쁨(+1)이 구간 끝. 행 우선 순서라 짝이 맞음
+    run_days, run_starts = np.nonzero(edges == -1)
+    _, run_ends = np.nonzero(edges == 1)
+    keep = (run_ends - run_starts) >= max(1, min_buckets)
+
+    return list(zip(
+        run_days[keep].tolist(),
+        run_starts[keep].tolist(),
+        run_ends[keep].tolist(),
+    ))
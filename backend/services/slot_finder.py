@@ -1,10 +1,14 @@
 """빈 시간대 계산 로직"""
 
-from datetime import datetime, date, timedelta
+import heapq
+import math
+from array import array
+from bisect import bisect_right
+from datetime import datetime, date, time, timedelta
 from typing import Optional
 from zoneinfo import ZoneInfo
 
-from models.calendar import TimeSlot, FreeSlot, ScheduleResponse
+from models.calendar import TimeSlot, FreeSlot, QuorumSlot, ScheduleResponse
 from models.room import Room, RoomAvailability
 from models.meeting import MeetingOption
 from models.employee import Employee
@@ -14,9 +18,17 @@ from utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+# 공통 빈 시간대 계산 엔진
+ENGINE_SWEEP = "sweep"  # 날짜별 인덱스 + 분 단위 정렬 스윕 (기본)
+ENGINE_MERGE = "merge"  # 기존 TimeSlot 병합 방식
+ENGINE_BITMAP = "bitmap"  # NumPy 비트맵 (버킷 정렬 결과, numpy 필요, 300명까지는 sweep보다 느림)
+
+
 class SlotFinder:
     """빈 시간대 찾기 서비스"""
 
+    ENGINES = (ENGINE_SWEEP, ENGINE_MERGE, ENGINE_BITMAP)
+
     def __init__(
         self,
         work_start_hour: int = 9,
@@ -24,12 +36,20 @@ class SlotFinder:
         exclude_lunch: bool = True,
         lunch_start_hour: int = 12,
         lunch_end_hour: int = 13,
+        engine: str = ENGINE_SWEEP,
+        bitmap_granularity: int = 5,
     ):
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown slot engine: {engine}")
+        if bitmap_granularity <= 0 or 60 % bitmap_granularity:
+            raise ValueError(f"bitmap_granularity must divide 60: {bitmap_granularity}")
         self.work_start_hour = work_start_hour
         self.work_end_hour = work_end_hour
         self.exclude_lunch = exclude_lunch
         self.lunch_start_hour = lunch_start_hour
         self.lunch_end_hour = lunch_end_hour
+        self.engine = engine
+        self.bitmap_granularity = bitmap_granularity
 
     def find_common_free_slots(
         self,
@@ -38,6 +58,7 @@ class SlotFinder:
         end_date: date,
         duration_minutes: int,
         preferred_time: Optional[str] = None,  # "morning", "afternoon", "any"
+        engine: Optional[str] = None,
     ) -> list[FreeSlot]:
         """
         여러 참석자의 공통 빈 시간대 찾기
@@ -48,6 +69,7 @@ class SlotFinder:
             end_date: 종료일
             duration_minutes: 필요한 회의 시간 (분)
             preferred_time: 선호 시간대
+            engine: 계산 엔진 (기본: 생성 시 지정한 엔진)
 
         Returns:
             공통 빈 시간대 목록
@@ -55,6 +77,24 @@ class SlotFinder:
         if not schedules:
             return []
 
+        engine = engine or self.engine
+        if engine in (ENGINE_SWEEP, ENGINE_BITMAP):
+            if engine == ENGINE_SWEEP:
+                common_free_slots = self._find_free_slots_sweep(
+                    schedules, start_date, end_date, duration_minutes
+                )
+            else:
+                common_free_slots = self._find_free_slots_bitmap(
+                    schedules, start_date, end_date, duration_minutes
+                )
+            if preferred_time and preferred_time != "any":
+                common_free_slots = self._filter_by_preference_per_day(
+                    common_free_slots, preferred_time
+                )
+            return self._rank_slots(common_free_slots, preferred_time)
+        if engine != ENGINE_MERGE:
+            raise ValueError(f"Unknown slot engine: {engine}")
+
         common_free_slots = []
         current_date = start_date
 
@@ -79,6 +119,179 @@ class SlotFinder:
         # 추천 점수 기반 정렬
         return self._rank_slots(common_free_slots, preferred_time)
 
+    def find_quorum_slots(
+        self,
+        schedules: list[ScheduleResponse],
+        start_date: date,
+        end_date: date,
+        duration_minutes: int,
+        min_attendees: Optional[int] = None,
+        required_ids: Optional[list[str]] = None,
+        required_weight: float = 3.0,
+        optional_weight: float = 1.0,
+        preferred_time: Optional[str] = None,
+        granularity: int = 15,
+        max_results: int = 10,
+    ) -> list[QuorumSlot]:
+        """
+        최소 K명 이상 참석 가능한 시간대 찾기 (best-effort)
+
+        모든 일정을 한 번 훑어 버킷별 바쁜 참석자 비트마스크를 만들고,
+        회의 길이만큼의 창마다 참석 가능 인원을 세어 순위를 매깁니다.
+        같은 참석자 구성으로 이어지는 창은 하나의 구간으로 합칩니다.
+
+        Args:
+            schedules: 참석자 일정 목록
+            start_date: 시작일
+            end_date: 종료일
+            duration_minutes: 필요한 회의 시간 (분)
+            min_attendees: 최소 참석 인원 K (기본: 전체 인원 - 1)
+            required_ids: 필수 참석자 ID 목록 (기본: 전원 필수)
+            required_weight: 필수 참석자 가중치
+            optional_weight: 선택 참석자 가중치
+            preferred_time: 선호 시간대
+            granularity: 시간 버킷 크기 (분)
+            max_results: 최대 반환 개수
+
+        Returns:
+            가중 참석 점수 순으로 정렬된 시간대 목록
+        """
+        if not schedules:
+            return []
+
+        attendee_ids = [schedule.employee_id for schedule in schedules]
+        n_attendees = len(attendee_ids)
+        if min_attendees is None:
+            min_attendees = max(1, n_attendees - 1)
+        required = set(required_ids) if required_ids is not None else set(attendee_ids)
+        weights = [
+            required_weight if emp_id in required else optional_weight
+            for emp_id in attendee_ids
+        ]
+
+        work_start = self.work_start_hour * 60
+        work_end = self.work_end_hour * 60
+        n_buckets = (work_end - work_start) // granularity
+        window = math.ceil(duration_minutes / granularity)
+        if window > n_buckets:
+            return []
+
+        # 날짜별 버킷 비트마스크 (비트 i = i번째 참석자가 바쁨)
+        masks: dict[date, list[int]] = {}
+        for i, schedule in enumerate(schedules):
+            bit = 1 << i
+            for day_schedule in schedule.schedules:
+                target_date = day_schedule.schedule_date
+                if target_date < start_date or target_date > end_date:
+                    continue
+                if not day_schedule.busy_slots or not is_weekday(target_date):
+                    continue
+
+                day_masks = masks.get(target_date)
+                if day_masks is None:
+                    day_masks = masks[target_date] = [0] * n_buckets
+
+                day_start = datetime.combine(target_date, time.min, tzinfo=KST)
+                for slot in day_schedule.busy_slots:
+                    offset_start = (slot.start - day_start).total_seconds() / 60 - work_start
+                    offset_end = (slot.end - day_start).total_seconds() / 60 - work_start
+                    first = max(0, math.floor(offset_start / granularity))
+                    last = min(n_buckets, math.ceil(offset_end / granularity))
+                    for b in range(first, last):
+                        day_masks[b] |= bit
+
+        # 점심시간은 창을 만들 수 없는 버킷
+        blocked = set()
+        if self.exclude_lunch:
+            lunch_first = (self.lunch_start_hour * 60 - work_start) // granularity
+            lunch_last = math.ceil((self.lunch_end_hour * 60 - work_start) / granularity)
+            blocked = set(range(max(0, lunch_first), min(n_buckets, lunch_last)))
+
+        candidates: list[QuorumSlot] = []
+        current_date = start_date
+        while current_date <= end_date:
+            if not is_weekday(current_date):
+                current_date += timedelta(days=1)
+                continue
+
+            day_masks = masks.get(current_date, [0] * n_buckets)
+            window_start = datetime.combine(current_date, time.min, tzinfo=KST) + timedelta(
+                minutes=work_start
+            )
+
+            run_mask = None
+            run_first = run_last = 0
+            for b in range(n_buckets - window + 1):
+                if any(bb in blocked for bb in range(b, b + window)):
+                    busy_mask = None
+                else:
+                    busy_mask = 0
+                    for bb in range(b, b + window):
+                        busy_mask |= day_masks[bb]
+                    if n_attendees - busy_mask.bit_count() < min_attendees:
+                        busy_mask = None
+
+                if busy_mask is not None and busy_mask == run_mask and b == run_last + 1:
+                    run_last = b
+                    continue
+                if run_mask is not None:
+                    candidates.append(self._make_quorum_slot(
+                        window_start, run_first, run_last, window, granularity,
+                        run_mask, attendee_ids, weights,
+                    ))
+                run_mask = busy_mask
+                run_first = run_last = b
+            if run_mask is not None:
+                candidates.append(self._make_quorum_slot(
+                    window_start, run_first, run_last, window, granularity,
+                    run_mask, attendee_ids, weights,
+                ))
+
+            current_date += timedelta(days=1)
+
+        candidates.sort(
+            key=lambda slot: (
+                slot.score,
+                slot.attendance_count,
+                self._time_score(slot.start, preferred_time),
+            ),
+            reverse=True,
+        )
+        return candidates[:max_results]
+
+    @staticmethod
+    def _make_quorum_slot(
+        window_start: datetime,
+        run_first: int,
+        run_last: int,
+        window: int,
+        granularity: int,
+        busy_mask: int,
+        attendee_ids: list[str],
+        weights: list[float],
+    ) -> QuorumSlot:
+        """연속된 창 구간으로 QuorumSlot 생성"""
+        available = []
+        unavailable = []
+        score = 0.0
+        for i, emp_id in enumerate(attendee_ids):
+            if busy_mask >> i & 1:
+                unavailable.append(emp_id)
+            else:
+                available.append(emp_id)
+                score += weights[i]
+
+        start = window_start + timedelta(minutes=run_first * granularity)
+        end = window_start + timedelta(minutes=(run_last + window) * granularity)
+        return QuorumSlot(
+            start=start,
+            end=end,
+            duration_minutes=(run_last + window - run_first) * granularity,
+            available_ids=available,
+            unavailable_ids=unavailable,
+            score=score,
+        )
+
     def _find_common_free_slots_for_day(
         self,
         schedules: list[ScheduleResponse],
@@ -128,6 +341,149 @@ class SlotFinder:
         # duration에 맞는 슬롯만 필터링
         return [slot for slot in free_slots if slot.duration_minutes >= duration_minutes]
 
+    def _find_free_slots_sweep(
+        self,
+        schedules: list[ScheduleResponse],
+        start_date: date,
+        end_date: date,
+        duration_minutes: int,
+    ) -> list[FreeSlot]:
+        """날짜별 바쁜 구간 인덱스를 한 번 만들고 날짜마다 스윕"""
+        index = self._build_busy_index(schedules, start_date, end_date)
+        work_start = self.work_start_hour * 60
+        work_end = self.work_end_hour * 60
+
+        free_slots = []
+        current_date = start_date
+        while current_date <= end_date:
+            if is_weekday(current_date):
+                events = index.get(current_date, array("l"))
+                if self.exclude_lunch:
+                    events.append(self.lunch_start_hour * 60 * 2 + 1)
+                    events.append(self.lunch_end_hour * 60 * 2)
+
+                day_start = datetime.combine(current_date, time.min, tzinfo=KST)
+                for gap_start, gap_end in self._sweep_free_minutes(events, work_start, work_end):
+                    if gap_end - gap_start >= duration_minutes:
+                        free_slots.append(FreeSlot(
+                            start=day_start + timedelta(minutes=gap_start),
+                            end=day_start + timedelta(minutes=gap_end),
+                            duration_minutes=gap_end - gap_start,
+                        ))
+            current_date += timedelta(days=1)
+
+        return free_slots
+
+    def _find_free_slots_bitmap(
+        self,
+        schedules: list[ScheduleResponse],
+        start_date: date,
+        end_date: date,
+        duration_minutes: int,
+    ) -> list[FreeSlot]:
+        """NumPy 비트맵으로 공통 빈 시간대 계산 (버킷 경계로 정렬됨)"""
+        import numpy as np
+        from .slot_bitmap import build_busy_matrix, find_free_runs
+
+        dates = []
+        current_date = start_date
+        while current_date <= end_date:
+            if is_weekday(current_date):
+                dates.append(current_date)
+            current_date += timedelta(days=1)
+        if not dates:
+            return []
+
+        granularity = self.bitmap_granularity
+        work_start = self.work_start_hour * 60
+        work_end = self.work_end_hour * 60
+
+        matrix = build_busy_matrix(schedules, dates, work_start, work_end, granularity)
+        common_busy = np.logical_or.reduce(matrix, axis=0)
+
+        if self.exclude_lunch:
+            lunch_start = max(0, (self.lunch_start_hour * 60 - work_start) // granularity)
+            lunch_end = max(0, (self.lunch_end_hour * 60 - work_start) // granularity)
+            common_busy[:, lunch_start:lunch_end] = True
+
+        min_buckets = math.ceil(duration_minutes / granularity)
+        free_slots = []
+        for day, run_start, run_end in find_free_runs(common_busy, min_buckets):
+            window_start = datetime.combine(dates[day], time.min, tzinfo=KST) + timedelta(
+                minutes=work_start
+            )
+            free_slots.append(FreeSlot(
+                start=window_start + timedelta(minutes=run_start * granularity),
+                end=window_start + timedelta(minutes=run_end * granularity),
+                duration_minutes=(run_end - run_start) * granularity,
+            ))
+
+        return free_slots
+
+    def _build_busy_index(
+        self,
+        schedules: list[ScheduleResponse],
+        start_date: date,
+        end_date: date,
+    ) -> dict[date, array]:
+        """
+        기간 내 바쁜 구간을 날짜별 이벤트 배열로 인덱싱
+
+        각 구간은 자정 기준 분 단위 오프셋 이벤트 두 개로 저장됩니다.
+        (시작: 분*2+1, 종료: 분*2) 같은 시각에서는 종료가 먼저 정렬되어
+        맞닿은 구간 사이에 길이 0인 빈 시간이 생기지 않습니다.
+        초 단위 경계는 바쁜 쪽으로 올림/내림 처리합니다.
+        """
+        index: dict[date, array] = {}
+        for schedule in schedules:
+            for day_schedule in schedule.schedules:
+                target_date = day_schedule.schedule_date
+                if target_date < start_date or target_date > end_date:
+                    continue
+                if not day_schedule.busy_slots:
+                    continue
+
+                events = index.get(target_date)
+                if events is None:
+                    events = index[target_date] = array("l")
+
+                day_start = datetime.combine(target_date, time.min, tzinfo=KST)
+                for slot in day_schedule.busy_slots:
+                    busy_start = math.floor((slot.start - day_start).total_seconds() / 60)
+                    busy_end = math.ceil((slot.end - day_start).total_seconds() / 60)
+                    if busy_end > busy_start:
+                        events.append(busy_start * 2 + 1)
+                        events.append(busy_end * 2)
+        return index
+
+    @staticmethod
+    def _sweep_free_minutes(
+        events: array,
+        work_start: int,
+        work_end: int,
+    ) -> list[tuple[int, int]]:
+        """정렬된 이벤트를 한 번 훑어 업무 시간 내 빈 구간(분) 계산"""
+        free = []
+        depth = 0
+        free_from = work_start
+
+        for event in sorted(events):
+            minute = event >> 1
+            if event & 1:
+                if depth == 0:
+                    gap_end = min(minute, work_end)
+                    if gap_end > free_from:
+                        free.append((free_from, gap_end))
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0 and minute > free_from:
+                    free_from = minute
+
+        if work_end > free_from:
+            free.append((free_from, work_end))
+        return free
+
     def _merge_busy_slots(self, busy_slots: list[TimeSlot]) -> list[TimeSlot]:
         """바쁜 시간대 병합"""
         if not busy_slots:
@@ -201,35 +557,57 @@ class SlotFinder:
 
         return filtered if filtered else slots  # 결과가 없으면 전체 반환
 
+    def _filter_by_preference_per_day(
+        self,
+        slots: list[FreeSlot],
+        preference: str,
+    ) -> list[FreeSlot]:
+        """날짜별로 선호 시간대 필터링 (기존 엔진과 동일한 날짜 단위 폴백)"""
+        filtered = []
+        day_slots: list[FreeSlot] = []
+        for slot in slots:
+            if day_slots and slot.start.date() != day_slots[0].start.date():
+                filtered.extend(self._filter_by_preference(day_slots, preference))
+                day_slots = []
+            day_slots.append(slot)
+        if day_slots:
+            filtered.extend(self._filter_by_preference(day_slots, preference))
+        return filtered
+
     def _rank_slots(
         self,
         slots: list[FreeSlot],
         preferred_time: Optional[str] = None,
     ) -> list[FreeSlot]:
         """빈 시간대 추천 순서 정렬"""
-        def score(slot: FreeSlot) -> float:
-            s = 0.0
-            hour = slot.start.hour
+        return sorted(
+            slots,
+            key=lambda slot: self._time_score(slot.start, preferred_time),
+            reverse=True,
+        )
 
-            # 선호 시간대 가점
-            if preferred_time == "morning" and 9 <= hour < 12:
-                s += 10
-            elif preferred_time == "afternoon" and 13 <= hour < 18:
-                s += 10
+    def _time_score(self, start: datetime, preferred_time: Optional[str] = None) -> float:
+        """시작 시간 기준 추천 점수"""
+        s = 0.0
+        hour = start.hour
 
-            # 일반적으로 선호되는 시간대 가점
-            if 10 <= hour <= 11:
-                s += 5
-            elif 14 <= hour <= 16:
-                s += 5
+        # 선호 시간대 가점
+        if preferred_time == "morning" and 9 <= hour < 12:
+            s += 10
+        elif preferred_time == "afternoon" and 13 <= hour < 18:
+            s += 10
 
-            # 이른 날짜 가점
-            days_from_now = (slot.start.date() - date.today()).days
-            s -= days_from_now * 0.5
+        # 일반적으로 선호되는 시간대 가점
+        if 10 <= hour <= 11:
+            s += 5
+        elif 14 <= hour <= 16:
+            s += 5
 
-            return s
+        # 이른 날짜 가점
+        days_from_now = (start.date() - date.today()).days
+        s -= days_from_now * 0.5
 
-        return sorted(slots, key=score, reverse=True)
+        return s
 
     def create_meeting_options(
         self,
@@ -238,52 +616,117 @@ class SlotFinder:
         attendees: list[Employee],
         duration_minutes: int,
         max_options: int = 5,
+        rooms_per_slot: int = 1,
     ) -> list[MeetingOption]:
         """
-        회의 옵션 생성
+        회의 옵션 생성 (시간대 × 회의실 매칭)
+
+        회의실별 빈 구간을 정렬해 두고, 각 빈 시간대마다 회의실별로
+        bisect 한 번으로 가장 이른 가능 시작 시간을 찾습니다.
+        후보는 크기 max_options의 힙으로만 유지하므로 전체 정렬을 하지 않습니다.
 
         Args:
-            free_slots: 공통 빈 시간대 목록
-            available_rooms: 예약 가능한 회의실 목록
+            free_slots: 공통 빈 시간대 목록 (추천 순서)
+            available_rooms: 회의실별 빈 구간 (같은 회의실이 여러 번 나올 수 있음)
             attendees: 참석자 목록
             duration_minutes: 회의 시간
             max_options: 최대 옵션 수
+            rooms_per_slot: 시간대당 최대 회의실 수
 
         Returns:
-            회의 옵션 목록
+            점수 높은 순 회의 옵션 목록
         """
-        options = []
-        option_id = 1
-
-        for slot in free_slots:
-            if option_id > max_options:
-                break
-
-            # 이 시간대에 예약 가능한 회의실 찾기
-            for room_avail in available_rooms:
-                if option_id > max_options:
-                    break
-
-                # 회의실 시간이 슬롯과 맞는지 확인
-                if (
-                    room_avail.start_time <= slot.start
-                    and room_avail.end_time >= slot.start + timedelta(minutes=duration_minutes)
-                    and room_avail.is_available
-                ):
-                    end_time = slot.start + timedelta(minutes=duration_minutes)
-
-                    options.append(MeetingOption.create(
-                        option_id=option_id,
-                        start_time=slot.start,
-                        end_time=end_time,
-                        room=room_avail.room,
-                        attendees=attendees,
-                        score=self._calculate_option_score(slot, room_avail.room),
-                    ))
-                    option_id += 1
-                    break  # 각 시간대당 하나의 회의실만
+        if max_options <= 0 or rooms_per_slot <= 0:
+            return []
 
-        return options
+        duration = timedelta(minutes=duration_minutes)
+        room_windows = self._build_room_windows(available_rooms)
+        attendee_count = len(attendees)
+
+        # (점수, -시간대 순번, -회의실 순번, 시작 시간, 회의실) 최소 힙
+        # 앞의 세 값이 후보마다 유일하므로 Room끼리 비교하는 일은 없음
+        best: list[tuple] = []
+        for slot_index, slot in enumerate(free_slots):
+            candidates = []
+            for room_index, (room, starts, ends) in enumerate(room_windows):
+                if attendee_count and room.capacity < attendee_count:
+                    continue
+
+                start = self._earliest_fit(slot, starts, ends, duration)
+                if start is None:
+                    continue
+
+                score = self._calculate_option_score(
+                    FreeSlot.from_times(start, start + duration), room
+                ) + self._capacity_fit_score(room.capacity, attendee_count)
+                candidates.append((score, -slot_index, -room_index, start, room))
+
+            for candidate in heapq.nlargest(rooms_per_slot, candidates):
+                if len(best) < max_options:
+                    heapq.heappush(best, candidate)
+                elif candidate > best[0]:
+                    heapq.heapreplace(best, candidate)
+
+        ranked = sorted(best, reverse=True)
+        return [
+            MeetingOption.create(
+                option_id=option_id,
+                start_time=start,
+                end_time=start + duration,
+                room=room,
+                attendees=attendees,
+                score=score,
+            )
+            for option_id, (score, _, _, start, room) in enumerate(ranked, start=1)
+        ]
+
+    @staticmethod
+    def _build_room_windows(
+        available_rooms: list[RoomAvailability],
+    ) -> list[tuple[Room, list[datetime], list[datetime]]]:
+        """회의실별 빈 구간을 병합·정렬 (회의실은 처음 나온 순서 유지)"""
+        grouped: dict[str, tuple[Room, list[tuple[datetime, datetime]]]] = {}
+        for availability in available_rooms:
+            if not availability.is_available:
+                continue
+            entry = grouped.setdefault(availability.room.id, (availability.room, []))
+            entry[1].append((availability.start_time, availability.end_time))
+
+        windows = []
+        for room, intervals in grouped.values():
+            intervals.sort()
+            starts, ends = [], []
+            for start, end in intervals:
+                if ends and start <= ends[-1]:
+                    ends[-1] = max(ends[-1], end)
+                else:
+                    starts.append(start)
+                    ends.append(end)
+            windows.append((room, starts, ends))
+        return windows
+
+    @staticmethod
+    def _earliest_fit(
+        slot: FreeSlot,
+        starts: list[datetime],
+        ends: list[datetime],
+        duration: timedelta,
+    ) -> Optional[datetime]:
+        """시간대 안에서 회의실 빈 구간에 들어가는 가장 이른 시작 시간"""
+        j = max(bisect_right(starts, slot.start) - 1, 0)
+        while j < len(starts) and starts[j] + duration <= slot.end:
+            start = max(slot.start, starts[j])
+            if start + duration <= min(slot.end, ends[j]):
+                return start
+            j += 1
+        return None
+
+    @staticmethod
+    def _capacity_fit_score(capacity: int, attendee_count: int) -> float:
+        """참석자 수 대비 회의실 크기 적합도 (딱 맞을수록 높음, 최대 10점)"""
+        if not attendee_count or capacity <= 0:
+            return 0.0
+        return 10.0 * attendee_count / capacity
 
     def _calculate_option_score(self, slot: FreeSlot, room: Room) -> float:
         """옵션 추천 점수 계산"""
@@ -0,0 +1,107 @@
+"""MeetingAgent 테스트"""
+
+import asyncio
+import time
+
+import pytest
+
+from agent.agent import MeetingAgent
+from models.chat import Conversation
+
+
+def _tool_call(call_id: str, name: str, arguments: dict) -> dict:
+    return {"id": call_id, "name": name, "arguments": arguments}
+
+
+class RecordingMockLLM:
+    """정해진 응답을 차례로 돌려주고 받은 메시지를 기록하는 LLM"""
+
+    def __init__(self, responses: list[dict]):
+        self.responses = responses
+        self.calls: list[list[dict]] = []
+
+    async def chat(self, messages, tools=None, tool_choice=None, system_prompt=None, max_tokens=4096):
+        self.calls.append(list(messages))
+        return self.responses[len(self.calls) - 1]
+
+    async def chat_stream_events(self, messages, tools=None, tool_choice=None, system_prompt=None, max_tokens=4096):
+        response = await self.chat(messages, tools, tool_choice, system_prompt, max_tokens)
+        for word in response["content"].split(" "):
+            yield {"type": "text", "text": word}
+            await asyncio.sleep(0.05)  # 토큰 생성 지연
+        yield {"type": "message", **response}
+
+
+class TestParallelToolCalls:
+    """한 턴의 여러 도구 호출 처리 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_results_and_context_in_call_order(self):
+        """도구 결과와 컨텍스트 업데이트가 호출 순서를 따름"""
+        names = ["윤서연", "이영희", "홍길동"]
+        llm = RecordingMockLLM([
+            {
+                "content": "",
+                "tool_calls": [
+                    _tool_call(f"call_{i}", "search_employee", {"query": name})
+                    for i, name in enumerate(names)
+                ],
+                "stop_reason": "tool_use",
+            },
+            {"content": "참석자를 확인했습니다.", "tool_calls": [], "stop_reason": "end_turn"},
+        ])
+        agent = MeetingAgent(use_mock_llm=True)
+        agent.llm = llm
+        conversation = Conversation(id="conv_test", user_id="user_001")
+        conversation.add_message("user", "윤서연, 이영희, 홍길동이랑 회의 잡아줘")
+
+        response = await agent.process("윤서연, 이영희, 홍길동이랑 회의 잡아줘", conversation)
+
+        assert response.response.content == "참석자를 확인했습니다."
+        tool_results = llm.calls[1][-1]["content"]
+        assert [r["tool_use_id"] for r in tool_results] == ["call_0", "call_1", "call_2"]
+        assert [e["name"] for e in conversation.context["selected_employees"]] == names
+
+
+class TestProcessStream:
+    """도구 호출을 포함한 스트리밍 처리 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_stream_runs_tools_and_continues(self):
+        """텍스트를 바로 전달하고, 도구 실행 이벤트 후 다음 응답을 이어서 스트리밍"""
+        llm = RecordingMockLLM([
+            {
+                "content": "참석자를 찾아볼게요.",
+                "tool_calls": [
+                    _tool_call("call_0", "search_employee", {"query": "이영희"}),
+                    _tool_call("call_1", "search_employee", {"query": "홍길동"}),
+                ],
+                "stop_reason": "tool_use",
+            },
+            {"content": "이영희님과 홍길동님을 찾았습니다.", "tool_calls": [], "stop_reason": "end_turn"},
+        ])
+        agent = MeetingAgent(use_mock_llm=True)
+        agent.llm = llm
+        conversation = Conversation(id="conv_stream", user_id="user_001")
+        conversation.add_message("user", "이영희, 홍길동이랑 회의 잡아줘")
+
+        started = time.perf_counter()
+        first_token_at = None
+        chunks = []
+        async for chunk in agent.process_stream("이영희, 홍길동이랑 회의 잡아줘", conversation):
+            if first_token_at is None:
+                first_token_at = time.perf_counter() - started
+            chunks.append(chunk)
+
+        assert first_token_at < 1.0
+        assert chunks[0] == {"type": "content", "text": "참석자를"}
+        assert [c for c in chunks if c["type"] == "tool_call"] == [
+            {"type": "tool_call", "name": "search_employee", "status": "start"},
+            {"type": "tool_call", "name": "search_employee", "status": "start"},
+            {"type": "tool_call", "name": "search_employee", "status": "success"},
+            {"type": "tool_call", "name": "search_employee", "status": "success"},
+        ]
+        text = " ".join(c["text"] for c in chunks if c["type"] == "content")
+        assert text.endswith("이영희님과 홍길동님을 찾았습니다.")
+        assert [r["tool_use_id"] for r in llm.calls[1][-1]["content"]] == ["call_0", "call_1"]
+        assert [e["name"] for e in conversation.context["selected_employees"]] == ["이영희", "홍길동"]
@@ -0,0 +1,62 @@
+"""사내 API 클라이언트 레지스트리 테스트"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from services.client_registry import APIClientRegistry
+
+
+async def _slow_ok(request: httpx.Request) -> httpx.Response:
+    await asyncio.sleep(0.05)
+    return httpx.Response(200, json={"ok": True})
+
+
+class TestAPIClientRegistry:
+    """APIClientRegistry 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_shared_per_url_and_token(self):
+        """같은 URL/토큰은 같은 클라이언트를 공유"""
+        registry = APIClientRegistry()
+
+        calendar = registry.get("https://intranet.company.com/api/calendar/", "token")
+        assert registry.get("https://intranet.company.com/api/calendar", "token") is calendar
+        assert registry.get("https://intranet.company.com/api/calendar", "other") is not calendar
+        assert registry.get("https://intranet.company.com/api/rooms", "token") is not calendar
+        assert len(registry) == 3
+
+        await registry.close_all()
+        assert len(registry) == 0
+        assert calendar.client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_pool_settings_applied(self):
+        """풀 설정이 httpx 클라이언트에 반영됨"""
+        registry = APIClientRegistry(max_connections=7, max_keepalive_connections=3, http2=True)
+        client = registry.get("https://intranet.company.com/api/org")
+
+        stats = client.stats()
+        assert stats["max_connections"] == 7
+        assert stats["http2"] is True
+        await registry.close_all()
+
+    @pytest.mark.asyncio
+    async def test_saturation_metrics(self):
+        """최대 연결 수를 넘는 동시 요청은 포화로 집계"""
+        registry = APIClientRegistry(max_connections=2)
+        client = registry.get("https://intranet.company.com/api/rooms")
+        client.client = httpx.AsyncClient(
+            base_url=client.base_url,
+            transport=httpx.MockTransport(_slow_ok),
+        )
+
+        await asyncio.gather(*[client.get("/rooms") for _ in range(5)])
+
+        [stats] = registry.stats()
+        assert stats["requests_total"] == 5
+        assert stats["peak_in_flight"] == 5
+        assert stats["saturated_total"] == 3
+        assert stats["in_flight"] == 0
+        await registry.close_all()
@@ -0,0 +1,113 @@
+"""대화 저장 코덱 테스트"""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from agent.conversation_codec import SCHEMA_VERSION, ConversationCodec, LazyMessageList
+from models.chat import Conversation, Message
+
+CONTEXT = {
+    "available_slots": [
+        {"date": "2026-10-19", "start_time": f"{hour:02d}:00", "end_time": f"{hour + 1:02d}:00", "score": 0.9}
+        for hour in range(9, 18)
+    ],
+    "available_rooms": [
+        {"id": f"ROOM{i:03d}", "name": f"회의실 {i}", "capacity": 8, "facilities": ["TV", "화상회의"]}
+        for i in range(5)
+    ],
+    "selected_employees": [{"id": "EMP001", "name": "이영희"}],
+    "duration_minutes": 60,
+}
+
+
+class TestConversationCodec:
+    """값/메시지 직렬화"""
+
+    @pytest.mark.parametrize("format", ["json", "orjson"])
+    def test_context_round_trip(self, format):
+        """컨텍스트 값을 그대로 복원하고, dict 목록은 model_dump_json보다 작게 저장"""
+        codec = ConversationCodec(format=format)
+
+        for field, value in CONTEXT.items():
+            assert codec.decode(codec.encode(value)) == value
+
+        slots = CONTEXT["available_slots"]
+        assert len(codec.encode(slots)) < len(json.dumps(slots, ensure_ascii=False)) * 0.7
+
+    def test_message_round_trip(self):
+        """메시지 시각은 마이크로초까지, 시간대가 있으면 그대로 복원"""
+        codec = ConversationCodec()
+        naive = Message(role="user", content="내일 회의 잡아줘", timestamp=datetime(2026, 10, 16, 9, 30, 1, 123456))
+        aware = Message(role="assistant", content="네", timestamp=datetime.now(timezone.utc), metadata={"a": 1})
+
+        for message in (naive, aware):
+            assert codec.decode_message(codec.encode_message(message)) == message
+
+    def test_versioned_header(self):
+        """값 앞에 스키마 버전 헤더"""
+        assert ConversationCodec().encode({"a": 1})[0] == SCHEMA_VERSION
+
+    def test_reads_schema_0_json(self):
+        """헤더 없는 JSON 텍스트(이전 형식)도 읽음"""
+        codec = ConversationCodec()
+        message = Message(role="user", content="안녕")
+
+        assert codec.decode(json.dumps(CONTEXT["available_rooms"])) == CONTEXT["available_rooms"]
+        assert codec.decode_message(message.model_dump_json()) == message
+
+    def test_reads_payloads_of_other_codec(self):
+        """코덱 설정을 바꿔도 이전 코덱으로 저장한 값을 읽음"""
+        msgpack_codec = ConversationCodec(format="msgpack")
+        payload = ConversationCodec(format="json").encode(CONTEXT)
+
+        assert msgpack_codec.decode(payload) == CONTEXT
+        assert ConversationCodec(format="json").decode(msgpack_codec.encode(CONTEXT)) == CONTEXT
+
+    def test_msgpack(self):
+        """msgpack 형식"""
+        pytest.importorskip("msgpack")
+        codec = ConversationCodec(format="msgpack")
+
+        assert codec.format == "msgpack"
+        assert codec.decode(codec.encode(CONTEXT)) == CONTEXT
+
+    def test_zstd_compresses_large_values(self):
+        """일정 크기 이상의 값만 압축"""
+        pytest.importorskip("zstandard")
+        codec = ConversationCodec(compression="zstd", compress_min_bytes=256)
+        plain = ConversationCodec()
+
+        assert codec.decode(codec.encode(CONTEXT)) == CONTEXT
+        assert len(codec.encode(CONTEXT)) < len(plain.encode(CONTEXT))
+        assert codec.encode(60) == plain.encode(60)
+
+
+class TestLazyMessageList:
+    """메시지 지연 디코딩"""
+
+    def make_list(self, count: int) -> LazyMessageList:
+        codec = ConversationCodec()
+        payloads = [codec.encode_message(Message(role="user", content=f"메시지 {i}")) for i in range(count)]
+        return LazyMessageList(payloads, codec.decode_message)
+
+    def test_decodes_only_accessed_messages(self):
+        """길이 확인/append는 디코딩하지 않고, 접근한 메시지만 디코딩"""
+        messages = self.make_list(10)
+        messages.append(Message(role="assistant", content="새 메시지"))
+
+        assert len(messages) == 11
+        assert messages.decoded_count == 1
+        assert [m.content for m in messages[8:]] == ["메시지 8", "메시지 9", "새 메시지"]
+        assert messages[-1].content == "새 메시지"
+        assert messages.decoded_count == 3
+
+    def test_iteration_and_serialization(self):
+        """순회와 Conversation 직렬화 시 모두 디코딩"""
+        conversation = Conversation(id="conv_1", user_id="user_001")
+        conversation.messages = self.make_list(3)
+
+        assert [m.content for m in reversed(conversation.messages)][0] == "메시지 2"
+        restored = Conversation.model_validate_json(conversation.model_dump_json())
+        assert [m.content for m in restored.messages] == ["메시지 0", "메시지 1", "메시지 2"]
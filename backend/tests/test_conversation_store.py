@@ -0,0 +1,478 @@
+"""대화 저장소 (Redis + 프로세스 내 LRU 대체 저장소) 테스트"""
+
+import asyncio
+import copy
+import time
+
+import pytest
+import redis.asyncio as redis
+from starlette.requests import ClientDisconnect
+
+import api.routes.chat as chat_routes
+from agent.agent import MeetingAgent
+from agent.conversation import ConversationBusy, ConversationManager
+from models.chat import ChatRequest, Conversation
+
+
+class FakePipeline:
+    """명령을 모았다가 execute 때 한 번의 왕복으로 실행"""
+
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+        self.watched = None  # WATCH한 키의 값 (MULTI 전까지는 명령을 바로 실행)
+        self.immediate = False
+
+    async def watch(self, *keys):
+        self.watched = {key: copy.deepcopy(self.client.data.get(key)) for key in keys}
+        self.immediate = True
+
+    def multi(self):
+        self.immediate = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        if self.immediate:
+            return getattr(self.client, name)
+        return lambda *args, **kwargs: self.commands.append((name, args, kwargs))
+
+    async def execute(self):
+        if self.watched and any(self.client.data.get(key) != value for key, value in self.watched.items()):
+            raise redis.WatchError("watched key changed")
+        self.client.round_trips += 1
+        self.client.commands.extend(name for name, _, _ in self.commands)
+        return [getattr(self.client, f"_{name}")(*args, **kwargs) for name, args, kwargs in self.commands]
+
+
+class FakeRedis:
+    """명령/왕복 횟수를 세는 Redis 대역"""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.data = {}
+        self.ttls = {}
+        self.round_trips = 0
+        self.commands = []
+        self.delays = {}  # 명령별 응답 지연 (초)
+        self.hooks = {}  # 명령 실행 직후 한 번 부르는 코루틴 함수 (다른 워커 끼어들기)
+
+    def _check(self):
+        if self.fail:
+            raise redis.ConnectionError("connection refused")
+
+    def pipeline(self, transaction=True):
+        self._check()
+        return FakePipeline(self)
+
+    def _get(self, key):
+        return self.data.get(key)
+
+    def _set(self, key, value, ex=None, nx=False, px=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        self.ttls[key] = ex if px is None else px / 1000
+        return True
+
+    def _eval(self, script, numkeys, key, token, *args):
+        if self.data.get(key) != token:
+            return 0
+        if "pexpire" in script:
+            self.ttls[key] = int(args[0]) / 1000
+            return 1
+        return self._delete(key)
+
+    def _exists(self, *keys):
+        return sum(key in self.data for key in keys)
+
+    def _delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    def _expire(self, key, seconds):
+        self.ttls[key] = seconds
+        return key in self.data
+
+    def _rpush(self, key, *values):
+        self.data.setdefault(key, []).extend(values)
+
+    def _lrange(self, key, start, end):
+        return list(self.data.get(key, []))
+
+    def _hset(self, key, mapping):
+        self.data.setdefault(key, {}).update(mapping)
+
+    def _hdel(self, key, *fields):
+        for field in fields:
+            self.data.get(key, {}).pop(field, None)
+
+    def _hgetall(self, key):
+        return dict(self.data.get(key, {}))
+
+    def __getattr__(self, name):
+        async def command(*args, **kwargs):
+            self._check()
+            self.round_trips += 1
+            self.commands.append(name)
+            await asyncio.sleep(self.delays.get(name, 0))
+            result = getattr(self, f"_{name}")(*args, **kwargs)
+            if name in self.hooks:
+                await self.hooks.pop(name)()
+            return result
+        return command
+
+    async def scan_iter(self, match, count=None):
+        prefix = match.rstrip("*")
+        for key in list(self.data):
+            if key.startswith(prefix):
+                yield key
+
+
+def redis_manager(client: FakeRedis, **kwargs) -> ConversationManager:
+    manager = ConversationManager(redis_url="redis://fake", **kwargs)
+    manager._redis_client = client
+    manager._use_redis = True
+    return manager
+
+
+def conversation(conversation_id: str) -> Conversation:
+    conv = Conversation(id=conversation_id, user_id="user_001")
+    conv.add_message("user", "내일 회의 잡아줘")
+    return conv
+
+
+class TestRedisStore:
+    """Redis 저장소"""
+
+    @pytest.mark.asyncio
+    async def test_round_trip_and_sliding_ttl(self):
+        """저장한 대화를 그대로 읽고, 조회 시 만료 시간을 한 번의 왕복으로 연장"""
+        client = FakeRedis()
+        manager = redis_manager(client, ttl_seconds=600)
+        await manager.save(conversation("conv_1"))
+        client.round_trips = 0
+
+        loaded = await manager.get("conv_1")
+
+        assert loaded.messages[0].content == "내일 회의 잡아줘"
+        assert client.round_trips == 1
+        assert client.ttls["conv:conv_1:messages"] == 600
+        assert len(manager._local_store) == 0
+
+    @pytest.mark.asyncio
+    async def test_save_writes_only_changes(self):
+        """새 메시지와 바뀐 컨텍스트 키만 쓰고, 읽으면 그대로 조립"""
+        client = FakeRedis()
+        manager = redis_manager(client)
+        conv = conversation("conv_1")
+        conv.context.update({"selected_employees": [{"id": "EMP001"}], "duration_minutes": 60})
+        await manager.save(conv)
+        assert (manager.written_messages, manager.written_context_fields) == (1, 2)
+
+        worker = redis_manager(client)
+        loaded = await worker.get("conv_1")
+        loaded.add_message("assistant", "몇 시로 잡을까요?")
+        loaded.context["duration_minutes"] = 30
+        loaded.context.pop("selected_employees")
+        client.commands.clear()
+        await worker.save(loaded)
+
+        assert (worker.written_messages, worker.written_context_fields) == (1, 2)
+        assert "delete" not in client.commands
+        again = await redis_manager(client).get("conv_1")
+        assert again.context == {"duration_minutes": 30}
+        assert again.messages.decoded_count == 0
+        assert [m.content for m in again.messages] == ["내일 회의 잡아줘", "몇 시로 잡을까요?"]
+
+    @pytest.mark.asyncio
+    async def test_rewrites_when_history_shrinks(self):
+        """메시지가 줄면 메시지 목록 전체를 다시 씀"""
+        client = FakeRedis()
+        manager = redis_manager(client)
+        conv = conversation("conv_1")
+        conv.add_message("assistant", "네")
+        await manager.save(conv)
+
+        conv.messages = conv.messages[1:]
+        await manager.save(conv)
+
+        assert [m.content for m in (await manager.get("conv_1")).messages] == ["네"]
+
+    @pytest.mark.asyncio
+    async def test_migrates_legacy_keys(self):
+        """이전 형식 키를 조회 시 또는 일괄로 옮김"""
+        client = FakeRedis()
+        for conversation_id in ("conv_1", "conv_2"):
+            legacy = conversation(conversation_id)
+            legacy.context["duration_minutes"] = 90
+            client.data[f"conv:{conversation_id}"] = legacy.model_dump_json()
+        manager = redis_manager(client)
+
+        loaded = await manager.get("conv_1")
+        assert await manager.migrate_legacy() == 1
+
+        assert loaded.context == {"duration_minutes": 90}
+        assert "conv:conv_1" not in client.data and "conv:conv_2" not in client.data
+        assert (await manager.get("conv_2")).messages[0].content == "내일 회의 잡아줘"
+        assert manager.stats()["migrated_total"] == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("interleave_after", ["get", "exists"])
+    async def test_migration_does_not_overwrite_newer_turns(self, interleave_after):
+        """읽은 뒤 다른 워커가 먼저 옮기고 턴을 저장했으면 오래된 JSON으로 덮어쓰지 않음"""
+        client = FakeRedis()
+        client.data["conv:conv_1"] = conversation("conv_1").model_dump_json()
+        worker_a, worker_b = redis_manager(client), redis_manager(client)
+
+        async def other_worker_turn():
+            conv = await worker_a.get("conv_1")
+            conv.add_message("assistant", "언제로 잡을까요?")
+            await worker_a.save(conv)
+
+        client.hooks[interleave_after] = other_worker_turn  # worker_b가 이전 형식 키를 읽은 직후
+        assert await worker_b.migrate_legacy() == 0
+
+        messages = (await worker_b.get("conv_1")).messages
+        assert [m.content for m in messages] == ["내일 회의 잡아줘", "언제로 잡을까요?"]
+        assert worker_a.stats()["migrated_total"] == 1
+
+    @pytest.mark.asyncio
+    async def test_shared_between_workers(self):
+        """같은 Redis를 쓰는 다른 관리자(워커)에서도 조회"""
+        client = FakeRedis()
+        await redis_manager(client).save(conversation("conv_1"))
+
+        assert await redis_manager(client).get("conv_1") is not None
+
+    @pytest.mark.asyncio
+    async def test_redis_error_falls_back_to_local(self):
+        """Redis 오류 시 프로세스 내 저장소로 처리"""
+        client = FakeRedis(fail=True)
+        manager = redis_manager(client)
+        await manager.save(conversation("conv_1"))
+
+        assert (await manager.get("conv_1")).id == "conv_1"
+        assert manager.stats()["redis_errors"] == 2
+
+    @pytest.mark.asyncio
+    async def test_delete(self):
+        """삭제 후 조회되지 않음"""
+        manager = redis_manager(FakeRedis())
+        await manager.save(conversation("conv_1"))
+
+        assert await manager.delete("conv_1") is True
+        assert await manager.delete("conv_1") is False
+        assert await manager.get("conv_1") is None
+
+    @pytest.mark.asyncio
+    async def test_unreachable_redis_uses_local(self):
+        """Redis에 연결할 수 없으면 프로세스 내 저장소 사용"""
+        manager = ConversationManager(redis_url="redis://127.0.0.1:1", socket_timeout=0.2)
+
+        assert await manager.connect_redis() is False
+        assert manager.backend == "local"
+
+
+class TestLocalStore:
+    """프로세스 내 대체 저장소"""
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        """최대 대화 수를 넘으면 가장 오래 안 쓴 대화부터 제거"""
+        manager = ConversationManager(local_max_entries=2)
+        for conversation_id in ("conv_1", "conv_2"):
+            await manager.save(conversation(conversation_id))
+        await manager.get("conv_1")
+        await manager.save(conversation("conv_3"))
+
+        assert await manager.get("conv_2") is None
+        assert await manager.get("conv_1") is not None
+        assert manager.stats()["evicted_total"] == 1
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry(self, monkeypatch):
+        """유지 시간이 지나면 조회되지 않음"""
+        manager = ConversationManager(local_ttl_seconds=60)
+        await manager.save(conversation("conv_1"))
+
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now + 61)
+
+        assert await manager.get("conv_1") is None
+        assert len(manager._local_store) == 0
+
+
+class TestConversationLock:
+    """대화 턴 잠금"""
+
+    @pytest.mark.asyncio
+    async def test_serializes_turns_of_same_conversation(self):
+        """같은 대화의 턴은 차례로 실행"""
+        manager = ConversationManager()
+        order = []
+
+        async def turn(name):
+            async with manager.lock("conv_1"):
+                order.append(f"{name} start")
+                await asyncio.sleep(0.02)
+                order.append(f"{name} end")
+
+        await asyncio.gather(turn("a"), turn("b"))
+
+        assert order == ["a start", "a end", "b start", "b end"]
+        stats = manager.stats()["locks"]
+        assert (stats["acquired_total"], stats["contended_total"]) == (2, 1)
+        assert manager._local_locks == {}
+
+    @pytest.mark.asyncio
+    async def test_other_conversations_run_in_parallel(self):
+        """다른 대화는 서로 기다리지 않음"""
+        manager = ConversationManager()
+
+        async def turn(conversation_id):
+            async with manager.lock(conversation_id):
+                await asyncio.sleep(0.05)
+
+        started = time.monotonic()
+        await asyncio.gather(*(turn(f"conv_{i}") for i in range(5)))
+
+        assert time.monotonic() - started < 0.15
+        assert manager.stats()["locks"]["contended_total"] == 0
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_too_many_waiters(self):
+        """대기 요청 수를 넘으면 기다리지 않고 바로 거절"""
+        manager = ConversationManager(lock_max_waiters=0)
+
+        async with manager.lock("conv_1"):
+            started = time.monotonic()
+            with pytest.raises(ConversationBusy):
+                await manager.lock("conv_1").acquire()
+            assert time.monotonic() - started < 0.01
+
+        assert manager.stats()["locks"]["rejected_total"] == 1
+
+    @pytest.mark.asyncio
+    async def test_rejects_after_bounded_wait(self):
+        """대기 시간 안에 풀리지 않으면 거절하고, 이후 요청은 정상 획득"""
+        manager = ConversationManager(lock_wait=0.05)
+
+        async with manager.lock("conv_1"):
+            with pytest.raises(ConversationBusy):
+                await manager.lock("conv_1").acquire()
+
+        async with manager.lock("conv_1"):
+            pass
+        assert manager.stats()["locks"]["acquired_total"] == 2
+
+    @pytest.mark.asyncio
+    async def test_redis_lease_serializes_workers(self):
+        """다른 워커가 잡은 Redis 임대가 풀릴 때까지 대기"""
+        client = FakeRedis()
+        worker_a, worker_b = redis_manager(client), redis_manager(client, lock_wait=1.0)
+        order = []
+
+        async def turn(manager, name):
+            async with manager.lock("conv_1"):
+                order.append(f"{name} start")
+                await asyncio.sleep(0.05)
+                order.append(f"{name} end")
+
+        task = asyncio.create_task(turn(worker_a, "a"))
+        await asyncio.sleep(0.01)
+        await turn(worker_b, "b")
+        await task
+
+        assert order == ["a start", "a end", "b start", "b end"]
+        assert "conv:conv_1:lock" not in client.data
+        assert worker_b.stats()["locks"]["contended_total"] == 1
+
+    @pytest.mark.asyncio
+    async def test_redis_lease_renewed_during_long_turn(self):
+        """턴이 임대 시간보다 길면 연장"""
+        client = FakeRedis()
+        manager = redis_manager(client, lock_lease=0.03)
+
+        async with manager.lock("conv_1"):
+            await asyncio.sleep(0.05)
+            assert client.data["conv:conv_1:lock"]
+            assert "eval" in client.commands
+
+        assert manager.stats()["locks"]["lost_total"] == 0
+
+    @pytest.mark.asyncio
+    async def test_release_cancelled_mid_unlock(self):
+        """해제 중 취소되어도 잠금은 풀리고, 두 번 해제해도 안전"""
+        client = FakeRedis()
+        manager = redis_manager(client, lock_wait=1.0)
+        lock = manager.lock("conv_1")
+        await lock.acquire()
+
+        client.delays["eval"] = 0.05
+        task = asyncio.create_task(lock.release())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await lock.release()
+
+        assert manager._local_locks == {}
+        client.delays.clear()
+        async with manager.lock("conv_1"):
+            pass
+        assert "conv:conv_1:lock" not in client.data
+
+
+class TestChatRoutes:
+    """채팅 라우트의 대화 저장소 사용"""
+
+    @pytest.mark.asyncio
+    async def test_conversation_persists_across_requests(self, monkeypatch):
+        """턴이 끝나면 저장되어 다음 요청과 조회/삭제 API에서 사용, 처리 중인 대화는 409"""
+        manager = redis_manager(FakeRedis())
+        monkeypatch.setattr(chat_routes, "get_conversation_manager", lambda: manager)
+
+        agent = MeetingAgent(use_mock_llm=True)
+
+        first = await chat_routes.chat(ChatRequest(message="안녕"), meeting_agent=agent)
+        await chat_routes.chat(ChatRequest(message="고마워", conversation_id=first.conversation_id), meeting_agent=agent)
+
+        history = await chat_routes.get_conversation(first.conversation_id)
+        assert [m["content"] for m in history["messages"][::2]] == ["안녕", "고마워"]
+        async with manager.lock(first.conversation_id):
+            manager.lock_max_waiters = 0
+            with pytest.raises(chat_routes.HTTPException) as busy:
+                await chat_routes.chat(ChatRequest(message="또", conversation_id=first.conversation_id), meeting_agent=agent)
+            assert busy.value.status_code == 409
+
+        await chat_routes.delete_conversation(first.conversation_id)
+        with pytest.raises(chat_routes.HTTPException):
+            await chat_routes.get_conversation(first.conversation_id)
+
+    @pytest.mark.asyncio
+    async def test_stream_releases_lock_when_body_never_starts(self, monkeypatch):
+        """스트리밍 본문이 시작되기 전에 연결이 끊겨도 잠금 해제"""
+        manager = redis_manager(FakeRedis())
+        monkeypatch.setattr(chat_routes, "get_conversation_manager", lambda: manager)
+
+        response = await chat_routes.chat_stream(
+            ChatRequest(message="안녕", conversation_id="conv_1"),
+            meeting_agent=MeetingAgent(use_mock_llm=True),
+        )
+        assert "conv_1" in manager._local_locks
+
+        async def receive():
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            raise OSError("client disconnected")
+
+        with pytest.raises(ClientDisconnect):
+            await response({"type": "http", "asgi": {"spec_version": "2.4"}}, receive, send)
+
+        assert manager._local_locks == {}
+        assert "conv:conv_1:lock" not in manager._redis_client.data
@@ -1,10 +1,15 @@
 """datetime_utils 테스트"""
 
 import pytest
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, time, timedelta
 
 from utils.datetime_utils import (
     parse_relative_date,
+    parse_korean_time,
+    parse_korean_time_range,
+    parse_duration_minutes,
+    is_ambiguous_korean_hour,
+    KOREAN_TIME_PATTERN,
     get_date_range,
     get_work_hours,
     is_lunch_time,
@@ -47,6 +52,54 @@ class TestParseRelativeDate:
         result = parse_relative_date("이상한 텍스트")
         assert result is None
 
+    def test_next_week_weekday(self):
+        """"다음 주 화요일"은 다음 주 월요일이 아닌 화요일"""
+        friday = date(2026, 10, 16)
+        assert parse_relative_date("다음 주 화요일", friday) == date(2026, 10, 20)
+        assert parse_relative_date("이번 주 금요일", friday) == friday
+
+    def test_week_after_next(self):
+        """"다다음 주"는 다음 주보다 한 주 뒤"""
+        friday = date(2026, 10, 16)
+        assert parse_relative_date("다다음 주 월요일", friday) == date(2026, 10, 26)
+        assert parse_relative_date("다음 다음 주 화요일", friday) == date(2026, 10, 27)
+        assert parse_relative_date("다다음 주", friday) == date(2026, 10, 26)
+
+
+class TestParseKoreanTime:
+    """한국어 시각/길이 표현 파싱 테스트"""
+
+    def test_single_time(self):
+        assert parse_korean_time("오후 2시") == time(14, 0)
+        assert parse_korean_time("오전 10시 반") == time(10, 30)
+        assert parse_korean_time("14:30") == time(14, 30)
+        assert parse_korean_time("2시") == time(14, 0)  # 업무 시간 기준 오후
+        assert parse_korean_time("1시간") is None
+
+    def test_range(self):
+        assert parse_korean_time_range("오후 2시부터 4시까지") == (time(14, 0), time(16, 0))
+        assert parse_korean_time_range("14:00-15:30") == (time(14, 0), time(15, 30))
+        assert parse_korean_time_range("11시~1시") == (time(11, 0), time(13, 0))
+        assert parse_korean_time_range("4시까지 예약해줘") is None  # 종료 시각만 있음
+
+    def test_start_with_duration(self):
+        assert parse_korean_time_range("오후 3시에 1시간 반 회의") == (time(15, 0), time(16, 30))
+        assert parse_korean_time_range("2시 30분에 30분 회의") == (time(14, 30), time(15, 0))
+        assert parse_korean_time_range("10시", default_duration_minutes=30) == (time(10, 0), time(10, 30))
+
+    def test_ambiguous_hour(self):
+        """오전/오후 모두 업무 시간 밖인 시각만 모호"""
+        def ambiguous(text):
+            return is_ambiguous_korean_hour(KOREAN_TIME_PATTERN.search(text))
+
+        assert ambiguous("7시") and ambiguous("8시 반")
+        assert not any(map(ambiguous, ["2시", "6시", "9시", "11시", "12시", "오후 7시", "19:00"]))
+
+    def test_duration(self):
+        assert parse_duration_minutes("한 시간 회의") == 60
+        assert parse_duration_minutes("1시간 30분") == 90
+        assert parse_duration_minutes("2시 30분") is None
+
 
 class TestGetDateRange:
     """get_date_range 테스트"""
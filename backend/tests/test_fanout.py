@@ -0,0 +1,76 @@
+"""fan-out 유틸리티 테스트"""
+
+import asyncio
+import time
+import pytest
+from datetime import date, timedelta
+
+from services.fanout import fan_out
+from services.calendar import CalendarService
+
+
+class TestFanOut:
+    """fan_out 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_runs_concurrently(self):
+        """요청들이 동시에 실행됨"""
+        async def slow(key):
+            await asyncio.sleep(0.1)
+            return key.upper()
+
+        started = time.perf_counter()
+        result = await fan_out(["a", "b", "c", "d", "e"], slow, concurrency=5)
+        elapsed = time.perf_counter() - started
+
+        assert result.values == ["A", "B", "C", "D", "E"]
+        assert elapsed < 0.3
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit(self):
+        """동시 실행 수 제한"""
+        running = 0
+        peak = 0
+
+        async def track(key):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return key
+
+        await fan_out(range(10), track, concurrency=3)
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_partial_failure_and_timeout(self):
+        """부분 실패와 타임아웃 보고"""
+        async def flaky(key):
+            if key == "broken":
+                raise ValueError("boom")
+            if key == "slow":
+                await asyncio.sleep(1)
+            return key
+
+        result = await fan_out(["ok", "broken", "slow"], flaky, timeout=0.05)
+
+        assert result.results == {"ok": "ok"}
+        assert result.failures == {"broken": "boom", "slow": "응답 시간 초과"}
+        with pytest.raises(ValueError):
+            result.raise_first_error()
+
+
+class TestCalendarFanOut:
+    """CalendarService 동시 조회 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_get_schedules_keeps_order(self):
+        """요청 순서대로 일정 반환"""
+        service = CalendarService()
+        tomorrow = date.today() + timedelta(days=1)
+        ids = ["emp_003", "emp_001", "emp_003"]
+
+        schedules = await service.get_schedules(ids, tomorrow, tomorrow)
+
+        assert [s.employee_id for s in schedules] == ids
@@ -0,0 +1,108 @@
+"""대화 이력 윈도우 테스트"""
+
+import pytest
+
+from agent.history import ExtractiveSummarizer, HistoryManager, estimate_tokens
+from config import Settings
+from models.chat import Conversation
+
+
+class RecordingSummarizer(ExtractiveSummarizer):
+    """요약에 넘겨진 메시지를 기록하는 요약기"""
+
+    def __init__(self):
+        super().__init__(max_tokens=200)
+        self.calls: list[list[dict]] = []
+
+    async def summarize(self, previous, messages):
+        self.calls.append(messages)
+        return await super().summarize(previous, messages)
+
+
+def _conversation(turns: int) -> Conversation:
+    conversation = Conversation(id="conv_history", user_id="user_001")
+    conversation.context["selected_employees"] = [{"id": "emp_001", "name": "이영희"}]
+    for i in range(turns):
+        conversation.add_message("user", f"{i}번째 요청입니다. 다음 주 화요일 오후로 회의 시간을 찾아 주세요.")
+        conversation.add_message("assistant", f"{i}번째 답변입니다. 가능한 시간대를 확인해 보겠습니다.")
+    return conversation
+
+
+class TestHistoryManager:
+    """HistoryManager 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_short_history_unchanged(self):
+        """예산 안의 대화는 그대로 전달"""
+        conversation = _conversation(2)
+        manager = HistoryManager(token_budget=1000, min_recent_messages=2)
+
+        window = await manager.build(conversation)
+
+        assert window.messages == conversation.get_messages_for_llm()
+        assert window.summary == ""
+        assert window.saved_tokens == 0
+        assert conversation.summarized_count == 0
+
+    @pytest.mark.asyncio
+    async def test_folds_overflow_into_summary(self):
+        """예산을 넘는 오래된 메시지는 요약으로 접고, 컨텍스트는 유지"""
+        conversation = _conversation(20)
+        context = dict(conversation.context)
+        manager = HistoryManager(token_budget=300, min_recent_messages=2)
+
+        window = await manager.build(conversation)
+
+        assert window.messages[0]["role"] == "user"
+        assert window.messages == conversation.get_messages_for_llm()[-len(window.messages):]
+        assert window.window_tokens <= 300
+        assert window.saved_tokens > 0
+        assert "19번째 요청" in window.messages[-2]["content"]
+        assert window.summary.startswith("- ") or "\n- " in window.summary
+        assert conversation.history_summary == window.summary
+        assert conversation.context == context
+        assert len(conversation.messages) == 40  # 원본 메시지는 보존
+
+    @pytest.mark.asyncio
+    async def test_incremental_summary(self):
+        """다음 턴에는 새로 넘친 메시지만 요약"""
+        conversation = _conversation(20)
+        summarizer = RecordingSummarizer()
+        manager = HistoryManager(token_budget=300, min_recent_messages=2, summarizer=summarizer)
+
+        await manager.build(conversation)
+        folded = conversation.summarized_count
+        assert len(summarizer.calls) == 1
+        assert len(summarizer.calls[0]) == folded
+
+        conversation.add_message("user", "20번째 요청입니다. 다음 주 화요일 오후로 회의 시간을 찾아 주세요.")
+        conversation.add_message("assistant", "20번째 답변입니다. 가능한 시간대를 확인해 보겠습니다.")
+        window = await manager.build(conversation)
+
+        assert len(summarizer.calls) == 2
+        assert summarizer.calls[1][0]["content"] == conversation.messages[folded].content
+        assert len(summarizer.calls[1]) == conversation.summarized_count - folded
+        assert window.full_tokens == conversation.summarized_tokens + sum(
+            estimate_tokens(m["content"]) + 4 for m in window.messages
+        )
+
+    @pytest.mark.asyncio
+    async def test_min_recent_messages_kept(self):
+        """예산이 작아도 최근 메시지는 원문으로 남김"""
+        conversation = _conversation(5)
+        manager = HistoryManager(token_budget=1, min_recent_messages=4)
+
+        window = await manager.build(conversation)
+
+        assert len(window.messages) == 4
+
+
+class TestHistoryTokenBudget:
+    """provider별 대화 이력 예산 설정 테스트"""
+
+    def test_per_provider_override(self):
+        settings = Settings(history_token_budget=8000, history_token_budgets="gemini=32000, custom=4000")
+
+        assert settings.get_history_token_budget("gemini") == 32000
+        assert settings.get_history_token_budget("custom") == 4000
+        assert settings.get_history_token_budget("anthropic") == 8000
@@ -0,0 +1,132 @@
+"""Intent 파싱 응답 캐시 테스트"""
+
+import time
+from datetime import date
+
+import pytest
+
+import api.routes.chat as chat_routes
+from api.routes.chat import ParseIntentRequest, parse_intent
+from config import get_settings
+from services.intent_cache import LocalIntentCache, make_intent_cache_key
+
+
+class CountingLLM:
+    """호출 횟수를 세고 고정된 함수 호출을 돌려주는 LLM"""
+
+    calls = 0
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    async def chat(self, **kwargs):
+        CountingLLM.calls += 1
+        return {
+            "content": "",
+            "tool_calls": [{
+                "id": "call_0",
+                "name": "createQuickReservation",
+                "arguments": {"date": "내일", "startTime": "14:00"},
+            }],
+            "stop_reason": "tool_use",
+        }
+
+
+class TestIntentCacheKey:
+    """캐시 키 정규화 테스트"""
+
+    def test_normalized_message(self):
+        """공백/끝 문장부호/전각 문자 차이는 같은 키"""
+        today = date(2026, 10, 16)
+        key = make_intent_cache_key("내일 오후 2시 회의실 예약해줘", None, today)
+
+        assert make_intent_cache_key("  내일  오후 2시 회의실 예약해줘!! ", None, today) == key
+        assert make_intent_cache_key("내일 오후 ２시 회의실 예약해줘.", None, today) == key
+        assert make_intent_cache_key("내일 오후 3시 회의실 예약해줘", None, today) != key
+
+    def test_context_and_date_bucket(self):
+        """관련 컨텍스트 항목과 날짜가 키에 반영됨"""
+        today = date(2026, 10, 16)
+        context = {"participants": ["이영희"], "selectedRoom": "회의실 A"}
+        key = make_intent_cache_key("예약해줘", context, today)
+
+        reordered = {"selectedRoom": "회의실 A", "participants": ["이영희"], "scrollTop": 120}
+        assert make_intent_cache_key("예약해줘", reordered, today) == key
+        assert make_intent_cache_key("예약해줘", {"participants": ["홍길동"]}, today) != key
+        assert make_intent_cache_key("예약해줘", context, date(2026, 10, 17)) != key
+
+
+class TestLocalIntentCache:
+    """LocalIntentCache 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_and_stats(self):
+        """최대 항목 수 초과 시 가장 오래 안 쓴 항목 제거, 적중률 집계"""
+        cache = LocalIntentCache(max_entries=2)
+
+        await cache.set("a", {"function_calls": []})
+        await cache.set("b", {"function_calls": []})
+        await cache.get("a")  # a 최근 사용
+        await cache.set("c", {"function_calls": []})
+
+        assert await cache.get("b") is None
+        assert await cache.get("c") is not None
+        assert cache.stats() == {"backend": "local", "hits": 2, "misses": 1, "hit_rate": 0.6667, "entries": 2}
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry(self):
+        """TTL이 지나면 미스"""
+        cache = LocalIntentCache(ttl_seconds=0)
+        await cache.set("a", {"function_calls": []})
+
+        assert await cache.get("a") is None
+        assert len(cache) == 0
+
+
+class TestParseIntentCache:
+    """parse-intent 라우트 캐시 적용 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_hit_skips_llm(self, monkeypatch):
+        """같은 요청의 두 번째 호출은 LLM 없이 캐시에서 응답"""
+        cache = LocalIntentCache()
+        CountingLLM.calls = 0
+        monkeypatch.setattr(get_settings(), "gemini_api_key", "test")
+        monkeypatch.setattr(get_settings(), "llm_provider", "gemini")
+        monkeypatch.setattr(chat_routes, "get_llm_router", CountingLLM)
+        monkeypatch.setattr(chat_routes, "get_intent_cache", lambda: cache)
+        monkeypatch.setattr(chat_routes, "get_intent_parser", lambda: None)  # LLM 경로만 확인
+
+        first = await parse_intent(ParseIntentRequest(message="내일 오후 2시 회의실 예약해줘"))
+
+        started = time.perf_counter()
+        second = await parse_intent(ParseIntentRequest(message="내일 오후 2시 회의실 예약해줘."))
+        elapsed = time.perf_counter() - started
+
+        assert CountingLLM.calls == 1
+        assert second == first
+        assert second.function_calls[0]["name"] == "createQuickReservation"
+        assert elapsed < 0.01
+        assert cache.stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_uses_intent_providers(self, monkeypatch):
+        """API 키 확인과 캐시 키는 기본 provider가 아니라 Intent 라우터의 provider 목록 기준"""
+        cache = LocalIntentCache()
+        CountingLLM.calls = 0
+        monkeypatch.setattr(get_settings(), "llm_provider", "anthropic")
+        monkeypatch.setattr(get_settings(), "anthropic_api_key", "")
+        monkeypatch.setattr(get_settings(), "gemini_api_key", "test")
+        monkeypatch.setattr(get_settings(), "llm_intent_providers", "gemini")
+        monkeypatch.setattr(chat_routes, "get_llm_router", CountingLLM)
+        monkeypatch.setattr(chat_routes, "get_intent_cache", lambda: cache)
+        monkeypatch.setattr(chat_routes, "get_intent_parser", lambda: None)
+
+        response = await parse_intent(ParseIntentRequest(message="내일 오후 2시 회의실 예약해줘"))
+
+        assert CountingLLM.calls == 1
+        assert response.function_calls[0]["name"] == "createQuickReservation"
+
+        monkeypatch.setattr(get_settings(), "gemini_model", "gemini-other")
+        await parse_intent(ParseIntentRequest(message="내일 오후 2시 회의실 예약해줘"))
+        assert CountingLLM.calls == 2  # Intent provider의 모델이 바뀌면 다른 캐시 키
@@ -0,0 +1,133 @@
+"""규칙 기반 Intent 파서 테스트"""
+
+from datetime import date
+
+import pytest
+
+import api.routes.chat as chat_routes
+from agent.intent_parser import IntentParser
+from api.routes.chat import ParseIntentRequest, parse_intent
+
+TODAY = date(2026, 10, 16)  # 금요일
+
+
+def _reserve(start, end, date_="2026-10-16", **extra):
+    return [{
+        "name": "createQuickReservation",
+        "arguments": {"title": "회의", "date": date_, "startTime": start, "endTime": end, **extra},
+    }]
+
+
+# (메시지, UI 컨텍스트, 기대 함수 호출) — 기대값이 None이면 LLM으로 넘겨야 하는 요청
+CORPUS = [
+    ("내일 오후 2시 회의실 예약해줘", None, _reserve("14:00", "15:00", "2026-10-17")),
+    ("오늘 3시~4시 회의 잡아줘", None, _reserve("15:00", "16:00")),
+    ("내일 오전 10시 반에 1시간 회의 잡아줘", None, _reserve("10:30", "11:30", "2026-10-17")),
+    ("다음 주 화요일 14:00-15:30 회의실 A 예약", None,
+     _reserve("14:00", "15:30", "2026-10-20", roomName="회의실 A")),
+    ("10월 20일 3시부터 5시까지 대회의실 예약해주세요", None,
+     _reserve("15:00", "17:00", "2026-10-20", roomName="대회의실")),
+    ("김철수, 이영희랑 내일 오후 2시부터 4시까지 회의 잡아줘", None,
+     _reserve("14:00", "16:00", "2026-10-17", requiredNames=["김철수", "이영희"])),
+    ("홍길동님이랑 모레 11시에 30분 미팅 예약", None,
+     _reserve("11:00", "11:30", "2026-10-18", requiredNames=["홍길동"])),
+    ("'주간 회의' 월요일 오전 9시 예약해줘", None,
+     [{"name": "createQuickReservation", "arguments": {
+         "title": "주간 회의", "date": "2026-10-19", "startTime": "09:00", "endTime": "10:00"}}]),
+    ("예약해줘", {"selectedTimeRange": {"startTime": "13:00", "endTime": "14:00"}}, _reserve("13:00", "14:00")),
+    ("이영희님 참석자로 추가해줘", None,
+     [{"name": "setParticipantsByNames", "arguments": {"names": ["이영희"], "type": "REQUIRED"}}]),
+    ("박민수 대리님 선택 참석자로 넣어줘", None,
+     [{"name": "setParticipantsByNames", "arguments": {"names": ["박민수"], "type": "OPTIONAL"}}]),
+    ("내일로 날짜 바꿔줘", None, [{"name": "setDateByString", "arguments": {"dateStr": "2026-10-17"}}]),
+    ("다음 주 수요일로 설정해줘", None, [{"name": "setDateByString", "arguments": {"dateStr": "2026-10-21"}}]),
+    ("오후 2시부터 3시까지로 시간 설정해줘", None,
+     [{"name": "setTimeByRange", "arguments": {"startTime": "14:00", "endTime": "15:00"}}]),
+    ("대회의실로 바꿔줘", None, [{"name": "setRoomByName", "arguments": {"roomName": "대회의실"}}]),
+    ("오후 3시에 빈 회의실 있어?", None,
+     [{"name": "getAvailableRooms", "arguments": {"startTime": "15:00", "endTime": "16:00"}}]),
+    ("1시간 회의 가능한 시간 찾아줘", None, [{"name": "findOptimalTimes", "arguments": {"durationMinutes": 60}}]),
+    ("30분 미팅 언제가 좋을까", None, None),
+    ("최적 시간 추천해줘", None, [{"name": "findOptimalTimes", "arguments": {"durationMinutes": 60}}]),
+    ("다다음 주 월요일 2시 예약해줘", None, _reserve("14:00", "15:00", "2026-10-26")),
+    ("다음 주 화요일 오후 3시 대회의실 예약해줘", None,
+     _reserve("15:00", "16:00", "2026-10-20", roomName="대회의실")),
+    ("오전 9시부터 10시까지 회의실 B 예약해줘", None, _reserve("09:00", "10:00", roomName="회의실 B")),
+    ("내일 오후 4시 30분에 30분 미팅 잡아줘", None, _reserve("16:30", "17:00", "2026-10-17")),
+    ("10월 23일 오전 11시 세미나실 예약해주세요", None,
+     _reserve("11:00", "12:00", "2026-10-23", roomName="세미나실")),
+    ("오후 5시에 빈 회의실 있어?", None,
+     [{"name": "getAvailableRooms", "arguments": {"startTime": "17:00", "endTime": "18:00"}}]),
+    ("다음 주 금요일 예약 현황 보여줘", None, [{"name": "getMyReservationList", "arguments": {"date": "2026-10-23"}}]),
+    ("내 예약 목록 보여줘", None, [{"name": "getMyReservationList", "arguments": {}}]),
+    ("내일 예약 현황 알려줘", None, [{"name": "getMyReservationList", "arguments": {"date": "2026-10-17"}}]),
+    ("회의실 A 오후 3시 예약 취소해줘", None,
+     [{"name": "cancelReservationByTime", "arguments": {"roomName": "회의실 A", "startTime": "15:00"}}]),
+    # LLM이 필요한 요청
+    ("지난번처럼 예약해줘", None, None),
+    ("점심 먹고 회의 잡아줘", None, None),
+    ("고객사 미팅 잡아줘 오후 4시", None, None),
+    ("다음 주 화요일 10시 회의실 A 예약하고 팀원들한테 공유해줘", None, None),
+    ("마케팅팀 전체랑 내일 2시 회의 잡아줘", None, None),
+    ("아까 그 회의 취소해줘", None, None),
+    ("회의실 예약 어떻게 해?", None, None),
+    ("안녕하세요", None, None),
+    ("내일 오후 2시 대회의실 예약하지마", None, None),
+    ("내일 오후 2시 대회의실 예약 안 해도 돼", None, None),
+    ("내일 오후 2시 대회의실 예약했어?", None, None),
+    ("내일 오후 2시 대회의실 예약했어", None, None),
+    ("내일 오후 2시 대회의실 예약해도 돼?", None, None),
+    ("내일 오후 2시 대회의실 예약 가능해", None, None),
+    ("내일 오후 2시 대회의실 예약 변경해줘", None, None),
+    ("회의실 A 오후 3시 예약 취소 가능해?", None, None),
+    # 시각/날짜를 규칙으로 확정할 수 없는 요청
+    ("4시까지 예약해줘", None, None),
+    ("3시 전에 회의 잡아줘", None, None),
+    ("2시쯤 회의 잡아줘", None, None),
+    ("2시나 3시에 예약해줘", None, None),
+    ("내일 2시 3시 예약해줘", None, None),
+    ("내일 7시 회의 잡아줘", None, None),
+    ("지난 주 월요일 2시 예약해줘", None, None),
+    ("내일 모레 2시 예약해줘", None, None),
+]
+
+
+class TestIntentParserCorpus:
+    """코퍼스 기반 정확도 테스트"""
+
+    def test_accuracy_and_coverage(self):
+        """확신한 응답은 모두 정답이고, LLM이 필요한 요청은 넘기며, 절반 이상을 직접 처리"""
+        parser = IntentParser()
+        handled = 0
+
+        for message, context, expected in CORPUS:
+            result = parser.parse(message, context, today=TODAY)
+            confident = bool(result.function_calls) and result.confidence >= parser.threshold
+
+            if expected is None:
+                assert not confident, f"{message!r} should fall through: {result}"
+            else:
+                assert confident, f"{message!r} not handled: {result}"
+                assert result.function_calls == expected, message
+                handled += 1
+
+        # 이전에는 모든 요청이 LLM으로 갔음
+        assert handled / len(CORPUS) >= 0.5
+
+
+class TestParseIntentFastPath:
+    """parse-intent 라우트 빠른 경로 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_fast_path_skips_llm(self, monkeypatch):
+        """확신하는 요청은 API 키/LLM 없이 응답하고 처리 횟수를 집계"""
+        parser = IntentParser()
+        monkeypatch.setattr(chat_routes, "get_intent_parser", lambda: parser)
+        monkeypatch.setattr(chat_routes, "get_llm_router", None)  # 호출되면 실패
+
+        response = await parse_intent(ParseIntentRequest(message="회의실 A 오후 3시 예약 취소해줘"))
+
+        assert response.function_calls == [
+            {"name": "cancelReservationByTime", "arguments": {"roomName": "회의실 A", "startTime": "15:00"}},
+        ]
+        assert parser.stats() == {"handled": 1, "fallbacks": 0, "handled_rate": 1.0}
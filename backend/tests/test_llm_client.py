@@ -0,0 +1,369 @@
+"""LLM 클라이언트 테스트"""
+
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+from agent.llm_client import LLMClient, SystemPrompt
+from agent.llm_pool import LLMClientPool
+from agent.prompts.prompt_manager import PromptManager
+from config import get_settings
+
+LATENCY = 0.2
+CONCURRENCY = 8
+
+
+def _completion_body(content: str) -> dict:
+    return {
+        "id": "chatcmpl-test",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "gpt-test",
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": content},
+            "finish_reason": "stop",
+        }],
+    }
+
+
+def _stream_body(chunks: list[str]) -> bytes:
+    lines = []
+    for text in chunks:
+        lines.append("data: " + json.dumps({
+            "id": "chatcmpl-test",
+            "object": "chat.completion.chunk",
+            "created": 0,
+            "model": "gpt-test",
+            "choices": [{"index": 0, "delta": {"content": text}, "finish_reason": None}],
+        }))
+    lines.append("data: [DONE]")
+    return ("\n\n".join(lines) + "\n\n").encode()
+
+
+def _tool_call_stream_body() -> bytes:
+    """도구 호출 2개의 인자가 여러 청크로 나뉘어 오는 스트림"""
+    deltas = [
+        {"content": "확인해 볼게요."},
+        {"tool_calls": [{"index": 0, "id": "call_a", "type": "function",
+                         "function": {"name": "search_employee", "arguments": ""}}]},
+        {"tool_calls": [{"index": 0, "function": {"arguments": '{"query": '}}]},
+        {"tool_calls": [{"index": 1, "id": "call_b", "type": "function",
+                         "function": {"name": "search_employee", "arguments": '{"query": "홍길동"}'}}]},
+        {"tool_calls": [{"index": 0, "function": {"arguments": '"이영희"}'}}]},
+    ]
+    lines = []
+    for i, delta in enumerate(deltas):
+        lines.append("data: " + json.dumps({
+            "id": "chatcmpl-test",
+            "object": "chat.completion.chunk",
+            "created": 0,
+            "model": "gpt-test",
+            "choices": [{
+                "index": 0,
+                "delta": delta,
+                "finish_reason": "tool_calls" if i == len(deltas) - 1 else None,
+            }],
+        }, ensure_ascii=False))
+    lines.append("data: [DONE]")
+    return ("\n\n".join(lines) + "\n\n").encode()
+
+
+async def _async_handler(request: httpx.Request) -> httpx.Response:
+    await asyncio.sleep(LATENCY)
+    if json.loads(request.content).get("stream"):
+        return httpx.Response(200, content=_stream_body(["안녕", "하세요"]),
+                              headers={"content-type": "text/event-stream"})
+    return httpx.Response(200, json=_completion_body("안녕하세요"))
+
+
+def _sync_handler(request: httpx.Request) -> httpx.Response:
+    time.sleep(LATENCY)
+    return httpx.Response(200, json=_completion_body("안녕하세요"))
+
+
+def _openai_client(call_mode: str) -> LLMClient:
+    """지연 시간이 있는 가짜 전송 계층을 쓰는 OpenAI LLMClient"""
+    from openai import AsyncOpenAI, OpenAI
+
+    client = LLMClient(provider="openai", call_mode=call_mode)
+    if call_mode == "native":
+        client.client = AsyncOpenAI(
+            api_key="test",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(_async_handler)),
+        )
+    else:
+        client.client = OpenAI(
+            api_key="test",
+            http_client=httpx.Client(transport=httpx.MockTransport(_sync_handler)),
+        )
+    return client
+
+
+async def _elapsed_for_concurrent_chats(client: LLMClient) -> float:
+    messages = [{"role": "user", "content": "안녕"}]
+    await client.chat(messages)  # SDK 첫 호출 시의 초기화 비용 제외
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*[client.chat(messages) for _ in range(CONCURRENCY)])
+    elapsed = time.perf_counter() - started
+
+    assert [r["content"] for r in results] == ["안녕하세요"] * CONCURRENCY
+    return elapsed
+
+
+@pytest.fixture(autouse=True)
+def openai_api_key(monkeypatch):
+    """SDK 클라이언트 생성에 필요한 테스트용 API 키"""
+    monkeypatch.setattr(get_settings(), "openai_api_key", "test")
+    monkeypatch.setattr(get_settings(), "anthropic_api_key", "test")
+
+
+class TestLLMClientConcurrency:
+    """LLM 호출이 이벤트 루프를 막지 않는지 테스트"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("call_mode", ["native", "thread"])
+    async def test_concurrent_chats_overlap(self, call_mode):
+        """N개의 동시 대화가 1개 대화 시간과 비슷하게 끝남"""
+        elapsed = await _elapsed_for_concurrent_chats(_openai_client(call_mode))
+
+        # 순차 실행이면 LATENCY * CONCURRENCY (1.6초)
+        assert elapsed < LATENCY * 3
+
+    @pytest.mark.asyncio
+    async def test_event_loop_not_blocked(self):
+        """동기 SDK(thread 모드) 호출 중에도 다른 코루틴이 실행됨"""
+        client = _openai_client("thread")
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        await client.chat([{"role": "user", "content": "안녕"}])
+        task.cancel()
+
+        assert ticks >= 5
+
+    @pytest.mark.asyncio
+    async def test_native_stream(self):
+        """비동기 스트리밍 응답을 청크 단위로 전달"""
+        client = _openai_client("native")
+
+        chunks = [chunk async for chunk in client.chat_stream([{"role": "user", "content": "안녕"}])]
+
+        assert chunks == ["안녕", "하세요"]
+
+
+class TestStreamEvents:
+    """스트리밍 도구 호출 조립 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_openai_tool_call_deltas(self):
+        """OpenAI 도구 호출 델타를 chat()과 같은 형식으로 조립"""
+        from openai import AsyncOpenAI
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=_tool_call_stream_body(),
+                                  headers={"content-type": "text/event-stream"})
+
+        client = LLMClient(provider="openai", call_mode="native")
+        client.client = AsyncOpenAI(
+            api_key="test",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+
+        events = [e async for e in client.chat_stream_events([{"role": "user", "content": "안녕"}])]
+
+        assert events[0] == {"type": "text", "text": "확인해 볼게요."}
+        assert events[-1] == {
+            "type": "message",
+            "content": "확인해 볼게요.",
+            "tool_calls": [
+                {"id": "call_a", "name": "search_employee", "arguments": {"query": "이영희"}},
+                {"id": "call_b", "name": "search_employee", "arguments": {"query": "홍길동"}},
+            ],
+            "stop_reason": "tool_use",
+            "usage": None,
+        }
+
+
+class TestPromptCache:
+    """시스템 프롬프트 캐시 경계/사용량 테스트"""
+
+    def test_static_prompt_has_no_datetime(self):
+        """고정 부분에는 날짜/시간이 없어 매 요청 동일"""
+        manager = PromptManager()
+        static = manager.get_static_prompt()
+
+        assert static == PromptManager().get_static_prompt()
+        assert "{{" not in static
+        assert "오늘 날짜:" not in static
+        assert "오늘 날짜:" in manager.get_datetime_prompt()
+        assert manager.get_system_prompt().startswith(static)
+
+    def test_datetime_prompt_rendered_once_per_minute(self, monkeypatch):
+        """같은 분 안에서는 렌더링 결과를 재사용"""
+        from datetime import datetime
+
+        from agent.prompts import prompt_manager as module
+        from utils.datetime_utils import KST
+
+        now = datetime(2026, 10, 16, 9, 30, 5, tzinfo=KST)  # 금요일
+        monkeypatch.setattr(module, "get_current_datetime", lambda: now)
+        manager = PromptManager()
+
+        first = manager.get_datetime_prompt()
+        now = now.replace(second=55)
+        assert manager.get_datetime_prompt() is first
+
+        now = now.replace(minute=31, second=0)
+        second = manager.get_datetime_prompt()
+        assert "09시 31분" in second
+        assert "2026년 10월 19일 (Mon) ~ 2026년 10월 23일 (Fri)" in second
+
+    def test_anthropic_cache_control(self):
+        """고정 시스템 블록에 cache_control, 동적 부분은 캐시 경계 뒤"""
+        client = LLMClient(provider="anthropic", call_mode="native")
+        tools = [{"name": "search_employee", "description": "직원 검색", "parameters": {"type": "object"}}]
+
+        kwargs = {}
+        client._apply_system_and_tools_anthropic(kwargs, SystemPrompt("규칙", "오늘 날짜"), tools)
+        assert kwargs["system"] == [
+            {"type": "text", "text": "규칙", "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": "오늘 날짜"},
+        ]
+        assert "cache_control" not in kwargs["tools"][-1]
+
+        # 고정 시스템 텍스트가 없으면 마지막 도구 정의까지 캐싱
+        kwargs = {}
+        client._apply_system_and_tools_anthropic(kwargs, SystemPrompt("", "오늘 날짜"), tools)
+        assert kwargs["tools"][-1]["cache_control"] == {"type": "ephemeral"}
+
+        # 일반 문자열은 기존처럼 그대로 전달
+        kwargs = {}
+        client._apply_system_and_tools_anthropic(kwargs, "시스템", None)
+        assert kwargs == {"system": "시스템"}
+
+    def test_anthropic_usage(self):
+        """Anthropic 캐시 읽기/쓰기 토큰을 전체 입력에 합산"""
+        from types import SimpleNamespace
+
+        usage = SimpleNamespace(
+            input_tokens=50, output_tokens=20,
+            cache_read_input_tokens=900, cache_creation_input_tokens=0,
+        )
+
+        assert LLMClient._usage_anthropic(usage) == {
+            "input_tokens": 950,
+            "output_tokens": 20,
+            "cache_hit_tokens": 900,
+            "cache_miss_tokens": 50,
+            "cache_write_tokens": 0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_openai_split_system_and_usage(self):
+        """OpenAI: 고정/동적 system 메시지 분리, cached_tokens를 적중 토큰으로 보고"""
+        from openai import AsyncOpenAI
+
+        requests = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(json.loads(request.content))
+            body = _completion_body("안녕하세요")
+            body["usage"] = {
+                "prompt_tokens": 1200,
+                "completion_tokens": 10,
+                "total_tokens": 1210,
+                "prompt_tokens_details": {"cached_tokens": 1024},
+            }
+            return httpx.Response(200, json=body)
+
+        client = LLMClient(provider="openai", call_mode="native")
+        client.client = AsyncOpenAI(
+            api_key="test",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+
+        response = await client.chat(
+            [{"role": "user", "content": "안녕"}],
+            system_prompt=SystemPrompt("규칙", "오늘 날짜"),
+        )
+
+        assert requests[0]["messages"][:2] == [
+            {"role": "system", "content": "규칙"},
+            {"role": "system", "content": "오늘 날짜"},
+        ]
+        assert response["usage"]["cache_hit_tokens"] == 1024
+        assert response["usage"]["cache_miss_tokens"] == 176
+
+
+class TestLLMClientPool:
+    """공용 LLM 클라이언트 풀 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_reuse_and_provider_limits(self):
+        """같은 provider는 같은 클라이언트를 재사용하고 provider별 연결 제한을 적용"""
+        pool = LLMClientPool(max_connections=20, max_connections_by_provider={"anthropic": 4})
+
+        openai_client = pool.get("openai", "native")
+        assert pool.get("openai", "native") is openai_client
+        assert pool.get("openai", "thread") is not openai_client
+
+        anthropic_client = pool.get("anthropic", "native")
+        assert openai_client.limits.max_connections == 20
+        assert anthropic_client.limits.max_connections == 4
+        assert anthropic_client.limits.max_keepalive_connections == 4
+        # SDK가 풀이 설정한 HTTP 클라이언트를 사용
+        assert openai_client.client._client is openai_client.http_client
+        assert anthropic_client.client._client is anthropic_client.http_client
+
+        stats = pool.stats()
+        assert stats["requests_total"] == 4
+        assert stats["created_total"] == 3
+
+        await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_close_all(self):
+        """종료 시 모든 HTTP 클라이언트를 닫고 풀을 비움"""
+        pool = LLMClientPool()
+        http_clients = [pool.get("openai", "native").http_client, pool.get("openai", "thread").http_client]
+
+        await pool.close_all()
+
+        assert len(pool) == 0
+        assert all(http_client.is_closed for http_client in http_clients)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("call_mode", ["native", "thread"])
+    async def test_warmup_keeps_connection(self, monkeypatch, call_mode):
+        """warmup은 provider API에 연결만 열고 실패해도 예외를 내지 않음 (thread 모드의 비동기 클라이언트 포함)"""
+        requests = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(404)
+
+        monkeypatch.setattr(get_settings(), "custom_api_url", "http://llm.test/v1")
+        client = LLMClient(provider="custom", call_mode=call_mode)
+        await client.close()
+        client.http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        assert await client.warmup() is True
+        assert [(r.method, str(r.url)) for r in requests] == [("HEAD", "http://llm.test/v1")]
+
+        async def failing(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("unreachable")
+
+        client.http_client = httpx.AsyncClient(transport=httpx.MockTransport(failing))
+        assert await client.warmup() is False
+        await client.close()
@@ -0,0 +1,202 @@
+"""LLM 라우팅 (헤징/장애 조치) 테스트"""
+
+import asyncio
+import time
+
+import pytest
+
+import agent.llm_router as llm_router
+from agent.llm_router import LLMRouter, get_provider_health
+from agent.rate_limiter import RateLimitExceeded
+from config import get_settings
+
+
+class FakeClient:
+    """지연 시간/오류를 지정할 수 있는 LLM 클라이언트"""
+
+    def __init__(self, name: str, delay: float = 0.0, error: Exception = None, content: str = None):
+        self.name = name
+        self.delay = delay
+        self.error = error
+        self.content = name if content is None else content
+        self.calls = 0
+        self.cancelled = 0
+
+    async def chat(self, **kwargs):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.error:
+            raise self.error
+        return {"content": self.content, "tool_calls": [], "stop_reason": "end_turn"}
+
+    async def chat_stream_events(self, *args):
+        self.calls += 1
+        if self.error:
+            raise self.error
+        yield {"type": "text", "text": self.content}
+        yield {"type": "message", "content": self.content, "tool_calls": [], "stop_reason": "end_turn", "usage": None}
+
+
+class FakePool:
+    def __init__(self, *clients: FakeClient):
+        self.clients = {client.name: client for client in clients}
+
+    def get(self, provider):
+        return self.clients[provider]
+
+
+def _router(*clients: FakeClient, **kwargs) -> LLMRouter:
+    kwargs.setdefault("hedge_min_delay", 0.05)
+    kwargs.setdefault("hedge_default_delay", 0.05)
+    return LLMRouter([c.name for c in clients], pool=FakePool(*clients), **kwargs)
+
+
+@pytest.fixture(autouse=True)
+def fresh_health(monkeypatch):
+    """테스트마다 provider 건강 상태 초기화"""
+    monkeypatch.setattr(llm_router, "_health", {})
+
+
+class TestHedging:
+    """헤징 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_hedged(self):
+        """기본 provider가 헤징 대기 시간을 넘기면 예비 provider 응답을 쓰고 기본 요청은 취소"""
+        slow = FakeClient("anthropic", delay=1.0)
+        fast = FakeClient("openai", delay=0.01)
+        router = _router(slow, fast)
+
+        started = time.perf_counter()
+        response = await router.chat([{"role": "user", "content": "안녕"}])
+        elapsed = time.perf_counter() - started
+        await asyncio.sleep(0)
+
+        assert response["content"] == "openai"
+        assert elapsed < 0.5
+        assert slow.cancelled == 1
+        assert router.stats()["hedged_total"] == 1
+        assert router.stats()["hedge_wins"] == 1
+        assert get_provider_health("anthropic").requests_total == 0  # 취소는 실패로 세지 않음
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_not_hedged(self):
+        """기본 provider가 제때 응답하면 예비 provider는 호출하지 않음"""
+        primary = FakeClient("anthropic", delay=0.01)
+        backup = FakeClient("openai")
+        router = _router(primary, backup)
+
+        response = await router.chat([{"role": "user", "content": "안녕"}])
+
+        assert response["content"] == "anthropic"
+        assert backup.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_hedge_delay_uses_latency_percentile(self):
+        """표본이 쌓이면 지연 시간 백분위를 헤징 대기 시간으로 사용"""
+        router = _router(FakeClient("anthropic"), FakeClient("openai"), hedge_min_delay=0.0, hedge_default_delay=5.0)
+        assert router.hedge_delay("anthropic") == 5.0
+
+        health = get_provider_health("anthropic")
+        for latency in range(1, 21):
+            health.record_success(latency / 10)
+
+        assert router.hedge_delay("anthropic") == pytest.approx(2.0)
+
+
+class TestFailover:
+    """장애 조치 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_error_fails_over(self):
+        """오류가 나면 다음 provider로 넘어감"""
+        broken = FakeClient("anthropic", error=RuntimeError("down"))
+        backup = FakeClient("openai")
+        router = _router(broken, backup, hedge_enabled=False)
+
+        response = await router.chat([{"role": "user", "content": "안녕"}])
+
+        assert response["content"] == "openai"
+        assert router.stats()["failovers_total"] == 1
+        assert get_provider_health("anthropic").errors_total == 1
+
+    @pytest.mark.asyncio
+    async def test_all_failed_raises(self):
+        """모든 provider가 실패하면 마지막 오류 전달"""
+        router = _router(
+            FakeClient("anthropic", error=RuntimeError("a")),
+            FakeClient("openai", error=RuntimeError("b")),
+        )
+
+        with pytest.raises(RuntimeError):
+            await router.chat([{"role": "user", "content": "안녕"}])
+
+    @pytest.mark.asyncio
+    async def test_empty_response_is_not_usable(self):
+        """빈 응답은 다음 provider 응답이 있으면 쓰지 않음"""
+        router = _router(FakeClient("anthropic", content=""), FakeClient("openai"), hedge_enabled=False)
+
+        response = await router.chat([{"role": "user", "content": "안녕"}])
+
+        assert response["content"] == "openai"
+
+    @pytest.mark.asyncio
+    async def test_unhealthy_provider_demoted(self):
+        """연속 실패로 제외된 provider는 뒤로 밀림"""
+        broken = FakeClient("anthropic", error=RuntimeError("down"))
+        backup = FakeClient("openai")
+        router = _router(broken, backup, hedge_enabled=False)
+
+        for _ in range(get_settings().llm_failure_threshold):
+            await router.chat([{"role": "user", "content": "안녕"}])
+
+        assert router.ranked_providers() == ["openai", "anthropic"]
+        calls = broken.calls
+        await router.chat([{"role": "user", "content": "안녕"}])
+        assert broken.calls == calls
+
+    @pytest.mark.asyncio
+    async def test_local_queue_rejection_keeps_provider_healthy(self):
+        """우리 쪽 속도 제한 대기열이 거절한 요청은 provider 실패로 세지 않음"""
+        limited = FakeClient("anthropic", error=RateLimitExceeded("anthropic:model", 5.0))
+        router = _router(limited, FakeClient("openai"), hedge_enabled=False)
+
+        for _ in range(get_settings().llm_failure_threshold + 1):
+            await router.chat([{"role": "user", "content": "안녕"}])
+        _ = [chunk async for chunk in router.chat_stream([{"role": "user", "content": "안녕"}])]
+
+        health = get_provider_health("anthropic")
+        assert health.available
+        assert health.errors_total == 0
+        assert router.ranked_providers() == ["anthropic", "openai"]
+
+    @pytest.mark.asyncio
+    async def test_stream_fails_over_before_first_event(self):
+        """스트리밍은 첫 이벤트 전 오류면 다음 provider로 넘어감"""
+        router = _router(FakeClient("anthropic", error=RuntimeError("down")), FakeClient("openai"))
+
+        chunks = [chunk async for chunk in router.chat_stream([{"role": "user", "content": "안녕"}])]
+
+        assert chunks == ["openai"]
+        assert router.stats()["failovers_total"] == 1
+
+
+class TestProviderConfig:
+    """용도별 provider 설정 테스트"""
+
+    def test_purpose_providers(self, monkeypatch):
+        """용도별 목록에서 설정이 갖춰진 provider만 사용"""
+        settings = get_settings()
+        monkeypatch.setattr(settings, "llm_provider", "gemini")
+        monkeypatch.setattr(settings, "anthropic_api_key", "key")
+        monkeypatch.setattr(settings, "openai_api_key", "")
+        monkeypatch.setattr(settings, "gemini_api_key", "key")
+        monkeypatch.setattr(settings, "llm_agent_providers", "anthropic, openai, gemini")
+        monkeypatch.setattr(settings, "llm_intent_providers", "")
+
+        assert settings.get_llm_providers("agent") == ["anthropic", "gemini"]
+        assert settings.get_llm_providers("intent") == ["gemini"]
@@ -0,0 +1,207 @@
+"""LLM 속도 제한/재시도 스케줄러 테스트"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from agent.llm_client import LLMClient
+from agent.rate_limiter import RateLimiter, RateLimitExceeded, TokenBucket, retry_after_seconds
+from config import get_settings
+
+
+def _limiter(requests_per_second: float, burst: int = 1, **kwargs) -> RateLimiter:
+    """버스트 용량이 작은 테스트용 리미터"""
+    limiter = RateLimiter("test", requests_per_minute=int(requests_per_second * 60), **kwargs)
+    limiter.requests = TokenBucket(requests_per_second * 60, capacity=burst)
+    return limiter
+
+
+def _status_error(status: int, headers: dict) -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "http://llm.test/chat/completions")
+    response = httpx.Response(status, headers=headers, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+class TestTokenBucket:
+    """토큰 버킷 예약 테스트"""
+
+    def test_reserve_returns_wait(self):
+        """잔량이 모자라면 채워질 때까지의 대기 시간을 반환"""
+        bucket = TokenBucket(60, capacity=2)  # 초당 1
+        now = time.monotonic()
+
+        assert bucket.reserve(1, now) == 0
+        assert bucket.reserve(1, now) == 0
+        assert bucket.reserve(1, now) == pytest.approx(1.0)
+        assert bucket.reserve(1, now) == pytest.approx(2.0)
+
+        bucket.refund(2)
+        assert bucket.reserve(1, now) == pytest.approx(1.0)
+
+
+class TestRetryAfter:
+    """Retry-After / rate-limit 헤더 해석 테스트"""
+
+    @pytest.mark.parametrize("headers, expected", [
+        ({"retry-after-ms": "250"}, 0.25),
+        ({"retry-after": "3"}, 3.0),
+        ({"x-ratelimit-reset-requests": "1m30s", "x-ratelimit-reset-tokens": "250ms"}, 90.0),
+        ({"x-ratelimit-reset-tokens": "6s"}, 6.0),
+        ({}, None),
+    ])
+    def test_headers(self, headers, expected):
+        """헤더 형식별 대기 시간"""
+        assert retry_after_seconds(httpx.Headers(headers)) == expected
+
+
+class TestRateLimiter:
+    """적응형 리미터 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_queue_smooths_burst(self):
+        """한도를 넘는 동시 요청은 거절되지 않고 간격을 두고 나감"""
+        limiter = _limiter(20)  # 50ms 간격
+
+        started = time.perf_counter()
+        waits = await asyncio.gather(*[limiter.acquire() for _ in range(4)])
+        elapsed = time.perf_counter() - started
+
+        assert sorted(waits) == pytest.approx([0, 0.05, 0.1, 0.15], abs=0.02)
+        assert elapsed >= 0.14
+        stats = limiter.stats()
+        assert stats["queued_total"] == 3
+        assert stats["peak_queue_depth"] == 3
+        assert stats["queue_depth"] == 0
+        assert stats["rejected_total"] == 0
+
+    @pytest.mark.asyncio
+    async def test_rejects_without_queue(self):
+        """대기열 비활성화 시 한도 초과 요청은 바로 거절하고 예약을 반환"""
+        limiter = _limiter(1, queue_enabled=False)
+
+        await limiter.acquire()
+        with pytest.raises(RateLimitExceeded):
+            await limiter.acquire()
+
+        assert limiter.stats()["rejected_total"] == 1
+        assert limiter.requests.tokens == pytest.approx(0, abs=0.1)
+
+    @pytest.mark.asyncio
+    async def test_token_accounting(self):
+        """예상 토큰으로 예약하고 실제 사용량으로 보정"""
+        limiter = RateLimiter("test", tokens_per_minute=1000)
+
+        await limiter.acquire(estimated_tokens=600)
+        limiter.record_success(600, {"input_tokens": 100, "output_tokens": 50})
+
+        assert limiter.tokens.tokens == pytest.approx(850, abs=1)
+
+    @pytest.mark.asyncio
+    async def test_429_blocks_and_slows_down(self):
+        """429 응답 헤더 시각까지 멈추고 허용 속도를 줄였다가 성공 시 회복"""
+        limiter = RateLimiter("test", requests_per_minute=600, retry_base_delay=0.01)
+        calls = []
+
+        async def request():
+            calls.append(time.perf_counter())
+            if len(calls) == 1:
+                raise _status_error(429, {"retry-after-ms": "100"})
+            return {"content": "ok", "usage": None}
+
+        response = await limiter.run(request, max_attempts=3)
+
+        assert response["content"] == "ok"
+        assert calls[1] - calls[0] >= 0.1
+        stats = limiter.stats()
+        assert stats["throttled_total"] == 1
+        assert stats["retries_total"] == 1
+        assert stats["requests_per_minute"] == 600 * 0.5 + 600 * 0.05
+
+    @pytest.mark.asyncio
+    async def test_queued_requests_respect_later_429(self):
+        """대기 중에 받은 429가 재개 시각을 늦추면 그 시각까지 더 기다리고, 최대 대기 시간을 넘으면 거절"""
+        limiter = _limiter(20)  # 50ms 간격
+        await limiter.acquire()
+
+        queued = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0.01)
+        limiter.blocked_until = time.monotonic() + 0.15
+
+        started = time.perf_counter()
+        wait = await queued
+        assert time.perf_counter() - started >= 0.14
+        assert wait >= 0.15
+
+        limiter.max_wait_seconds = 0.2
+        await limiter.acquire()
+        queued = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0.01)
+        limiter.blocked_until = time.monotonic() + 1.0
+        with pytest.raises(RateLimitExceeded):
+            await queued
+        assert limiter.stats()["rejected_total"] == 1
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_error(self):
+        """재시도할 수 없는 오류는 바로 전달"""
+        limiter = RateLimiter("test")
+        calls = 0
+
+        async def request():
+            nonlocal calls
+            calls += 1
+            raise _status_error(400, {})
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await limiter.run(request, max_attempts=3)
+        assert calls == 1
+
+    def test_jittered_backoff(self):
+        """헤더가 없으면 지수 백오프 범위 안에서 무작위 지연"""
+        limiter = RateLimiter("test", retry_base_delay=1.0, retry_max_delay=5.0)
+
+        delays = [limiter.retry_delay(3) for _ in range(200)]
+
+        assert all(0 <= d <= 5.0 for d in delays)
+        assert len(set(delays)) > 100
+
+
+class TestLLMClientRetry:
+    """LLMClient 재시도 연동 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_openai_retry_after(self, monkeypatch):
+        """OpenAI 429 응답의 retry-after를 따라 한 번 재시도"""
+        from openai import AsyncOpenAI
+
+        monkeypatch.setattr(get_settings(), "openai_api_key", "test")
+        attempts = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                return httpx.Response(429, headers={"retry-after-ms": "50"}, json={"error": {"message": "slow down"}})
+            return httpx.Response(200, json={
+                "id": "chatcmpl-test",
+                "object": "chat.completion",
+                "created": 0,
+                "model": "gpt-test",
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": "안녕하세요"}, "finish_reason": "stop"}],
+            })
+
+        client = LLMClient(provider="openai", call_mode="native")
+        client.client = AsyncOpenAI(
+            api_key="test",
+            max_retries=0,
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+        client.rate_limiter = RateLimiter("openai:test", retry_base_delay=0.01)
+
+        response = await client.chat([{"role": "user", "content": "안녕"}])
+
+        assert response["content"] == "안녕하세요"
+        assert attempts == 2
+        assert client.rate_limiter.stats()["throttled_total"] == 1
@@ -0,0 +1,176 @@
+"""LLM 요청/응답 기록 및 재생 테스트"""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from agent.llm_client import LLMProvider, SystemPrompt
+from agent.replay_client import RecordingLLMClient, ReplayLLMClient, make_trace_key
+
+TOOLS = [{"name": "search_employee"}, {"name": "get_schedule"}]
+TOOL_RESPONSE = {
+    "content": "",
+    "tool_calls": [{"id": "tool_001", "name": "search_employee", "arguments": {"query": "김철수"}}],
+    "stop_reason": "tool_use",
+    "usage": {"input_tokens": 100, "output_tokens": 20},
+}
+
+
+class FakeProvider:
+    """지연 시간을 두고 정해진 응답을 돌려주는 LLM 클라이언트"""
+
+    provider = LLMProvider.ANTHROPIC
+
+    def __init__(self, response: dict, delay: float = 0.0):
+        self.response = response
+        self.delay = delay
+
+    async def chat(self, messages, tools=None, tool_choice=None, system_prompt=None, max_tokens=4096):
+        await asyncio.sleep(self.delay)
+        return self.response
+
+    async def chat_stream_events(self, messages, tools=None, tool_choice=None, system_prompt=None, max_tokens=4096):
+        await asyncio.sleep(self.delay)
+        for chunk in ("안녕", "하세요"):
+            yield {"type": "text", "text": chunk}
+        yield {"type": "message", "content": "안녕하세요", "tool_calls": [], "stop_reason": "end_turn", "usage": None}
+
+
+def user(text: str) -> list[dict]:
+    return [{"role": "user", "content": text}]
+
+
+async def record(path, response=TOOL_RESPONSE, delay=0.0, text="회의 잡아줘"):
+    recorder = RecordingLLMClient(FakeProvider(response, delay), path)
+    await recorder.chat(user(text), TOOLS, system_prompt=SystemPrompt("system", "today"))
+    return recorder
+
+
+class TestTraceKey:
+    """요청 매칭 키"""
+
+    def test_ignores_dynamic_prompt_and_tool_order(self):
+        """날짜 등 동적 프롬프트와 도구 순서는 키에 영향 없음"""
+        a = make_trace_key(user("안녕"), TOOLS, SystemPrompt("system", "2026-10-16"))
+        b = make_trace_key(user("안녕"), list(reversed(TOOLS)), SystemPrompt("system", "2026-10-17"))
+        assert a == b
+
+    def test_messages_change_key(self):
+        """메시지가 다르면 다른 키"""
+        assert make_trace_key(user("안녕"), TOOLS, "system") != make_trace_key(user("반가워"), TOOLS, "system")
+
+
+class TestRecordingLLMClient:
+    """요청/응답 기록"""
+
+    @pytest.mark.asyncio
+    async def test_records_chat_with_tool_calls(self, tmp_path):
+        """도구 호출 응답과 지연 시간을 JSONL로 기록"""
+        path = tmp_path / "trace.jsonl"
+        recorder = await record(path, delay=0.02)
+
+        records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+        assert recorder.recorded == 1
+        assert records[0]["response"]["tool_calls"][0]["name"] == "search_employee"
+        assert records[0]["tools"] == ["search_employee", "get_schedule"]
+        assert records[0]["latency"] >= 0.02
+
+    @pytest.mark.asyncio
+    async def test_records_stream_events(self, tmp_path):
+        """스트리밍 이벤트와 최종 응답을 함께 기록"""
+        path = tmp_path / "trace.jsonl"
+        recorder = RecordingLLMClient(FakeProvider(TOOL_RESPONSE), path)
+        chunks = [chunk async for chunk in recorder.chat_stream(user("안녕"))]
+
+        record = json.loads(path.read_text(encoding="utf-8"))
+        assert chunks == ["안녕", "하세요"]
+        assert [e["event"]["type"] for e in record["events"]] == ["text", "text", "message"]
+        assert record["response"]["content"] == "안녕하세요"
+
+
+class TestReplayLLMClient:
+    """기록 재생"""
+
+    @pytest.mark.asyncio
+    async def test_replays_matching_record(self, tmp_path):
+        """같은 요청에 기록된 응답을 그대로 반환"""
+        path = tmp_path / "trace.jsonl"
+        await record(path, response={"content": "다른 응답", "tool_calls": [], "stop_reason": "end_turn"}, text="안녕")
+        await record(path)
+
+        replay = ReplayLLMClient(path)
+        response = await replay.chat(user("회의 잡아줘"), TOOLS, system_prompt=SystemPrompt("system", "tomorrow"))
+
+        assert response == TOOL_RESPONSE
+        assert replay.stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_miss_falls_back_to_file_order(self, tmp_path):
+        """키가 없으면 파일 순서대로 재생"""
+        path = tmp_path / "trace.jsonl"
+        await record(path)
+
+        replay = ReplayLLMClient(path)
+        response = await replay.chat(user("처음 보는 요청"))
+
+        assert response["tool_calls"][0]["name"] == "search_employee"
+        assert replay.stats()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_strict_miss_raises(self, tmp_path):
+        """strict면 키가 없을 때 KeyError"""
+        path = tmp_path / "trace.jsonl"
+        await record(path)
+
+        with pytest.raises(KeyError):
+            await ReplayLLMClient(path, strict=True).chat(user("처음 보는 요청"))
+
+    def test_empty_trace_rejected(self, tmp_path):
+        """빈 기록 파일은 ValueError"""
+        path = tmp_path / "trace.jsonl"
+        path.write_text("", encoding="utf-8")
+
+        with pytest.raises(ValueError):
+            ReplayLLMClient(path)
+
+    @pytest.mark.asyncio
+    async def test_latency_modes(self, tmp_path):
+        """zero는 지연 없음, fixed는 고정 지연, recorded는 기록된 시간"""
+        path = tmp_path / "trace.jsonl"
+        await record(path, delay=0.05)
+
+        async def elapsed(replay):
+            started = time.monotonic()
+            await replay.chat(user("회의 잡아줘"), TOOLS, system_prompt="system")
+            return time.monotonic() - started
+
+        assert await elapsed(ReplayLLMClient(path, latency="zero")) < 0.02
+        assert await elapsed(ReplayLLMClient(path, latency="fixed", fixed_latency=0.03)) >= 0.03
+        assert await elapsed(ReplayLLMClient(path, latency="recorded")) >= 0.05
+
+    @pytest.mark.asyncio
+    async def test_replays_stream_events(self, tmp_path):
+        """기록된 스트리밍 이벤트를 순서대로 재생"""
+        path = tmp_path / "trace.jsonl"
+        recorder = RecordingLLMClient(FakeProvider(TOOL_RESPONSE), path)
+        _ = [event async for event in recorder.chat_stream_events(user("안녕"))]
+
+        replay = ReplayLLMClient(path)
+        events = [event async for event in replay.chat_stream_events(user("안녕"))]
+
+        assert [e.get("text") for e in events[:2]] == ["안녕", "하세요"]
+        assert events[-1]["type"] == "message"
+
+    @pytest.mark.asyncio
+    async def test_chat_record_replayed_as_stream(self, tmp_path):
+        """chat()으로 기록한 응답도 스트리밍으로 재생 (도구 호출 포함)"""
+        path = tmp_path / "trace.jsonl"
+        await record(path)
+
+        replay = ReplayLLMClient(path)
+        events = [e async for e in replay.chat_stream_events(user("회의 잡아줘"), TOOLS, system_prompt="system")]
+
+        assert [e["type"] for e in events] == ["message"]
+        assert events[0]["tool_calls"][0]["arguments"] == {"query": "김철수"}
@@ -0,0 +1,155 @@
+"""회의실 예약 타임라인 인덱스 테스트"""
+
+import random
+import pytest
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from services.room import RoomService
+from services.room_index import RoomTimelineIndex
+
+KST = ZoneInfo("Asia/Seoul")
+
+
+def at(target_date: date, hour: int, minute: int = 0) -> datetime:
+    return datetime.combine(target_date, datetime.min.time(), tzinfo=KST).replace(hour=hour, minute=minute)
+
+
+def next_weekday(days_ahead: int = 1) -> date:
+    target = date.today() + timedelta(days=days_ahead)
+    while target.weekday() >= 5:
+        target += timedelta(days=1)
+    return target
+
+
+class CountingLoader:
+    """호출 기록을 남기는 예약 현황 로더"""
+
+    def __init__(self, bookings: dict[str, list[dict]]):
+        self.bookings = bookings
+        self.calls = []
+
+    async def __call__(self, room_ids, target_date):
+        self.calls.append((tuple(room_ids), target_date))
+        return {room_id: self.bookings.get(room_id, []) for room_id in room_ids}
+
+
+class TestRoomTimelineIndex:
+    """RoomTimelineIndex 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_free_rooms_with_overlapping_bookings(self):
+        """긴 예약 안에 짧은 예약이 겹쳐 있어도 충돌 판정"""
+        target = next_weekday()
+        loader = CountingLoader({
+            "room_a": [
+                {"start": at(target, 9).isoformat(), "end": at(target, 12).isoformat(), "meeting_title": "워크숍"},
+                {"start": at(target, 10).isoformat(), "end": at(target, 10, 30).isoformat()},
+            ],
+            "room_b": [
+                {"start": at(target, 11).isoformat(), "end": at(target, 12).isoformat()},
+            ],
+        })
+        index = RoomTimelineIndex(loader)
+
+        [free] = await index.free_rooms_bulk(["room_a", "room_b", "room_c"], [(at(target, 11), at(target, 11, 30))])
+        assert free == ["room_c"]
+
+        assert await index.get_conflict("room_a", at(target, 11), at(target, 11, 30)) == "워크숍"
+        assert await index.get_conflict("room_b", at(target, 10), at(target, 11)) is None  # 끝점은 미포함
+
+    @pytest.mark.asyncio
+    async def test_bulk_loads_each_day_once(self):
+        """여러 후보 시간대여도 날짜별로 한 번만 로드"""
+        target = next_weekday()
+        loader = CountingLoader({})
+        index = RoomTimelineIndex(loader)
+        slots = [(at(target, h), at(target, h + 1)) for h in range(9, 17)]
+
+        await index.free_rooms_bulk(["room_a", "room_b"], slots)
+        await index.free_rooms_bulk(["room_a", "room_b"], slots)
+
+        assert loader.calls == [(("room_a", "room_b"), target)]
+
+    @pytest.mark.asyncio
+    async def test_add_booking(self):
+        """추가한 예약이 바로 반영됨"""
+        target = next_weekday()
+        index = RoomTimelineIndex(CountingLoader({}))
+        await index.ensure_loaded(["room_a"], [target])
+
+        index.add_booking("room_a", at(target, 14), at(target, 15), "주간 회의")
+
+        assert index.find_conflict("room_a", at(target, 14, 30), at(target, 16)) == "주간 회의"
+        assert index.find_conflict("room_a", at(target, 15), at(target, 16)) is None
+
+    @pytest.mark.asyncio
+    async def test_free_windows(self):
+        """예약 사이의 빈 구간을 기간에 맞춰 잘라서 반환"""
+        target = next_weekday()
+        index = RoomTimelineIndex(CountingLoader({
+            "room_a": [
+                {"start": at(target, 8).isoformat(), "end": at(target, 10).isoformat()},
+                {"start": at(target, 13).isoformat(), "end": at(target, 14).isoformat()},
+                {"start": at(target, 13, 30).isoformat(), "end": at(target, 15).isoformat()},
+            ],
+        }))
+
+        windows = await index.free_windows(["room_a", "room_b"], at(target, 9), at(target, 18))
+
+        assert windows["room_a"] == [(at(target, 10), at(target, 13)), (at(target, 15), at(target, 18))]
+        assert windows["room_b"] == [(at(target, 9), at(target, 18))]
+
+    @pytest.mark.asyncio
+    async def test_matches_linear_scan(self):
+        """무작위 예약에 대해 선형 탐색과 결과 동일"""
+        rng = random.Random(7)
+        target = next_weekday()
+        index = RoomTimelineIndex(CountingLoader({}))
+        await index.ensure_loaded(["room_a"], [target])
+
+        bookings = []
+        for _ in range(30):
+            start = at(target, 8) + timedelta(minutes=15 * rng.randrange(40))
+            end = start + timedelta(minutes=15 * rng.randrange(1, 12))
+            index.add_booking("room_a", start, end)
+            bookings.append((start, end))
+
+        for _ in range(200):
+            start = at(target, 8) + timedelta(minutes=5 * rng.randrange(130))
+            end = start + timedelta(minutes=5 * rng.randrange(1, 24))
+            expected = any(start < b_end and end > b_start for b_start, b_end in bookings)
+            assert (index.find_conflict("room_a", start, end) is not None) == expected
+
+
+class TestRoomServiceIndex:
+    """RoomService 인덱스 연동 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_book_room_updates_search(self):
+        """예약한 시간대는 이후 검색에서 제외"""
+        service = RoomService()
+        target = next_weekday(7)
+        start, end = at(target, 16), at(target, 17)
+
+        before = await service.search_available_rooms(start, end)
+        room_id = before.rooms[0].id
+        assert await service.book_room(room_id, start, end, "mtg_test")
+
+        after = await service.search_available_rooms(start, end)
+        assert room_id not in [room.id for room in after.rooms]
+        assert not await service.book_room(room_id, start, end, "mtg_test2")
+
+    @pytest.mark.asyncio
+    async def test_bulk_search_matches_single(self):
+        """일괄 검색 결과가 시간대별 단건 검색과 동일"""
+        service = RoomService()
+        target = next_weekday()
+        slots = [(at(target, h), at(target, h + 1)) for h in range(9, 18)]
+
+        bulk = await service.search_available_rooms_bulk(slots, min_capacity=4)
+        singles = [await service.search_available_rooms(s, e, min_capacity=4) for s, e in slots]
+
+        assert [[r.id for r in result.rooms] for result in bulk] == [
+            [r.id for r in result.rooms] for result in singles
+        ]
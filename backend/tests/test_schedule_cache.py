@@ -0,0 +1,98 @@
+"""일정 캐시 테스트"""
+
+import pytest
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from models.calendar import DaySchedule
+from models.meeting import MeetingRequest
+from services.calendar import CalendarService
+from services.schedule_cache import LocalScheduleCache
+
+KST = ZoneInfo("Asia/Seoul")
+
+
+class CountingCalendarService(CalendarService):
+    """API 조회 구간을 기록하는 CalendarService"""
+
+    def __init__(self, cache):
+        super().__init__(cache=cache)
+        self.fetched_ranges = []
+
+    async def _fetch_schedule(self, employee_id, start_date, end_date):
+        self.fetched_ranges.append((employee_id, start_date, end_date))
+        return await super()._fetch_schedule(employee_id, start_date, end_date)
+
+
+class TestLocalScheduleCache:
+    """LocalScheduleCache 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        """최대 항목 수 초과 시 가장 오래 안 쓴 항목 제거"""
+        cache = LocalScheduleCache(max_entries=2)
+        today = date.today()
+        days = [DaySchedule(schedule_date=today + timedelta(days=i), employee_id="emp_001") for i in range(3)]
+
+        await cache.set_days("emp_001", "김철수", days[:2])
+        await cache.get_days("emp_001", [days[0].schedule_date])  # days[0] 최근 사용
+        await cache.set_days("emp_001", "김철수", days[2:])
+
+        _, found = await cache.get_days("emp_001", [d.schedule_date for d in days])
+        assert set(found) == {days[0].schedule_date, days[2].schedule_date}
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry(self):
+        """TTL이 지나면 캐시 미스"""
+        cache = LocalScheduleCache(ttl_seconds=0)
+        today = date.today()
+
+        await cache.set_days("emp_001", "김철수", [DaySchedule(schedule_date=today, employee_id="emp_001")])
+        _, found = await cache.get_days("emp_001", [today])
+
+        assert found == {}
+        assert len(cache) == 0
+
+
+class TestCachedCalendarService:
+    """CalendarService 캐시 연동 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_only_missing_days_fetched(self):
+        """캐시된 날짜는 다시 조회하지 않음"""
+        service = CountingCalendarService(LocalScheduleCache())
+        start = date.today()
+
+        first = await service.get_schedule("emp_001", start, start + timedelta(days=2))
+        second = await service.get_schedule("emp_001", start, start + timedelta(days=4))
+        third = await service.get_schedule("emp_001", start + timedelta(days=1), start + timedelta(days=3))
+
+        assert service.fetched_ranges == [
+            ("emp_001", start, start + timedelta(days=2)),
+            ("emp_001", start + timedelta(days=3), start + timedelta(days=4)),
+        ]
+        assert second.schedules[:3] == first.schedules
+        assert [d.schedule_date for d in third.schedules] == [
+            start + timedelta(days=i) for i in range(1, 4)
+        ]
+        assert third.employee_name == "김철수"
+
+    @pytest.mark.asyncio
+    async def test_create_event_invalidates_attendees(self):
+        """회의 생성 시 참석자의 해당 날짜 캐시 무효화"""
+        service = CountingCalendarService(LocalScheduleCache())
+        target = date.today() + timedelta(days=1)
+
+        await service.get_schedules(["emp_001", "emp_003"], target, target)
+        await service.create_event(MeetingRequest(
+            title="주간 회의",
+            attendee_ids=["emp_001"],
+            room_id="room_001",
+            start_time=datetime.combine(target, datetime.min.time().replace(hour=10), tzinfo=KST),
+            end_time=datetime.combine(target, datetime.min.time().replace(hour=11), tzinfo=KST),
+        ))
+        await service.get_schedules(["emp_001", "emp_003"], target, target)
+
+        fetched_ids = [employee_id for employee_id, _, _ in service.fetched_ranges]
+        assert fetched_ids.count("emp_001") == 2
+        assert fetched_ids.count("emp_003") == 1
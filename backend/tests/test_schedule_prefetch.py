@@ -0,0 +1,193 @@
+"""참석자 일정 선조회 테스트"""
+
+import asyncio
+from datetime import date
+
+import pytest
+
+import agent.agent as agent_module
+import services.calendar as calendar_module
+from agent.agent import MeetingAgent
+from agent.conversation import ConversationContext
+from models.chat import Conversation
+from services.calendar import CalendarService
+from services.schedule_cache import LocalScheduleCache
+from services.schedule_prefetch import SchedulePrefetcher, prefetch_window
+
+
+class SlowCalendarService(CalendarService):
+    """API 조회에 지연이 있고 조회 횟수를 세는 CalendarService"""
+
+    def __init__(self, cache, delay: float = 0.05):
+        super().__init__(cache=cache)
+        self.delay = delay
+        self.fetched = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def _fetch_schedule(self, employee_id, start_date, end_date):
+        self.fetched.append(employee_id)
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        return await super()._fetch_schedule(employee_id, start_date, end_date)
+
+
+def _slow_fetch(delay: float):
+    async def fetch(employee_id, start_date, end_date):
+        await asyncio.sleep(delay)
+    return fetch
+
+
+class TestPrefetchWindow:
+    """선조회 기간 테스트"""
+
+    @pytest.mark.parametrize("today, end", [
+        (date(2026, 10, 16), date(2026, 10, 23)),  # 금요일 -> 다음 주 금요일
+        (date(2026, 10, 19), date(2026, 10, 30)),  # 월요일
+        (date(2026, 10, 18), date(2026, 10, 23)),  # 일요일
+    ])
+    def test_today_through_next_friday(self, today, end):
+        """오늘부터 다음 주 금요일까지"""
+        assert prefetch_window(today) == (today, end)
+
+
+class TestSchedulePrefetcher:
+    """SchedulePrefetcher 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_later_lookup_reuses_prefetch(self, monkeypatch):
+        """진행 중인 선조회를 기다려 캐시에서 읽고 같은 API 요청을 다시 보내지 않음"""
+        service = SlowCalendarService(LocalScheduleCache())
+        prefetcher = SchedulePrefetcher(service.get_schedule)
+        monkeypatch.setattr(calendar_module, "get_schedule_prefetcher", lambda: prefetcher)
+        start, end = prefetch_window()
+
+        assert prefetcher.prefetch(["emp_001", "emp_002"], owner="conv_1") == 2
+        await asyncio.sleep(0)
+        fetched = await service.fetch_schedules(["emp_001", "emp_002"], start, end)
+
+        assert set(fetched.results) == {"emp_001", "emp_002"}
+        assert sorted(service.fetched) == ["emp_001", "emp_002"]
+        assert prefetcher.stats()["joined_total"] == 2
+        assert prefetcher.stats()["completed_total"] == 2
+        assert len(prefetcher) == 0
+
+    @pytest.mark.asyncio
+    async def test_changed_attendees_cancel_stale(self):
+        """같은 대화의 참석자가 바뀌면 빠진 직원의 선조회를 취소"""
+        prefetcher = SchedulePrefetcher(_slow_fetch(1.0))
+
+        prefetcher.prefetch(["emp_001", "emp_002"], owner="conv_1")
+        prefetcher.prefetch(["emp_003"], owner="conv_2")
+        prefetcher.prefetch(["emp_002"], owner="conv_1")
+
+        assert sorted(prefetcher._tasks) == ["emp_002", "emp_003"]
+        assert prefetcher.cancel("conv_1") == 1
+        assert prefetcher.cancel("conv_2") == 1
+        assert prefetcher.stats()["cancelled_total"] == 3
+        assert len(prefetcher) == 0
+
+    @pytest.mark.asyncio
+    async def test_shared_task_cancelled_after_last_owner(self):
+        """다른 대화도 쓰는 선조회는 마지막 대화가 빠질 때 취소"""
+        prefetcher = SchedulePrefetcher(_slow_fetch(1.0))
+
+        assert prefetcher.prefetch(["emp_001"], owner="conv_1") == 1
+        assert prefetcher.prefetch(["emp_001"], owner="conv_2") == 0
+        (entry,) = prefetcher._tasks["emp_001"]
+
+        assert prefetcher.prefetch(["emp_002"], owner="conv_1") == 1  # conv_1에서 emp_001이 빠짐
+        assert not entry.task.cancelled() and entry.owners == {"conv_2"}
+        assert prefetcher.cancel("conv_2") == 1
+        await asyncio.sleep(0)
+        assert entry.task.cancelled()
+        prefetcher.cancel("conv_1")
+
+    @pytest.mark.asyncio
+    async def test_wider_window_tracked_separately(self):
+        """더 넓은 기간의 선조회는 따로 시작하고 두 작업 모두 대기 작업 수에 포함"""
+        prefetcher = SchedulePrefetcher(_slow_fetch(1.0), max_pending=2)
+        start, end = prefetch_window()
+
+        prefetcher.prefetch(["emp_001"], owner="conv_1", start_date=start, end_date=start)
+        prefetcher.prefetch(["emp_001"], owner="conv_2", start_date=start, end_date=end)
+
+        assert len(prefetcher) == 2
+        assert prefetcher.prefetch(["emp_002"], owner="conv_3") == 0
+        assert prefetcher.cancel("conv_2") == 1
+        assert [entry.owners for entry in prefetcher._tasks["emp_001"]] == [{"conv_1"}]
+        assert prefetcher.cancel("conv_1") == 1
+        assert len(prefetcher) == 0
+
+    @pytest.mark.asyncio
+    async def test_lookup_does_not_queue_behind_prefetches(self):
+        """아직 시작하지 않은 선조회는 기다리지 않고, 조회 중인 선조회만 기다림"""
+        prefetcher = SchedulePrefetcher(_slow_fetch(0.1), concurrency=1)
+        start, end = prefetch_window()
+
+        prefetcher.prefetch(["emp_001", "emp_002"], owner="conv_1")
+        await asyncio.sleep(0)
+
+        started = asyncio.get_running_loop().time()
+        await prefetcher.wait("emp_002", start, end)
+        assert asyncio.get_running_loop().time() - started < 0.05
+        await prefetcher.wait("emp_001", start, end)
+        assert asyncio.get_running_loop().time() - started >= 0.09
+
+        stats = prefetcher.stats()
+        assert (stats["bypassed_total"], stats["joined_total"]) == (1, 1)
+        prefetcher.cancel("conv_1")
+
+    @pytest.mark.asyncio
+    async def test_bounded(self):
+        """동시 조회 수와 대기 작업 수를 제한"""
+        service = SlowCalendarService(LocalScheduleCache(), delay=0.02)
+        prefetcher = SchedulePrefetcher(service.get_schedule, concurrency=2, max_pending=3)
+
+        started = prefetcher.prefetch(["emp_001", "emp_002", "emp_003", "emp_004"], owner="conv_1")
+        await asyncio.gather(*[entry.task for entries in prefetcher._tasks.values() for entry in entries])
+
+        assert started == 3
+        assert prefetcher.stats()["skipped_total"] == 1
+        assert service.peak_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_timeout_and_failure_are_swallowed(self):
+        """선조회 실패/타임아웃은 예외 없이 집계만 함"""
+        async def failing(employee_id, start_date, end_date):
+            raise RuntimeError("calendar down")
+
+        prefetcher = SchedulePrefetcher(failing)
+        slow = SchedulePrefetcher(_slow_fetch(1.0), timeout=0.01)
+
+        prefetcher.prefetch(["emp_001"])
+        slow.prefetch(["emp_001"])
+        await asyncio.sleep(0.05)
+
+        assert prefetcher.stats()["failed_total"] == 1
+        assert slow.stats()["failed_total"] == 1
+
+
+class TestAgentPrefetch:
+    """Agent 참석자 확정 시 선조회 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_team_members_trigger_prefetch(self, monkeypatch):
+        """팀원 조회 결과로 선조회를 시작하고 회의 생성 시 남은 작업을 취소"""
+        prefetcher = SchedulePrefetcher(_slow_fetch(1.0))
+        monkeypatch.setattr(agent_module, "get_schedule_prefetcher", lambda: prefetcher)
+        agent = MeetingAgent(use_mock_llm=True)
+        conversation = Conversation(id="conv_1", user_id="user_001")
+        ctx = ConversationContext(conversation)
+
+        agent._update_context_from_result(ctx, "get_team_members", {
+            "members": [{"id": "emp_001", "name": "김철수"}, {"id": "emp_002", "name": "이영희"}],
+        })
+        assert sorted(prefetcher._tasks) == ["emp_001", "emp_002"]
+
+        agent._update_context_from_result(ctx, "create_meeting", {"meeting_id": "m1"})
+        assert len(prefetcher) == 0
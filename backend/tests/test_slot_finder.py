@@ -1,11 +1,14 @@
 """slot_finder 테스트"""
 
+import random
 import pytest
 from datetime import date, datetime, timedelta
 from zoneinfo import ZoneInfo
 
 from services.slot_finder import SlotFinder
 from models.calendar import TimeSlot, DaySchedule, ScheduleResponse, FreeSlot
+from models.employee import Employee
+from models.room import Room, RoomAvailability
 
 KST = ZoneInfo("Asia/Seoul")
 
@@ -213,3 +216,268 @@ class TestMergeBusySlots:
 
         merged = slot_finder._merge_busy_slots(slots)
         assert len(merged) == 2
+
+
+class TestSlotEngines:
+    """스윕/비트맵 엔진 테스트 (기존 병합 엔진과 결과 동일)"""
+
+    @staticmethod
+    def _random_schedules(seed: int, start: date, days: int, people: int) -> list[ScheduleResponse]:
+        import random
+
+        rng = random.Random(seed)
+        schedules = []
+        for p in range(people):
+            day_schedules = []
+            for d in range(days):
+                target = start + timedelta(days=d)
+                busy = []
+                for _ in range(rng.randint(0, 4)):
+                    begin = rng.randrange(7 * 60, 19 * 60, 15)
+                    length = rng.choice([15, 30, 45, 60, 90, 120])
+                    day_start = datetime.combine(target, datetime.min.time(), tzinfo=KST)
+                    busy.append(TimeSlot(
+                        start=day_start + timedelta(minutes=begin),
+                        end=day_start + timedelta(minutes=begin + length),
+                        is_busy=True,
+                    ))
+                day_schedules.append(DaySchedule(
+                    schedule_date=target,
+                    employee_id=f"emp_{p}",
+                    busy_slots=busy,
+                ))
+            schedules.append(ScheduleResponse(
+                employee_id=f"emp_{p}",
+                employee_name=f"직원{p}",
+                start_date=start,
+                end_date=start + timedelta(days=days - 1),
+                schedules=day_schedules,
+            ))
+        return schedules
+
+    @pytest.mark.parametrize("seed", range(20))
+    @pytest.mark.parametrize("preferred_time", [None, "morning", "afternoon"])
+    @pytest.mark.parametrize("engine", ["sweep", "bitmap"])
+    def test_matches_merge_engine(self, slot_finder, seed, preferred_time, engine):
+        """무작위 일정에서 병합 엔진과 같은 결과 (15분 단위 일정이라 비트맵도 동일)"""
+        start = date.today()
+        schedules = self._random_schedules(seed, start, days=10, people=1 + seed % 6)
+        end = start + timedelta(days=9)
+
+        for duration in (30, 60, 120):
+            sweep = slot_finder.find_common_free_slots(
+                schedules, start, end, duration, preferred_time, engine=engine
+            )
+            merge = slot_finder.find_common_free_slots(
+                schedules, start, end, duration, preferred_time, engine="merge"
+            )
+            assert sweep == merge
+
+    def test_unknown_engine(self):
+        """알 수 없는 엔진"""
+        with pytest.raises(ValueError):
+            SlotFinder(engine="unknown")
+
+    def test_bitmap_rounds_to_buckets(self):
+        """비트맵 엔진은 버킷 경계에 걸친 일정을 바쁨으로 처리"""
+        today = date.today()
+        while today.weekday() >= 5:
+            today += timedelta(days=1)
+        day_start = datetime.combine(today, datetime.min.time(), tzinfo=KST)
+        schedule = ScheduleResponse(
+            employee_id="emp_001",
+            employee_name="테스트 사용자",
+            start_date=today,
+            end_date=today,
+            schedules=[DaySchedule(
+                schedule_date=today,
+                employee_id="emp_001",
+                busy_slots=[TimeSlot(
+                    start=day_start + timedelta(hours=9),
+                    end=day_start + timedelta(hours=10, minutes=7),
+                    is_busy=True,
+                )],
+            )],
+        )
+
+        finder = SlotFinder(engine="bitmap", bitmap_granularity=15)
+        slots = finder.find_common_free_slots([schedule], today, today, 30)
+
+        starts = sorted(slot.start for slot in slots)
+        assert starts[0] == day_start + timedelta(hours=10, minutes=15)
+        with pytest.raises(ValueError):
+            SlotFinder(bitmap_granularity=7)
+
+
+class TestQuorumSlots:
+    """best-effort(K명 이상) 시간대 검색 테스트"""
+
+    @staticmethod
+    def _schedule(employee_id: str, target: date, busy_hours: list[tuple[int, int]]) -> ScheduleResponse:
+        day_start = datetime.combine(target, datetime.min.time(), tzinfo=KST)
+        return ScheduleResponse(
+            employee_id=employee_id,
+            employee_name=employee_id,
+            start_date=target,
+            end_date=target,
+            schedules=[DaySchedule(
+                schedule_date=target,
+                employee_id=employee_id,
+                busy_slots=[
+                    TimeSlot(
+                        start=day_start + timedelta(hours=s),
+                        end=day_start + timedelta(hours=e),
+                        is_busy=True,
+                    )
+                    for s, e in busy_hours
+                ],
+            )],
+        )
+
+    @pytest.fixture
+    def weekday(self):
+        target = date.today() + timedelta(days=1)
+        while target.weekday() >= 5:
+            target += timedelta(days=1)
+        return target
+
+    def test_returns_slots_when_one_person_is_busy(self, slot_finder, weekday):
+        """한 명이 종일 바쁘면 나머지 인원으로 시간대 반환"""
+        schedules = [
+            self._schedule("a", weekday, []),
+            self._schedule("b", weekday, []),
+            self._schedule("c", weekday, [(9, 18)]),
+        ]
+
+        assert slot_finder.find_common_free_slots(schedules, weekday, weekday, 60) == []
+        slots = slot_finder.find_quorum_slots(schedules, weekday, weekday, 60)
+
+        assert slots
+        for slot in slots:
+            assert slot.available_ids == ["a", "b"]
+            assert slot.unavailable_ids == ["c"]
+        # 같은 참석자 구성은 하나의 구간으로 합쳐짐 (점심 전후 2개)
+        assert sorted(slot.duration_minutes for slot in slots) == [180, 300]
+
+    def test_required_attendees_rank_higher(self, slot_finder, weekday):
+        """필수 참석자가 가능한 시간이 먼저 추천됨"""
+        schedules = [
+            self._schedule("boss", weekday, [(9, 12)]),
+            self._schedule("member", weekday, [(13, 18)]),
+        ]
+
+        slots = slot_finder.find_quorum_slots(
+            schedules, weekday, weekday, 60,
+            min_attendees=1, required_ids=["boss"],
+        )
+
+        assert slots[0].available_ids == ["boss"]
+        assert slots[0].start.hour >= 13
+        assert slots[-1].available_ids == ["member"]
+
+    def test_min_attendees(self, slot_finder, weekday):
+        """최소 인원을 채우지 못하면 결과 없음"""
+        schedules = [
+            self._schedule("a", weekday, [(9, 18)]),
+            self._schedule("b", weekday, [(9, 18)]),
+        ]
+
+        assert slot_finder.find_quorum_slots(schedules, weekday, weekday, 60) == []
+
+
+class TestMeetingOptions:
+    """시간대 × 회의실 매칭 테스트"""
+
+    @staticmethod
+    def _at(hour: int, minute: int = 0) -> datetime:
+        target = date.today()
+        return datetime.combine(target, datetime.min.time(), tzinfo=KST).replace(hour=hour, minute=minute)
+
+    @staticmethod
+    def _window(room: Room, start: datetime, end: datetime) -> RoomAvailability:
+        return RoomAvailability(room=room, is_available=True, start_time=start, end_time=end)
+
+    @staticmethod
+    def _attendees(count: int) -> list[Employee]:
+        return [
+            Employee(id=f"emp_{i}", name=f"직원{i}", department="개발팀", email=f"e{i}@company.com")
+            for i in range(count)
+        ]
+
+    def test_earliest_start_within_slot(self, slot_finder):
+        """회의실이 시간대 시작에 비어 있지 않아도 시간대 안의 가장 이른 시작으로 매칭"""
+        room = Room(id="room_a", name="A", floor=1, capacity=4)
+        slots = [FreeSlot.from_times(self._at(9), self._at(12))]
+        windows = [
+            self._window(room, self._at(8), self._at(9, 30)),
+            self._window(room, self._at(10, 30), self._at(18)),
+        ]
+
+        [option] = slot_finder.create_meeting_options(slots, windows, self._attendees(3), 60)
+
+        assert option.start_time == self._at(10, 30)
+        assert option.end_time == self._at(11, 30)
+        assert option.room.id == "room_a"
+
+    def test_capacity_fit_and_top_k(self, slot_finder):
+        """수용 인원이 부족한 회의실은 제외하고, 인원에 맞는 회의실을 우선"""
+        small = Room(id="small", name="소", floor=1, capacity=2)
+        fit = Room(id="fit", name="중", floor=1, capacity=4)
+        large = Room(id="large", name="대", floor=1, capacity=20)
+        slots = [
+            FreeSlot.from_times(self._at(h), self._at(h + 1))
+            for h in (9, 10, 13, 14, 15, 16, 17)
+        ]
+        windows = [self._window(room, self._at(9), self._at(18)) for room in (small, large, fit)]
+
+        options = slot_finder.create_meeting_options(
+            slots, windows, self._attendees(4), 60, max_options=3, rooms_per_slot=2
+        )
+
+        assert len(options) == 3
+        assert [o.id for o in options] == [1, 2, 3]
+        assert all(o.room.id != "small" for o in options)
+        assert [o.score for o in options] == sorted((o.score for o in options), reverse=True)
+        assert options[0].room.id == "fit"
+        # 선호 시간대(10~11시, 14~16시) 중 앞선 시간대가 먼저
+        assert options[0].start_time == self._at(10)
+
+    def test_matches_exhaustive_search(self, slot_finder):
+        """무작위 입력에서 전체 후보 정렬 결과와 동일"""
+        rng = random.Random(11)
+        rooms = [Room(id=f"room_{i}", name=str(i), floor=1, capacity=rng.choice([4, 6, 8, 12])) for i in range(8)]
+        windows = []
+        for room in rooms:
+            for _ in range(3):
+                start = self._at(9) + timedelta(minutes=30 * rng.randrange(16))
+                windows.append(self._window(room, start, start + timedelta(minutes=30 * rng.randrange(1, 6))))
+        slots = []
+        for _ in range(10):
+            start = self._at(9) + timedelta(minutes=30 * rng.randrange(16))
+            slots.append(FreeSlot.from_times(start, start + timedelta(minutes=30 * rng.randrange(2, 6))))
+        attendees = self._attendees(4)
+
+        options = slot_finder.create_meeting_options(
+            slots, windows, attendees, 60, max_options=5, rooms_per_slot=len(rooms)
+        )
+
+        # 30분 단위로 가능한 시작 시간을 모두 시도하는 단순 탐색
+        duration = timedelta(minutes=60)
+        expected = []
+        for si, slot in enumerate(slots):
+            for ri, room in enumerate(rooms):
+                room_windows = [(w.start_time, w.end_time) for w in windows if w.room.id == room.id]
+                start = slot.start
+                while start + duration <= slot.end:
+                    if any(ws <= start and start + duration <= we for ws, we in room_windows):
+                        score = slot_finder._calculate_option_score(
+                            FreeSlot.from_times(start, start + duration), room
+                        ) + slot_finder._capacity_fit_score(room.capacity, len(attendees))
+                        expected.append((score, -si, -ri, start, room.id))
+                        break
+                    start += timedelta(minutes=30)
+        expected.sort(reverse=True)
+
+        assert [(o.score, o.start_time, o.room.id) for o in options] == [
+            (score, start, room_id) for score, _, _, start, room_id in expected[:5]
+        ]
@@ -1,5 +1,8 @@
 """도구 테스트"""
 
+import asyncio
+import time
+
 import pytest
 from datetime import date, datetime, timedelta
 from zoneinfo import ZoneInfo
@@ -7,6 +10,7 @@ from zoneinfo import ZoneInfo
 from agent.tools.employee import SearchEmployeeTool
 from agent.tools.calendar import GetCalendarTool, FindFreeSlotsTool
 from agent.tools.room import SearchRoomsTool
+from agent.tools.base import BaseTool, ToolResult
 from agent.tools.registry import ToolRegistry
 
 KST = ZoneInfo("Asia/Seoul")
@@ -206,9 +210,99 @@ class TestToolRegistry:
             assert "description" in schema
             assert "parameters" in schema
 
+    def test_schemas_cached_until_register(self, tool_registry):
+        """provider 변환 결과는 재사용하고, 도구 등록 시 다시 만듦"""
+        from agent.llm_client import LLMClient
+
+        schemas = tool_registry.get_all_schemas()
+        assert tool_registry.get_all_schemas() is schemas
+
+        convert = LLMClient._convert_tools_openai
+        openai_tools = LLMClient._provider_tools(schemas, convert)
+        assert LLMClient._provider_tools(schemas, convert) is openai_tools
+        assert LLMClient._provider_tools(list(schemas), convert) == openai_tools
+
+        tool_registry.register(SleepTool("sleep", []))
+        refreshed = tool_registry.get_all_schemas()
+        assert refreshed is not schemas
+        assert "sleep" in [t["function"]["name"] for t in LLMClient._provider_tools(refreshed, convert)]
+
     @pytest.mark.asyncio
     async def test_execute_unknown_tool(self, tool_registry):
         """존재하지 않는 도구 실행"""
         result = await tool_registry.execute("unknown_tool", {})
         assert result.success is False
         assert "알 수 없는 도구" in result.error
+
+
+class SleepTool(BaseTool):
+    """지정한 시간만큼 기다린 뒤 실행 순서를 기록하는 테스트용 도구"""
+
+    description = "테스트용 도구"
+    parameters = {
+        "type": "object",
+        "properties": {"delay": {"type": "number"}, "label": {"type": "string"}},
+        "required": ["delay", "label"],
+    }
+
+    def __init__(self, name: str, log: list, parallel_safe: bool = True):
+        self.name = name
+        self.log = log
+        self.parallel_safe = parallel_safe
+
+    async def execute(self, delay: float, label: str) -> ToolResult:
+        self.log.append(f"start:{label}")
+        await asyncio.sleep(delay)
+        self.log.append(f"end:{label}")
+        return ToolResult(success=True, data={"label": label})
+
+
+class TestExecuteMany:
+    """한 턴의 여러 도구 호출 동시 실행 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_parallel_results_in_call_order(self, tool_registry):
+        """동시에 실행해도 결과는 호출 순서대로"""
+        log = []
+        tool_registry.register(SleepTool("sleep", log))
+        calls = [
+            {"name": "sleep", "arguments": {"delay": delay, "label": str(i)}}
+            for i, delay in enumerate([0.15, 0.05, 0.1])
+        ]
+
+        started = time.perf_counter()
+        results = await tool_registry.execute_many(calls, concurrency=3)
+        elapsed = time.perf_counter() - started
+
+        assert [r.data["label"] for r in results] == ["0", "1", "2"]
+        assert elapsed < 0.25  # 순차 실행이면 0.3초
+        assert log[:3] == ["start:0", "start:1", "start:2"]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap(self, tool_registry):
+        """동시 실행 수 제한"""
+        log = []
+        tool_registry.register(SleepTool("sleep", log))
+        calls = [{"name": "sleep", "arguments": {"delay": 0.02, "label": str(i)}} for i in range(4)]
+
+        await tool_registry.execute_many(calls, concurrency=2)
+
+        assert log[:3] == ["start:0", "start:1", "end:0"]
+
+    @pytest.mark.asyncio
+    async def test_unsafe_tool_runs_alone(self, tool_registry):
+        """parallel_safe가 아닌 도구는 앞뒤 호출과 겹치지 않음"""
+        log = []
+        tool_registry.register(SleepTool("sleep", log))
+        tool_registry.register(SleepTool("book", log, parallel_safe=False))
+        calls = [
+            {"name": "sleep", "arguments": {"delay": 0.02, "label": "a"}},
+            {"name": "book", "arguments": {"delay": 0.01, "label": "b"}},
+            {"name": "sleep", "arguments": {"delay": 0.01, "label": "c"}},
+        ]
+
+        results = await tool_registry.execute_many(calls)
+
+        assert [r.data["label"] for r in results] == ["a", "b", "c"]
+        assert log == ["start:a", "end:a", "start:b", "end:b", "start:c", "end:c"]
+        assert tool_registry.get("create_meeting").parallel_safe is False
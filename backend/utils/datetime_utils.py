@@ -14,6 +14,22 @@ DEFAULT_WORK_END = time(18, 0)
 LUNCH_START = time(12, 0)
 LUNCH_END = time(13, 0)
 
+# 한국어 시각 표현: "오후 2시", "2시 반", "14:30", "정오" ("1시간"의 "시"는 제외)
+KOREAN_TIME_PATTERN = re.compile(
+    r"(?:(오전|오후|아침|낮|저녁|밤)\s*)?"
+    r"(?:(정오)|(\d{1,2}):(\d{2})|(\d{1,2})\s*시(?!간)(?:\s*(반)|\s*(\d{1,2})\s*분)?)"
+)
+
+# 시각 범위 연결 표현: "2시~3시", "2시부터 3시까지", "14:00-15:00"
+KOREAN_TIME_RANGE_CONNECTOR = re.compile(r"\s*(?:~|-|–|부터|에서)\s*")
+
+# 한국어 시간 길이 표현: "1시간", "1시간 30분", "한 시간 반", "90분"
+KOREAN_DURATION_PATTERN = re.compile(
+    r"(?:(\d+|한|두|세|네)\s*시간(?:\s*(반)|\s*(\d{1,2})\s*분)?|(\d+)\s*분)(?:\s*(?:동안|간|짜리))?"
+)
+
+_KOREAN_NUMBERS = {"한": 1, "두": 2, "세": 3, "네": 4}
+
 
 def get_current_datetime() -> datetime:
     """현재 시간 반환 (KST)"""
@@ -41,6 +57,12 @@ def parse_relative_date(text: str, reference_date: Optional[date] = None) -> Opt
 
     text = text.strip().lower()
 
+    # 다다음 주 (다음 주 기준 + 7일, "다음 주"보다 먼저 확인)
+    further = re.match(r"(?:다다음|다음\s*다음)\s*주\s*(.*)", text)
+    if further:
+        next_week = parse_relative_date(f"다음 주 {further.group(1)}".strip(), reference_date)
+        return next_week + timedelta(days=7) if next_week else None
+
     # 오늘
     if text in ["오늘", "today"]:
         return reference_date
@@ -53,8 +75,8 @@ def parse_relative_date(text: str, reference_date: Optional[date] = None) -> Opt
     if text in ["모레", "day after tomorrow"]:
         return reference_date + timedelta(days=2)
 
-    # 다음 주
-    if "다음 주" in text or "next week" in text:
+    # 다음 주 (요일이 없으면 다음 주 월요일, "다음 주 화요일"은 아래 요일 처리)
+    if ("다음 주" in text or "next week" in text) and "요일" not in text:
         # 다음 주 월요일
         days_until_monday = (7 - reference_date.weekday()) % 7
         if days_until_monday == 0:
@@ -78,7 +100,8 @@ def parse_relative_date(text: str, reference_date: Optional[date] = None) -> Opt
             days_ahead = weekday - current_weekday
             if "다음" in text:
                 days_ahead += 7
-            elif days_ahead <= 0:
+            elif days_ahead < 0 or (days_ahead == 0 and "이번" not in text):
+                # "이번 주 금요일"은 오늘이 금요일이면 오늘
                 days_ahead += 7
             return reference_date + timedelta(days=days_ahead)
 
@@ -243,3 +266,146 @@ def format_time_korean(dt: datetime) -> str:
     minute_str = f" {dt.minute}분" if dt.minute > 0 else ""
 
     return f"{period} {display_hour}시{minute_str}"
+
+
+def _korean_time_match_to_time(match: re.Match, start: Optional[time] = None) -> Optional[time]:
+    """KOREAN_TIME_PATTERN 매치 → time (오전/오후가 없으면 업무 시간 기준으로 추정)"""
+    meridiem, noon, hh, mm, hour_text, half, minute_text = match.groups()
+
+    if noon:
+        return time(12, 0)
+    if hh is not None:
+        hour, minute = int(hh), int(mm)
+    else:
+        hour = int(hour_text)
+        minute = 30 if half else int(minute_text or 0)
+
+    if hour > 23 or minute > 59:
+        return None
+
+    if meridiem in ("오후", "저녁", "밤", "낮") and hour < 12:
+        if meridiem != "낮" or hour <= 6:
+            hour += 12
+    elif meridiem in ("오전", "아침") and hour == 12:
+        hour = 0
+    elif meridiem is None and hh is None:
+        if start is not None:
+            # 범위의 끝: 시작 시각 이후가 되도록 오후로 해석
+            if hour * 60 + minute <= start.hour * 60 + start.minute and hour < 12:
+                hour += 12
+        elif 1 <= hour <= 6:
+            # "2시" → 14:00 (업무 시간 기준)
+            hour += 12
+
+    if hour > 23:
+        return None
+    return time(hour, minute)
+
+
+def is_ambiguous_korean_hour(match: re.Match) -> bool:
+    """
+    오전/오후 없이 쓴 시각이 어느 쪽인지 업무 시간으로도 정할 수 없는지
+
+    "7시"는 07:00과 19:00 모두 업무 시간 밖이므로 모호하고,
+    "10시"(오전)와 "2시"(오후)는 한쪽만 업무 시간 안이라 모호하지 않습니다.
+
+    Args:
+        match: KOREAN_TIME_PATTERN 매치
+
+    Returns:
+        모호하면 True
+    """
+    meridiem, noon, hh, _, hour_text, _, _ = match.groups()
+    if meridiem or noon or hh is not None:
+        return False
+    hour = int(hour_text)
+    if not 1 <= hour <= 12:
+        return False
+    work_start, work_end = DEFAULT_WORK_START.hour, DEFAULT_WORK_END.hour
+    am_in_hours = work_start <= hour <= work_end
+    pm_in_hours = hour < 12 and work_start <= hour + 12 <= work_end
+    return not (am_in_hours or pm_in_hours)
+
+
+def parse_korean_time(text: str) -> Optional[time]:
+    """
+    한국어 시각 표현 파싱
+
+    Args:
+        text: "오후 2시", "2시 반", "14:30", "정오" 등을 포함한 문자열
+
+    Returns:
+        처음 나오는 시각 또는 None
+    """
+    match = KOREAN_TIME_PATTERN.search(text)
+    return _korean_time_match_to_time(match) if match else None
+
+
+def parse_duration_minutes(text: str) -> Optional[int]:
+    """
+    한국어 시간 길이 표현 파싱
+
+    Args:
+        text: "1시간", "1시간 30분", "한 시간 반", "90분" 등을 포함한 문자열
+
+    Returns:
+        분 단위 길이 또는 None
+    """
+    # "2시 30분"의 "30분"은 시각이므로 제외
+    text = KOREAN_TIME_PATTERN.sub(" ", text)
+    match = KOREAN_DURATION_PATTERN.search(text)
+    if not match:
+        return None
+
+    hours, half, minutes, only_minutes = match.groups()
+    if only_minutes is not None:
+        return int(only_minutes)
+
+    total = (_KOREAN_NUMBERS.get(hours) or int(hours)) * 60
+    if half:
+        total += 30
+    elif minutes:
+        total += int(minutes)
+    return total
+
+
+def parse_korean_time_range(
+    text: str,
+    default_duration_minutes: int = 60,
+) -> Optional[tuple[time, time]]:
+    """
+    한국어 시각 범위 파싱
+
+    "2시~3시", "오후 2시부터 4시까지"처럼 범위가 있으면 그대로,
+    시작 시각만 있으면 시간 길이 표현("1시간")이나 기본 길이로 종료 시각을 계산합니다.
+    "4시까지"처럼 종료 시각만 있으면 시작 시각을 알 수 없으므로 None입니다.
+
+    Args:
+        text: 사용자 메시지
+        default_duration_minutes: 길이 표현이 없을 때의 회의 시간 (분)
+
+    Returns:
+        (시작, 종료) 튜플 또는 None
+    """
+    matches = list(KOREAN_TIME_PATTERN.finditer(text))
+    if not matches:
+        return None
+
+    start = _korean_time_match_to_time(matches[0])
+    if start is None:
+        return None
+
+    if len(matches) > 1 and KOREAN_TIME_RANGE_CONNECTOR.fullmatch(
+        text[matches[0].end():matches[1].start()]
+    ):
+        end = _korean_time_match_to_time(matches[1], start=start)
+    elif re.match(r"\s*까지", text[matches[0].end():]):
+        return None
+    else:
+        duration = parse_duration_minutes(text) or default_duration_minutes
+        end_minutes = start.hour * 60 + start.minute + duration
+        end = time(end_minutes // 60, end_minutes % 60) if end_minutes < 24 * 60 else None
+
+    if end is None or end <= start:
+        return None
+    return start, end